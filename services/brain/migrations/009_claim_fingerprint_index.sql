@@ -0,0 +1,57 @@
+-- Migration 009: Cross-Session Claim Fingerprint Index
+-- One row per distinct claim fingerprint seen in any research session, so
+-- extraction can reuse earlier scores instead of re-evaluating known claims
+-- Date: 2026-10-18
+-- Dependencies: 008_evidence_tracking.sql
+
+-- ============================================================================
+-- CLAIM FINGERPRINT INDEX
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS research_claim_index (
+    -- Equality lookups (fingerprint = ANY(...)) use the primary key; a hash
+    -- index cannot enforce the uniqueness the ON CONFLICT upsert needs
+    fingerprint TEXT PRIMARY KEY,
+    claim_id TEXT NOT NULL,                       -- First claim recorded with this fingerprint
+    claim_text TEXT NOT NULL,
+    claim_type TEXT NOT NULL DEFAULT 'fact',
+    entailment_score REAL NOT NULL DEFAULT 0.0,
+    provenance_score REAL NOT NULL DEFAULT 0.0,
+    confidence REAL NOT NULL DEFAULT 0.0,
+    evaluation JSONB NOT NULL DEFAULT '{}',       -- Collective evaluation decision and scores
+    evidence_count INTEGER NOT NULL DEFAULT 0,    -- Evidence spans seen across sessions
+    session_count INTEGER NOT NULL DEFAULT 1,
+    first_session_id TEXT,
+    last_session_id TEXT,
+    embedding REAL[],                             -- Optional claim embedding for fuzzy matching
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_claim_index_updated ON research_claim_index(updated_at DESC);
+
+COMMENT ON TABLE research_claim_index IS
+'Claims known across research sessions, keyed by dedupe fingerprint. Extraction consults it in bulk before scoring and evaluation; known claims reuse stored scores and only contribute new evidence.';
+
+-- Backfill from claims already persisted by earlier sessions
+INSERT INTO research_claim_index (
+    fingerprint, claim_id, claim_text, entailment_score, provenance_score,
+    confidence, evidence_count, session_count, first_session_id, last_session_id
+)
+SELECT DISTINCT ON (c.dedupe_fingerprint)
+    c.dedupe_fingerprint, c.id, c.claim_text, c.entailment_score, c.provenance_score,
+    c.confidence,
+    (SELECT COUNT(*) FROM research_evidence e WHERE e.claim_id = c.id),
+    1, c.session_id, c.session_id
+FROM research_claims c
+WHERE c.dedupe_fingerprint <> ''
+ORDER BY c.dedupe_fingerprint, c.confidence DESC
+ON CONFLICT (fingerprint) DO NOTHING;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT FROM pg_tables WHERE tablename = 'research_claim_index') THEN
+        RAISE EXCEPTION 'Migration failed: research_claim_index table not created';
+    END IF;
+
+    RAISE NOTICE 'Migration 009 completed successfully: claim fingerprint index created';
+END $$;
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -432,6 +433,14 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error during session manager graceful shutdown: {e}")
 
+    # Stop the search cache invalidation listener and its Redis client
+    try:
+        from brain.research.search_cache import search_cache
+
+        await search_cache.close()
+    except Exception as e:
+        logger.error(f"Error closing search cache: {e}")
+
     # Cleanup research infrastructure
     if hasattr(app.state, 'pg_pool') and app.state.pg_pool is not None:
         logger.info("Closing PostgreSQL connection pool")
@@ -456,6 +465,25 @@ async def lifespan(app: FastAPI):
         scheduler.stop(wait=True)
         logger.info("Autonomous scheduler stopped")
 
+    # Close HTTP clients held by MCP tool servers (e.g. vision CLIP scoring)
+    from .dependencies import get_orchestrator
+
+    if get_orchestrator.cache_info().currsize:
+        try:
+            await get_orchestrator().aclose()
+        except Exception as e:
+            logger.error(f"Error closing orchestrator tools: {e}")
+
+    # Publish coalesced context updates and final retained snapshots
+    from .dependencies import get_context_store
+
+    if get_context_store.cache_info().currsize:
+        try:
+            await asyncio.to_thread(get_context_store().close)
+            logger.info("MQTT context store flushed")
+        except Exception as e:
+            logger.error(f"Error flushing MQTT context store: {e}")
+
 
 app = FastAPI(title="KITTY Brain API", lifespan=lifespan)
 
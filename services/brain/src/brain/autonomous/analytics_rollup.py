@@ -0,0 +1,341 @@
+# noqa: D401
+"""Incremental rollups behind goal generation and feedback loop analytics.
+
+Failed print outcomes and measured goal effectiveness are folded into daily
+buckets. A refresh aggregates only source rows newer than the rollup's
+watermark, so nightly cost tracks new activity instead of total history.
+
+Readers combine the daily buckets with a live GROUP BY over the rows the
+buckets do not cover (newer than the watermark, or on the partial first day
+of a lookback window), so results stay exact between refreshes.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, delete, func, or_, select, true
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from common.db.models import (
+    AnalyticsWatermark,
+    Goal,
+    GoalEffectivenessDaily,
+    GoalStatus,
+    PrintFailureDaily,
+    PrintOutcome,
+)
+
+logger = logging.getLogger(__name__)
+
+FAILURE_ROLLUP = "print_failure_daily"
+EFFECTIVENESS_ROLLUP = "goal_effectiveness_daily"
+
+
+@dataclass
+class EffectivenessStats:
+    """Aggregated effectiveness scores for one goal type."""
+
+    count: int = 0
+    total: float = 0.0
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, count: Any, total: Any, minimum: Any, maximum: Any) -> None:
+        if not count:
+            return
+        self.count += int(count)
+        self.total += float(total or 0)
+        if minimum is not None:
+            value = float(minimum)
+            self.minimum = value if self.minimum is None else min(self.minimum, value)
+        if maximum is not None:
+            value = float(maximum)
+            self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+
+def _as_date(value: Any) -> date:
+    # func.date() yields a date on PostgreSQL and an ISO string on SQLite
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _next_midnight(moment: datetime) -> datetime:
+    return datetime.combine(moment.date() + timedelta(days=1), datetime.min.time())
+
+
+def _reason_key(reason: Any) -> str:
+    if reason is None:
+        return "unknown"
+    return getattr(reason, "value", str(reason))
+
+
+def _type_key(goal_type: Any) -> str:
+    return getattr(goal_type, "value", str(goal_type))
+
+
+def _measured_goal_filter() -> ColumnElement:
+    return and_(
+        Goal.status == GoalStatus.completed,
+        Goal.outcome_measured_at.is_not(None),
+        Goal.learn_from == True,  # noqa: E712
+        Goal.effectiveness_score.is_not(None),
+    )
+
+
+def _uncovered(
+    window_column: Any,
+    watermark_column: Any,
+    since: Optional[datetime],
+    watermark: Optional[datetime],
+) -> ColumnElement:
+    """Filter for source rows in the window that the daily buckets do not cover.
+
+    Buckets strictly after ``since``'s day are read from the rollup, so the
+    live part is the tail past the watermark plus the rolled-up rows of the
+    window's first (partial) day.
+    """
+    if watermark is None:
+        return window_column >= since if since is not None else true()
+    tail = watermark_column > watermark
+    if since is None:
+        return tail
+    first_day = and_(
+        window_column >= since,
+        window_column < _next_midnight(since),
+        watermark_column <= watermark,
+    )
+    return or_(and_(tail, window_column >= since), first_day)
+
+
+class AnalyticsRollup:
+    """Watermarked daily rollups of print failures and goal effectiveness.
+
+    Example:
+        rollup = AnalyticsRollup(session)
+        rollup.refresh()
+        session.commit()
+        counts = rollup.failure_counts(since=datetime.utcnow() - timedelta(days=30))
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.db = session
+
+    def watermark(self, name: str) -> Optional[datetime]:
+        row = self.db.get(AnalyticsWatermark, name)
+        return row.high_water if row is not None else None
+
+    def refresh(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Fold source rows newer than each watermark into the daily buckets.
+
+        The caller commits. Watermark rows are locked for the duration of the
+        transaction so concurrent refreshes cannot fold the same rows twice.
+
+        Returns:
+            Number of bucket rows touched per rollup
+        """
+        now = now or datetime.utcnow()
+        touched = {
+            FAILURE_ROLLUP: self._refresh_failures(now),
+            EFFECTIVENESS_ROLLUP: self._refresh_effectiveness(now),
+        }
+        logger.info(f"Analytics rollups refreshed up to {now.isoformat()}: {touched}")
+        return touched
+
+    def rebuild(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Discard the rollups and fold the full history again.
+
+        Needed after backfills or edits to already-folded rows (for example
+        flipping ``learn_from`` on a measured goal).
+        """
+        self.db.execute(delete(PrintFailureDaily))
+        self.db.execute(delete(GoalEffectivenessDaily))
+        self.db.execute(
+            delete(AnalyticsWatermark).where(
+                AnalyticsWatermark.name.in_([FAILURE_ROLLUP, EFFECTIVENESS_ROLLUP])
+            )
+        )
+        self.db.flush()
+        return self.refresh(now)
+
+    def failure_counts(self, since: Optional[datetime] = None) -> Dict[str, int]:
+        """Failed prints per failure reason completed at or after ``since``."""
+        counts: Dict[str, int] = defaultdict(int)
+
+        rolled = select(
+            PrintFailureDaily.failure_reason, func.sum(PrintFailureDaily.failure_count)
+        ).group_by(PrintFailureDaily.failure_reason)
+        if since is not None:
+            rolled = rolled.where(PrintFailureDaily.bucket_date > since.date())
+        for reason, count in self.db.execute(rolled):
+            counts[reason] += int(count or 0)
+
+        live = (
+            select(PrintOutcome.failure_reason, func.count())
+            .where(
+                PrintOutcome.success == False,  # noqa: E712
+                _uncovered(
+                    PrintOutcome.completed_at,
+                    PrintOutcome.measured_at,
+                    since,
+                    self.watermark(FAILURE_ROLLUP),
+                ),
+            )
+            .group_by(PrintOutcome.failure_reason)
+        )
+        for reason, count in self.db.execute(live):
+            counts[_reason_key(reason)] += int(count)
+
+        return {reason: count for reason, count in counts.items() if count}
+
+    def effectiveness_by_type(
+        self, since: Optional[datetime] = None
+    ) -> Dict[str, EffectivenessStats]:
+        """Effectiveness statistics per goal type for goals measured at or after ``since``."""
+        stats: Dict[str, EffectivenessStats] = defaultdict(EffectivenessStats)
+
+        rolled = select(
+            GoalEffectivenessDaily.goal_type,
+            func.sum(GoalEffectivenessDaily.sample_count),
+            func.sum(GoalEffectivenessDaily.score_sum),
+            func.min(GoalEffectivenessDaily.score_min),
+            func.max(GoalEffectivenessDaily.score_max),
+        ).group_by(GoalEffectivenessDaily.goal_type)
+        if since is not None:
+            rolled = rolled.where(GoalEffectivenessDaily.bucket_date > since.date())
+        for goal_type, count, total, minimum, maximum in self.db.execute(rolled):
+            stats[goal_type].merge(count, total, minimum, maximum)
+
+        live = (
+            select(
+                Goal.goal_type,
+                func.count(Goal.effectiveness_score),
+                func.sum(Goal.effectiveness_score),
+                func.min(Goal.effectiveness_score),
+                func.max(Goal.effectiveness_score),
+            )
+            .where(
+                _measured_goal_filter(),
+                _uncovered(
+                    Goal.outcome_measured_at,
+                    Goal.outcome_measured_at,
+                    since,
+                    self.watermark(EFFECTIVENESS_ROLLUP),
+                ),
+            )
+            .group_by(Goal.goal_type)
+        )
+        for goal_type, count, total, minimum, maximum in self.db.execute(live):
+            stats[_type_key(goal_type)].merge(count, total, minimum, maximum)
+
+        return {goal_type: entry for goal_type, entry in stats.items() if entry.count}
+
+    def _refresh_failures(self, now: datetime) -> int:
+        previous = self._lock_watermark(FAILURE_ROLLUP)
+        bucket = func.date(PrintOutcome.completed_at)
+        stmt = (
+            select(bucket, PrintOutcome.failure_reason, func.count())
+            .where(
+                PrintOutcome.success == False,  # noqa: E712
+                PrintOutcome.measured_at <= now,
+            )
+            .group_by(bucket, PrintOutcome.failure_reason)
+        )
+        if previous is not None:
+            stmt = stmt.where(PrintOutcome.measured_at > previous.high_water)
+
+        rows = self.db.execute(stmt).all()
+        for day, reason, count in rows:
+            key = (_as_date(day), _reason_key(reason))
+            entry = self.db.get(PrintFailureDaily, key)
+            if entry is None:
+                self.db.add(
+                    PrintFailureDaily(bucket_date=key[0], failure_reason=key[1], failure_count=count)
+                )
+            else:
+                entry.failure_count += count
+
+        self._advance_watermark(FAILURE_ROLLUP, previous, now)
+        return len(rows)
+
+    def _refresh_effectiveness(self, now: datetime) -> int:
+        previous = self._lock_watermark(EFFECTIVENESS_ROLLUP)
+        bucket = func.date(Goal.outcome_measured_at)
+        stmt = (
+            select(
+                bucket,
+                Goal.goal_type,
+                func.count(Goal.effectiveness_score),
+                func.sum(Goal.effectiveness_score),
+                func.min(Goal.effectiveness_score),
+                func.max(Goal.effectiveness_score),
+            )
+            .where(_measured_goal_filter(), Goal.outcome_measured_at <= now)
+            .group_by(bucket, Goal.goal_type)
+        )
+        if previous is not None:
+            stmt = stmt.where(Goal.outcome_measured_at > previous.high_water)
+
+        rows = self.db.execute(stmt).all()
+        for day, goal_type, count, total, minimum, maximum in rows:
+            key = (_as_date(day), _type_key(goal_type))
+            entry = self.db.get(GoalEffectivenessDaily, key)
+            if entry is None:
+                self.db.add(
+                    GoalEffectivenessDaily(
+                        bucket_date=key[0],
+                        goal_type=key[1],
+                        sample_count=count,
+                        score_sum=total,
+                        score_min=minimum,
+                        score_max=maximum,
+                    )
+                )
+            else:
+                merged = EffectivenessStats(
+                    count=entry.sample_count,
+                    total=float(entry.score_sum),
+                    minimum=None if entry.score_min is None else float(entry.score_min),
+                    maximum=None if entry.score_max is None else float(entry.score_max),
+                )
+                merged.merge(count, total, minimum, maximum)
+                entry.sample_count = merged.count
+                entry.score_sum = merged.total
+                entry.score_min = merged.minimum
+                entry.score_max = merged.maximum
+
+        self._advance_watermark(EFFECTIVENESS_ROLLUP, previous, now)
+        return len(rows)
+
+    def _lock_watermark(self, name: str) -> Optional[AnalyticsWatermark]:
+        stmt = (
+            select(AnalyticsWatermark)
+            .where(AnalyticsWatermark.name == name)
+            .with_for_update()
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def _advance_watermark(
+        self, name: str, previous: Optional[AnalyticsWatermark], now: datetime
+    ) -> None:
+        if previous is None:
+            self.db.add(AnalyticsWatermark(name=name, high_water=now, updated_at=now))
+        else:
+            previous.high_water = now
+            previous.updated_at = now
+        self.db.flush()
+
+
+__all__ = ["AnalyticsRollup", "EffectivenessStats", "FAILURE_ROLLUP", "EFFECTIVENESS_ROLLUP"]
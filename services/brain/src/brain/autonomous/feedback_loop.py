@@ -11,11 +11,12 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
-from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from common.config import settings
-from common.db.models import Goal, GoalStatus, GoalType
+from common.db.models import GoalType
+
+from .analytics_rollup import AnalyticsRollup
 
 logger = logging.getLogger(__name__)
 
@@ -86,54 +87,24 @@ class FeedbackLoop:
 
         logger.info("Analyzing historical goal effectiveness")
 
-        # Build query for goals with measured outcomes
-        stmt = select(Goal).where(
-            and_(
-                Goal.status == GoalStatus.completed,
-                Goal.outcome_measured_at.is_not(None),
-                Goal.learn_from == True,  # noqa: E712
-            )
-        )
-
-        # Apply lookback window if specified
+        cutoff = None
         if lookback_days:
             cutoff = datetime.utcnow() - timedelta(days=lookback_days)
-            stmt = stmt.where(Goal.outcome_measured_at >= cutoff)
-
-        # Execute query
-        measured_goals = self.db.execute(stmt).scalars().all()
-
-        logger.info(f"Found {len(measured_goals)} goals with measured outcomes")
-
-        # Group by goal type
-        stats_by_type = {}
 
-        for goal in measured_goals:
-            goal_type = goal.goal_type.value
+        # Aggregated in SQL: daily rollup buckets plus rows not yet rolled up
+        stats_by_type = AnalyticsRollup(self.db).effectiveness_by_type(since=cutoff)
 
-            if goal_type not in stats_by_type:
-                stats_by_type[goal_type] = {
-                    "effectiveness_scores": [],
-                    "goal_ids": [],
-                }
-
-            if goal.effectiveness_score is not None:
-                stats_by_type[goal_type]["effectiveness_scores"].append(
-                    float(goal.effectiveness_score)
-                )
-                stats_by_type[goal_type]["goal_ids"].append(goal.id)
+        logger.info(
+            f"Found {sum(stats.count for stats in stats_by_type.values())} "
+            f"goals with measured outcomes"
+        )
 
         # Calculate statistics and adjustment factors
         results = {}
 
-        for goal_type, data in stats_by_type.items():
-            scores = data["effectiveness_scores"]
-            count = len(scores)
-
-            if count == 0:
-                continue
-
-            avg_effectiveness = sum(scores) / count
+        for goal_type, stats in stats_by_type.items():
+            count = stats.count
+            avg_effectiveness = stats.average
             sample_size_met = count >= self.min_samples
 
             # Calculate adjustment factor
@@ -145,8 +116,8 @@ class FeedbackLoop:
             results[goal_type] = {
                 "avg_effectiveness": round(avg_effectiveness, 2),
                 "count": count,
-                "min_effectiveness": round(min(scores), 2),
-                "max_effectiveness": round(max(scores), 2),
+                "min_effectiveness": round(stats.minimum, 2),
+                "max_effectiveness": round(stats.maximum, 2),
                 "adjustment_factor": round(adjustment_factor, 3),
                 "sample_size_met": sample_size_met,
                 "sample_size_required": self.min_samples,
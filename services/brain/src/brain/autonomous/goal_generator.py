@@ -11,19 +11,20 @@ from decimal import Decimal
 from typing import List, Dict, Any, Optional, Tuple
 
 import structlog
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from common.db.models import (
     Goal,
     GoalType,
     GoalStatus,
-    FabricationJob,
-    FabricationStatus,
     RoutingDecision,
 )
 from common.db import SessionLocal
 
+from .analytics_rollup import AnalyticsRollup
+
 logger = logging.getLogger(__name__)
 struct_logger = structlog.get_logger()
 
@@ -137,6 +138,9 @@ class GoalGenerator:
         with self._session_factory() as session:
             goals: List[Goal] = []
 
+            # Fold outcomes recorded since the last run into the daily rollups
+            self._refresh_rollups(session)
+
             # 1. Detect print failure patterns
             failure_goals = self._detect_print_failures(session)
             goals.extend(failure_goals)
@@ -149,6 +153,11 @@ class GoalGenerator:
             cost_goals = self._detect_cost_opportunities(session)
             goals.extend(cost_goals)
 
+            # Phase 3: Analyze historical effectiveness once for all candidates
+            analysis = None
+            if self.feedback_loop:
+                analysis = self.feedback_loop.analyze_historical_effectiveness()
+
             # Calculate impact scores with feedback loop adjustment
             goals_with_scores = []
             for goal in goals:
@@ -158,7 +167,7 @@ class GoalGenerator:
                 adjustment_factor = 1.0
                 if self.feedback_loop:
                     adjustment_factor = self.feedback_loop.get_adjustment_factor(
-                        goal.goal_type
+                        goal.goal_type, analysis
                     )
 
                 adjusted_score = base_score.total_score * adjustment_factor
@@ -210,31 +219,16 @@ class GoalGenerator:
         goals: List[Goal] = []
         cutoff_date = datetime.utcnow() - timedelta(days=self.lookback_days)
 
-        # Query failed fabrication jobs
-        stmt = (
-            select(FabricationJob)
-            .where(
-                and_(
-                    FabricationJob.status == FabricationStatus.failed,
-                    FabricationJob.created_at >= cutoff_date,
-                )
-            )
-        )
-
-        failed_jobs = session.execute(stmt).scalars().all()
+        # Failed print outcomes grouped by failure reason in SQL
+        failure_patterns = AnalyticsRollup(session).failure_counts(since=cutoff_date)
+        total_failures = sum(failure_patterns.values())
 
-        if len(failed_jobs) < self.min_failure_count:
+        if total_failures < self.min_failure_count:
             logger.debug(
-                f"Not enough failures to analyze ({len(failed_jobs)} < {self.min_failure_count})"
+                f"Not enough failures to analyze ({total_failures} < {self.min_failure_count})"
             )
             return goals
 
-        # Group failures by failure_reason (if stored in metadata)
-        failure_patterns: Dict[str, int] = {}
-        for job in failed_jobs:
-            reason = job.job_metadata.get("failure_reason", "unknown")
-            failure_patterns[reason] = failure_patterns.get(reason, 0) + 1
-
         # Generate goals for top failure patterns
         for reason, count in sorted(
             failure_patterns.items(), key=lambda x: x[1], reverse=True
@@ -263,6 +257,16 @@ class GoalGenerator:
 
         return goals
 
+    def _refresh_rollups(self, session: Session) -> None:
+        """Advance the analytics rollups; failures only cost the speed-up."""
+        try:
+            AnalyticsRollup(session).refresh()
+            session.commit()
+        except SQLAlchemyError as exc:
+            # Readers aggregate rows past the watermark live, so results stay exact
+            logger.warning(f"Analytics rollup refresh failed: {exc}")
+            session.rollback()
+
     def _detect_knowledge_gaps(self, session: Session) -> List[Goal]:
         """Identify gaps in knowledge base.
 
@@ -376,10 +376,9 @@ async def task_execution_cycle() -> None:
         # Import task executor
         from .task_executor import TaskExecutor
 
-        # Initialize executor (lock_manager will be injected during app startup)
         task_exec = TaskExecutor()
 
-        # Execute ready tasks (now with distributed locking)
+        # Execute ready tasks (claimed with row locks, so replicas never overlap)
         logger.info("⚙️ Checking for ready tasks...")
         executed_tasks = await task_exec.execute_ready_tasks(limit=5)
 
@@ -3,7 +3,9 @@
 Executes tasks based on task_type, updating status and managing dependencies.
 
 Features:
-- Distributed locking to prevent race conditions in concurrent job execution
+- Atomic task claiming (SELECT ... FOR UPDATE SKIP LOCKED) so concurrent
+  executors never run the same task
+- Bounded worker pool with per-task-type concurrency caps
 - Task type routing (research_gather, research_synthesize, kb_create, etc.)
 - Dependency management
 - Project/goal status tracking
@@ -13,15 +15,16 @@ import asyncio
 import logging
 import subprocess
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 import structlog
 import redis.asyncio as aioredis
-from sqlalchemy import select, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import select, and_, or_
+from sqlalchemy.orm import Session, aliased
 
 from common.config import settings
 from common.db.models import (
@@ -37,12 +40,21 @@ from common.db import SessionLocal
 from brain.routing.cloud_clients import MCPClient
 from brain.agents.collective.graph_async import build_collective_graph_async
 from brain.knowledge.updater import KnowledgeUpdater
-from brain.autonomous.distributed_lock import LockManager, get_lock_manager
 
 logger = logging.getLogger(__name__)
 struct_logger = structlog.get_logger()
 
 
+def _parse_type_limits(spec: str) -> Dict[str, int]:
+    """Parse "kb_create:1,review_commit:1" into {"kb_create": 1, "review_commit": 1}."""
+    limits: Dict[str, int] = {}
+    for item in (spec or "").split(","):
+        name, _, value = item.strip().partition(":")
+        if name and value.strip().isdigit():
+            limits[name.strip()] = int(value)
+    return limits
+
+
 class TaskExecutor:
     """Executes autonomous tasks based on task_type.
 
@@ -59,7 +71,9 @@ class TaskExecutor:
         session_factory=SessionLocal,
         mcp_client: Optional[MCPClient] = None,
         kb_updater: Optional[KnowledgeUpdater] = None,
-        lock_manager: Optional[LockManager] = None,
+        max_workers: Optional[int] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+        claim_timeout: Optional[timedelta] = None,
     ):
         """Initialize task executor.
 
@@ -67,11 +81,22 @@ class TaskExecutor:
             session_factory: SQLAlchemy session factory
             mcp_client: Perplexity MCP client (optional, will create if needed)
             kb_updater: Knowledge base updater (optional, will create if needed)
-            lock_manager: Distributed lock manager (optional, uses global if not provided)
+            max_workers: Tasks executed concurrently (default: settings.autonomous_task_workers)
+            type_limits: Per task_type concurrency caps
+                (default: parsed from settings.autonomous_task_type_limits)
+            claim_timeout: Age after which an in_progress task is considered
+                abandoned (crashed executor) and may be claimed again
         """
         self._session_factory = session_factory
-        # Use provided lock manager, or fallback to global instance
-        self._lock_manager = lock_manager or get_lock_manager()
+
+        self.max_workers = max(1, max_workers or settings.autonomous_task_workers)
+        if type_limits is None:
+            type_limits = _parse_type_limits(settings.autonomous_task_type_limits)
+        self._type_limits = type_limits
+        self._type_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._claim_timeout = claim_timeout or timedelta(
+            minutes=settings.autonomous_task_claim_timeout_minutes
+        )
 
         # Initialize Perplexity MCP client
         if mcp_client:
@@ -121,155 +146,191 @@ class TaskExecutor:
         return (tokens / 1_000_000) * rate
 
     async def execute_ready_tasks(self, limit: int = 5) -> List[Task]:
-        """Execute tasks that are ready to run with distributed locking.
+        """Claim ready tasks and execute them on a bounded worker pool.
 
         A task is ready if:
-        - status = pending
+        - status = pending (or in_progress but abandoned past the claim timeout)
         - depends_on is None OR depends_on task has status = completed
-        - NOT currently locked (being executed by another job)
 
-        Uses distributed locking to prevent race conditions when multiple
-        APScheduler jobs run concurrently.
+        Ready tasks are claimed in one statement with FOR UPDATE SKIP LOCKED
+        and flipped to in_progress before commit, so concurrent executors
+        (APScheduler jobs or brain replicas) never claim the same task.
+        Each claimed task then runs in its own thread with its own session,
+        at most ``max_workers`` at a time and within per-task-type caps. The
+        worker threads only live for the cycle.
 
         Args:
-            limit: Maximum number of tasks to execute in one cycle
+            limit: Maximum number of tasks to claim in one cycle
 
         Returns:
-            List of executed Task objects
+            List of executed Task objects (detached, attributes loaded)
         """
         struct_logger.info("task_execution_started", limit=limit)
 
-        with self._session_factory() as session:
-            # Find ready tasks
-            ready_tasks = self._find_ready_tasks(session, limit)
-
-            if not ready_tasks:
-                logger.info("No tasks ready for execution")
-                struct_logger.info("task_execution_no_tasks")
-                return []
-
-            logger.info(f"Found {len(ready_tasks)} tasks ready for execution")
-
-            executed_tasks = []
-            for task in ready_tasks:
-                try:
-                    # Try to acquire distributed lock for this task
-                    if self._lock_manager:
-                        try:
-                            async with self._lock_manager.lock_task(task.id):
-                                # Lock acquired - execute task
-                                success = await self._execute_task_async(task, session)
-
-                                if success:
-                                    executed_tasks.append(task)
-                                    logger.info(
-                                        f"✅ Task executed: {task.title} (ID: {task.id[:16]}...)"
-                                    )
-                                else:
-                                    logger.warning(
-                                        f"⚠️ Task execution incomplete: {task.title}"
-                                    )
-                        except RuntimeError as lock_err:
-                            # Failed to acquire lock - task is being executed by another job
-                            logger.info(
-                                f"⏭️ Skipping task (locked by another job): {task.title}"
-                            )
-                            continue
-                    else:
-                        # No lock manager - execute without locking (backwards compatible)
-                        logger.warning(
-                            "LockManager not configured - executing without distributed locks"
-                        )
-                        success = await self._execute_task_async(task, session)
-
-                        if success:
-                            executed_tasks.append(task)
-                            logger.info(
-                                f"✅ Task executed: {task.title} (ID: {task.id[:16]}...)"
-                            )
-                        else:
-                            logger.warning(
-                                f"⚠️ Task execution incomplete: {task.title}"
-                            )
-
-                except Exception as exc:
-                    logger.error(
-                        f"Failed to execute task {task.id}: {exc}",
-                        exc_info=True
-                    )
-                    # Mark task as failed
-                    task.status = TaskStatus.failed
-                    task.result = {
-                        "error": str(exc),
-                        "failed_at": datetime.utcnow().isoformat(),
-                    }
-                    session.commit()
-                    continue
+        claimed = await asyncio.to_thread(self._claim_ready_tasks, limit)
+        if not claimed:
+            logger.info("No tasks ready for execution")
+            struct_logger.info("task_execution_no_tasks")
+            return []
 
-            # Check for completed projects
-            self._update_project_status(session)
+        logger.info(f"Claimed {len(claimed)} tasks for execution")
 
-            struct_logger.info(
-                "task_execution_completed",
-                tasks_executed=len(executed_tasks),
-                task_ids=[t.id for t in executed_tasks],
-                skipped=len(ready_tasks) - len(executed_tasks)
+        workers = asyncio.Semaphore(self.max_workers)
+        # Dedicated threads: the loop's default executor may be smaller than max_workers
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="task-executor")
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    self._run_claimed_task(task_id, task_type, workers, pool)
+                    for task_id, task_type in claimed
+                )
             )
+        finally:
+            # Running tasks finish in their threads; don't block the loop on them
+            pool.shutdown(wait=False)
+        executed_tasks = [task for task in outcomes if task is not None]
 
-            return executed_tasks
+        # Check for completed projects
+        await asyncio.to_thread(self._update_project_status_in_session)
 
-    def _find_ready_tasks(self, session: Session, limit: int) -> List[Task]:
-        """Find tasks ready for execution.
+        struct_logger.info(
+            "task_execution_completed",
+            tasks_executed=len(executed_tasks),
+            task_ids=[t.id for t in executed_tasks],
+            skipped=len(claimed) - len(executed_tasks)
+        )
 
-        Args:
-            session: Database session
-            limit: Maximum tasks to return
+        return executed_tasks
 
-        Returns:
-            List of ready Task objects
+    def _ready_tasks_query(
+        self, limit: int, now: Optional[datetime] = None, for_update: bool = True
+    ):
+        """Build the set-based readiness query used for claiming.
+
+        Joins each task to its dependency once instead of loading
+        dependencies one by one. When ``for_update`` is set, only the
+        candidate task rows are locked and rows locked by another executor
+        are skipped rather than waited on.
         """
-        # Query for pending tasks
+        now = now or datetime.utcnow()
+        dependency = aliased(Task)
         stmt = (
             select(Task)
-            .where(Task.status == TaskStatus.pending)
+            .outerjoin(dependency, Task.depends_on == dependency.id)
+            .where(
+                or_(
+                    Task.status == TaskStatus.pending,
+                    and_(
+                        Task.status == TaskStatus.in_progress,
+                        Task.started_at < now - self._claim_timeout,
+                    ),
+                ),
+                or_(Task.depends_on.is_(None), dependency.status == TaskStatus.completed),
+            )
             .order_by(Task.priority.desc())  # High priority first
-            .limit(limit * 3)  # Get extra to filter dependencies
+            .limit(limit)
         )
+        if for_update:
+            stmt = stmt.with_for_update(of=Task, skip_locked=True)
+        return stmt
 
-        pending_tasks = session.execute(stmt).scalars().all()
+    def _claim_ready_tasks(self, limit: int) -> List[Tuple[str, str]]:
+        """Atomically claim up to ``limit`` ready tasks.
 
-        # Filter by dependency status
-        ready_tasks = []
-        for task in pending_tasks:
-            if task.depends_on is None:
-                # No dependencies, ready to run
-                ready_tasks.append(task)
-            else:
-                # Check if dependency is completed
-                dependency = session.get(Task, task.depends_on)
-                if dependency and dependency.status == TaskStatus.completed:
-                    ready_tasks.append(task)
-
-            if len(ready_tasks) >= limit:
-                break
-
-        return ready_tasks
+        Returns:
+            (task_id, task_type) pairs now marked in_progress
+        """
+        now = datetime.utcnow()
+        with self._session_factory() as session:
+            tasks = session.execute(self._ready_tasks_query(limit, now)).scalars().all()
+            claimed = []
+            for task in tasks:
+                task.status = TaskStatus.in_progress
+                task.started_at = now
+                claimed.append((task.id, (task.task_metadata or {}).get("task_type", "unknown")))
+            session.commit()
+        return claimed
+
+    def _type_semaphore(self, task_type: str) -> Optional[asyncio.Semaphore]:
+        limit = self._type_limits.get(task_type)
+        if limit is None:
+            return None
+        semaphore = self._type_semaphores.get(task_type)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._type_semaphores[task_type] = semaphore
+        return semaphore
+
+    async def _run_claimed_task(
+        self,
+        task_id: str,
+        task_type: str,
+        workers: asyncio.Semaphore,
+        pool: ThreadPoolExecutor,
+    ) -> Optional[Task]:
+        """Run one claimed task within the worker and task-type limits."""
+        type_semaphore = self._type_semaphore(task_type)
+        loop = asyncio.get_running_loop()
+        if type_semaphore is None:
+            async with workers:
+                return await loop.run_in_executor(pool, self._execute_claimed_task, task_id)
+        # Wait for the type cap before taking a worker slot, so capped task
+        # types never block other types from running
+        async with type_semaphore, workers:
+            return await loop.run_in_executor(pool, self._execute_claimed_task, task_id)
+
+    def _execute_claimed_task(self, task_id: str) -> Optional[Task]:
+        """Execute a claimed task in a dedicated session (runs in a worker thread).
 
-    async def _execute_task_async(self, task: Task, session: Session) -> bool:
-        """Async wrapper for task execution.
+        Returns:
+            The detached Task if it completed, None otherwise
+        """
+        with self._session_factory() as session:
+            task = session.get(Task, task_id)
+            if task is None:
+                return None
+            try:
+                success = self._execute_task(task, session)
+            except Exception as exc:
+                logger.error(
+                    f"Failed to execute task {task_id}: {exc}",
+                    exc_info=True
+                )
+                session.rollback()
+                task.status = TaskStatus.failed
+                task.result = {
+                    "error": str(exc),
+                    "failed_at": datetime.utcnow().isoformat(),
+                }
+                session.commit()
+                return None
+
+            if not success:
+                logger.warning(f"⚠️ Task execution incomplete: {task.title}")
+                return None
+
+            # Load attributes before the session closes so callers can read them
+            session.refresh(task)
+            session.expunge(task)
+            logger.info(f"✅ Task executed: {task.title} (ID: {task.id[:16]}...)")
+            return task
 
-        Runs the synchronous _execute_task in a thread pool to avoid blocking
-        the event loop during long-running task execution.
+    def _find_ready_tasks(self, session: Session, limit: int) -> List[Task]:
+        """Find tasks ready for execution without claiming them.
 
         Args:
-            task: Task object to execute
             session: Database session
+            limit: Maximum tasks to return
 
         Returns:
-            True if task completed successfully, False otherwise
+            List of ready Task objects
         """
-        # Run synchronous task execution in thread pool
-        return await asyncio.to_thread(self._execute_task, task, session)
+        stmt = self._ready_tasks_query(limit, for_update=False)
+        return list(session.execute(stmt).scalars().all())
+
+    def _update_project_status_in_session(self) -> None:
+        with self._session_factory() as session:
+            self._update_project_status(session)
 
     def _execute_task(self, task: Task, session: Session) -> bool:
         """Execute a single task based on task_type.
@@ -3,13 +3,18 @@
 Wraps ConversationState to automatically persist changes to database
 after each state modification. This ensures consistency and prevents
 data loss without requiring manual save() calls.
+
+Changes made within a short window (``DEFAULT_FLUSH_WINDOW_SECONDS``) are
+coalesced into one write: new agent steps are appended as rows and the
+header (metadata, pending confirmation) is upserted once. Hazard
+confirmation changes bypass the window and flush immediately.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 from brain.agents.types import AgentStep
 from brain.conversation.state import ConversationState
@@ -17,16 +22,19 @@ from brain.conversation.persistent_state import PersistentConversationStateManag
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FLUSH_WINDOW_SECONDS = 0.25
+
 
 class AutoPersistConversationState(ConversationState):
     """ConversationState that automatically persists changes.
 
-    Wraps ConversationState and persists to database after each mutation.
+    Wraps ConversationState and persists to database after mutations.
     This prevents data loss and ensures hazard confirmations survive restarts.
 
     Attributes:
         _manager: PersistentConversationStateManager for database operations
-        _persist_task: Background task for async persistence
+        _persist_task: Pending windowed flush, if one is scheduled
+        _persisted_steps: Number of history steps already stored
     """
 
     def __init__(
@@ -34,6 +42,7 @@ class AutoPersistConversationState(ConversationState):
         conversation_id: str,
         user_id: str,
         manager: PersistentConversationStateManager,
+        flush_window: float = DEFAULT_FLUSH_WINDOW_SECONDS,
         **kwargs
     ):
         """Initialize auto-persisting conversation state.
@@ -42,11 +51,18 @@ class AutoPersistConversationState(ConversationState):
             conversation_id: Unique conversation identifier
             user_id: User identifier
             manager: PersistentConversationStateManager instance
+            flush_window: Seconds to coalesce non-critical changes before writing
             **kwargs: Additional ConversationState fields
         """
         super().__init__(conversation_id=conversation_id, user_id=user_id, **kwargs)
         self._manager = manager
+        self._flush_window = flush_window
         self._persist_task: Optional[asyncio.Task] = None
+        self._immediate_tasks: Set[asyncio.Task] = set()
+        self._flush_lock = asyncio.Lock()
+        # History loaded from the database is already stored
+        self._persisted_steps = len(self.history)
+        self._header_dirty = False
 
     def add_step(self, step: AgentStep) -> None:
         """Add a reasoning step and persist to database.
@@ -69,6 +85,7 @@ class AutoPersistConversationState(ConversationState):
 
         CRITICAL: This immediately persists to ensure hazard confirmations
         survive restart. Double-execution of hazard operations must be prevented.
+        Async callers should ``await flush()`` to know the write is durable.
 
         Args:
             tool_name: Name of the tool awaiting confirmation
@@ -82,6 +99,7 @@ class AutoPersistConversationState(ConversationState):
         )
 
         # CRITICAL: Persist immediately for hazard operations
+        self._header_dirty = True
         self._schedule_persist(immediate=True)
 
         logger.warning(
@@ -99,6 +117,7 @@ class AutoPersistConversationState(ConversationState):
 
         if pending:
             # CRITICAL: Persist immediately when clearing hazard confirmation
+            self._header_dirty = True
             self._schedule_persist(immediate=True)
 
             logger.info(
@@ -116,54 +135,85 @@ class AutoPersistConversationState(ConversationState):
             value: Metadata value
         """
         super().update_metadata(key, value)
+        self._header_dirty = True
         self._schedule_persist()
 
+    async def flush(self) -> bool:
+        """Write all unsaved changes now and wait for the write to finish.
+
+        Returns:
+            True if nothing was pending or the write succeeded
+        """
+        # A still-pending windowed flush finds nothing left to write
+        return await self._persist()
+
     def _schedule_persist(self, immediate: bool = False) -> None:
         """Schedule persistence to database.
 
+        Non-critical changes start a flush window on first change; later
+        changes inside the window ride along with that single write.
+
         Args:
-            immediate: If True, persist synchronously (blocks). Use for critical operations.
+            immediate: If True, flush without waiting for the window. Use for critical operations.
         """
-        if immediate:
-            # For critical operations (hazard confirmations), persist immediately
-            # This runs in the event loop but blocks until complete
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            # No event loop: persist synchronously (blocks)
             try:
-                # Create a new task and wait for it
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Schedule as background task if loop is running
-                    asyncio.create_task(self._persist())
-                else:
-                    # Run synchronously if no loop
-                    loop.run_until_complete(self._persist())
+                asyncio.run(self._persist())
             except Exception as e:
                 logger.error(f"Critical error persisting conversation state: {e}")
-                # Re-raise for critical operations
-                raise
-        else:
-            # For non-critical operations, debounce persistence
-            if self._persist_task and not self._persist_task.done():
-                self._persist_task.cancel()
+                if immediate:
+                    raise
+            return
 
-            self._persist_task = asyncio.create_task(self._persist())
+        if immediate:
+            # Carries everything pending in the window too; the windowed
+            # flush then finds nothing left to write
+            task = loop.create_task(self._persist())
+            self._immediate_tasks.add(task)
+            task.add_done_callback(self._immediate_tasks.discard)
+        elif self._persist_task is None or self._persist_task.done():
+            self._persist_task = loop.create_task(self._persist_after_window())
+
+    async def _persist_after_window(self) -> None:
+        await asyncio.sleep(self._flush_window)
+        await self._persist()
 
-    async def _persist(self) -> None:
-        """Persist state to database.
+    async def _persist(self) -> bool:
+        """Persist unsaved header changes and new steps to database.
 
         Logs errors but does not raise to prevent disrupting conversation flow.
+        Failed writes stay pending and are retried by the next flush.
         """
-        try:
-            success = await self._manager.save(self)
+        async with self._flush_lock:
+            first_new_step = self._persisted_steps
+            step_count = len(self.history)
+            if step_count == first_new_step and not self._header_dirty:
+                return True
+            header_dirty, self._header_dirty = self._header_dirty, False
 
-            if not success:
+            try:
+                success = await self._manager.append(self, first_new_step)
+            except Exception as e:
+                logger.error(
+                    f"Exception persisting conversation state {self.conversation_id}: {e}",
+                    exc_info=True
+                )
+                success = False
+
+            if success:
+                self._persisted_steps = max(self._persisted_steps, step_count)
+            else:
+                self._header_dirty = self._header_dirty or header_dirty
                 logger.error(
                     f"Failed to persist conversation state {self.conversation_id}"
                 )
-        except Exception as e:
-            logger.error(
-                f"Exception persisting conversation state {self.conversation_id}: {e}",
-                exc_info=True
-            )
+            return success
 
 
 class AutoPersistStateManager:
@@ -1,7 +1,7 @@
 """PostgreSQL-backed persistent conversation state management.
 
 Provides durable storage for conversation state including:
-- Agent reasoning history
+- Agent reasoning history (append-only, one conversation_steps row per step)
 - Pending hazard confirmations
 - Conversation metadata
 
@@ -87,14 +87,23 @@ class PersistentConversationStateManager:
         try:
             async with self.pool.connection() as conn:
                 async with conn.cursor() as cur:
+                    # Header row plus its ordered steps in one round trip
                     await cur.execute(
                         """
                         SELECT
-                            id, context_key, user_id,
-                            agent_history, pending_confirmation,
-                            conversation_metadata, created_at, updated_at
-                        FROM conversation_sessions
-                        WHERE id = %s OR context_key = %s
+                            c.id, c.context_key, c.user_id,
+                            COALESCE(
+                                (
+                                    SELECT jsonb_agg(s.step ORDER BY s.step_index)
+                                    FROM conversation_steps s
+                                    WHERE s.conversation_id = c.id
+                                ),
+                                c.agent_history
+                            ),
+                            c.pending_confirmation,
+                            c.conversation_metadata, c.created_at, c.updated_at
+                        FROM conversation_sessions c
+                        WHERE c.id = %s OR c.context_key = %s
                         """,
                         (conversation_id, conversation_id)
                     )
@@ -123,6 +132,21 @@ class PersistentConversationStateManager:
         """
         return await self._persist(state)
 
+    async def append(self, state: ConversationState, first_new_step: int) -> bool:
+        """Persist the header and only the steps from ``first_new_step`` on.
+
+        Write cost is independent of how long the history already is: one
+        header upsert plus one insert per new step, in a single transaction.
+
+        Args:
+            state: ConversationState to persist
+            first_new_step: Index of the first step not yet stored
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._persist(state, first_new_step)
+
     async def delete(self, conversation_id: str) -> bool:
         """Delete a conversation state from database.
 
@@ -240,11 +264,12 @@ class PersistentConversationStateManager:
 
     # Private methods
 
-    async def _persist(self, state: ConversationState) -> bool:
-        """Persist conversation state to database.
+    async def _persist(self, state: ConversationState, first_new_step: int = 0) -> bool:
+        """Persist conversation header and steps to database.
 
         Args:
             state: ConversationState to persist
+            first_new_step: Steps before this index are assumed stored already
 
         Returns:
             True if successful, False otherwise
@@ -252,24 +277,29 @@ class PersistentConversationStateManager:
         try:
             # Serialize state to JSON-compatible format
             serialized = self._serialize_state(state)
+            steps = [
+                (serialized["id"], index, Json(self._serialize_agent_step(step)))
+                for index, step in enumerate(
+                    state.history[first_new_step:], start=first_new_step
+                )
+            ]
 
             async with self.pool.connection() as conn:
                 async with conn.cursor() as cur:
-                    # Upsert conversation state
+                    # Upsert conversation header (history lives in conversation_steps)
                     await cur.execute(
                         """
                         INSERT INTO conversation_sessions (
                             id, context_key, user_id,
-                            agent_history, pending_confirmation, conversation_metadata,
+                            pending_confirmation, conversation_metadata,
                             state, active_participants,
                             last_message_at, created_at, updated_at
                         ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s,
+                            %s, %s, %s, %s, %s, %s, %s,
                             NOW(), NOW(), NOW()
                         )
                         ON CONFLICT (id) DO UPDATE SET
                             user_id = EXCLUDED.user_id,
-                            agent_history = EXCLUDED.agent_history,
                             pending_confirmation = EXCLUDED.pending_confirmation,
                             conversation_metadata = EXCLUDED.conversation_metadata,
                             state = EXCLUDED.state,
@@ -279,16 +309,28 @@ class PersistentConversationStateManager:
                             serialized["id"],
                             serialized["context_key"],
                             serialized["user_id"],
-                            Json(serialized["agent_history"]),
                             Json(serialized["pending_confirmation"]) if serialized["pending_confirmation"] else None,
                             Json(serialized["conversation_metadata"]),
                             Json({"updated_at": serialized["updated_at"]}),  # Legacy state field
                             Json([]),  # active_participants
                         )
                     )
+
+                    if steps:
+                        await cur.executemany(
+                            """
+                            INSERT INTO conversation_steps (conversation_id, step_index, step)
+                            VALUES (%s, %s, %s)
+                            ON CONFLICT (conversation_id, step_index) DO NOTHING
+                            """,
+                            steps,
+                        )
                     await conn.commit()
 
-                    logger.debug(f"Persisted conversation state: {state.conversation_id}")
+                    logger.debug(
+                        f"Persisted conversation state: {state.conversation_id} "
+                        f"(+{len(steps)} steps)"
+                    )
                     return True
 
         except Exception as e:
@@ -296,7 +338,7 @@ class PersistentConversationStateManager:
             return False
 
     def _serialize_state(self, state: ConversationState) -> Dict[str, Any]:
-        """Serialize ConversationState to JSON-compatible dict.
+        """Serialize ConversationState header fields to a JSON-compatible dict.
 
         Args:
             state: ConversationState to serialize
@@ -308,7 +350,6 @@ class PersistentConversationStateManager:
             "id": state.conversation_id,
             "context_key": state.conversation_id,
             "user_id": state.user_id,
-            "agent_history": [self._serialize_agent_step(step) for step in state.history],
             "pending_confirmation": state.pending_confirmation,
             "conversation_metadata": state.metadata,
             "created_at": state.created_at,
@@ -329,7 +370,7 @@ class PersistentConversationStateManager:
             "action": step.action,
             "action_input": step.action_input,
             "observation": step.observation,
-            "error": step.error,
+            "is_final": step.is_final,
             "timestamp": getattr(step, "timestamp", time.time())
         }
 
@@ -389,7 +430,7 @@ class PersistentConversationStateManager:
             action=step_dict.get("action", ""),
             action_input=step_dict.get("action_input"),
             observation=step_dict.get("observation"),
-            error=step_dict.get("error")
+            is_final=step_dict.get("is_final", False),
         )
 
 
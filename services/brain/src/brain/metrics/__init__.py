@@ -75,6 +75,27 @@ AUTONOMY_CAN_RUN = Gauge(
     labelnames=("workload",),
 )
 
+CONTEXT_PUBLISHES = Counter(
+    "kitty_context_publishes_total",
+    "Conversation context MQTT messages by kind (delta, snapshot)",
+    labelnames=("kind",),
+)
+
+CONTEXT_UPDATES_COALESCED = Counter(
+    "kitty_context_updates_coalesced_total",
+    "Context updates superseded before they were published",
+)
+
+CONTEXT_PUBLISH_DEFERRED = Counter(
+    "kitty_context_publish_deferred_total",
+    "Context publishes postponed because the outbound queue was full",
+)
+
+CONTEXT_OUTBOUND_QUEUE = Gauge(
+    "kitty_context_outbound_queue",
+    "QoS 1 context messages awaiting broker acknowledgement",
+)
+
 
 def record_decision(
     *, tier: str, latency_ms: int, cost: float, local_ratio: Optional[float] = None
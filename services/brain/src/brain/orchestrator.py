@@ -594,6 +594,10 @@ class BrainOrchestrator:
             hazard_class=hazard_class,
             reason=reason,
         )
+        # Auto-persisting states: wait until the confirmation is durable
+        flush = getattr(conv_state, "flush", None)
+        if flush is not None:
+            await flush()
         logger.info(
             f"Set pending confirmation for {tool_name} in conversation {conversation_id}"
         )
@@ -618,5 +622,9 @@ class BrainOrchestrator:
             return True
         return False
 
+    async def aclose(self) -> None:
+        """Close clients held by the router's tools on shutdown."""
+        await self._router.aclose()
+
 
 __all__ = ["BrainOrchestrator"]
@@ -0,0 +1,227 @@
+"""
+Cross-session claim fingerprint index.
+
+Claims are keyed by ``dedupe_fingerprint`` in the ``research_claim_index``
+table (migration 009). A whole batch of fingerprints is looked up in one
+query:
+- Extraction copies stored scores onto known claims; their new evidence
+  is still persisted with the session's claim and counted in the index
+- ``CollectiveEvaluator.evaluate_batch`` reuses stored evaluations, so only
+  new claims cost LLM calls
+
+Research sessions do not run the collective evaluator, so within a session
+the index only reuses scores; the claim extraction call itself is always
+made. Reuse is measured by the counters in ``brain.research.metrics``.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from psycopg.types.json import Json
+
+from .metrics.claim_reuse import CLAIM_INDEX_LOOKUPS
+from .types import Claim
+
+logger = logging.getLogger(__name__)
+
+_LOOKUP_SQL = """
+    SELECT fingerprint, claim_id, claim_text, claim_type, entailment_score,
+           provenance_score, confidence, evaluation, evidence_count, session_count
+    FROM research_claim_index
+    WHERE fingerprint = ANY(%s)
+"""
+
+_UPSERT_PREFIX = """
+    INSERT INTO research_claim_index AS idx
+    (fingerprint, claim_id, claim_text, claim_type, entailment_score, provenance_score,
+     confidence, evaluation, evidence_count, first_session_id, last_session_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (fingerprint) DO UPDATE SET
+"""
+
+_UPSERT_SCORES = """
+        entailment_score = EXCLUDED.entailment_score,
+        provenance_score = EXCLUDED.provenance_score,
+        confidence = EXCLUDED.confidence,
+"""
+
+_UPSERT_COUNTS = """
+        evaluation = CASE WHEN EXCLUDED.evaluation = '{}'::jsonb
+                          THEN idx.evaluation ELSE EXCLUDED.evaluation END,
+        evidence_count = idx.evidence_count + EXCLUDED.evidence_count,
+        session_count = idx.session_count + CASE
+            WHEN EXCLUDED.last_session_id IS NOT NULL
+                 AND idx.last_session_id IS DISTINCT FROM EXCLUDED.last_session_id
+            THEN 1 ELSE 0 END,
+        last_session_id = COALESCE(EXCLUDED.last_session_id, idx.last_session_id),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Session records own the scores; evaluation-only records leave stored scores alone
+_UPSERT_SQL = _UPSERT_PREFIX + _UPSERT_SCORES + _UPSERT_COUNTS
+_UPSERT_EVALUATION_SQL = _UPSERT_PREFIX + _UPSERT_COUNTS
+
+
+@dataclass
+class KnownClaim:
+    """A claim already recorded by an earlier session."""
+    fingerprint: str
+    claim_id: str
+    claim_text: str
+    claim_type: str
+    entailment_score: float
+    provenance_score: float
+    confidence: float
+    evaluation: Dict[str, Any] = field(default_factory=dict)
+    evidence_count: int = 0
+    session_count: int = 1
+
+
+@dataclass
+class IndexEntry:
+    """One row to record in the index."""
+    fingerprint: str
+    claim_id: str
+    claim_text: str
+    claim_type: str = "fact"
+    entailment_score: float = 0.0
+    provenance_score: float = 0.0
+    confidence: float = 0.0
+    evaluation: Dict[str, Any] = field(default_factory=dict)
+    evidence_count: int = 0
+
+    @classmethod
+    def from_claim(cls, claim: Claim) -> "IndexEntry":
+        return cls(
+            fingerprint=claim.dedupe_fingerprint,
+            claim_id=claim.id,
+            claim_text=claim.text,
+            claim_type=getattr(claim, "claim_type", "fact"),
+            entailment_score=claim.entailment_score,
+            provenance_score=claim.provenance_score,
+            confidence=claim.confidence,
+            evidence_count=len(claim.evidence),
+        )
+
+
+class ClaimFingerprintIndex:
+    """
+    Bulk lookups and upserts against ``research_claim_index``.
+
+    Example usage:
+        index = ClaimFingerprintIndex(pool)
+        new_claims = await index.apply_known(claims)  # one query per batch
+    """
+
+    def __init__(self, connection_pool):
+        """
+        Args:
+            connection_pool: psycopg AsyncConnectionPool
+        """
+        self.pool = connection_pool
+
+    async def lookup_many(self, fingerprints: Iterable[str]) -> Dict[str, KnownClaim]:
+        """
+        Look up a batch of fingerprints with one query.
+
+        Args:
+            fingerprints: Claim fingerprints (duplicates and blanks ignored)
+
+        Returns:
+            Dict mapping each known fingerprint to its index entry
+        """
+        unique = list(dict.fromkeys(fp for fp in fingerprints if fp))
+        if not unique:
+            return {}
+
+        async with self.pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(_LOOKUP_SQL, (unique,))
+                rows = await cur.fetchall()
+
+        known = {row[0]: KnownClaim(*row[:7], row[7] or {}, *row[8:]) for row in rows}
+        CLAIM_INDEX_LOOKUPS.labels(result="known").inc(len(known))
+        CLAIM_INDEX_LOOKUPS.labels(result="new").inc(len(unique) - len(known))
+        logger.debug(f"Claim index: {len(known)}/{len(unique)} fingerprints already known")
+        return known
+
+    async def apply_known(self, claims: List[Claim]) -> List[Claim]:
+        """
+        Copy stored scores onto claims the index already knows.
+
+        Known claims keep their own ID and evidence (persisted with the
+        session as usual) but take the stored entailment score and
+        confidence.
+
+        Args:
+            claims: Freshly extracted claims
+
+        Returns:
+            The claims that are new to the index, in input order
+        """
+        known = await self.lookup_many(claim.dedupe_fingerprint for claim in claims)
+        new_claims = []
+        for claim in claims:
+            entry = known.get(claim.dedupe_fingerprint)
+            if entry is None:
+                new_claims.append(claim)
+                continue
+            claim.entailment_score = entry.entailment_score
+            claim.confidence = max(claim.confidence, entry.confidence)
+        if known:
+            logger.info(
+                f"Reused scores for {len(claims) - len(new_claims)} of {len(claims)} "
+                f"claims known from earlier sessions"
+            )
+        return new_claims
+
+    async def record(
+        self,
+        entries: Sequence[IndexEntry],
+        session_id: Optional[str] = None,
+        conn=None,
+        update_scores: bool = True,
+    ) -> None:
+        """
+        Upsert index entries, adding their evidence to known claims' counts.
+
+        Args:
+            entries: Rows to record
+            session_id: Session the entries came from (None for offline evaluation)
+            conn: Open connection to join its transaction (default: from the pool)
+            update_scores: Overwrite known claims' entailment, provenance and
+                confidence; False records only the evaluation and evidence
+        """
+        if not entries:
+            return
+        if conn is None:
+            async with self.pool.connection() as owned:
+                async with owned.transaction():
+                    await self.record(entries, session_id, owned, update_scores)
+            return
+
+        rows = [
+            (
+                entry.fingerprint,
+                entry.claim_id,
+                entry.claim_text,
+                entry.claim_type,
+                entry.entailment_score,
+                entry.provenance_score,
+                entry.confidence,
+                Json(entry.evaluation),
+                entry.evidence_count,
+                session_id,
+                session_id,
+            )
+            for entry in entries
+            if entry.fingerprint
+        ]
+        async with conn.cursor() as cur:
+            # executemany runs in pipeline mode: one round trip for the batch
+            await cur.executemany(_UPSERT_SQL if update_scores else _UPSERT_EVALUATION_SQL, rows)
+
+    async def record_claims(self, session_id: str, claims: Sequence[Claim], conn=None) -> None:
+        """Record a session's final claims (see ``record``)."""
+        await self.record([IndexEntry.from_claim(claim) for claim in claims], session_id, conn)
@@ -0,0 +1,119 @@
+"""
+Client for the claim embedding index in the mem0-mcp service.
+
+Cross-referencing a session's claims goes through the bulk
+``/claims/find_related_batch`` endpoint: claims are sent in chunks, each
+chunk is encoded in one model pass and searched with one Qdrant batch
+request, and results come back grouped per input claim.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 300
+
+
+@dataclass
+class ClaimQuery:
+    """One related-claim lookup."""
+    claim_text: str
+    claim_id: Optional[str] = None
+    limit: int = 10
+    score_threshold: float = 0.7
+    topic_ids: Optional[List[str]] = None
+    exclude_claim_ids: List[str] = field(default_factory=list)
+
+    def to_request(self) -> Dict[str, Any]:
+        exclude = list(self.exclude_claim_ids)
+        # A claim is trivially related to itself
+        if self.claim_id and self.claim_id not in exclude:
+            exclude.append(self.claim_id)
+        return {
+            "claim_text": self.claim_text,
+            "limit": self.limit,
+            "score_threshold": self.score_threshold,
+            "topic_ids": self.topic_ids,
+            "exclude_claim_ids": exclude,
+        }
+
+
+@dataclass
+class RelatedClaim:
+    """A claim returned by the index."""
+    claim_id: str
+    paper_id: str
+    claim_text: str
+    claim_type: str
+    score: float
+    relation: str = "similar"
+
+
+class ClaimIndexClient:
+    """Bulk related-claim lookups against mem0-mcp."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: float = 60.0,
+    ):
+        """
+        Args:
+            base_url: mem0-mcp base URL (defaults to MEM0_MCP_URL env var)
+            chunk_size: Claims per request; each chunk is one encoder pass
+            timeout: Per-request timeout in seconds
+        """
+        self.base_url = base_url or os.getenv("MEM0_MCP_URL", "http://mem0-mcp:8765")
+        self.chunk_size = max(1, chunk_size)
+        self.timeout = timeout
+
+    async def find_related_batch(
+        self,
+        queries: Sequence[ClaimQuery],
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> List[List[RelatedClaim]]:
+        """
+        Find related claims for every query.
+
+        Args:
+            queries: Claims to cross-reference
+            client: Optional shared HTTP client
+
+        Returns:
+            One list of related claims per query, in input order
+        """
+        if not queries:
+            return []
+        if client is None:
+            async with httpx.AsyncClient(timeout=self.timeout) as owned:
+                return await self.find_related_batch(queries, owned)
+
+        related: List[List[RelatedClaim]] = []
+        for start in range(0, len(queries), self.chunk_size):
+            chunk = queries[start:start + self.chunk_size]
+            response = await client.post(
+                f"{self.base_url}/claims/find_related_batch",
+                json={"queries": [query.to_request() for query in chunk]},
+            )
+            response.raise_for_status()
+            results = response.json()["results"]
+            if len(results) != len(chunk):
+                raise ValueError(
+                    f"find_related_batch returned {len(results)} results for {len(chunk)} claims"
+                )
+            related.extend(
+                [RelatedClaim(**claim) for claim in result["related_claims"]]
+                for result in results
+            )
+        logger.debug(f"Cross-referenced {len(queries)} claims via {self.base_url}")
+        return related
+
+    async def find_related(self, query: ClaimQuery) -> List[RelatedClaim]:
+        """Single-claim convenience wrapper over the batch endpoint."""
+        return (await self.find_related_batch([query]))[0]
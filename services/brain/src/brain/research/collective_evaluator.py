@@ -18,11 +18,14 @@ Decision Thresholds:
 import asyncio
 import json
 import logging
+import os
 import re
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 import uuid
 
 import httpx
@@ -33,12 +36,28 @@ from .extraction_schemas import (
     EvaluationDecision,
     ClaimType,
 )
+from .metrics.claim_reuse import CLAIM_EVALUATION_CALLS, CLAIM_EVALUATION_CALLS_SKIPPED
+
+if TYPE_CHECKING:
+    from .claim_fingerprints import ClaimFingerprintIndex, KnownClaim
 
 logger = logging.getLogger(__name__)
 
 # Token limits (leave room for prompt overhead)
 MAX_BATCH_TOKENS = 28000
 
+# LLM calls for a full claim evaluation (accuracy, novelty, coherence)
+AGENTS_PER_CLAIM = 3
+
+# Tokens reserved per in-flight claim until real usage has been observed
+CLAIM_TOKEN_ESTIMATE = 2000
+
+# Concurrent requests the Q4 llama.cpp server can serve (its --parallel slots)
+DEFAULT_LLM_SLOTS = int(os.getenv("LLAMACPP_Q4_PARALLEL", "6"))
+
+# Calls the current agent task has sent to the server (see CollectiveEvaluator._slot)
+_started_calls: ContextVar[Optional["LLMUsage"]] = ContextVar("started_calls", default=None)
+
 
 class EvaluationDimension(str, Enum):
     """Dimensions for multi-agent evaluation."""
@@ -47,6 +66,24 @@ class EvaluationDimension(str, Enum):
     COHERENCE = "coherence"
 
 
+@dataclass
+class LLMUsage:
+    """LLM calls and tokens reported by the server."""
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, other: "LLMUsage") -> None:
+        """Accumulate another usage record into this one."""
+        self.calls += other.calls
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+
+
 @dataclass
 class AgentEvaluation:
     """Evaluation result from a single agent."""
@@ -56,6 +93,7 @@ class AgentEvaluation:
     reasoning: str
     issues_found: List[str] = field(default_factory=list)
     suggestions: List[str] = field(default_factory=list)
+    usage: LLMUsage = field(default_factory=LLMUsage)
 
 
 @dataclass
@@ -70,6 +108,7 @@ class CollectiveEvaluationResult:
     consensus_reasoning: str
     refinement_suggestions: List[str]
     evaluated_at: datetime = field(default_factory=datetime.utcnow)
+    usage: LLMUsage = field(default_factory=LLMUsage)
 
 
 @dataclass
@@ -83,6 +122,7 @@ class BatchEvaluationResult:
     results: List[CollectiveEvaluationResult]
     total_tokens_used: int
     duration_seconds: float
+    llm_calls: int = 0
 
 
 # Evaluation prompts for each dimension
@@ -195,7 +235,8 @@ class CollectiveEvaluator:
     """
     Multi-agent evaluator for research claims and dataset entries.
 
-    Uses multiple evaluation dimensions with consensus scoring.
+    Uses multiple evaluation dimensions with consensus scoring. LLM
+    requests are bounded by a semaphore sized to the server's slot count.
     """
 
     # Decision thresholds
@@ -207,10 +248,13 @@ class CollectiveEvaluator:
         q4_url: str = "http://localhost:8083/v1/chat/completions",
         ollama_url: str = "http://localhost:11434/api/generate",
         timeout: float = 120.0,
+        max_concurrency: int = DEFAULT_LLM_SLOTS,
     ):
         self.q4_url = q4_url
         self.ollama_url = ollama_url
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self._slots = asyncio.Semaphore(self.max_concurrency)
 
     async def evaluate_claim(
         self,
@@ -221,6 +265,12 @@ class CollectiveEvaluator:
         """
         Evaluate a single claim using multi-agent consensus.
 
+        Agents run concurrently. Once two of them have scored the claim
+        below the reject threshold, the remaining agent is cancelled. An
+        agent that had already been given a server slot still counts as a
+        call, charged the average tokens of the agents that finished, so
+        the returned usage covers every request sent to the server.
+
         Args:
             claim: The claim to evaluate
             related_claims: Related claims for novelty comparison
@@ -229,22 +279,49 @@ class CollectiveEvaluator:
         Returns:
             CollectiveEvaluationResult with decision and scores
         """
-        agent_evaluations = []
+        agent_evaluations: List[AgentEvaluation] = []
 
-        # Run evaluation agents in parallel
-        tasks = [
+        # Run evaluation agents in parallel (created in slot-priority order)
+        agents = [
             self._evaluate_accuracy(claim, paper_title),
             self._evaluate_novelty(claim, related_claims or []),
             self._evaluate_coherence(claim),
         ]
+        started: Dict[asyncio.Future, LLMUsage] = {}
+        for agent in agents:
+            calls = LLMUsage()
+            started[asyncio.ensure_future(self._run_agent(agent, calls))] = calls
+        pending = set(started)
+        finished = set()
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, AgentEvaluation):
-                agent_evaluations.append(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Evaluation agent failed: {result}")
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        logger.error(f"Evaluation agent failed: {task.exception()}")
+                    else:
+                        agent_evaluations.append(task.result())
+                        finished.add(task)
+
+                rejects = sum(1 for e in agent_evaluations if e.score < self.REFINE_THRESHOLD)
+                if pending and rejects >= 2:
+                    logger.debug(f"Claim {claim.id}: two agents reject, skipping the rest")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        usage = LLMUsage()
+        for evaluation in agent_evaluations:
+            usage.add(evaluation.usage)
+        # Requests of cancelled or failed agents were sent all the same
+        unreported = sum(calls.calls for task, calls in started.items() if task not in finished)
+        if unreported:
+            answered = max(1, usage.calls)
+            usage.calls += unreported
+            usage.prompt_tokens += unreported * usage.prompt_tokens // answered
+            usage.completion_tokens += unreported * usage.completion_tokens // answered
 
         # Calculate aggregate scores
         dimension_scores = {}
@@ -293,6 +370,7 @@ class CollectiveEvaluator:
             agent_evaluations=agent_evaluations,
             consensus_reasoning=consensus,
             refinement_suggestions=all_suggestions[:5],  # Top 5 suggestions
+            usage=usage,
         )
 
     async def evaluate_entry(
@@ -314,7 +392,7 @@ class CollectiveEvaluator:
             output=entry.output,
         )
 
-        response = await self._call_llm(prompt)
+        response, usage = await self._call_llm(prompt)
 
         try:
             result = self._parse_json_response(response)
@@ -346,6 +424,7 @@ class CollectiveEvaluator:
                 reasoning=result.get("reasoning", ""),
                 issues_found=result.get("issues", []),
                 suggestions=result.get("suggestions", []),
+                usage=usage,
             )
 
             return CollectiveEvaluationResult(
@@ -357,6 +436,7 @@ class CollectiveEvaluator:
                 agent_evaluations=[agent_eval],
                 consensus_reasoning=result.get("reasoning", ""),
                 refinement_suggestions=result.get("suggestions", [])[:5],
+                usage=usage,
             )
 
         except Exception as e:
@@ -370,6 +450,7 @@ class CollectiveEvaluator:
                 agent_evaluations=[],
                 consensus_reasoning=f"Evaluation failed: {e}",
                 refinement_suggestions=[],
+                usage=usage,
             )
 
     async def evaluate_batch(
@@ -377,56 +458,181 @@ class CollectiveEvaluator:
         claims: List[ExtractedClaim],
         budget: int = MAX_BATCH_TOKENS,
         external_calls: int = 3,
+        claim_index: Optional["ClaimFingerprintIndex"] = None,
     ) -> BatchEvaluationResult:
         """
-        Evaluate a batch of claims with token budget.
+        Evaluate a batch of claims concurrently within a token and call budget.
+
+        Up to ``max_concurrency`` claims are in flight at once. Budgets are
+        charged with the usage the LLM server reports. A claim is admitted
+        only if its worst case (three calls, and the average tokens per
+        claim so far) still fits next to the claims in flight. Overrun is
+        therefore bounded by the token estimate of one in-flight claim.
+
+        With a ``claim_index``, claims already evaluated in an earlier
+        session reuse their stored evaluation (no LLM calls, no budget), and
+        the new evaluations are recorded for later sessions.
 
         Args:
             claims: List of claims to evaluate
             budget: Maximum tokens to use
             external_calls: Maximum LLM calls for this batch
+            claim_index: Cross-session fingerprint index (optional)
 
         Returns:
-            BatchEvaluationResult with all evaluations
+            BatchEvaluationResult with evaluations in input order
         """
         batch_id = uuid.uuid4().hex[:8]
         start_time = datetime.utcnow()
 
-        results: List[CollectiveEvaluationResult] = []
-        tokens_used = 0
-        calls_made = 0
-
-        for claim in claims:
-            if calls_made >= external_calls:
-                logger.info(f"Batch {batch_id}: Reached call limit ({external_calls})")
-                break
+        results: Dict[int, CollectiveEvaluationResult] = {}
+        in_flight: Dict[asyncio.Task, int] = {}
+        usage = LLMUsage()
+        completed = 0
 
+        known: Dict[str, "KnownClaim"] = {}
+        if claim_index is not None:
             try:
-                result = await self.evaluate_claim(claim)
-                results.append(result)
-                calls_made += 3  # 3 agents per claim
-                tokens_used += 2000  # Estimate
+                known = await claim_index.lookup_many(c.dedupe_fingerprint for c in claims)
             except Exception as e:
-                logger.error(f"Failed to evaluate claim {claim.id}: {e}")
+                logger.warning(f"Batch {batch_id}: Claim index lookup failed: {e}")
+        pending_claims = []
+        for index, claim in enumerate(claims):
+            entry = known.get(claim.dedupe_fingerprint)
+            if entry is not None and entry.evaluation.get("decision"):
+                results[index] = self._result_from_index(claim, entry)
+                CLAIM_EVALUATION_CALLS_SKIPPED.labels(stage="collective_evaluation").inc(AGENTS_PER_CLAIM)
+            else:
+                pending_claims.append((index, claim))
+        reused = set(results)
+
+        def token_estimate() -> float:
+            return usage.total_tokens / completed if completed else CLAIM_TOKEN_ESTIMATE
+
+        def admits() -> bool:
+            reserved = len(in_flight) + 1
+            return (
+                usage.calls + reserved * AGENTS_PER_CLAIM <= external_calls
+                and usage.total_tokens + reserved * token_estimate() <= budget
+            )
+
+        async def reap() -> None:
+            nonlocal completed
+            done, _ = await asyncio.wait(set(in_flight), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = in_flight.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    logger.error(f"Failed to evaluate claim {claims[index].id}: {e}")
+                    continue
+                results[index] = result
+                usage.add(result.usage)
+                completed += 1
+
+        try:
+            for index, claim in pending_claims:
+                while in_flight and (len(in_flight) >= self.max_concurrency or not admits()):
+                    await reap()
+                if not admits():
+                    logger.info(
+                        f"Batch {batch_id}: Budget reached after {len(results) - len(reused)} claims "
+                        f"({usage.calls}/{external_calls} calls, {usage.total_tokens}/{budget} tokens)"
+                    )
+                    break
+                in_flight[asyncio.create_task(self.evaluate_claim(claim))] = index
+
+            while in_flight:
+                await reap()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        CLAIM_EVALUATION_CALLS.labels(stage="collective_evaluation").inc(usage.calls)
+        if claim_index is not None:
+            await self._record_evaluations(
+                claim_index,
+                [(claims[i], results[i]) for i in sorted(results) if i not in reused],
+            )
+
+        ordered = [results[index] for index in sorted(results)]
 
         # Count decisions
-        accepted = sum(1 for r in results if r.decision == EvaluationDecision.ACCEPT)
-        refined = sum(1 for r in results if r.decision == EvaluationDecision.REFINE)
-        rejected = sum(1 for r in results if r.decision == EvaluationDecision.REJECT)
+        accepted = sum(1 for r in ordered if r.decision == EvaluationDecision.ACCEPT)
+        refined = sum(1 for r in ordered if r.decision == EvaluationDecision.REFINE)
+        rejected = sum(1 for r in ordered if r.decision == EvaluationDecision.REJECT)
 
         duration = (datetime.utcnow() - start_time).total_seconds()
 
         return BatchEvaluationResult(
             batch_id=batch_id,
-            items_evaluated=len(results),
+            items_evaluated=len(ordered),
             accepted=accepted,
             refined=refined,
             rejected=rejected,
-            results=results,
-            total_tokens_used=tokens_used,
+            results=ordered,
+            total_tokens_used=usage.total_tokens,
             duration_seconds=round(duration, 2),
+            llm_calls=usage.calls,
+        )
+
+    def _result_from_index(
+        self,
+        claim: ExtractedClaim,
+        entry: "KnownClaim",
+    ) -> CollectiveEvaluationResult:
+        """Rebuild an evaluation result from a known claim's stored evaluation."""
+        evaluation = entry.evaluation
+        return CollectiveEvaluationResult(
+            item_id=claim.id,
+            item_type="claim",
+            decision=EvaluationDecision(evaluation["decision"]),
+            overall_score=float(evaluation.get("overall_score", 0.0)),
+            dimension_scores=dict(evaluation.get("dimension_scores", {})),
+            agent_evaluations=[],
+            consensus_reasoning=(
+                f"Reused evaluation of known claim {entry.claim_id} "
+                f"(seen in {entry.session_count} sessions)"
+            ),
+            refinement_suggestions=list(evaluation.get("refinement_suggestions", [])),
         )
 
+    async def _record_evaluations(
+        self,
+        claim_index: "ClaimFingerprintIndex",
+        evaluated: List[Tuple[ExtractedClaim, CollectiveEvaluationResult]],
+    ) -> None:
+        """
+        Record new evaluations in the fingerprint index for later sessions.
+
+        Known claims keep the scores their sessions stored; the scores here
+        only seed claims the index has not seen.
+        """
+        from .claim_fingerprints import IndexEntry
+
+        entries = [
+            IndexEntry(
+                fingerprint=claim.dedupe_fingerprint,
+                claim_id=claim.id,
+                claim_text=claim.claim_text,
+                claim_type=claim.claim_type.value,
+                provenance_score=claim.provenance_score,
+                confidence=result.overall_score,
+                evaluation={
+                    "decision": result.decision.value,
+                    "overall_score": result.overall_score,
+                    "dimension_scores": result.dimension_scores,
+                    "refinement_suggestions": result.refinement_suggestions,
+                },
+                evidence_count=len(claim.evidence_quotes),
+            )
+            for claim, result in evaluated
+        ]
+        try:
+            await claim_index.record(entries, update_scores=False)
+        except Exception as e:
+            logger.warning(f"Failed to record {len(entries)} evaluations in claim index: {e}")
+
     async def _evaluate_accuracy(
         self,
         claim: ExtractedClaim,
@@ -443,7 +649,7 @@ class CollectiveEvaluator:
             paper_title=paper_title or "(unknown)",
         )
 
-        response = await self._call_llm(prompt)
+        response, usage = await self._call_llm(prompt)
         result = self._parse_json_response(response)
 
         return AgentEvaluation(
@@ -453,6 +659,7 @@ class CollectiveEvaluator:
             reasoning=result.get("reasoning", ""),
             issues_found=result.get("issues_found", []),
             suggestions=result.get("suggestions", []),
+            usage=usage,
         )
 
     async def _evaluate_novelty(
@@ -471,7 +678,7 @@ class CollectiveEvaluator:
             related_claims=related_text,
         )
 
-        response = await self._call_llm(prompt)
+        response, usage = await self._call_llm(prompt)
         result = self._parse_json_response(response)
 
         return AgentEvaluation(
@@ -481,6 +688,7 @@ class CollectiveEvaluator:
             reasoning=result.get("reasoning", ""),
             issues_found=result.get("issues_found", []),
             suggestions=result.get("suggestions", []),
+            usage=usage,
         )
 
     async def _evaluate_coherence(
@@ -494,7 +702,7 @@ class CollectiveEvaluator:
             section=claim.section.value,
         )
 
-        response = await self._call_llm(prompt)
+        response, usage = await self._call_llm(prompt)
         result = self._parse_json_response(response)
 
         return AgentEvaluation(
@@ -504,32 +712,58 @@ class CollectiveEvaluator:
             reasoning=result.get("reasoning", ""),
             issues_found=result.get("issues_found", []),
             suggestions=result.get("suggestions", []),
+            usage=usage,
         )
 
-    async def _call_llm(self, prompt: str) -> str:
-        """Call LLM via llama.cpp Q4 server."""
+    async def _run_agent(self, agent: Awaitable[AgentEvaluation], calls: LLMUsage) -> AgentEvaluation:
+        """Run one evaluation agent, counting the calls it sends in ``calls``."""
+        _started_calls.set(calls)
+        return await agent
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        """Hold one server slot; the request counts as sent once it is held."""
+        async with self._slots:
+            calls = _started_calls.get()
+            if calls is not None:
+                calls.calls += 1
+            yield
+
+    async def _call_llm(self, prompt: str) -> Tuple[str, LLMUsage]:
+        """
+        Call LLM via llama.cpp Q4 server, holding one server slot.
+
+        Returns:
+            Response text and the token usage reported by the server
+        """
+        usage = LLMUsage(calls=1)
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.q4_url,
-                    json={
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.1,
-                        "max_tokens": 1000,
-                        "stream": False,
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                if "choices" in data and data["choices"]:
-                    return data["choices"][0].get("message", {}).get("content", "")
-
-                return ""
+            async with self._slot():
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.post(
+                        self.q4_url,
+                        json={
+                            "messages": [{"role": "user", "content": prompt}],
+                            "temperature": 0.1,
+                            "max_tokens": 1000,
+                            "stream": False,
+                        }
+                    )
+            response.raise_for_status()
+            data = response.json()
+
+            reported = data.get("usage") or {}
+            usage.prompt_tokens = int(reported.get("prompt_tokens", 0))
+            usage.completion_tokens = int(reported.get("completion_tokens", 0))
+
+            if "choices" in data and data["choices"]:
+                return data["choices"][0].get("message", {}).get("content", ""), usage
+
+            return "", usage
 
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
-            return "{}"
+            return "{}", usage
 
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON from LLM response."""
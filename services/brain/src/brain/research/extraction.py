@@ -8,12 +8,15 @@ import logging
 import uuid
 import json
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from decimal import Decimal
 
 from .types import Claim, EvidenceSpan, fingerprint, compute_provenance_score, merge_duplicate_claims
 from .models.coordinator import ConsultationRequest, ConsultationTier, ModelCapability
 
+if TYPE_CHECKING:
+    from .claim_fingerprints import ClaimFingerprintIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,7 +119,8 @@ async def extract_claims_from_content(
     sub_question_id: Optional[str],
     model_coordinator,
     current_iteration: int = 0,
-    invoke_model_func: Optional[Any] = None
+    invoke_model_func: Optional[Any] = None,
+    claim_index: Optional["ClaimFingerprintIndex"] = None,
 ) -> List[Claim]:
     """
     Extract atomic claims with evidence from research content.
@@ -131,6 +135,8 @@ async def extract_claims_from_content(
         sub_question_id: Sub-question ID if hierarchical
         model_coordinator: ModelCoordinator for LLM invocation
         current_iteration: Current research iteration
+        claim_index: Cross-session fingerprint index; claims it already
+            knows take their stored entailment score and confidence
 
     Returns:
         List of structured Claim objects with evidence
@@ -276,6 +282,12 @@ async def extract_claims_from_content(
                 f"with {len(evidence)} quotes, provenance={prov_score:.2f}"
             )
 
+        if claim_index is not None and claims:
+            try:
+                await claim_index.apply_known(claims)
+            except Exception as e:
+                logger.warning(f"Claim index lookup failed, treating all claims as new: {e}")
+
         logger.info(f"Extracted {len(claims)} claims from content")
         return claims
 
@@ -7,6 +7,7 @@ Provides:
 - Saturation detection
 - Knowledge gap identification
 - Stopping criteria
+- Cross-session claim reuse counters
 """
 
 __version__ = "0.1.0"
@@ -42,6 +43,12 @@ from .stopping_criteria import (
     StoppingDecision,
 )
 
+from .claim_reuse import (
+    CLAIM_INDEX_LOOKUPS,
+    CLAIM_EVALUATION_CALLS,
+    CLAIM_EVALUATION_CALLS_SKIPPED,
+)
+
 __all__ = [
     # RAGAS
     "RAGASEvaluator",
@@ -64,4 +71,8 @@ __all__ = [
     "StoppingCriteria",
     "StoppingReason",
     "StoppingDecision",
+    # Claim reuse
+    "CLAIM_INDEX_LOOKUPS",
+    "CLAIM_EVALUATION_CALLS",
+    "CLAIM_EVALUATION_CALLS_SKIPPED",
 ]
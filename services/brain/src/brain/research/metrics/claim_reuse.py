@@ -0,0 +1,30 @@
+"""
+Prometheus counters for cross-session claim reuse.
+
+Track how often a claim is already in the fingerprint index, and how many
+LLM evaluation calls ``CollectiveEvaluator.evaluate_batch`` saves by reusing
+stored evaluations (research sessions do not run that evaluator).
+"""
+
+from prometheus_client import Counter
+
+# Claims looked up in the fingerprint index, by result (known, new)
+CLAIM_INDEX_LOOKUPS = Counter(
+    "brain_research_claim_index_lookups_total",
+    "Claims looked up in the cross-session fingerprint index",
+    labelnames=["result"],
+)
+
+# LLM evaluation calls not made because the claim was already known
+CLAIM_EVALUATION_CALLS_SKIPPED = Counter(
+    "brain_research_claim_evaluation_calls_skipped_total",
+    "LLM evaluation calls skipped for claims known from earlier sessions",
+    labelnames=["stage"],  # stage: collective_evaluation
+)
+
+# LLM evaluation calls made for claims not found in the index
+CLAIM_EVALUATION_CALLS = Counter(
+    "brain_research_claim_evaluation_calls_total",
+    "LLM evaluation calls made for new claims",
+    labelnames=["stage"],
+)
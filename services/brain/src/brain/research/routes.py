@@ -25,6 +25,7 @@ from brain.research.templates import (
     apply_template,
     TEMPLATES
 )
+from brain.research.claim_fingerprints import ClaimFingerprintIndex
 from brain.research.extraction import extract_claims_from_content
 from brain.research.types import Claim, EvidenceSpan
 from brain.research.template_selector import TemplateSelector
@@ -212,6 +213,12 @@ async def get_session_manager(request: Request) -> ResearchSessionManager:
     return request.app.state.session_manager
 
 
+async def get_claim_index(request: Request) -> Optional[ClaimFingerprintIndex]:
+    """Get the cross-session claim fingerprint index (None without a database)"""
+    pool = getattr(request.app.state, 'pg_pool', None)
+    return ClaimFingerprintIndex(pool) if pool is not None else None
+
+
 async def get_model_coordinator(request: Request):
     """Get model coordinator from app state"""
     if not hasattr(request.app.state, 'model_coordinator') or request.app.state.model_coordinator is None:
@@ -1283,7 +1290,8 @@ Provide ONLY the synthesis (no meta-commentary about the task)."""
 @router.post("/extract-claims", response_model=ExtractClaimsResponse, status_code=200)
 async def extract_claims_endpoint(
     request: ExtractClaimsRequest,
-    model_coordinator=Depends(get_model_coordinator)
+    model_coordinator=Depends(get_model_coordinator),
+    claim_index: Optional[ClaimFingerprintIndex] = Depends(get_claim_index),
 ):
     """
     Extract atomic claims with evidence from research content.
@@ -1294,6 +1302,7 @@ async def extract_claims_endpoint(
     Args:
         request: Extraction request with content and metadata
         model_coordinator: Model coordinator from app state
+        claim_index: Cross-session claim index for reusing known claims
 
     Returns:
         ExtractClaimsResponse with list of extracted claims
@@ -1312,7 +1321,8 @@ async def extract_claims_endpoint(
             sub_question_id=request.sub_question_id,
             model_coordinator=model_coordinator,
             current_iteration=request.current_iteration,
-            invoke_model_func=invoke_model
+            invoke_model_func=invoke_model,
+            claim_index=claim_index,
         )
 
         logger.info(f"✅ Extracted {len(claims)} claims via HTTP endpoint")
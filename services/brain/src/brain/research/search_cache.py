@@ -1,9 +1,18 @@
 """
 Search Results Cache
 
-Redis-backed cache for search results with 24-hour TTL.
+Two-tier cache for search results with 24-hour TTL.
 Reduces API costs by reusing results for identical queries.
 
+- L1: bounded in-process LRU with a short TTL (no I/O on hit)
+- L2: Redis via ``redis.asyncio`` (shared across processes, 24h TTL)
+
+Multi-key lookups and writes are pipelined, so checking every provider for
+a query costs one Redis round trip, and lookups issued concurrently share
+that pipeline. Invalidations and overwrites are
+broadcast on a pub/sub channel so other processes drop stale L1 entries.
+Entry counts come from an expiry-scored index instead of a keyspace scan.
+
 Usage:
     from brain.research.search_cache import search_cache
 
@@ -17,13 +26,19 @@ Usage:
 
     # Cache results
     await search_cache.set(query, provider_id, results)
+
+    # Provider fan-out: one round trip for all providers
+    hits = await search_cache.get_many([(query, p) for p in providers])
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional
+import uuid
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -31,51 +46,129 @@ logger = logging.getLogger(__name__)
 CACHE_PREFIX = "kitt:search_cache:"
 DEFAULT_TTL = 86400  # 24 hours in seconds
 STATS_KEY = "kitt:search_cache:stats"
+INDEX_KEY = "kitt:search_cache:index"  # ZSET: cache key -> expiry timestamp
+INVALIDATE_CHANNEL = "kitt:search_cache:invalidate"
+CLEAR_ALL = "*"
+
+L1_MAX_ENTRIES = 1024
+L1_TTL = 300.0  # seconds
+
+REDIS_MAX_CONNECTIONS = 16
+
+_DELETE_CHUNK = 500
 
 
 class SearchCache:
     """
-    Redis-backed search results cache.
+    Two-tier (in-process + Redis) search results cache.
 
     Provides:
     - 24-hour TTL for search results
-    - Graceful degradation if Redis unavailable
-    - Cache hit/miss statistics
+    - Non-blocking Redis access with pipelined batch get/set
+    - Bounded LRU/TTL L1 tier kept coherent via Redis pub/sub
+    - Graceful degradation if Redis unavailable (L1 only)
+    - Cache hit/miss statistics and entry counts without key scans
     - Normalized query hashing for better cache hits
     """
 
-    def __init__(self):
-        """Initialize cache (lazy Redis connection)."""
-        self._redis = None
+    def __init__(
+        self,
+        redis_client: Any = None,
+        l1_max_entries: int = L1_MAX_ENTRIES,
+        l1_ttl: float = L1_TTL,
+    ):
+        """Initialize cache (lazy Redis connection unless a client is given)."""
+        self._redis = redis_client
         self._redis_available = True  # Assume available until proven otherwise
+        self._connecting: Optional[asyncio.Future] = None
+
+        self._l1: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._l1_max_entries = max(0, l1_max_entries)
+        self._l1_ttl = l1_ttl
+
+        self._instance_id = uuid.uuid4().hex
+        self._subscriber: Optional[asyncio.Task] = None
+        # Hit/miss increments ride along with the next pipeline
+        self._pending_stats: Counter = Counter()
+        # Concurrent Redis lookups waiting to share one pipeline
+        self._batch: List[Tuple[List[str], asyncio.Future]] = []
 
-    def _get_redis(self):
-        """Get Redis connection (lazy initialization)."""
+    async def _get_redis(self):
+        """Get Redis connection (lazy initialization, shared across callers)."""
         if not self._redis_available:
             return None
 
         if self._redis is None:
-            try:
-                import redis
-                from common.config import settings
-
-                self._redis = redis.from_url(
-                    settings.redis_url,
-                    decode_responses=True,
-                    socket_connect_timeout=1.0,
-                    socket_timeout=1.0,
-                )
-                # Test connection
-                self._redis.ping()
-                logger.info("Search cache connected to Redis")
-            except Exception as e:
-                logger.warning(f"Redis unavailable for search cache: {e}")
-                self._redis = None
-                self._redis_available = False
+            if self._connecting is None or self._connecting.done():
+                self._connecting = asyncio.ensure_future(self._connect())
+            await asyncio.shield(self._connecting)
+            if self._redis is None:
                 return None
 
+        self._ensure_subscriber()
         return self._redis
 
+    async def _connect(self) -> None:
+        """Open the async Redis client and verify it answers."""
+        try:
+            import redis.asyncio as aioredis
+            from common.config import settings
+
+            # Bounded: bursts of lookups wait for a connection instead of opening more
+            pool = aioredis.BlockingConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=5,
+                decode_responses=True,
+                socket_connect_timeout=1.0,
+                socket_timeout=1.0,
+            )
+            client = aioredis.Redis(connection_pool=pool)
+            # Test connection
+            await client.ping()
+            self._redis = client
+            logger.info("Search cache connected to Redis")
+        except Exception as e:
+            logger.warning(f"Redis unavailable for search cache: {e}")
+            self._redis = None
+            self._redis_available = False
+
+    def _ensure_subscriber(self) -> None:
+        """Start listening for invalidations from other processes."""
+        if self._subscriber is not None and not self._subscriber.done():
+            return
+        if self._l1_max_entries == 0:
+            return
+        self._subscriber = asyncio.ensure_future(self._listen())
+
+    async def _listen(self) -> None:
+        """Drop L1 entries invalidated or overwritten elsewhere."""
+        pubsub = self._redis.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATE_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode()
+                origin, _, key = data.partition("|")
+                if origin == self._instance_id:
+                    continue
+                if key == CLEAR_ALL:
+                    self._l1.clear()
+                else:
+                    self._l1.pop(key, None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Search cache invalidation listener stopped: {e}")
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
     def _normalize_query(self, query: str) -> str:
         """Normalize query for consistent caching."""
         # Lowercase, strip, collapse whitespace
@@ -88,6 +181,32 @@ class SearchCache:
         query_hash = hashlib.sha256(normalized.encode()).hexdigest()[:16]
         return f"{CACHE_PREFIX}{provider}:{query_hash}"
 
+    def _l1_get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= now:
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return payload
+
+    def _l1_put(self, key: str, payload: Dict[str, Any], expires_at: float) -> None:
+        if self._l1_max_entries == 0:
+            return
+        self._l1[key] = (expires_at, payload)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self._l1_max_entries:
+            self._l1.popitem(last=False)
+
+    def _flush_stats(self, pipe) -> None:
+        """Queue buffered hit/miss increments onto a pipeline."""
+        for field, amount in self._pending_stats.items():
+            if amount:
+                pipe.hincrby(STATS_KEY, field, amount)
+        self._pending_stats.clear()
+
     async def get(
         self, query: str, provider: str
     ) -> Optional[Dict[str, Any]]:
@@ -100,37 +219,108 @@ class SearchCache:
 
         Returns:
             Cached results dict with keys: results, cached_at, cache_age
-            None if not cached or Redis unavailable
+            None if not cached
         """
-        r = self._get_redis()
-        if not r:
-            return None
+        return (await self.get_many([(query, provider)]))[0]
 
-        try:
-            key = self._cache_key(query, provider)
-            data = r.get(key)
+    async def get_many(
+        self, lookups: Sequence[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get cached results for several (query, provider) pairs.
 
-            if data:
-                cached = json.loads(data)
-                cached_at = cached.get("cached_at", 0)
-                cached["cache_age"] = time.time() - cached_at
+        L1 hits are served without I/O; the rest are fetched from Redis
+        in a single pipelined round trip.
 
-                # Update stats
-                r.hincrby(STATS_KEY, "hits", 1)
+        Args:
+            lookups: (query, provider) pairs
 
-                logger.debug(
-                    f"Cache HIT for query '{query[:50]}...' "
-                    f"(provider={provider}, age={cached['cache_age']:.0f}s)"
-                )
-                return cached
+        Returns:
+            Cached results dicts (or None) in the order of ``lookups``
+        """
+        now = time.time()
+        monotonic = time.monotonic()
+        keys = [self._cache_key(query, provider) for query, provider in lookups]
+        found: List[Optional[Dict[str, Any]]] = [None] * len(keys)
+
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            payload = self._l1_get(key, monotonic)
+            if payload is not None:
+                found[i] = payload
+                self._pending_stats["hits"] += 1
+                self._pending_stats["l1_hits"] += 1
+            else:
+                missing.append(i)
+
+        r = await self._get_redis() if missing else None
+        if r is not None:
+            try:
+                replies = await self._fetch(r, [keys[i] for i in missing])
+
+                for i, (data, pttl) in zip(missing, replies):
+                    if not data:
+                        continue
+                    payload = json.loads(data)
+                    found[i] = payload
+                    self._pending_stats["hits"] += 1
+                    l1_ttl = self._l1_ttl if pttl is None or pttl < 0 else min(self._l1_ttl, pttl / 1000)
+                    self._l1_put(keys[i], payload, monotonic + l1_ttl)
+            except Exception as e:
+                logger.warning(f"Cache get error: {e}")
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for (query, provider), payload in zip(lookups, found):
+            if payload is None:
+                self._pending_stats["misses"] += 1
+                results.append(None)
+                continue
+            cached = dict(payload)
+            cached["cache_age"] = now - cached.get("cached_at", 0)
+            logger.debug(
+                f"Cache HIT for query '{query[:50]}...' "
+                f"(provider={provider}, age={cached['cache_age']:.0f}s)"
+            )
+            results.append(cached)
+        return results
 
-            # Cache miss
-            r.hincrby(STATS_KEY, "misses", 1)
-            return None
+    async def _fetch(self, r, keys: List[str]) -> List[Tuple[Optional[str], Optional[int]]]:
+        """Fetch values and remaining TTLs (ms) for ``keys``.
 
+        Lookups issued in the same event-loop iteration (e.g. concurrent
+        research branches) are coalesced into one pipelined round trip.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((keys, future))
+        if len(self._batch) == 1:
+            loop.call_soon(self._start_batch, r)
+        return await future
+
+    def _start_batch(self, r) -> None:
+        batch, self._batch = self._batch, []
+        asyncio.ensure_future(self._run_batch(r, batch))
+
+    async def _run_batch(self, r, batch: List[Tuple[List[str], asyncio.Future]]) -> None:
+        unique = list(dict.fromkeys(key for keys, _ in batch for key in keys))
+        try:
+            pipe = r.pipeline(transaction=False)
+            self._flush_stats(pipe)
+            for key in unique:
+                pipe.get(key)
+                pipe.pttl(key)
+            replies = await pipe.execute()
         except Exception as e:
-            logger.warning(f"Cache get error: {e}")
-            return None
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        replies = replies[len(replies) - 2 * len(unique):]
+        values = {key: (replies[2 * n], replies[2 * n + 1]) for n, key in enumerate(unique)}
+        for keys, future in batch:
+            if not future.done():
+                future.set_result([values[key] for key in keys])
 
     async def set(
         self,
@@ -151,50 +341,92 @@ class SearchCache:
         Returns:
             True if cached successfully, False otherwise
         """
-        r = self._get_redis()
-        if not r:
-            return False
+        return await self.set_many([(query, provider, results)], ttl=ttl) == 1
 
-        try:
+    async def set_many(
+        self,
+        entries: Iterable[Tuple[str, str, List[Dict[str, Any]]]],
+        ttl: int = DEFAULT_TTL,
+    ) -> int:
+        """
+        Cache results for several (query, provider, results) entries.
+
+        Args:
+            entries: (query, provider, results) triples
+            ttl: Time-to-live in seconds (default: 24 hours)
+
+        Returns:
+            Number of entries written to Redis
+        """
+        now = time.time()
+        monotonic = time.monotonic()
+        writes: List[Tuple[str, Dict[str, Any]]] = []
+        for query, provider, results in entries:
             key = self._cache_key(query, provider)
             payload = {
                 "results": results,
-                "cached_at": time.time(),
+                "cached_at": now,
                 "query": query,
                 "provider": provider,
             }
+            self._l1_put(key, payload, monotonic + min(self._l1_ttl, ttl))
+            writes.append((key, payload))
 
-            r.setex(key, ttl, json.dumps(payload))
+        r = await self._get_redis() if writes else None
+        if r is None:
+            return 0
 
-            logger.debug(
-                f"Cached {len(results)} results for query '{query[:50]}...' "
-                f"(provider={provider}, ttl={ttl}s)"
-            )
-            return True
+        try:
+            pipe = r.pipeline(transaction=False)
+            self._flush_stats(pipe)
+            for key, payload in writes:
+                pipe.set(key, json.dumps(payload), ex=ttl)
+                pipe.publish(INVALIDATE_CHANNEL, f"{self._instance_id}|{key}")
+            pipe.zadd(INDEX_KEY, {key: now + ttl for key, _ in writes})
+            await pipe.execute()
+
+            logger.debug(f"Cached results for {len(writes)} queries (ttl={ttl}s)")
+            return len(writes)
 
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
-            return False
+            return 0
 
     async def get_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
-        r = self._get_redis()
+        stats = {
+            "hits": 0,
+            "misses": 0,
+            "entries": 0,
+            "l1_hits": 0,
+            "l1_entries": len(self._l1),
+        }
+        r = await self._get_redis()
         if not r:
-            return {"hits": 0, "misses": 0, "entries": 0}
+            for field in ("hits", "misses", "l1_hits"):
+                stats[field] = self._pending_stats[field]
+            return stats
 
         try:
-            stats = r.hgetall(STATS_KEY) or {}
-            # Count cached entries
-            entries = len(list(r.scan_iter(f"{CACHE_PREFIX}*")))
-
-            return {
-                "hits": int(stats.get("hits", 0)),
-                "misses": int(stats.get("misses", 0)),
-                "entries": entries,
-            }
+            pipe = r.pipeline(transaction=False)
+            self._flush_stats(pipe)
+            # Index entries expire with their keys; trim, then count
+            pipe.zremrangebyscore(INDEX_KEY, "-inf", time.time())
+            pipe.zcard(INDEX_KEY)
+            pipe.hgetall(STATS_KEY)
+            replies = await pipe.execute()
+            entries, counters = replies[-2], replies[-1] or {}
+
+            stats.update(
+                hits=int(counters.get("hits", 0)),
+                misses=int(counters.get("misses", 0)),
+                l1_hits=int(counters.get("l1_hits", 0)),
+                entries=int(entries),
+            )
+            return stats
         except Exception as e:
             logger.warning(f"Cache stats error: {e}")
-            return {"hits": 0, "misses": 0, "entries": 0}
+            return stats
 
     async def clear(self) -> int:
         """
@@ -203,19 +435,25 @@ class SearchCache:
         Returns:
             Number of entries cleared
         """
-        r = self._get_redis()
+        self._l1.clear()
+        self._pending_stats.clear()
+        r = await self._get_redis()
         if not r:
             return 0
 
         try:
-            keys = list(r.scan_iter(f"{CACHE_PREFIX}*"))
-            if keys:
-                r.delete(*keys)
-            # Reset stats
-            r.delete(STATS_KEY)
-
-            logger.info(f"Cleared {len(keys)} cached search results")
-            return len(keys)
+            keys = await r.zrange(INDEX_KEY, 0, -1)
+            pipe = r.pipeline(transaction=False)
+            for start in range(0, len(keys), _DELETE_CHUNK):
+                pipe.delete(*keys[start:start + _DELETE_CHUNK])
+            # Reset index and stats
+            pipe.delete(INDEX_KEY, STATS_KEY)
+            pipe.publish(INVALIDATE_CHANNEL, f"{self._instance_id}|{CLEAR_ALL}")
+            replies = await pipe.execute()
+            cleared = sum(replies[:-2])
+
+            logger.info(f"Cleared {cleared} cached search results")
+            return cleared
 
         except Exception as e:
             logger.warning(f"Cache clear error: {e}")
@@ -232,18 +470,38 @@ class SearchCache:
         Returns:
             True if invalidated, False otherwise
         """
-        r = self._get_redis()
+        key = self._cache_key(query, provider)
+        in_l1 = self._l1.pop(key, None) is not None
+        r = await self._get_redis()
         if not r:
-            return False
+            return in_l1
 
         try:
-            key = self._cache_key(query, provider)
-            deleted = r.delete(key)
+            pipe = r.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.zrem(INDEX_KEY, key)
+            pipe.publish(INVALIDATE_CHANNEL, f"{self._instance_id}|{key}")
+            deleted, _, _ = await pipe.execute()
             return deleted > 0
         except Exception as e:
             logger.warning(f"Cache invalidate error: {e}")
             return False
 
+    async def close(self) -> None:
+        """Stop the invalidation listener and close the Redis client."""
+        if self._subscriber is not None:
+            self._subscriber.cancel()
+            try:
+                await self._subscriber
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._subscriber = None
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception as e:
+                logger.debug(f"Cache close error: {e}")
+
 
 # Singleton instance
 search_cache = SearchCache()
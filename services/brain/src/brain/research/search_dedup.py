@@ -1,19 +1,54 @@
 """
 Search Query Deduplication for Research Pipeline
 
-Collects search queries at iteration start, deduplicates similar ones
-using Jaccard similarity, and enables parallel execution of unique queries.
+Collects search queries at iteration start, deduplicates similar ones,
+and enables parallel execution of unique queries.
+
+Two queries are merged when either:
+- their word sets overlap (Jaccard >= ``similarity_threshold``). Candidates
+  come from MinHash-LSH buckets, so each query is checked against a handful
+  of canonicals instead of all of them;
+- their MiniLM embeddings are close (cosine >= ``embedding_threshold``),
+  which catches paraphrases sharing few tokens ("LLM quantization" vs
+  "compressing large language model weights"). Embeddings are encoded in
+  one batch per call and cached per normalized query.
+
+Without sentence-transformers only the lexical check runs.
 
 Adapted from the Collective Intelligence dedup module.
 """
 
-import re
+import hashlib
 import logging
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Protocol, Sequence, Set, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_EMBEDDING_THRESHOLD = 0.8
+
+# MinHash-LSH layout: 32 bands x 2 rows makes a pair at the default 0.7
+# threshold a candidate with probability > 0.99999 (0.5 at Jaccard ~0.18)
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 32
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, _MERSENNE_PRIME, size=MINHASH_PERMUTATIONS).astype(np.uint64)
+_PERM_B = _rng.randint(0, _MERSENNE_PRIME, size=MINHASH_PERMUTATIONS).astype(np.uint64)
+
+# An estimate this far below the threshold is > 4 standard errors off (64 perms)
+_ESTIMATE_MARGIN = 0.25
+
+# Similarities are computed for this many queries at a time (bounds memory)
+_BLOCK_SIZE = 256
+
 
 def normalize_query(query: str) -> str:
     """
@@ -59,6 +94,121 @@ def jaccard_similarity(q1: str, q2: str) -> float:
     return len(intersection) / len(union)
 
 
+def _jaccard(words1: Set[str], words2: Set[str]) -> float:
+    if not words1 or not words2:
+        return 0.0
+    return len(words1 & words2) / len(words1 | words2)
+
+
+class QueryEncoder(Protocol):
+    """Anything that embeds texts into L2-normalized vectors."""
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        ...
+
+
+class QueryEmbedder:
+    """Lazy MiniLM encoder with an LRU cache of normalized-query embeddings."""
+
+    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL, max_cached: int = 20000):
+        self._model_name = model_name
+        self._model = None
+        self._max_cached = max_cached
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load_model(self):
+        """Lazy-load embedding model (~80MB, ~2s first load)."""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
+            logger.info(f"Loading SentenceTransformer model: {self._model_name}")
+            self._model = SentenceTransformer(self._model_name)
+        return self._model
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts, encoding only those not cached (in one batch)."""
+        with self._lock:
+            missing = list(dict.fromkeys(t for t in texts if t not in self._cache))
+            if missing:
+                vectors = self._load_model().encode(
+                    missing, convert_to_numpy=True, normalize_embeddings=True, batch_size=64
+                )
+                for text, vector in zip(missing, vectors):
+                    self._cache[text] = vector.astype(np.float32)
+            rows = []
+            for text in texts:
+                self._cache.move_to_end(text)
+                rows.append(self._cache[text])
+            while len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
+        return np.stack(rows) if rows else np.zeros((0, 0), dtype=np.float32)
+
+
+_default_embedder: Optional[QueryEmbedder] = None
+_embeddings_unavailable = False
+
+
+def get_query_embedder() -> Optional[QueryEmbedder]:
+    """Shared embedder, or None when sentence-transformers is not installed."""
+    global _default_embedder, _embeddings_unavailable
+    if _embeddings_unavailable:
+        return None
+    if _default_embedder is None:
+        try:
+            import sentence_transformers  # noqa: F401
+        except ImportError:
+            logger.warning("sentence-transformers not installed; query dedup is lexical only")
+            _embeddings_unavailable = True
+            return None
+        _default_embedder = QueryEmbedder()
+    return _default_embedder
+
+
+_token_hashes: Dict[str, int] = {}
+
+
+def _token_hash(token: str) -> int:
+    value = _token_hashes.get(token)
+    if value is None:
+        digest = hashlib.blake2b(token.encode(), digest_size=4).digest()
+        value = int.from_bytes(digest, "little") % _MERSENNE_PRIME
+        if len(_token_hashes) < 100000:
+            _token_hashes[token] = value
+    return value
+
+
+def minhash_signature(words: Set[str]) -> np.ndarray:
+    """MinHash signature of a word set (``MINHASH_PERMUTATIONS`` values)."""
+    hashes = np.fromiter((_token_hash(w) for w in words), dtype=np.uint64, count=len(words))
+    permuted = (hashes[:, None] * _PERM_A + _PERM_B) % _MERSENNE_PRIME
+    return permuted.min(axis=0)
+
+
+class MinHashLSH:
+    """Banded MinHash index returning candidate ids for a word set."""
+
+    def __init__(self, bands: int = LSH_BANDS):
+        self._rows = MINHASH_PERMUTATIONS // bands
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[i * self._rows:(i + 1) * self._rows].tobytes()
+            for i in range(len(self._buckets))
+        ]
+
+    def candidates(self, signature: np.ndarray) -> Set[int]:
+        found: Set[int] = set()
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            found.update(buckets.get(key, ()))
+        return found
+
+    def add(self, item_id: int, signature: np.ndarray) -> None:
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(key, []).append(item_id)
+
+
 @dataclass
 class DeduplicationResult:
     """Result of query deduplication."""
@@ -95,17 +245,24 @@ def deduplicate_queries(
     queries: List[str],
     similarity_threshold: float = 0.7,
     max_queries: int = 15,
+    embedding_threshold: Optional[float] = DEFAULT_EMBEDDING_THRESHOLD,
+    embedder: Optional[QueryEncoder] = None,
 ) -> DeduplicationResult:
     """
     Deduplicate a list of search queries.
 
-    Two queries are considered duplicates if their Jaccard similarity
-    exceeds the threshold (default 0.7 = 70% word overlap).
+    Two queries are considered duplicates if their word-level Jaccard
+    similarity reaches ``similarity_threshold`` (default 0.7 = 70% word
+    overlap) or their embedding cosine similarity reaches
+    ``embedding_threshold``. Each query maps to the first canonical query
+    it matches (lexical matches first, then the most similar embedding).
 
     Args:
         queries: List of search queries to deduplicate
         similarity_threshold: Jaccard threshold (0.0-1.0)
         max_queries: Maximum unique queries to return
+        embedding_threshold: Cosine threshold, or None for lexical only
+        embedder: Encoder for embeddings (defaults to the shared MiniLM embedder)
 
     Returns:
         DeduplicationResult with unique queries and mapping
@@ -118,48 +275,99 @@ def deduplicate_queries(
             similarity_threshold=similarity_threshold,
         )
 
-    # Track: normalized_query -> canonical_query
-    canonical_map: Dict[str, str] = {}
-
     # Track: original_query -> canonical_query
     original_to_canonical: Dict[str, str] = {}
 
     # Unique queries in order seen
     unique_queries: List[str] = []
 
+    # Distinct normalized queries, in order of first appearance
+    items: List[Tuple[str, str]] = []  # (original, normalized)
+    first_seen: Dict[str, int] = {}
     for query in queries:
         query = query.strip()
         if not query:
             continue
-
         normalized = normalize_query(query)
+        if normalized not in first_seen:
+            first_seen[normalized] = len(items)
+            items.append((query, normalized))
+
+    embeddings: Optional[np.ndarray] = None
+    if embedding_threshold is not None and items:
+        encoder = embedder if embedder is not None else get_query_embedder()
+        if encoder is not None:
+            try:
+                embeddings = np.asarray(encoder.encode([n for _, n in items]), dtype=np.float32)
+            except Exception as e:
+                logger.warning(f"Query embedding failed, using lexical dedup only: {e}")
+
+    # canonical_of[i]: index of the canonical item for item i
+    canonical_of: List[int] = []
+    is_canonical = np.zeros(len(items), dtype=bool)
+    word_sets: List[Set[str]] = []
+    signatures = np.zeros((len(items), MINHASH_PERMUTATIONS), dtype=np.uint64)
+    lsh = MinHashLSH()
+
+    for block_start in range(0, len(items), _BLOCK_SIZE):
+        block_end = min(block_start + _BLOCK_SIZE, len(items))
+        block_sims = (
+            embeddings[block_start:block_end] @ embeddings[:block_end].T
+            if embeddings is not None
+            else None
+        )
 
-        # Check for exact match (normalized)
-        if normalized in canonical_map:
-            original_to_canonical[query] = canonical_map[normalized]
-            logger.debug(
-                f"Exact duplicate: '{query[:40]}...' -> '{canonical_map[normalized][:40]}...'"
-            )
-            continue
-
-        # Check Jaccard similarity against existing canonical queries
-        is_duplicate = False
-        for existing_norm, canonical in canonical_map.items():
-            similarity = jaccard_similarity(normalized, existing_norm)
-            if similarity >= similarity_threshold:
-                original_to_canonical[query] = canonical
-                is_duplicate = True
-                logger.debug(
-                    f"Similar query ({similarity:.2f}): '{query[:40]}...' "
-                    f"-> '{canonical[:40]}...'"
-                )
-                break
+        for i in range(block_start, block_end):
+            query, normalized = items[i]
+            words = set(normalized.split())
+            word_sets.append(words)
+            signature = minhash_signature(words) if words else None
+
+            match: Optional[int] = None
+            # Lexical: exact Jaccard on LSH candidates only
+            if signature is not None:
+                signatures[i] = signature
+                candidates = np.fromiter(sorted(lsh.candidates(signature)), dtype=np.int64)
+                if len(candidates):
+                    # Signature agreement estimates Jaccard; skip clear non-matches
+                    estimate = (signatures[candidates] == signature).mean(axis=1)
+                    candidates = candidates[estimate >= similarity_threshold - _ESTIMATE_MARGIN]
+                for j in candidates.tolist():
+                    similarity = _jaccard(words, word_sets[j])
+                    if similarity >= similarity_threshold:
+                        match = j
+                        logger.debug(
+                            f"Similar query ({similarity:.2f}): '{query[:40]}...' "
+                            f"-> '{items[j][0][:40]}...'"
+                        )
+                        break
+
+            # Semantic: nearest canonical embedding
+            if match is None and block_sims is not None and i > 0:
+                sims = np.where(is_canonical[:i], block_sims[i - block_start, :i], -1.0)
+                j = int(np.argmax(sims))
+                if sims[j] >= embedding_threshold:
+                    match = j
+                    logger.debug(
+                        f"Paraphrase ({sims[j]:.2f}): '{query[:40]}...' "
+                        f"-> '{items[j][0][:40]}...'"
+                    )
+
+            if match is None:
+                # New unique query
+                is_canonical[i] = True
+                canonical_of.append(i)
+                unique_queries.append(query)
+                if signature is not None:
+                    lsh.add(i, signature)
+            else:
+                canonical_of.append(canonical_of[match])
 
-        if not is_duplicate:
-            # New unique query
-            canonical_map[normalized] = query
-            original_to_canonical[query] = query
-            unique_queries.append(query)
+    for query in queries:
+        query = query.strip()
+        if query:
+            index = first_seen[normalize_query(query)]
+            original_to_canonical[query] = items[canonical_of[index]][0]
 
     # Limit total queries
     if len(unique_queries) > max_queries:
@@ -172,7 +380,8 @@ def deduplicate_queries(
 
     logger.info(
         f"Deduplication: {len(queries)} queries -> {len(unique_queries)} unique "
-        f"(removed {duplicates_removed} duplicates, threshold={similarity_threshold})"
+        f"(removed {duplicates_removed} duplicates, threshold={similarity_threshold}, "
+        f"embedding_threshold={embedding_threshold if embeddings is not None else 'off'})"
     )
 
     return DeduplicationResult(
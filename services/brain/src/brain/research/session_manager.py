@@ -22,6 +22,7 @@ from psycopg.types.json import Json
 from psycopg_pool import AsyncConnectionPool
 
 from brain.research.checkpoint import CheckpointManager
+from brain.research.claim_fingerprints import ClaimFingerprintIndex
 from brain.research.types import Claim, EvidenceSpan
 from brain.research.events import (
     ResearchEventType,
@@ -36,6 +37,24 @@ from typing import Callable, Awaitable
 EventCallback = Callable[[Dict[str, Any]], Awaitable[None]]
 
 
+# Column order for bulk COPY of session results
+FINDING_COLUMNS = ("session_id", "finding_type", "content", "confidence", "iteration", "sources")
+CLAIM_COLUMNS = (
+    "id", "session_id", "sub_question_id", "claim_text", "entailment_score",
+    "provenance_score", "dedupe_fingerprint", "confidence", "iteration",
+)
+EVIDENCE_COLUMNS = ("id", "claim_id", "source_id", "url", "title", "quote", "char_start", "char_end")
+
+
+async def _copy_rows(cur, table: str, columns, rows: List[tuple]) -> None:
+    """Stream rows into a table with one COPY FROM STDIN."""
+    if not rows:
+        return
+    async with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            await copy.write_row(row)
+
+
 class SessionStatus(str, Enum):
     """Research session status"""
     ACTIVE = "active"
@@ -107,6 +126,7 @@ class ResearchSessionManager:
         self.checkpointer = checkpointer
         self.pool = connection_pool
         self.checkpoint_manager = CheckpointManager(checkpointer, connection_pool)
+        self.claim_index = ClaimFingerprintIndex(connection_pool)
 
         # Track active sessions and their background tasks
         self.active_sessions: Dict[str, asyncio.Task] = {}
@@ -851,6 +871,8 @@ class ResearchSessionManager:
         """
         Persist findings and sources from graph state to database tables.
 
+        All findings are written with one COPY in a single transaction.
+
         Args:
             session_id: Session ID
             final_state: Final research state from graph execution
@@ -866,54 +888,48 @@ class ResearchSessionManager:
         # Create URL -> source mapping for efficient lookup
         source_map = {s.get("url"): s for s in sources if s.get("url")}
 
-        async with self.pool.connection() as conn:
-            async with conn.cursor() as cur:
-                # Persist findings with full source metadata
-                for finding in findings:
-                    try:
-                        # Get citation URLs from finding
-                        citation_urls = finding.get("citations", [])
-
-                        # Look up full source metadata for each citation
-                        full_sources = []
-                        for url in citation_urls:
-                            if url in source_map:
-                                source = source_map[url]
-                                # Include full source metadata
-                                full_sources.append({
-                                    "url": source.get("url", ""),
-                                    "title": source.get("title", ""),
-                                    "snippet": source.get("snippet", ""),
-                                    "relevance": source.get("relevance", 0.0),
-                                    "tool": source.get("tool", "unknown")
-                                })
-                            else:
-                                # Fallback: store just the URL if full metadata not found
-                                full_sources.append({"url": url})
+        rows = []
+        for finding in findings:
+            try:
+                # Look up full source metadata for each citation URL
+                full_sources = []
+                for url in finding.get("citations", []):
+                    if url in source_map:
+                        source = source_map[url]
+                        full_sources.append({
+                            "url": source.get("url", ""),
+                            "title": source.get("title", ""),
+                            "snippet": source.get("snippet", ""),
+                            "relevance": source.get("relevance", 0.0),
+                            "tool": source.get("tool", "unknown")
+                        })
+                    else:
+                        # Fallback: store just the URL if full metadata not found
+                        full_sources.append({"url": url})
 
-                        await cur.execute(
-                            """
-                            INSERT INTO research_findings
-                            (session_id, finding_type, content, confidence, iteration, sources)
-                            VALUES (%s, %s, %s, %s, %s, %s)
-                            """,
-                            (
-                                session_id,
-                                finding.get("tool", "unknown"),
-                                finding.get("content", ""),
-                                finding.get("confidence", 0.0),
-                                finding.get("iteration", 0),
-                                Json(full_sources)  # Store full source objects, not just URLs
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to persist finding {finding.get('id')}: {e}")
-                        # Continue with other findings
+                rows.append((
+                    session_id,
+                    finding.get("tool", "unknown"),
+                    finding.get("content", ""),
+                    finding.get("confidence", 0.0),
+                    finding.get("iteration", 0),
+                    Json(full_sources)  # Store full source objects, not just URLs
+                ))
+            except Exception as e:
+                logger.error(f"Failed to prepare finding {finding.get('id')}: {e}")
+                # Continue with other findings
 
-                await conn.commit()
-                logger.info(
-                    f"✅ Committed {len(findings)} findings with full source metadata to database"
-                )
+        if not rows:
+            return
+
+        async with self.pool.connection() as conn:
+            async with conn.transaction():
+                async with conn.cursor() as cur:
+                    await _copy_rows(cur, "research_findings", FINDING_COLUMNS, rows)
+
+        logger.info(
+            f"✅ Committed {len(rows)} findings with full source metadata to database"
+        )
 
     async def _persist_claims(
         self,
@@ -923,6 +939,13 @@ class ResearchSessionManager:
         """
         Persist structured claims and evidence from graph state to database.
 
+        Claims are copied into a temporary staging table and merged into
+        research_claims with one INSERT ... ON CONFLICT; evidence is copied
+        straight into research_evidence, all in one transaction. The claims
+        are also recorded in the cross-session fingerprint index under a
+        savepoint: if that fails (e.g. migration 009 not applied), the error
+        is logged and the claims and evidence are still committed.
+
         Args:
             session_id: Session ID
             final_state: Final research state from graph execution
@@ -937,78 +960,74 @@ class ResearchSessionManager:
             f"Persisting {len(claims)} structured claims for session {session_id}"
         )
 
-        async with self.pool.connection() as conn:
-            async with conn.cursor() as cur:
-                claims_persisted = 0
-                evidence_persisted = 0
+        # Later copies of a claim win, as with row-by-row upserts
+        claim_rows: Dict[str, tuple] = {}
+        evidence_rows = []
+        for claim in claims:
+            try:
+                claim_rows[claim.id] = (
+                    claim.id,
+                    claim.session_id,
+                    claim.sub_question_id,
+                    claim.text,
+                    claim.entailment_score,
+                    claim.provenance_score,
+                    claim.dedupe_fingerprint,
+                    claim.confidence,
+                    0  # iteration - could be tracked in state if needed
+                )
+                evidence_rows.extend(
+                    (
+                        str(uuid.uuid4()),
+                        claim.id,
+                        evidence.source_id,
+                        evidence.url,
+                        evidence.title,
+                        evidence.quote,
+                        evidence.char_start,
+                        evidence.char_end
+                    )
+                    for evidence in claim.evidence
+                )
+            except Exception as e:
+                logger.error(f"Failed to prepare claim {getattr(claim, 'id', None)}: {e}")
+                # Continue with other claims
 
-                for claim in claims:
-                    try:
-                        # Insert claim
-                        await cur.execute(
-                            """
-                            INSERT INTO research_claims
-                            (id, session_id, sub_question_id, claim_text, entailment_score,
-                             provenance_score, dedupe_fingerprint, confidence, iteration)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (id) DO UPDATE SET
-                                entailment_score = EXCLUDED.entailment_score,
-                                provenance_score = EXCLUDED.provenance_score,
-                                confidence = EXCLUDED.confidence
-                            """,
-                            (
-                                claim.id,
-                                claim.session_id,
-                                claim.sub_question_id,
-                                claim.text,
-                                claim.entailment_score,
-                                claim.provenance_score,
-                                claim.dedupe_fingerprint,
-                                claim.confidence,
-                                0  # iteration - could be tracked in state if needed
-                            )
-                        )
-                        claims_persisted += 1
-
-                        # Insert evidence for this claim
-                        for evidence in claim.evidence:
-                            try:
-                                evidence_id = str(uuid.uuid4())
-                                await cur.execute(
-                                    """
-                                    INSERT INTO research_evidence
-                                    (id, claim_id, source_id, url, title, quote, char_start, char_end)
-                                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                                    """,
-                                    (
-                                        evidence_id,
-                                        claim.id,
-                                        evidence.source_id,
-                                        evidence.url,
-                                        evidence.title,
-                                        evidence.quote,
-                                        evidence.char_start,
-                                        evidence.char_end
-                                    )
-                                )
-                                evidence_persisted += 1
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to persist evidence for claim {claim.id}: {e}"
-                                )
-                                # Continue with other evidence
+        async with self.pool.connection() as conn:
+            async with conn.transaction():
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        """
+                        CREATE TEMP TABLE research_claims_stage
+                        (LIKE research_claims INCLUDING DEFAULTS)
+                        ON COMMIT DROP
+                        """
+                    )
+                    await _copy_rows(
+                        cur, "research_claims_stage", CLAIM_COLUMNS, list(claim_rows.values())
+                    )
+                    await cur.execute(
+                        f"""
+                        INSERT INTO research_claims ({", ".join(CLAIM_COLUMNS)})
+                        SELECT {", ".join(CLAIM_COLUMNS)} FROM research_claims_stage
+                        ON CONFLICT (id) DO UPDATE SET
+                            entailment_score = EXCLUDED.entailment_score,
+                            provenance_score = EXCLUDED.provenance_score,
+                            confidence = EXCLUDED.confidence
+                        """
+                    )
+                    await _copy_rows(cur, "research_evidence", EVIDENCE_COLUMNS, evidence_rows)
 
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to persist claim {claim.id}: {e}"
-                        )
-                        # Continue with other claims
+                try:
+                    async with conn.transaction():
+                        await self.claim_index.record_claims(session_id, claims, conn=conn)
+                except Exception as e:
+                    logger.warning(f"Failed to record claims in the claim fingerprint index: {e}")
 
-                await conn.commit()
-                logger.info(
-                    f"✅ Committed {claims_persisted} claims and {evidence_persisted} "
-                    f"evidence spans to database"
-                )
+        logger.info(
+            f"✅ Committed {len(claim_rows)} claims and {len(evidence_rows)} "
+            f"evidence spans to database"
+        )
 
     async def _persist_synthesis(
         self,
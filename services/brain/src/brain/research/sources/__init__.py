@@ -12,7 +12,9 @@ from .base import (
     AcademicSource,
     PaperMetadata,
     RateLimitConfig,
+    RequestBudgetExceeded,
     SourcePriority,
+    request_budget,
 )
 from .arxiv import ArxivSource
 from .semantic_scholar import SemanticScholarSource
@@ -28,7 +30,9 @@ __all__ = [
     "AcademicSource",
     "PaperMetadata",
     "RateLimitConfig",
+    "RequestBudgetExceeded",
     "SourcePriority",
+    "request_budget",
     # Source implementations
     "ArxivSource",
     "SemanticScholarSource",
@@ -3,14 +3,17 @@ Abstract base class for academic paper sources.
 
 Provides:
 - Async rate limiting with token bucket algorithm
+- Per-search request budgets
 - Pagination via async iterators
 - PDF download with retries
 - Error handling and fallback
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Optional, List, Dict, Any
+from typing import AsyncIterator, Iterator, Optional, List, Dict, Any
 from datetime import datetime
 from enum import IntEnum
 import asyncio
@@ -21,6 +24,31 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Remaining rate-limited requests for the current task (None = unlimited)
+_request_budget: ContextVar[Optional[List[int]]] = ContextVar("request_budget", default=None)
+
+
+class RequestBudgetExceeded(Exception):
+    """Raised when a source has used up its request budget for a search."""
+
+
+@contextmanager
+def request_budget(max_requests: Optional[int]) -> Iterator[None]:
+    """
+    Cap the rate-limited requests any source makes in this context.
+
+    The budget is tracked per asyncio task (context variable), so concurrent
+    searches each get their own allowance.
+
+    Args:
+        max_requests: Requests allowed, or None for no limit
+    """
+    token = _request_budget.set(None if max_requests is None else [max_requests])
+    try:
+        yield
+    finally:
+        _request_budget.reset(token)
+
 
 class SourcePriority(IntEnum):
     """Priority ordering for source fallback.
@@ -145,7 +173,17 @@ class AcademicSource(ABC):
             self._client = None
 
     async def _acquire_rate_limit(self):
-        """Acquire a rate limit token using token bucket algorithm."""
+        """Acquire a rate limit token using token bucket algorithm.
+
+        Raises:
+            RequestBudgetExceeded: If the request budget for this task is spent
+        """
+        budget = _request_budget.get()
+        if budget is not None:
+            if budget[0] <= 0:
+                raise RequestBudgetExceeded(f"{self.name}: request budget exhausted")
+            budget[0] -= 1
+
         async with self._lock:
             now = time.monotonic()
             elapsed = now - self._last_refill
@@ -2,16 +2,24 @@
 Source registry for managing academic paper sources.
 
 Provides a unified interface to search across multiple sources
-with priority ordering and fallback handling.
+concurrently, with per-source deadlines and fallback handling.
 """
 
 import asyncio
+from contextlib import aclosing
 from typing import Dict, List, Optional, AsyncIterator, Set
 from datetime import datetime
 import logging
 import os
-
-from .base import AcademicSource, PaperMetadata, SourcePriority
+import re
+
+from .base import (
+    AcademicSource,
+    PaperMetadata,
+    RequestBudgetExceeded,
+    SourcePriority,
+    request_budget,
+)
 from .arxiv import ArxivSource
 from .semantic_scholar import SemanticScholarSource
 from .pubmed import PubMedSource
@@ -19,15 +27,42 @@ from .core import CORESource
 
 logger = logging.getLogger(__name__)
 
+# Default deadline for each source in search_all
+DEFAULT_SOURCE_TIMEOUT = 30.0
+
+# Queue marker for a source that has finished (or failed, or timed out)
+_SOURCE_DONE = object()
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _dedup_keys(paper: PaperMetadata) -> Set[str]:
+    """Identity keys for a paper: external IDs plus its normalized title."""
+    keys = set()
+    if paper.doi:
+        keys.add(f"doi:{paper.doi.strip().lower()}")
+    if paper.arxiv_id:
+        # Versions of the same preprint are one paper
+        keys.add(f"arxiv:{re.sub(r'v[0-9]+$', '', paper.arxiv_id.strip().lower())}")
+    if paper.semantic_scholar_id:
+        keys.add(f"s2:{paper.semantic_scholar_id}")
+    if paper.pubmed_id:
+        keys.add(f"pubmed:{paper.pubmed_id}")
+    title = _NON_ALNUM.sub(" ", (paper.title or "").lower()).strip()
+    if title:
+        keys.add(f"title:{title}")
+    return keys
+
 
 class SourceRegistry:
     """
     Registry for managing academic paper sources.
 
     Provides:
-    - Unified search across multiple sources
+    - Unified concurrent search across multiple sources
     - Priority-based source ordering
-    - Deduplication via paper IDs
+    - Deduplication via paper IDs and titles
+    - Per-source deadlines and request budgets
     - Fallback on source failures
 
     Example usage:
@@ -109,9 +144,17 @@ class SourceRegistry:
         date_to: Optional[datetime] = None,
         categories: Optional[List[str]] = None,
         deduplicate: bool = True,
+        source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+        max_requests_per_source: Optional[int] = None,
     ) -> AsyncIterator[PaperMetadata]:
         """
-        Search across all (or specified) sources.
+        Search across all (or specified) sources concurrently.
+
+        Every source is started at once and papers are yielded in arrival
+        order, so the first paper comes from the fastest source and the
+        search takes as long as the slowest one. A source that misses its
+        deadline or spends its request budget is cancelled; papers it
+        already produced are kept.
 
         Args:
             query: Search query string
@@ -120,7 +163,9 @@ class SourceRegistry:
             date_from: Filter by publication date (start)
             date_to: Filter by publication date (end)
             categories: Category filters (source-specific)
-            deduplicate: Whether to deduplicate by DOI/arXiv ID
+            deduplicate: Whether to deduplicate by DOI/arXiv/S2/PubMed ID and title
+            source_timeout: Seconds each source may run (None = no deadline)
+            max_requests_per_source: Rate-limited requests each source may make
 
         Yields:
             PaperMetadata from all sources, deduplicated
@@ -139,56 +184,58 @@ class SourceRegistry:
             logger.warning("No sources available for search")
             return
 
-        # Track seen papers for deduplication
-        seen_dois: Set[str] = set()
-        seen_arxiv: Set[str] = set()
-        seen_s2: Set[str] = set()
-        seen_pubmed: Set[str] = set()
+        queue: asyncio.Queue = asyncio.Queue()
 
-        # Search sources in priority order
-        for source in source_list:
+        async def stream_source(source: AcademicSource) -> None:
+            count = 0
             try:
-                logger.info(f"Searching {source.name} for: {query[:50]}...")
-
-                async for paper in source.search(
-                    query=query,
-                    max_results=max_per_source,
-                    date_from=date_from,
-                    date_to=date_to,
-                    categories=categories,
-                ):
-                    if deduplicate:
-                        # Check for duplicates
-                        is_dup = False
-
-                        if paper.doi and paper.doi in seen_dois:
-                            is_dup = True
-                        elif paper.arxiv_id and paper.arxiv_id in seen_arxiv:
-                            is_dup = True
-                        elif paper.semantic_scholar_id and paper.semantic_scholar_id in seen_s2:
-                            is_dup = True
-                        elif paper.pubmed_id and paper.pubmed_id in seen_pubmed:
-                            is_dup = True
-
-                        if is_dup:
-                            continue
-
-                        # Track this paper
-                        if paper.doi:
-                            seen_dois.add(paper.doi)
-                        if paper.arxiv_id:
-                            seen_arxiv.add(paper.arxiv_id)
-                        if paper.semantic_scholar_id:
-                            seen_s2.add(paper.semantic_scholar_id)
-                        if paper.pubmed_id:
-                            seen_pubmed.add(paper.pubmed_id)
-
-                    yield paper
-
+                with request_budget(max_requests_per_source):
+                    async with asyncio.timeout(source_timeout):
+                        async for paper in source.search(
+                            query=query,
+                            max_results=max_per_source,
+                            date_from=date_from,
+                            date_to=date_to,
+                            categories=categories,
+                        ):
+                            count += 1
+                            queue.put_nowait(paper)
+            except TimeoutError:
+                logger.warning(
+                    f"{source.name} missed its {source_timeout}s deadline "
+                    f"after {count} papers"
+                )
+            except RequestBudgetExceeded:
+                logger.info(f"{source.name} spent its request budget after {count} papers")
             except Exception as e:
                 logger.error(f"Error searching {source.name}: {e}")
-                # Continue with next source on failure
-                continue
+            finally:
+                queue.put_nowait(_SOURCE_DONE)
+
+        logger.info(f"Searching {len(source_list)} sources for: {query[:50]}...")
+        tasks = [asyncio.create_task(stream_source(source)) for source in source_list]
+        seen: Set[str] = set()
+        pending = len(tasks)
+
+        try:
+            while pending:
+                item = await queue.get()
+                if item is _SOURCE_DONE:
+                    pending -= 1
+                    continue
+
+                if deduplicate:
+                    keys = _dedup_keys(item)
+                    if not seen.isdisjoint(keys):
+                        continue
+                    seen.update(keys)
+
+                yield item
+        finally:
+            # Consumer stopped early (or was cancelled): stop the remaining sources
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def search_parallel(
         self,
@@ -337,9 +384,10 @@ class SourceRegistry:
                 return paper
 
         # Fall back to search
-        async for paper in self.search_all(doi, max_per_source=5):
-            if paper.doi == doi:
-                return paper
+        async with aclosing(self.search_all(doi, max_per_source=5)) as papers:
+            async for paper in papers:
+                if paper.doi == doi:
+                    return paper
 
         return None
 
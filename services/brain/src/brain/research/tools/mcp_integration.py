@@ -491,7 +491,7 @@ class ResearchToolExecutor:
         Execute multiple searches with deduplication and parallel execution.
 
         Two-phase approach:
-        1. Collect and deduplicate queries using Jaccard similarity
+        1. Collect and deduplicate queries (word overlap + embedding similarity)
         2. Execute unique queries in parallel with semaphore
 
         Args:
@@ -512,7 +512,9 @@ class ResearchToolExecutor:
         start_time = time.time()
 
         # Phase 1: Deduplicate queries
-        dedup_result = deduplicate_queries(
+        # Off the event loop: the first call loads the embedding model
+        dedup_result = await asyncio.to_thread(
+            deduplicate_queries,
             queries,
             similarity_threshold=similarity_threshold,
             max_queries=15,
@@ -24,6 +24,12 @@ from .pipeline import (
     ChainValidator,
     create_research_output_pipeline,
 )
+from .contradictions import (
+    Contradiction,
+    ContradictionDetector,
+    CrossEncoderNLIScorer,
+    NegationScorer,
+)
 
 from .schemas import (
     SourceDocument,
@@ -56,6 +62,11 @@ __all__ = [
     "HallucinationDetector",
     "ChainValidator",
     "create_research_output_pipeline",
+    # Contradiction detection
+    "Contradiction",
+    "ContradictionDetector",
+    "CrossEncoderNLIScorer",
+    "NegationScorer",
     # Schemas
     "SourceDocument",
     "SearchToolInput",
@@ -0,0 +1,274 @@
+"""
+Indexed contradiction detection for research outputs.
+
+Comparing every sentence pair is quadratic and, with word overlap alone,
+very noisy. Instead:
+- Sentences are bucketed by salient subject terms in an inverted index;
+  only pairs sharing at least ``min_shared_terms`` key terms are candidates
+- Candidates are scored by a small NLI cross-encoder on CPU, in batches
+- Scores are cached by sentence-pair hash, so re-validating a revised
+  synthesis only scores the new pairs
+
+Without sentence-transformers, or if the model cannot be loaded,
+candidates fall back to a negation heuristic (one sentence negated, the
+other not).
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Protocol, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NLI_MODEL = "cross-encoder/nli-deberta-v3-xsmall"
+
+# Contradiction probability needed to report a pair
+DEFAULT_CONTRADICTION_THRESHOLD = 0.7
+
+# A term in more than this share of sentences (and more than MIN_TERM_CAP
+# sentences) is topic vocabulary, not a subject
+MAX_TERM_SHARE = 0.2
+MIN_TERM_CAP = 5
+
+STOPWORDS = frozenset(
+    "a about above after again against all also an and any are as at be because been before being "
+    "below between both but by can could did do does doing down during each either few for from "
+    "further had has have having he her here hers him his how however i if in into is it its itself "
+    "just more most much must my neither nor of off on once only or other our ours out over own "
+    "same she should so some such than that the their theirs them then there these they this those "
+    "through thus to too under until up us very was we were what when where which while who whom "
+    "why will with within would you your".split()
+)
+
+NEGATIONS = frozenset(
+    "not no never none nothing nobody neither nor cannot without fails failed lacks".split()
+)
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9\-+.]*[a-z0-9+]|[a-z0-9]")
+
+
+@dataclass
+class Contradiction:
+    """A pair of sentences judged to contradict each other."""
+    first: str
+    second: str
+    score: float
+
+    def describe(self) -> str:
+        return f"{self.first[:50]}... vs {self.second[:50]}..."
+
+
+class ContradictionScorer(Protocol):
+    """Scores sentence pairs with the probability that they contradict."""
+
+    def score(self, pairs: Sequence[Tuple[str, str]]) -> List[float]:
+        ...
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences on terminal punctuation and line breaks."""
+    return [s.strip() for s in _SENTENCE_SPLIT.split(text) if len(s.strip()) > 1]
+
+
+def _tokens(sentence: str) -> List[str]:
+    return _TOKEN.findall(sentence.lower().replace("n't", " not"))
+
+
+def salient_terms(sentence: str) -> Set[str]:
+    """Content words that can identify what a sentence is about."""
+    return {
+        t for t in _tokens(sentence)
+        if t not in STOPWORDS and t not in NEGATIONS and (len(t) > 2 or t.isdigit())
+    }
+
+
+def _pair_key(first: str, second: str) -> bytes:
+    return hashlib.blake2b(f"{first}\x00{second}".encode(), digest_size=16).digest()
+
+
+class NegationScorer:
+    """Fallback scorer: a candidate pair where exactly one side is negated."""
+
+    def score(self, pairs: Sequence[Tuple[str, str]]) -> List[float]:
+        scores = []
+        for first, second in pairs:
+            negated_first = any(t in NEGATIONS for t in _tokens(first))
+            negated_second = any(t in NEGATIONS for t in _tokens(second))
+            scores.append(1.0 if negated_first != negated_second else 0.0)
+        return scores
+
+
+class CrossEncoderNLIScorer:
+    """
+    Small NLI cross-encoder on CPU with an LRU cache keyed by pair hash.
+
+    If the model fails to load (missing download, no network, broken
+    install), the failure is remembered and the negation heuristic is used
+    from then on, so validation never raises or retries the download.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_NLI_MODEL,
+        batch_size: int = 32,
+        max_cached: int = 50000,
+    ):
+        self._model_name = model_name
+        self._model = None
+        self._contradiction_index = 0
+        self._batch_size = batch_size
+        self._max_cached = max_cached
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fallback: Optional[NegationScorer] = None
+
+    def _load_model(self):
+        """Lazy-load the cross-encoder (~70MB, CPU); None if it cannot be loaded."""
+        if self._model is None and self._fallback is None:
+            try:
+                from sentence_transformers import CrossEncoder
+
+                logger.info(f"Loading NLI cross-encoder: {self._model_name}")
+                model = CrossEncoder(self._model_name, device="cpu")
+                labels = {
+                    str(label).lower(): int(index)
+                    for index, label in (model.config.id2label or {}).items()
+                }
+            except Exception as e:
+                logger.warning(
+                    f"NLI cross-encoder {self._model_name} unavailable, "
+                    f"contradiction checks use negation heuristic: {e}"
+                )
+                self._fallback = NegationScorer()
+                return None
+            self._contradiction_index = labels.get("contradiction", 0)
+            self._model = model
+        return self._model
+
+    def score(self, pairs: Sequence[Tuple[str, str]]) -> List[float]:
+        """Contradiction probability per pair, running the model only on cache misses."""
+        keys = [_pair_key(a, b) for a, b in pairs]
+        with self._lock:
+            missing = {}
+            for key, pair in zip(keys, pairs):
+                if key not in self._cache and key not in missing:
+                    missing[key] = pair
+            if missing:
+                model = self._load_model()
+                if model is None:
+                    return self._fallback.score(pairs)
+                try:
+                    probabilities = model.predict(
+                        list(missing.values()),
+                        batch_size=self._batch_size,
+                        apply_softmax=True,
+                        show_progress_bar=False,
+                    )
+                except Exception as e:
+                    logger.warning(f"NLI scoring failed, using negation heuristic: {e}")
+                    return NegationScorer().score(pairs)
+                for key, row in zip(missing, probabilities):
+                    self._cache[key] = float(row[self._contradiction_index])
+            scores = []
+            for key in keys:
+                self._cache.move_to_end(key)
+                scores.append(self._cache[key])
+            while len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
+        return scores
+
+
+class ContradictionDetector:
+    """
+    Finds contradicting sentence pairs via an inverted index of subject terms.
+
+    Example usage:
+        detector = ContradictionDetector()
+        for contradiction in detector.detect(synthesis_text):
+            print(contradiction.describe())
+    """
+
+    def __init__(
+        self,
+        scorer: Optional[ContradictionScorer] = None,
+        threshold: float = DEFAULT_CONTRADICTION_THRESHOLD,
+        min_shared_terms: int = 2,
+        max_candidates: int = 2000,
+    ):
+        self.scorer = scorer if scorer is not None else get_contradiction_scorer()
+        self.threshold = threshold
+        self.min_shared_terms = min_shared_terms
+        self.max_candidates = max_candidates
+
+    def candidate_pairs(self, sentences: Sequence[str]) -> List[Tuple[int, int]]:
+        """
+        Sentence index pairs that share enough salient terms.
+
+        Pairs sharing the most terms come first; at most ``max_candidates``.
+        """
+        term_sets = [salient_terms(s) for s in sentences]
+        document_frequency: Dict[str, int] = defaultdict(int)
+        for terms in term_sets:
+            for term in terms:
+                document_frequency[term] += 1
+        max_df = max(MIN_TERM_CAP, int(len(sentences) * MAX_TERM_SHARE))
+
+        index: Dict[str, List[int]] = defaultdict(list)
+        shared: Dict[Tuple[int, int], int] = defaultdict(int)
+        for i, terms in enumerate(term_sets):
+            for term in terms:
+                if document_frequency[term] > max_df:
+                    continue
+                for j in index[term]:
+                    shared[(j, i)] += 1
+                index[term].append(i)
+
+        candidates = [pair for pair, count in shared.items() if count >= self.min_shared_terms]
+        candidates.sort(key=lambda pair: (-shared[pair], pair))
+        if len(candidates) > self.max_candidates:
+            logger.debug(f"Capping contradiction candidates at {self.max_candidates} of {len(candidates)}")
+        return candidates[: self.max_candidates]
+
+    def detect(self, text: str) -> List[Contradiction]:
+        """
+        Detect contradicting sentence pairs in text.
+
+        Returns:
+            Contradictions sorted by descending score
+        """
+        sentences = list(dict.fromkeys(split_sentences(text)))
+        candidates = self.candidate_pairs(sentences)
+        if not candidates:
+            return []
+
+        pairs = [(sentences[i], sentences[j]) for i, j in candidates]
+        scores = self.scorer.score(pairs)
+        found = [
+            Contradiction(first=a, second=b, score=round(score, 3))
+            for (a, b), score in zip(pairs, scores)
+            if score >= self.threshold
+        ]
+        found.sort(key=lambda c: -c.score)
+        return found
+
+
+_default_scorer: Optional[ContradictionScorer] = None
+
+
+def get_contradiction_scorer() -> ContradictionScorer:
+    """Shared NLI scorer, or the negation heuristic without sentence-transformers."""
+    global _default_scorer
+    if _default_scorer is None:
+        try:
+            import sentence_transformers  # noqa: F401
+        except Exception:
+            logger.warning("sentence-transformers not installed; contradiction checks use negation heuristic")
+            _default_scorer = NegationScorer()
+        else:
+            _default_scorer = CrossEncoderNLIScorer()
+    return _default_scorer
@@ -9,6 +9,7 @@ Provides comprehensive validation for research tools and outputs:
 - Chain validation (tool output compatibility)
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -18,6 +19,8 @@ import re
 
 from pydantic import BaseModel, ValidationError
 
+from .contradictions import ContradictionDetector
+
 logger = logging.getLogger(__name__)
 
 
@@ -510,8 +513,9 @@ class HallucinationDetector(BaseValidator):
     - Speculation is marked as such
     """
 
-    def __init__(self):
+    def __init__(self, contradiction_detector: Optional[ContradictionDetector] = None):
         super().__init__(name="hallucination_detector")
+        self._contradiction_detector = contradiction_detector
 
     async def validate(self, data: Any, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
         """Detect potential hallucinations"""
@@ -569,8 +573,8 @@ class HallucinationDetector(BaseValidator):
                 )
             )
 
-        # Check for contradictory statements (basic)
-        contradictions = self._detect_contradictions(text_content)
+        # Check for contradictory statements (model inference off the event loop)
+        contradictions = await asyncio.to_thread(self._detect_contradictions, text_content)
         if contradictions:
             metadata["potential_contradictions"] = len(contradictions)
             issues.append(
@@ -592,26 +596,15 @@ class HallucinationDetector(BaseValidator):
         """
         Detect potential contradictions.
 
-        Simple heuristic: look for negation patterns.
+        Candidate sentence pairs come from an inverted index of shared
+        subject terms and are scored by an NLI cross-encoder (see
+        ``ContradictionDetector``).
         """
-        contradictions = []
-
-        # Look for "X is Y" followed later by "X is not Y"
-        # This is a very basic implementation
-        sentences = [s.strip() for s in text.split(".") if s.strip()]
-
-        for i, sent1 in enumerate(sentences):
-            for sent2 in sentences[i+1:]:
-                # Very basic: check for "not" appearing in similar sentences
-                words1 = set(sent1.lower().split())
-                words2 = set(sent2.lower().split())
-
-                overlap = words1 & words2
-                if len(overlap) > 3:  # Significant overlap
-                    if ("not" in words1) != ("not" in words2):  # One has "not", other doesn't
-                        contradictions.append(f"{sent1[:50]}... vs {sent2[:50]}...")
+        if self._contradiction_detector is None:
+            self._contradiction_detector = ContradictionDetector()
 
-        return contradictions[:3]  # Return max 3 examples
+        contradictions = self._contradiction_detector.detect(text)
+        return [c.describe() for c in contradictions[:3]]  # Return max 3 examples
 
 
 class ChainValidator(BaseValidator):
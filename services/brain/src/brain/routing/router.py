@@ -136,6 +136,11 @@ class BrainRouter:
         # Cache for all available tools (registry + MCP)
         self._all_tools_cache: Optional[List[Dict[str, Any]]] = None
 
+    async def aclose(self) -> None:
+        """Close clients owned by the tool MCP servers."""
+        if self._tool_mcp:
+            await self._tool_mcp.aclose()
+
     def _get_all_available_tools(self) -> List[Dict[str, Any]]:
         """Get all available tools from registry and MCP servers.
 
@@ -0,0 +1,281 @@
+# noqa: D401
+"""Coalescing MQTT publisher for conversation context.
+
+Context updates are handed to a background thread instead of being
+published inline. Per conversation only the latest context inside a short
+window is sent, as a compact JSON merge patch (RFC 7386) on
+``kitty/ctx/<id>/delta``. The full context is retained on ``kitty/ctx/<id>``
+for late joiners: on the first publish, every ``snapshot_every`` deltas, and
+at most ``snapshot_interval`` seconds after the last change. A subscriber
+that applies the retained snapshot and then each delta (see
+``apply_merge_patch``) holds exactly the publisher's latest state.
+
+Conversations idle for ``idle_ttl`` seconds with a current retained
+snapshot are dropped from memory; their next update starts over with a
+full snapshot.
+
+Outbound QoS 1 messages not yet acknowledged by the broker are bounded by
+``max_outbound``; when the bound is reached, updates stay coalesced in
+memory (only the latest per conversation) until the broker catches up.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from common.logging import get_logger
+from common.mqtt import MQTTClient, PublishOptions
+
+from ..metrics import (
+    CONTEXT_OUTBOUND_QUEUE,
+    CONTEXT_PUBLISH_DEFERRED,
+    CONTEXT_PUBLISHES,
+    CONTEXT_UPDATES_COALESCED,
+)
+
+LOGGER = get_logger(__name__)
+
+TOPIC_PREFIX = "kitty/ctx"
+
+
+def merge_patch(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the RFC 7386 merge patch turning ``old`` into ``new``.
+
+    Removed keys (and values that became ``None``) are sent as ``null``.
+    """
+
+    patch: Dict[str, Any] = {key: None for key in old.keys() - new.keys()}
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+        elif old[key] != value:
+            if isinstance(value, dict) and isinstance(old[key], dict):
+                patch[key] = merge_patch(old[key], value)
+            else:
+                patch[key] = value
+    return patch
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """Apply an RFC 7386 merge patch (used by subscribers of the delta topic)."""
+
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
+
+
+@dataclass
+class _ConversationState:
+    published: Optional[Dict[str, Any]] = None
+    pending: Optional[Dict[str, Any]] = None
+    seq: int = 0
+    deltas_since_snapshot: int = 0
+    snapshot_at: float = 0.0
+    snapshot_current: bool = False
+    force_snapshot: bool = False
+    due_at: Optional[float] = None
+    updated_at: float = 0.0
+
+
+_Message = Tuple[str, str, Dict[str, Any], PublishOptions]
+
+
+class ContextPublisher:
+    """Background publisher with per-conversation coalescing."""
+
+    def __init__(
+        self,
+        client: MQTTClient,
+        *,
+        window: float = 0.05,
+        snapshot_every: int = 20,
+        snapshot_interval: float = 5.0,
+        max_outbound: int = 1000,
+        idle_ttl: float = 600.0,
+        topic_prefix: str = TOPIC_PREFIX,
+    ) -> None:
+        self._client = client
+        self.window = window
+        self.snapshot_every = max(1, snapshot_every)
+        self.snapshot_interval = snapshot_interval
+        self.max_outbound = max(1, max_outbound)
+        self.idle_ttl = idle_ttl
+        self.topic_prefix = topic_prefix
+        self._states: Dict[str, _ConversationState] = {}
+        self._inflight: Deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._publishing = False
+        self.counts = {"updates": 0, "coalesced": 0, "deltas": 0, "snapshots": 0, "deferred": 0}
+
+    def submit(self, conversation_id: str, payload: Dict[str, Any]) -> None:
+        """Queue the latest context of a conversation; never blocks on the broker."""
+
+        with self._cond:
+            now = time.monotonic()
+            state = self._states.setdefault(conversation_id, _ConversationState())
+            self.counts["updates"] += 1
+            if state.pending is not None:
+                self.counts["coalesced"] += 1
+                CONTEXT_UPDATES_COALESCED.inc()
+            state.pending = payload
+            state.updated_at = now
+            deadline = now + self.window
+            if state.due_at is None or state.due_at > deadline:
+                state.due_at = deadline
+            self._ensure_thread()
+            self._cond.notify()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Publish everything pending now, with current retained snapshots.
+
+        Returns ``False`` if the work did not finish within ``timeout``.
+        """
+
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            for state in self._states.values():
+                if state.pending is not None or not state.snapshot_current:
+                    state.force_snapshot = True
+                    state.due_at = 0.0
+            self._ensure_thread()
+            self._cond.notify()
+            while self._publishing or any(s.due_at is not None for s in self._states.values()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush and stop the publisher thread."""
+
+        self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {**self.counts, "outbound": self._outbound(), "conversations": len(self._states)}
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None and not self._stopping:
+            self._thread = threading.Thread(target=self._run, name="mqtt-context-publisher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._publishing = False
+                self._cond.notify_all()
+                messages = self._collect_due()
+                while not messages:
+                    if self._stopping:
+                        return
+                    self._cond.wait(self._next_wait())
+                    messages = self._collect_due()
+                self._publishing = True
+            for kind, topic, payload, options in messages:
+                try:
+                    info = self._client.publish(topic, payload, options=options)
+                except Exception as exc:  # noqa: BLE001 - keep the publisher alive
+                    LOGGER.warning("Context publish failed", topic=topic, error=str(exc))
+                    continue
+                if info is not None and options.qos > 0:
+                    with self._cond:
+                        self._inflight.append(info)
+                CONTEXT_PUBLISHES.labels(kind=kind).inc()
+
+    def _next_wait(self) -> Optional[float]:
+        dues = [s.due_at for s in self._states.values() if s.due_at is not None]
+        if not dues:
+            return None
+        wait = min(dues) - time.monotonic()
+        if self._outbound() >= self.max_outbound:
+            # Backpressured: re-check acknowledgements instead of spinning
+            wait = max(wait, self.window)
+        return max(0.0, wait)
+
+    def _outbound(self) -> int:
+        while self._inflight and self._inflight[0].is_published():
+            self._inflight.popleft()
+        CONTEXT_OUTBOUND_QUEUE.set(len(self._inflight))
+        return len(self._inflight)
+
+    def _collect_due(self) -> List[_Message]:
+        now = time.monotonic()
+        messages: List[_Message] = []
+        for conversation_id, state in self._states.items():
+            if state.due_at is None or state.due_at > now:
+                continue
+            if self._outbound() + len(messages) >= self.max_outbound:
+                self.counts["deferred"] += 1
+                CONTEXT_PUBLISH_DEFERRED.inc()
+                state.due_at = now + self.window
+                continue
+            messages.extend(self._messages_for(conversation_id, state, now))
+        self._prune_idle(now)
+        return messages
+
+    def _prune_idle(self, now: float) -> None:
+        idle = [
+            conversation_id
+            for conversation_id, state in self._states.items()
+            if state.due_at is None and state.pending is None and now - state.updated_at >= self.idle_ttl
+        ]
+        for conversation_id in idle:
+            del self._states[conversation_id]
+
+    def _messages_for(self, conversation_id: str, state: _ConversationState, now: float) -> List[_Message]:
+        topic = f"{self.topic_prefix}/{conversation_id}"
+        messages: List[_Message] = []
+        if state.pending is not None:
+            if state.published is not None:
+                patch = merge_patch(state.published, state.pending)
+                if patch:
+                    state.seq += 1
+                    state.deltas_since_snapshot += 1
+                    state.snapshot_current = False
+                    self.counts["deltas"] += 1
+                    messages.append(
+                        ("delta", f"{topic}/delta", {"seq": state.seq, "patch": patch}, PublishOptions(qos=1))
+                    )
+            else:
+                state.snapshot_current = False
+            state.published = state.pending
+            state.pending = None
+
+        snapshot_due = not state.snapshot_current and (
+            state.force_snapshot
+            or state.seq == 0
+            or state.deltas_since_snapshot >= self.snapshot_every
+            or now - state.snapshot_at >= self.snapshot_interval
+        )
+        if snapshot_due and state.published is not None:
+            self.counts["snapshots"] += 1
+            messages.append(("snapshot", topic, state.published, PublishOptions(qos=1, retain=True)))
+            state.snapshot_current = True
+            state.deltas_since_snapshot = 0
+            state.snapshot_at = now
+        state.force_snapshot = False
+        # A stale retained snapshot is refreshed once the conversation goes quiet
+        state.due_at = None if state.snapshot_current else state.snapshot_at + self.snapshot_interval
+        return messages
+
+
+__all__ = ["ContextPublisher", "apply_merge_patch", "merge_patch"]
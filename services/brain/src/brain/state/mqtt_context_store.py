@@ -6,18 +6,29 @@ from __future__ import annotations
 from typing import Dict, Optional
 
 from common.logging import get_logger
-from common.mqtt import MQTTClient, PublishOptions
+from common.mqtt import MQTTClient
 
 from ..models.context import ConversationContext
+from .context_publisher import ContextPublisher
 
 LOGGER = get_logger(__name__)
 
 
 class MQTTContextStore:
-    """Persist conversational context locally and publish to MQTT for other clients."""
+    """Persist conversational context locally and publish to MQTT for other clients.
 
-    def __init__(self, client: Optional[MQTTClient] = None) -> None:
+    Publishing is coalesced and runs off the request path; see
+    ``ContextPublisher`` for the topic layout (retained snapshots on
+    ``kitty/ctx/<id>``, merge-patch deltas on ``kitty/ctx/<id>/delta``).
+    """
+
+    def __init__(
+        self,
+        client: Optional[MQTTClient] = None,
+        publisher: Optional[ContextPublisher] = None,
+    ) -> None:
         self._client = client or MQTTClient(client_id="brain-context-store")
+        self._publisher = publisher or ContextPublisher(self._client)
         self._contexts: Dict[str, ConversationContext] = {}
         self._connected = False
 
@@ -32,15 +43,25 @@ class MQTTContextStore:
 
         self._contexts[context.conversation_id] = context
         self._ensure_connection()
-        topic = f"kitty/ctx/{context.conversation_id}"
-        payload = context.model_dump(mode="json")
-        LOGGER.info("Publishing conversation context", topic=topic)
-        self._client.publish(topic, payload, options=PublishOptions(qos=1, retain=True))
+        self._publisher.submit(context.conversation_id, context.model_dump(mode="json"))
 
     def get_context(self, conversation_id: str) -> Optional[ConversationContext]:
         """Return stored context if available."""
 
         return self._contexts.get(conversation_id)
 
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Publish pending updates and refresh retained snapshots now."""
+
+        return self._publisher.flush(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending updates and stop publishing."""
+
+        self._publisher.stop(timeout)
+
+    def publisher_stats(self) -> Dict[str, int]:
+        return self._publisher.stats()
+
 
 __all__ = ["MQTTContextStore"]
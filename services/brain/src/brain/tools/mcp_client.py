@@ -222,6 +222,17 @@ class MCPClient:
 
         raise ValueError(f"Resource not found: {uri}")
 
+    async def aclose(self) -> None:
+        """Release resources held by servers that own clients (e.g. vision)."""
+        for server_name, server in self._servers.items():
+            aclose = getattr(server, "aclose", None)
+            if aclose is None:
+                continue
+            try:
+                await aclose()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to close MCP server %s: %s", server_name, exc)
+
     def get_tools_for_prompt(self) -> List[Dict[str, Any]]:
         """Get all tools formatted for LLM prompts (JSON Schema).
 
@@ -1,16 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from common.logging import get_logger
+
+from .dependencies import get_artifact_catalog
 from .routes.generate import router as generate_router
 from .routes.print_integration import router as print_router
 from .routes.artifacts import router as artifacts_router
 
-app = FastAPI(title="KITTY CAD Service")
+LOGGER = get_logger(__name__)
+
+# How often the artifact catalog is reconciled against the filesystem
+CATALOG_RECONCILE_INTERVAL = float(os.getenv("CAD_CATALOG_RECONCILE_SECONDS", "900"))
+
+
+async def _reconcile_catalog_loop() -> None:
+    catalog = get_artifact_catalog()
+    while True:
+        try:
+            await asyncio.to_thread(catalog.reconcile)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Artifact catalog reconcile failed", error=str(exc))
+        await asyncio.sleep(CATALOG_RECONCILE_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    reconcile_task = asyncio.create_task(_reconcile_catalog_loop())
+    try:
+        yield
+    finally:
+        reconcile_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reconcile_task
+
+
+app = FastAPI(title="KITTY CAD Service", lifespan=lifespan)
 app.include_router(generate_router)
 app.include_router(print_router)
 app.include_router(artifacts_router)
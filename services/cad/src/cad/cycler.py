@@ -196,7 +196,9 @@ class CADCycler:
             tmp_output = Path("/tmp") / f"{uuid4().hex}.glb"
             success = self._local_runner.generate(image_path, tmp_output)
             if success:
-                location = self._store.save_file(tmp_output, ".glb")
+                location = await asyncio.to_thread(
+                    self._store.save_file, tmp_output, ".glb"
+                )
                 artifacts.append(
                     CADArtifact(
                         provider="tripo_local",
@@ -212,7 +214,9 @@ class CADCycler:
             tmp_output = Path("/tmp") / f"{uuid4().hex}.step"
             success = self._freecad.run_script(script_path, tmp_output)
             if success:
-                location = self._store.save_file(tmp_output, ".step")
+                location = await asyncio.to_thread(
+                    self._store.save_file, tmp_output, ".step"
+                )
                 artifacts.append(
                     CADArtifact(
                         provider="freecad",
@@ -484,11 +488,8 @@ class CADCycler:
             LOGGER.warning("Meshy result missing GLB URL", task_id=task_id, result_keys=list(result.keys()))
             return None
 
-        # Download GLB
-        glb_bytes = await self._download_bytes(glb_url)
-        glb_location = await asyncio.to_thread(
-            self._store.save_bytes, glb_bytes, ".glb", "glb"
-        )
+        # Stream GLB into storage
+        glb_location = await self._store.save_from_url(glb_url, ".glb", "glb")
         LOGGER.info("Saved Meshy GLB", location=glb_location)
 
         # Convert to 3MF for slicer compatibility
@@ -497,7 +498,10 @@ class CADCycler:
         primary_location = glb_location
 
         try:
-            threemf_data = convert_mesh_to_3mf(glb_bytes, source_format="glb")
+            glb_bytes = await self._read_stored_mesh(glb_location, glb_url)
+            threemf_data = await asyncio.to_thread(
+                convert_mesh_to_3mf, glb_bytes, source_format="glb"
+            )
             threemf_location = await asyncio.to_thread(
                 self._store.save_bytes, threemf_data, ".3mf", "3mf"
             )
@@ -623,16 +627,8 @@ class CADCycler:
                 LOGGER.warning("Tripo text-to-3D result missing model URL", result=result_data)
                 return None
 
-            # Download GLB
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(model_url)
-                response.raise_for_status()
-                glb_data = response.content
-
             # Always save GLB for preview purposes
-            glb_location = await asyncio.to_thread(
-                self._store.save_bytes, glb_data, ".glb", "glb"
-            )
+            glb_location = await self._store.save_from_url(model_url, ".glb", "glb")
             LOGGER.info("Saved GLB for preview", location=glb_location)
 
             # Convert GLB to 3MF for slicer compatibility
@@ -640,7 +636,10 @@ class CADCycler:
             artifact_type = "glb"
             primary_location = glb_location
             try:
-                threemf_data = convert_mesh_to_3mf(glb_data, source_format="glb")
+                glb_data = await self._read_stored_mesh(glb_location, model_url)
+                threemf_data = await asyncio.to_thread(
+                    convert_mesh_to_3mf, glb_data, source_format="glb"
+                )
                 threemf_location = await asyncio.to_thread(
                     self._store.save_bytes, threemf_data, ".3mf", "3mf"
                 )
@@ -769,6 +768,18 @@ class CADCycler:
             response.raise_for_status()
             return response.content
 
+    async def _read_stored_mesh(self, location: str, url: str) -> bytes:
+        """Load a stored mesh for local conversion.
+
+        Downloads are streamed into the store; only the mesh converter needs
+        the whole file in memory. Local artifacts are read back from disk,
+        anything else (e.g. MinIO) is fetched again from the source URL.
+        """
+        path = Path(location)
+        if await asyncio.to_thread(path.is_file):
+            return await asyncio.to_thread(path.read_bytes)
+        return await self._download_bytes(url)
+
     async def _store_tripo_result(
         self,
         result: Dict[str, Any],
@@ -786,19 +797,16 @@ class CADCycler:
         # First, try to get the original mesh URL for GLB preview
         mesh_url, mesh_format = self._extract_mesh_url(payload)
         glb_location = None
-        glb_bytes = None
 
         if mesh_url:
-            glb_bytes = await self._download_bytes(mesh_url)
             # Always save GLB for preview purposes
-            glb_location = self._store.save_bytes(glb_bytes, ".glb", "glb")
+            glb_location = await self._store.save_from_url(mesh_url, ".glb", "glb")
             LOGGER.info("Saved GLB for preview", location=glb_location)
 
         # Try server-side 3MF conversion first
         convert_payload = await self._convert_tripo_task_to_3mf(task_id)
         if convert_payload:
-            content, convert_task_id = convert_payload
-            threemf_location = self._store.save_bytes(content, ".3mf", "3mf")
+            threemf_location, convert_task_id = convert_payload
             LOGGER.info("Saved 3MF from server conversion", location=threemf_location)
             metadata = {
                 "task_id": task_id or "",
@@ -837,12 +845,15 @@ class CADCycler:
         artifact_type = "glb"
         primary_location = glb_location
 
-        if self._mesh_converter and glb_bytes:
+        if self._mesh_converter and glb_location:
             try:
+                glb_bytes = await self._read_stored_mesh(glb_location, mesh_url)
                 converted = await asyncio.to_thread(
                     self._mesh_converter, glb_bytes, mesh_format
                 )
-                threemf_location = self._store.save_bytes(converted, ".3mf", "3mf")
+                threemf_location = await asyncio.to_thread(
+                    self._store.save_bytes, converted, ".3mf", "3mf"
+                )
                 artifact_type = "3mf"
                 primary_location = threemf_location
                 LOGGER.info("Saved 3MF from local conversion", location=threemf_location)
@@ -890,7 +901,11 @@ class CADCycler:
 
     async def _convert_tripo_task_to_3mf(
         self, task_id: Optional[str]
-    ) -> Optional[tuple[bytes, Optional[str]]]:
+    ) -> Optional[tuple[str, Optional[str]]]:
+        """Convert a Tripo task to 3MF server-side and stream it into storage.
+
+        Returns the stored location and the convert task ID, or None.
+        """
         if not self._tripo_convert_enabled or not self._tripo or not task_id:
             return None
         try:
@@ -909,8 +924,8 @@ class CADCycler:
                     task_id=convert_job.get("task_id"),
                 )
                 return None
-            data = await self._download_bytes(threemf_url)
-            return data, convert_job.get("task_id")
+            location = await self._store.save_from_url(threemf_url, ".3mf", "3mf")
+            return location, convert_job.get("task_id")
         except Exception as exc:  # noqa: BLE001
             LOGGER.warning(
                 "Tripo 3MF convert failed",
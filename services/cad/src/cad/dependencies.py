@@ -15,12 +15,18 @@ from .providers.meshy_client import MeshyClient
 from .providers.tripo_client import TripoClient
 from .providers.tripo_local import LocalMeshRunner
 from .providers.zoo_client import ZooClient
+from .storage.artifact_catalog import ArtifactCatalog
 from .storage.artifact_store import ArtifactStore
 
 
+@lru_cache(maxsize=1)
+def get_artifact_catalog() -> ArtifactCatalog:
+    return ArtifactCatalog(Path(os.getenv("CAD_ARTIFACTS_DIR", "artifacts")))
+
+
 @lru_cache(maxsize=1)
 def get_artifact_store() -> ArtifactStore:
-    return ArtifactStore()
+    return ArtifactStore(catalog=get_artifact_catalog())
 
 
 @lru_cache(maxsize=1)
@@ -80,4 +86,4 @@ def get_cad_cycler() -> CADCycler:
     )
 
 
-__all__ = ["get_cad_cycler"]
+__all__ = ["get_artifact_catalog", "get_cad_cycler"]
@@ -4,28 +4,22 @@ Artifacts API - List and browse generated artifacts.
 
 from __future__ import annotations
 
+import asyncio
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from ..dependencies import get_artifact_catalog, get_artifact_store
+from ..storage.artifact_catalog import ARTIFACT_TYPES, CatalogEntry
+
 router = APIRouter(prefix="/api/cad/artifacts", tags=["artifacts"])
 
 ARTIFACTS_DIR = Path(os.getenv("CAD_ARTIFACTS_DIR", "artifacts"))
 
-# Supported artifact types and their directories
-ARTIFACT_TYPES = {
-    "glb": "glb",
-    "stl": "stl",
-    "3mf": "3mf",
-    "gcode": "gcode",
-    "step": "step",
-    "gltf": "gltf",
-}
-
 
 class ArtifactInfo(BaseModel):
     """Information about a single artifact."""
@@ -43,6 +37,19 @@ class ArtifactListResponse(BaseModel):
     artifacts: list[ArtifactInfo]
     total: int
     type_filter: str | None
+    next_cursor: str | None = None
+
+
+def _to_info(entry: CatalogEntry) -> ArtifactInfo:
+    return ArtifactInfo(
+        filename=entry.filename,
+        type=entry.type,
+        path=entry.path,
+        download_url=f"/api/cad/files/{entry.path}",
+        size_bytes=entry.size_bytes,
+        created_at=datetime.fromtimestamp(entry.created_at).isoformat(),
+        modified_at=datetime.fromtimestamp(entry.modified_at).isoformat(),
+    )
 
 
 @router.get("/list", response_model=ArtifactListResponse)
@@ -50,61 +57,40 @@ async def list_artifacts(
     type: Literal["all", "glb", "stl", "3mf", "gcode", "step", "gltf"] = "all",
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> ArtifactListResponse:
     """
-    List artifacts in storage.
+    List artifacts in storage, newest first.
+
+    Served from the artifact catalog, so each page is an index seek rather
+    than a walk of the artifact tree.
 
     Args:
         type: Filter by artifact type ("all" for all types)
         limit: Maximum number of artifacts to return
-        offset: Number of artifacts to skip (for pagination)
+        offset: Number of artifacts to skip (ignored when cursor is given)
+        cursor: Opaque keyset cursor from a previous page's next_cursor
     """
-    if not ARTIFACTS_DIR.exists():
-        return ArtifactListResponse(artifacts=[], total=0, type_filter=type if type != "all" else None)
-
-    artifacts: list[ArtifactInfo] = []
-
-    # Determine which directories to scan
-    if type == "all":
-        dirs_to_scan = list(ARTIFACT_TYPES.items())
-    else:
-        if type not in ARTIFACT_TYPES:
-            raise HTTPException(status_code=400, detail=f"Invalid artifact type: {type}")
-        dirs_to_scan = [(type, ARTIFACT_TYPES[type])]
-
-    # Collect all artifacts
-    all_artifacts: list[tuple[Path, str]] = []
-    for artifact_type, subdir in dirs_to_scan:
-        type_dir = ARTIFACTS_DIR / subdir
-        if type_dir.exists() and type_dir.is_dir():
-            for file_path in type_dir.iterdir():
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    all_artifacts.append((file_path, artifact_type))
-
-    # Sort by modification time (newest first)
-    all_artifacts.sort(key=lambda x: x[0].stat().st_mtime, reverse=True)
-
-    # Apply pagination
-    total = len(all_artifacts)
-    paginated = all_artifacts[offset:offset + limit]
-
-    # Build response
-    for file_path, artifact_type in paginated:
-        stat = file_path.stat()
-        artifacts.append(ArtifactInfo(
-            filename=file_path.name,
-            type=artifact_type,
-            path=f"{artifact_type}/{file_path.name}",
-            download_url=f"/api/cad/files/{artifact_type}/{file_path.name}",
-            size_bytes=stat.st_size,
-            created_at=datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            modified_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-        ))
+    if type != "all" and type not in ARTIFACT_TYPES:
+        raise HTTPException(status_code=400, detail=f"Invalid artifact type: {type}")
+
+    catalog = get_artifact_catalog()
+    try:
+        page = await asyncio.to_thread(
+            catalog.list,
+            type if type != "all" else None,
+            limit,
+            cursor,
+            offset,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
     return ArtifactListResponse(
-        artifacts=artifacts,
-        total=total,
+        artifacts=[_to_info(entry) for entry in page.entries],
+        total=page.total,
         type_filter=type if type != "all" else None,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -113,8 +99,7 @@ async def get_artifact_stats() -> dict:
     """
     Get storage statistics for artifacts.
     """
-    if not ARTIFACTS_DIR.exists():
-        return {"total_files": 0, "total_size_bytes": 0, "by_type": {}}
+    rollup = await asyncio.to_thread(get_artifact_catalog().stats)
 
     stats = {
         "total_files": 0,
@@ -122,16 +107,8 @@ async def get_artifact_stats() -> dict:
         "by_type": {},
     }
 
-    for artifact_type, subdir in ARTIFACT_TYPES.items():
-        type_dir = ARTIFACTS_DIR / subdir
-        type_stats = {"count": 0, "size_bytes": 0}
-
-        if type_dir.exists() and type_dir.is_dir():
-            for file_path in type_dir.iterdir():
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    type_stats["count"] += 1
-                    type_stats["size_bytes"] += file_path.stat().st_size
-
+    for artifact_type in ARTIFACT_TYPES:
+        type_stats = rollup.get(artifact_type, {"count": 0, "size_bytes": 0})
         stats["by_type"][artifact_type] = type_stats
         stats["total_files"] += type_stats["count"]
         stats["total_size_bytes"] += type_stats["size_bytes"]
@@ -158,6 +135,8 @@ async def delete_artifact(artifact_type: str, filename: str) -> dict:
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid path")
 
-    file_path.unlink()
+    # Drops this reference (and the shared blob once unreferenced) and
+    # removes the catalog row
+    await asyncio.to_thread(get_artifact_store().release, str(file_path))
 
     return {"status": "deleted", "filename": filename}
@@ -0,0 +1,353 @@
+"""Persistent SQLite catalog of locally stored artifacts.
+
+The catalog mirrors ``<artifacts>/<type>/<filename>`` so the artifacts API can
+serve listings and stats without walking the tree. It is kept current by write
+hooks in ``ArtifactStore`` and ``ArtifactRenamer``; ``reconcile`` repairs drift
+from files added or removed behind the service's back.
+
+Per-type counts and sizes live in ``artifact_stats`` and are maintained by
+triggers, so stats are a single-row lookup per type.
+"""
+
+from __future__ import annotations
+
+import base64
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from common.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Supported artifact types and their directories
+ARTIFACT_TYPES = {
+    "glb": "glb",
+    "stl": "stl",
+    "3mf": "3mf",
+    "gcode": "gcode",
+    "step": "step",
+    "gltf": "gltf",
+}
+
+CATALOG_FILENAME = ".catalog.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    modified_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_recent
+    ON artifacts (modified_at DESC, path DESC);
+CREATE INDEX IF NOT EXISTS idx_artifacts_type_recent
+    ON artifacts (type, modified_at DESC, path DESC);
+
+CREATE TABLE IF NOT EXISTS artifact_stats (
+    type TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS artifacts_stats_insert AFTER INSERT ON artifacts
+BEGIN
+    INSERT OR IGNORE INTO artifact_stats (type) VALUES (NEW.type);
+    UPDATE artifact_stats
+       SET count = count + 1, size_bytes = size_bytes + NEW.size_bytes
+     WHERE type = NEW.type;
+END;
+
+CREATE TRIGGER IF NOT EXISTS artifacts_stats_delete AFTER DELETE ON artifacts
+BEGIN
+    UPDATE artifact_stats
+       SET count = count - 1, size_bytes = size_bytes - OLD.size_bytes
+     WHERE type = OLD.type;
+END;
+
+CREATE TRIGGER IF NOT EXISTS artifacts_stats_update AFTER UPDATE ON artifacts
+BEGIN
+    UPDATE artifact_stats
+       SET count = count - 1, size_bytes = size_bytes - OLD.size_bytes
+     WHERE type = OLD.type;
+    INSERT OR IGNORE INTO artifact_stats (type) VALUES (NEW.type);
+    UPDATE artifact_stats
+       SET count = count + 1, size_bytes = size_bytes + NEW.size_bytes
+     WHERE type = NEW.type;
+END;
+"""
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Catalog row for a single artifact file."""
+
+    path: str
+    type: str
+    filename: str
+    size_bytes: int
+    created_at: float
+    modified_at: float
+
+
+@dataclass(frozen=True)
+class CatalogPage:
+    """One keyset-paginated page of catalog entries."""
+
+    entries: List[CatalogEntry]
+    total: int
+    next_cursor: Optional[str]
+
+
+class ArtifactCatalog:
+    """SQLite-backed index of the local artifact tree.
+
+    All methods are blocking; async callers should use ``asyncio.to_thread``.
+    """
+
+    def __init__(self, root: Path, db_path: Optional[Path] = None) -> None:
+        self._root = root
+        self._db_path = db_path or root / CATALOG_FILENAME
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self._db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Write hooks
+    # ------------------------------------------------------------------
+
+    def record(self, file_path: Path) -> Optional[CatalogEntry]:
+        """Insert or refresh the row for a file. Ignores files outside type dirs."""
+        key = self._key_for(file_path)
+        if key is None:
+            return None
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            self.remove(file_path)
+            return None
+        entry = CatalogEntry(
+            path=key[0] + "/" + key[1],
+            type=key[0],
+            filename=key[1],
+            size_bytes=stat.st_size,
+            created_at=stat.st_ctime,
+            modified_at=stat.st_mtime,
+        )
+        with self._lock:
+            self._upsert(entry)
+        return entry
+
+    def remove(self, file_path: Path) -> None:
+        key = self._key_for(file_path)
+        if key is None:
+            return
+        with self._lock:
+            self._conn.execute("DELETE FROM artifacts WHERE path = ?", (f"{key[0]}/{key[1]}",))
+
+    def rename(self, old_path: Path, new_path: Path) -> None:
+        self.remove(old_path)
+        self.record(new_path)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def list(
+        self,
+        artifact_type: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> CatalogPage:
+        """Return artifacts newest first.
+
+        ``cursor`` (from a previous page's ``next_cursor``) seeks directly to
+        the next page via the ``(modified_at, path)`` index. ``offset`` is kept
+        for older clients and is only applied when no cursor is given.
+        """
+        clauses: List[str] = []
+        params: List[object] = []
+        if artifact_type:
+            clauses.append("type = ?")
+            params.append(artifact_type)
+        if cursor:
+            modified_at, path = _decode_cursor(cursor)
+            clauses.append("(modified_at < ? OR (modified_at = ? AND path < ?))")
+            params.extend([modified_at, modified_at, path])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT path, type, filename, size_bytes, created_at, modified_at "
+            f"FROM artifacts {where} ORDER BY modified_at DESC, path DESC LIMIT ?"
+        )
+        params.append(limit + 1)
+        if not cursor and offset:
+            sql += " OFFSET ?"
+            params.append(offset)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        entries = [CatalogEntry(*row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and entries:
+            last = entries[-1]
+            next_cursor = _encode_cursor(last.modified_at, last.path)
+        return CatalogPage(entries=entries, total=self.count(artifact_type), next_cursor=next_cursor)
+
+    def count(self, artifact_type: Optional[str] = None) -> int:
+        with self._lock:
+            if artifact_type:
+                row = self._conn.execute(
+                    "SELECT count FROM artifact_stats WHERE type = ?", (artifact_type,)
+                ).fetchone()
+            else:
+                row = self._conn.execute("SELECT SUM(count) FROM artifact_stats").fetchone()
+        return int(row[0] or 0) if row else 0
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-type ``{"count", "size_bytes"}`` from the maintained rollup."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT type, count, size_bytes FROM artifact_stats"
+            ).fetchall()
+        return {row[0]: {"count": row[1], "size_bytes": row[2]} for row in rows}
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    def reconcile(self) -> Dict[str, int]:
+        """Bring the catalog in line with the filesystem.
+
+        Walks each type directory once, upserting new or changed files and
+        deleting rows whose files disappeared. Returns counts of each action.
+        """
+        seen: Dict[str, Tuple[int, float, float]] = {}
+        for artifact_type, file_path in self._iter_files():
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue
+            seen[f"{artifact_type}/{file_path.name}"] = (
+                stat.st_size,
+                stat.st_ctime,
+                stat.st_mtime,
+            )
+
+        added = updated = removed = 0
+        with self._lock:
+            known = {
+                row[0]: (row[1], row[2])
+                for row in self._conn.execute(
+                    "SELECT path, size_bytes, modified_at FROM artifacts"
+                )
+            }
+            self._conn.execute("BEGIN")
+            try:
+                for path, (size, ctime, mtime) in seen.items():
+                    current = known.get(path)
+                    if current == (size, mtime):
+                        continue
+                    artifact_type, filename = path.split("/", 1)
+                    self._upsert(
+                        CatalogEntry(path, artifact_type, filename, size, ctime, mtime)
+                    )
+                    if current is None:
+                        added += 1
+                    else:
+                        updated += 1
+                stale = [path for path in known if path not in seen]
+                for path in stale:
+                    self._conn.execute("DELETE FROM artifacts WHERE path = ?", (path,))
+                removed = len(stale)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if added or updated or removed:
+            LOGGER.info(
+                "Reconciled artifact catalog", added=added, updated=updated, removed=removed
+            )
+        return {"added": added, "updated": updated, "removed": removed}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _upsert(self, entry: CatalogEntry) -> None:
+        # UPDATE first so the stats trigger sees a proper OLD row
+        cur = self._conn.execute(
+            "UPDATE artifacts SET size_bytes = ?, created_at = ?, modified_at = ? "
+            "WHERE path = ?",
+            (entry.size_bytes, entry.created_at, entry.modified_at, entry.path),
+        )
+        if cur.rowcount == 0:
+            self._conn.execute(
+                "INSERT INTO artifacts (path, type, filename, size_bytes, created_at, modified_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    entry.path,
+                    entry.type,
+                    entry.filename,
+                    entry.size_bytes,
+                    entry.created_at,
+                    entry.modified_at,
+                ),
+            )
+
+    def _key_for(self, file_path: Path) -> Optional[Tuple[str, str]]:
+        try:
+            relative = file_path.resolve().relative_to(self._root.resolve())
+        except ValueError:
+            return None
+        if len(relative.parts) != 2 or relative.name.startswith("."):
+            return None
+        subdir, filename = relative.parts
+        artifact_type = _TYPE_BY_DIR.get(subdir)
+        if artifact_type is None:
+            return None
+        return artifact_type, filename
+
+    def _iter_files(self) -> Iterator[Tuple[str, Path]]:
+        for artifact_type, subdir in ARTIFACT_TYPES.items():
+            type_dir = self._root / subdir
+            if not type_dir.is_dir():
+                continue
+            for file_path in type_dir.iterdir():
+                if file_path.is_file() and not file_path.name.startswith("."):
+                    yield artifact_type, file_path
+
+
+_TYPE_BY_DIR = {subdir: artifact_type for artifact_type, subdir in ARTIFACT_TYPES.items()}
+
+
+def _encode_cursor(modified_at: float, path: str) -> str:
+    raw = f"{modified_at!r}|{path}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[float, str]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        modified_at, path = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return float(modified_at), path
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid artifact cursor") from exc
@@ -8,12 +8,17 @@ from typing import Optional
 
 import structlog
 
+from .artifact_catalog import ArtifactCatalog
+
 LOGGER = structlog.get_logger(__name__)
 
 
 class ArtifactRenamer:
     """Rename artifact files with descriptive names."""
 
+    def __init__(self, catalog: Optional[ArtifactCatalog] = None) -> None:
+        self._catalog = catalog
+
     def generate_new_path(
         self,
         old_path: str,
@@ -81,6 +86,8 @@ class ArtifactRenamer:
                 )
 
             shutil.move(str(old), str(final_path))
+            if self._catalog is not None:
+                self._catalog.rename(old, final_path)
             LOGGER.info("Renamed artifact", old=old_path, new=str(final_path))
             return str(final_path)
 
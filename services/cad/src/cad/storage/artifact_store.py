@@ -1,25 +1,75 @@
-"""Artifact storage backed by MinIO or local filesystem."""
+"""Artifact storage backed by MinIO or local filesystem.
+
+Artifacts are content-addressed: every write streams through a SHA-256 digest
+in fixed-size chunks, and identical payloads collapse onto a single stored
+object. Peak memory per upload is bounded by ``chunk_size`` regardless of the
+artifact size.
+
+Local layout::
+
+    artifacts/.blobs/ab/abcdef...   # one blob per unique digest
+    artifacts/glb/<uuid>.glb        # hard link per reference
+
+Each reference is a hard link to the blob, so the filesystem link count is the
+reference count and renaming a reference never affects other references.
+
+MinIO layout: one object per digest (``<subdir>/<sha256><suffix>``) whose
+``refcount`` user metadata tracks how many saves point at it.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, BinaryIO, Dict, Optional
 from uuid import uuid4
 
 import httpx
 from minio import Minio
+from minio.commonconfig import REPLACE, CopySource
+from minio.error import S3Error
 
 from common.config import settings
 from common.logging import get_logger
 
+from .artifact_catalog import ArtifactCatalog
+
 LOGGER = get_logger(__name__)
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+# S3 multipart uploads require parts of at least 5 MiB
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
+BLOB_DIR = ".blobs"
+STAGING_DIR = ".staging"
+REFCOUNT_META_KEY = "refcount"
+SHA256_META_KEY = "sha256"
+
 
 class ArtifactStore:
-    def __init__(self, bucket: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        bucket: Optional[str] = None,
+        *,
+        local_root: Optional[Path] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        catalog: Optional[ArtifactCatalog] = None,
+    ) -> None:
         self._bucket = bucket or settings.minio_bucket
+        self._chunk_size = chunk_size
+        self._catalog = catalog
         self._minio: Optional[Minio] = None
         self._local_root: Optional[Path] = None
+        # Commits run on worker threads; serialise them per digest so concurrent
+        # saves of identical content cannot race on the blob or its refcount.
+        self._locks_guard = threading.Lock()
+        self._digest_locks: Dict[str, threading.Lock] = {}
         if settings.minio_access_key and settings.minio_secret_key:
             endpoint = settings.minio_endpoint.replace("http://", "").replace(
                 "https://", ""
@@ -33,54 +83,338 @@ class ArtifactStore:
             )
             if not self._minio.bucket_exists(self._bucket):
                 self._minio.make_bucket(self._bucket)
+            self._staging_root = Path(tempfile.gettempdir()) / "kitty-artifact-staging"
         else:
-            self._local_root = Path("artifacts")
+            self._local_root = local_root or Path(os.getenv("CAD_ARTIFACTS_DIR", "artifacts"))
             self._local_root.mkdir(parents=True, exist_ok=True)
+            # Staging lives on the same filesystem so commits are atomic renames
+            self._staging_root = self._local_root / STAGING_DIR
+        self._staging_root.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
 
     def save_bytes(self, content: bytes, suffix: str, subdir: Optional[str] = None) -> str:
         """Save bytes to storage, optionally in a subdirectory.
 
+        Blocking; call through ``asyncio.to_thread`` from async code.
+
         Args:
             content: Raw bytes to save
             suffix: File extension (e.g., ".stl", ".glb")
             subdir: Optional subdirectory (e.g., "stl", "glb" for organization)
         """
-        object_name = f"{uuid4().hex}{suffix}"
+        digest = hashlib.sha256(content).hexdigest()
+
+        if self._minio:
+            with self._lock_for(digest):
+                return self._commit_minio(
+                    digest, len(content), suffix, subdir, data=BytesIO(content)
+                )
+
+        staged = self._new_staging_path()
+        staged.write_bytes(content)
+        return self._commit_staged(staged, digest, len(content), suffix, subdir)
+
+    def save_file(self, path: Path, suffix: str, subdir: Optional[str] = None) -> str:
+        """Save a file from disk, hashing and copying it in ``chunk_size`` pieces.
+
+        Blocking; call through ``asyncio.to_thread`` from async code.
+        """
+        staged = self._new_staging_path()
+        hasher = hashlib.sha256()
+        size = 0
+        with path.open("rb") as src, staged.open("wb") as dst:
+            while chunk := src.read(self._chunk_size):
+                hasher.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+        return self._commit_staged(staged, hasher.hexdigest(), size, suffix, subdir)
+
+    async def save_from_url(
+        self,
+        url: str,
+        suffix: str,
+        subdir: Optional[str] = None,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> str:
+        """Stream a remote artifact into storage without buffering it in memory."""
+        if client is not None:
+            return await self._stream_url(client, url, suffix, subdir)
+        async with httpx.AsyncClient(timeout=60) as owned_client:
+            return await self._stream_url(owned_client, url, suffix, subdir)
+
+    async def save_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        suffix: str,
+        subdir: Optional[str] = None,
+    ) -> str:
+        """Save an async byte stream, hashing it on the fly.
+
+        Chunks are written to a staging file from a worker thread, so the event
+        loop never blocks on disk and memory never holds more than one chunk.
+        """
+        staged = self._new_staging_path()
+        hasher = hashlib.sha256()
+        size = 0
+        handle = await asyncio.to_thread(staged.open, "wb")
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                await asyncio.to_thread(_hash_and_write, hasher, handle, chunk)
+                size += len(chunk)
+        except BaseException:
+            await asyncio.to_thread(handle.close)
+            staged.unlink(missing_ok=True)
+            raise
+        await asyncio.to_thread(handle.close)
+
+        return await asyncio.to_thread(
+            self._commit_staged, staged, hasher.hexdigest(), size, suffix, subdir
+        )
+
+    def release(self, location: str) -> bool:
+        """Drop one reference to an artifact, deleting the data at zero.
+
+        Returns True if the reference existed.
+        """
+        if location.startswith("minio://"):
+            return self._release_minio(location)
+
+        path = Path(location)
+        if not path.exists():
+            return False
+        if self._local_root is None:
+            # Local file written outside the content-addressed layout
+            path.unlink()
+            if self._catalog is not None:
+                self._catalog.remove(path)
+            return True
+        digest = _sha256_file(path, self._chunk_size)
+        blob = self._blob_path(digest)
+        with self._lock_for(digest):
+            path.unlink()
+            if self._catalog is not None:
+                self._catalog.remove(path)
+            try:
+                if blob.stat().st_nlink <= 1:
+                    blob.unlink()
+                    LOGGER.info("Deleted unreferenced artifact blob", digest=digest)
+            except FileNotFoundError:
+                pass
+        return True
+
+    def refcount(self, location: str) -> int:
+        """Return how many saved references share this artifact's content."""
+        if location.startswith("minio://"):
+            assert self._minio is not None
+            bucket, object_name = _split_minio_location(location)
+            try:
+                stat = self._minio.stat_object(bucket, object_name)
+            except S3Error:
+                return 0
+            return _metadata_refcount(stat.metadata)
+
+        path = Path(location)
+        if not path.exists():
+            return 0
+        # One link belongs to the blob itself
+        return max(path.stat().st_nlink - 1, 1)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _stream_url(
+        self, client: httpx.AsyncClient, url: str, suffix: str, subdir: Optional[str]
+    ) -> str:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            return await self.save_stream(
+                response.aiter_bytes(self._chunk_size), suffix, subdir
+            )
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._digest_locks.setdefault(key, threading.Lock())
+
+    def _new_staging_path(self) -> Path:
+        return self._staging_root / f"{uuid4().hex}.part"
+
+    def _blob_path(self, digest: str) -> Path:
+        assert self._local_root is not None
+        return self._local_root / BLOB_DIR / digest[:2] / digest
+
+    def _commit_staged(
+        self, staged: Path, digest: str, size: int, suffix: str, subdir: Optional[str]
+    ) -> str:
+        with self._lock_for(digest):
+            if self._minio:
+                try:
+                    return self._commit_minio(
+                        digest, size, suffix, subdir, file_path=staged
+                    )
+                finally:
+                    staged.unlink(missing_ok=True)
+            return self._commit_local(staged, digest, size, suffix, subdir)
+
+    def _commit_local(
+        self, staged: Path, digest: str, size: int, suffix: str, subdir: Optional[str]
+    ) -> str:
+        assert self._local_root is not None
+        blob = self._blob_path(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        deduplicated = blob.exists()
+        if deduplicated:
+            staged.unlink(missing_ok=True)
+        else:
+            os.replace(staged, blob)
+
+        target_dir = self._local_root / subdir if subdir else self._local_root
+        target_dir.mkdir(parents=True, exist_ok=True)
+        path = target_dir / f"{uuid4().hex}{suffix}"
+        try:
+            os.link(blob, path)
+        except OSError:
+            # Filesystems without hard links fall back to a private copy
+            shutil.copyfile(blob, path)
+        if self._catalog is not None:
+            self._catalog.record(path)
+
+        LOGGER.info(
+            "Stored artifact locally",
+            path=str(path),
+            sha256=digest,
+            size_bytes=size,
+            deduplicated=deduplicated,
+        )
+        return str(path)
+
+    def _commit_minio(
+        self,
+        digest: str,
+        size: int,
+        suffix: str,
+        subdir: Optional[str],
+        *,
+        data: Optional[BinaryIO] = None,
+        file_path: Optional[Path] = None,
+    ) -> str:
+        assert self._minio is not None
+        object_name = f"{digest}{suffix}"
         if subdir:
             object_name = f"{subdir}/{object_name}"
+        location = f"minio://{self._bucket}/{object_name}"
 
-        if self._minio:
-            from io import BytesIO
+        try:
+            stat = self._minio.stat_object(self._bucket, object_name)
+        except S3Error as exc:
+            if exc.code not in {"NoSuchKey", "NoSuchObject", "ResourceNotFound"}:
+                raise
+            stat = None
 
-            data_stream = BytesIO(content)
-            self._minio.put_object(
+        if stat is not None:
+            refs = _metadata_refcount(stat.metadata) + 1
+            self._set_minio_refcount(object_name, digest, refs)
+            LOGGER.info(
+                "Deduplicated artifact in MinIO",
+                bucket=self._bucket,
+                object_name=object_name,
+                refcount=refs,
+            )
+            return location
+
+        metadata = {SHA256_META_KEY: digest, REFCOUNT_META_KEY: "1"}
+        part_size = max(self._chunk_size, MIN_MULTIPART_PART_SIZE)
+        if file_path is not None:
+            self._minio.fput_object(
                 self._bucket,
                 object_name,
-                data=data_stream,
-                length=len(content),
+                str(file_path),
                 content_type="application/octet-stream",
+                metadata=metadata,
+                part_size=part_size,
             )
-            LOGGER.info(
-                "Stored artifact in MinIO", bucket=self._bucket, object_name=object_name
+        else:
+            assert data is not None
+            self._minio.put_object(
+                self._bucket,
+                object_name,
+                data=data,
+                length=size,
+                content_type="application/octet-stream",
+                metadata=metadata,
+                part_size=part_size,
             )
-            return f"minio://{self._bucket}/{object_name}"
+        LOGGER.info(
+            "Stored artifact in MinIO",
+            bucket=self._bucket,
+            object_name=object_name,
+            size_bytes=size,
+        )
+        return location
 
-        assert self._local_root is not None
-        if subdir:
-            target_dir = self._local_root / subdir
-            target_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            target_dir = self._local_root
-        path = target_dir / f"{uuid4().hex}{suffix}"
-        path.write_bytes(content)
-        LOGGER.info("Stored artifact locally", path=str(path))
-        return str(path)
+    def _set_minio_refcount(self, object_name: str, digest: str, refs: int) -> None:
+        assert self._minio is not None
+        self._minio.copy_object(
+            self._bucket,
+            object_name,
+            CopySource(self._bucket, object_name),
+            metadata={SHA256_META_KEY: digest, REFCOUNT_META_KEY: str(refs)},
+            metadata_directive=REPLACE,
+        )
+
+    def _release_minio(self, location: str) -> bool:
+        assert self._minio is not None
+        bucket, object_name = _split_minio_location(location)
+        digest = Path(object_name).name.split(".", 1)[0]
+        with self._lock_for(digest):
+            try:
+                stat = self._minio.stat_object(bucket, object_name)
+            except S3Error:
+                return False
+            refs = _metadata_refcount(stat.metadata) - 1
+            if refs <= 0:
+                self._minio.remove_object(bucket, object_name)
+                LOGGER.info(
+                    "Deleted unreferenced artifact", bucket=bucket, object_name=object_name
+                )
+            else:
+                self._set_minio_refcount(object_name, digest, refs)
+        return True
+
+
+def _hash_and_write(hasher: "hashlib._Hash", handle: BinaryIO, chunk: bytes) -> None:
+    hasher.update(chunk)
+    handle.write(chunk)
+
+
+def _sha256_file(path: Path, chunk_size: int) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _split_minio_location(location: str) -> tuple[str, str]:
+    bucket, _, object_name = location.removeprefix("minio://").partition("/")
+    return bucket, object_name
 
-    async def save_from_url(self, url: str, suffix: str) -> str:
-        async with httpx.AsyncClient(timeout=60) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return self.save_bytes(response.content, suffix)
 
-    def save_file(self, path: Path, suffix: str) -> str:
-        return self.save_bytes(path.read_bytes(), suffix)
+def _metadata_refcount(metadata: object) -> int:
+    if not metadata:
+        return 1
+    for key in (f"x-amz-meta-{REFCOUNT_META_KEY}", REFCOUNT_META_KEY):
+        value = metadata.get(key)  # type: ignore[attr-defined]
+        if value is not None:
+            try:
+                return int(value)
+            except ValueError:
+                break
+    # Objects written before refcounting existed count as one reference
+    return 1
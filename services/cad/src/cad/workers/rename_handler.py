@@ -9,6 +9,7 @@ from typing import Any, Dict, Optional
 
 import structlog
 
+from ..dependencies import get_artifact_catalog
 from ..storage.artifact_renamer import ArtifactRenamer
 from ..vision.gemma_client import GemmaVisionClient
 
@@ -65,7 +66,7 @@ class ArtifactRenameWorker:
 
     def __init__(self):
         self.vision_client = GemmaVisionClient()
-        self.renamer = ArtifactRenamer()
+        self.renamer = ArtifactRenamer(catalog=get_artifact_catalog())
         self._enabled = os.getenv("ARTIFACT_RENAME_ENABLED", "true").lower() == "true"
 
     async def process_artifact(
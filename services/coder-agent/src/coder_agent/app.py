@@ -4,6 +4,7 @@ FastAPI application for coder-agent service.
 Provides REST API for LLM-powered code generation with test-driven refinement.
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -19,6 +20,7 @@ from prometheus_client import Counter, Histogram, generate_latest
 from .graph import CoderGraph, create_coder_graph
 from .llm_client import CoderLLMClient
 from .models import GenerateCodeRequest, GenerateCodeResponse, HealthCheckResponse, StreamRequest
+from .sandbox_pool import SandboxPool
 
 # Logging setup
 logging.basicConfig(
@@ -30,6 +32,7 @@ logger = logging.getLogger(__name__)
 # Global state
 coder_graph: Optional[CoderGraph] = None
 llm_client: Optional[CoderLLMClient] = None
+sandbox_pool: Optional[SandboxPool] = None
 
 # Prometheus metrics
 generation_counter = Counter(
@@ -55,24 +58,45 @@ test_pass_counter = Counter(
 )
 
 
+async def _start_sandbox_pool(pool: SandboxPool) -> None:
+    try:
+        await pool.start()
+    except Exception as exc:
+        logger.error(f"Sandbox pool failed to start, using subprocess sandbox: {exc}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global coder_graph, llm_client
+    global coder_graph, llm_client, sandbox_pool
 
     # Load configuration
     max_refinements = int(os.getenv("CODER_MAX_REFINEMENTS", "2"))
     timeout_seconds = int(os.getenv("CODER_TIMEOUT_SECONDS", "20"))
+    pool_size = int(os.getenv("CODER_SANDBOX_POOL_SIZE", "2"))
 
     logger.info(
         f"Initializing coder-agent: max_refinements={max_refinements}, "
-        f"timeout={timeout_seconds}s"
+        f"timeout={timeout_seconds}s, sandbox_pool={pool_size}"
     )
 
+    # Warm sandbox workers (0 disables); until they are up, tests run in
+    # one-off subprocesses
+    pool_start = None
+    if pool_size > 0:
+        sandbox_pool = SandboxPool(
+            size=pool_size,
+            max_jobs_per_worker=int(os.getenv("CODER_SANDBOX_MAX_JOBS", "50")),
+            timeout_seconds=timeout_seconds,
+            memory_limit_mb=int(os.getenv("CODER_SANDBOX_MEMORY_MB", "1024")),
+        )
+        pool_start = asyncio.create_task(_start_sandbox_pool(sandbox_pool))
+
     # Initialize graph
     coder_graph = await create_coder_graph(
         max_refinements=max_refinements,
         timeout_seconds=timeout_seconds,
+        sandbox_pool=sandbox_pool,
     )
 
     # Initialize LLM client for health checks
@@ -86,6 +110,11 @@ async def lifespan(app: FastAPI):
     if llm_client:
         await llm_client.close()
         logger.info("LLM client closed")
+    if sandbox_pool:
+        if pool_start and not pool_start.done():
+            pool_start.cancel()
+        await sandbox_pool.close()
+        logger.info("Sandbox pool closed")
 
 
 # Create FastAPI app
@@ -309,7 +338,7 @@ async def stream_generate_code(request: StreamRequest) -> StreamingResponse:
             for iteration in range(request.max_refinements + 1):
                 yield f"data: {json.dumps({'type': 'run_start', 'iteration': iteration})}\n\n"
 
-                result = graph.test_runner.run_single_test(
+                result = await graph.test_runner.run_single_test_async(
                     code=state["code"],
                     test_code=state["test_code"],
                 )
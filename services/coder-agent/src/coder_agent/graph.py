@@ -8,7 +8,7 @@ code generation and automated testing feedback loop.
 from __future__ import annotations
 
 import logging
-from typing import Literal, TypedDict
+from typing import Literal, Optional, TypedDict
 
 from langgraph.graph import END, StateGraph
 
@@ -23,6 +23,7 @@ from .prompts import (
     TEST_PROMPT_TEMPLATE,
 )
 from .sandbox import TestRunner
+from .sandbox_pool import SandboxPool
 
 logger = logging.getLogger(__name__)
 
@@ -262,7 +263,7 @@ class CoderGraph:
         """
         logger.info("Running tests in sandbox...")
 
-        result = self.test_runner.run_single_test(
+        result = await self.test_runner.run_single_test_async(
             code=state["code"],
             test_code=state["test_code"],
         )
@@ -409,6 +410,7 @@ class CoderGraph:
 async def create_coder_graph(
     max_refinements: int = 2,
     timeout_seconds: int = 20,
+    sandbox_pool: Optional[SandboxPool] = None,
 ) -> CoderGraph:
     """
     Factory function to create configured coder graph.
@@ -416,12 +418,13 @@ async def create_coder_graph(
     Args:
         max_refinements: Maximum refinement iterations
         timeout_seconds: Sandbox execution timeout
+        sandbox_pool: Optional warm worker pool for test runs
 
     Returns:
         Initialized CoderGraph
     """
     llm_client = CoderLLMClient()
-    test_runner = TestRunner(timeout_seconds=timeout_seconds)
+    test_runner = TestRunner(timeout_seconds=timeout_seconds, pool=sandbox_pool)
 
     return CoderGraph(
         llm_client=llm_client,
@@ -7,12 +7,16 @@ and no network access. Used for test-driven code validation.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import subprocess
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .sandbox_pool import SandboxPool
 
 logger = logging.getLogger(__name__)
 
@@ -334,12 +338,15 @@ class TestRunner:
     High-level test runner for code generation workflow.
 
     Combines code execution, test execution, and result analysis.
+    Async methods use the warm SandboxPool when one is attached and fall
+    back to a one-off sandbox subprocess (off the event loop) otherwise.
     """
 
     def __init__(
         self,
         timeout_seconds: int = 20,
         allow_network: bool = False,
+        pool: Optional["SandboxPool"] = None,
     ) -> None:
         """
         Initialize test runner.
@@ -347,11 +354,13 @@ class TestRunner:
         Args:
             timeout_seconds: Execution timeout
             allow_network: Allow network access
+            pool: Optional started SandboxPool for fast async execution
         """
         self.sandbox = CodeSandbox(
             timeout_seconds=timeout_seconds,
             allow_network=allow_network,
         )
+        self.pool = pool
 
     def validate_and_test(
         self,
@@ -395,3 +404,46 @@ class TestRunner:
             ExecutionResult
         """
         return self.sandbox.run_tests(code, test_code)
+
+    async def run_single_test_async(
+        self,
+        code: str,
+        test_code: str,
+    ) -> ExecutionResult:
+        """
+        Run tests without blocking the event loop.
+
+        Args:
+            code: Python code to test
+            test_code: Test code
+
+        Returns:
+            ExecutionResult
+        """
+        if self.pool is not None:
+            from .sandbox_pool import SandboxPoolUnavailable
+
+            try:
+                return await self.pool.run_tests(code, test_code)
+            except SandboxPoolUnavailable as exc:
+                logger.warning(f"Sandbox pool unavailable, using subprocess: {exc}")
+        return await asyncio.to_thread(self.sandbox.run_tests, code, test_code)
+
+    async def run_candidates(
+        self,
+        candidates: Sequence[tuple[str, str]],
+    ) -> list[ExecutionResult]:
+        """
+        Test independent candidate solutions concurrently.
+
+        Args:
+            candidates: (code, test_code) pairs
+
+        Returns:
+            One ExecutionResult per candidate, in input order
+        """
+        return list(
+            await asyncio.gather(
+                *(self.run_single_test_async(code, test_code) for code, test_code in candidates)
+            )
+        )
@@ -0,0 +1,337 @@
+"""
+Warm pool of sandbox worker processes.
+
+Spawning ``python -m pytest`` for every generate→test→refine iteration pays
+interpreter startup and pytest import cost each time. The pool keeps a few
+long-lived workers (see ``sandbox_worker``) that already have pytest loaded
+and fork a fresh, resource-limited child per job, so a small test run costs
+tens of milliseconds instead of seconds.
+
+Isolation matches ``CodeSandbox``: workers run with the same restricted
+environment (``_build_sandbox_env``), every job gets its own temporary
+directory, and the forked child adds rlimits (CPU, address space, file size,
+open files). A worker is recycled after ``max_jobs_per_worker`` jobs and
+killed (with any processes the job started) on timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from .sandbox import CodeSandbox, ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("sandbox_worker.py")
+
+
+class SandboxPoolUnavailable(RuntimeError):
+    """Raised when the pool has no workers left to run a job."""
+
+
+@dataclass(eq=False)
+class _Worker:
+    process: asyncio.subprocess.Process
+    jobs: int = 0
+
+
+class SandboxPool:
+    """
+    Async pool of pre-forked sandbox workers.
+
+    Jobs submitted concurrently run in parallel on different workers, so
+    independent candidate solutions can be tested at the same time.
+
+    Example:
+        pool = SandboxPool(size=2, timeout_seconds=20)
+        await pool.start()
+        result = await pool.run_tests(code, test_code)
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_jobs_per_worker: int = 50,
+        timeout_seconds: int = 20,
+        max_output_size: int = 50_000,
+        allow_network: bool = False,
+        memory_limit_mb: int = 1024,
+        max_file_size_mb: int = 64,
+        max_open_files: int = 256,
+        startup_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize sandbox pool.
+
+        Args:
+            size: Number of warm workers
+            max_jobs_per_worker: Jobs served before a worker is replaced
+            timeout_seconds: Maximum execution time per job
+            max_output_size: Maximum stdout/stderr size (chars)
+            allow_network: Allow network access (default: False)
+            memory_limit_mb: Address space limit per job
+            max_file_size_mb: Largest file a job may write
+            max_open_files: Open file descriptor limit per job
+            startup_timeout: Seconds to wait for a worker to warm up
+        """
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self.timeout_seconds = timeout_seconds
+        self.startup_timeout = startup_timeout
+        self._sandbox = CodeSandbox(
+            timeout_seconds=timeout_seconds,
+            max_output_size=max_output_size,
+            allow_network=allow_network,
+        )
+        self._limits = {
+            # CPU backstop in case a job ignores the wall-clock kill
+            "cpu_seconds": timeout_seconds + 1,
+            "memory_bytes": memory_limit_mb * 1024 * 1024,
+            "file_size_bytes": max_file_size_mb * 1024 * 1024,
+            "open_files": max_open_files,
+        }
+        self._idle: asyncio.Queue[Optional[_Worker]] = asyncio.Queue()
+        # Workers running a job, so close() can kill them too
+        self._busy: set[_Worker] = set()
+        self._live = 0
+        self._closed = False
+        self._tasks: set[asyncio.Task] = set()
+        self.jobs_run = 0
+        self.timeouts = 0
+        self.recycled = 0
+
+    async def start(self) -> None:
+        """Spawn and warm up all workers."""
+        workers = await asyncio.gather(
+            *(self._spawn() for _ in range(self.size)), return_exceptions=True
+        )
+        for worker in workers:
+            if isinstance(worker, BaseException):
+                logger.error(f"Sandbox worker failed to start: {worker}")
+                continue
+            self._live += 1
+            self._idle.put_nowait(worker)
+        if self._live == 0:
+            raise SandboxPoolUnavailable("no sandbox workers could be started")
+        logger.info(
+            f"Sandbox pool ready: {self._live} workers, "
+            f"recycle after {self.max_jobs_per_worker} jobs"
+        )
+
+    async def close(self) -> None:
+        """Stop all workers, including those in the middle of a job."""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        for worker in list(self._busy):
+            await self._kill(worker)
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker is not None:
+                await self._kill(worker)
+        self._live = 0
+
+    async def run_tests(self, code: str, test_code: str) -> ExecutionResult:
+        """
+        Run pytest tests against generated code.
+
+        Args:
+            code: Python module code to test
+            test_code: Pytest test code
+
+        Returns:
+            ExecutionResult with test outcomes
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir) / "work"
+            workdir.mkdir()
+            (workdir / "module.py").write_text(code, encoding="utf-8")
+            (workdir / "test_module.py").write_text(test_code, encoding="utf-8")
+            return await self._submit({"kind": "pytest"}, Path(tmpdir))
+
+    async def run_code(self, code: str, check_syntax: bool = True) -> ExecutionResult:
+        """
+        Run Python code directly (without tests).
+
+        Args:
+            code: Python code to execute
+            check_syntax: Validate syntax before execution
+
+        Returns:
+            ExecutionResult with execution outcomes
+        """
+        if check_syntax:
+            syntax_result = self._sandbox._check_syntax(code)
+            if not syntax_result.success:
+                return syntax_result
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir) / "work"
+            workdir.mkdir()
+            script = workdir / "module.py"
+            script.write_text(code, encoding="utf-8")
+            return await self._submit({"kind": "python", "script": str(script)}, Path(tmpdir))
+
+    def stats(self) -> dict:
+        return {
+            "workers": self._live,
+            "idle": self._idle.qsize(),
+            "jobs_run": self.jobs_run,
+            "timeouts": self.timeouts,
+            "recycled": self.recycled,
+        }
+
+    async def _submit(self, job: dict, job_root: Path) -> ExecutionResult:
+        job.update(
+            cwd=str(job_root / "work"),
+            stdout=str(job_root / "stdout"),
+            stderr=str(job_root / "stderr"),
+            limits=self._limits,
+        )
+        worker = await self._acquire()
+        self._busy.add(worker)
+        try:
+            return await self._run_on(worker, job, job_root)
+        finally:
+            self._busy.discard(worker)
+
+    async def _run_on(self, worker: _Worker, job: dict, job_root: Path) -> ExecutionResult:
+        self.jobs_run += 1
+        worker.jobs += 1
+        try:
+            worker.process.stdin.write(json.dumps(job).encode() + b"\n")
+            await worker.process.stdin.drain()
+            line = await asyncio.wait_for(
+                worker.process.stdout.readline(), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.warning(f"Process timed out after {self.timeout_seconds}s")
+            self._retire(worker)
+            return ExecutionResult(
+                success=False,
+                stdout="",
+                stderr=f"Execution timed out after {self.timeout_seconds}s",
+                exit_code=-1,
+                timed_out=True,
+                error_message=f"Timeout after {self.timeout_seconds}s",
+            )
+        except (ConnectionError, OSError) as exc:
+            line = b""
+            logger.warning(f"Sandbox worker pipe failed: {exc}")
+        except BaseException:
+            # Caller cancelled mid-job (e.g. client disconnect): the worker may
+            # still be running the job and its reply would desync the next one
+            self._retire(worker)
+            raise
+
+        if not line:
+            self._retire(worker)
+            return ExecutionResult(
+                success=False,
+                stdout="",
+                stderr="",
+                exit_code=-1,
+                error_message="Sandbox error: worker exited unexpectedly",
+            )
+
+        if worker.jobs >= self.max_jobs_per_worker:
+            self._retire(worker)
+        else:
+            self._idle.put_nowait(worker)
+
+        exit_code = json.loads(line)["exit_code"]
+        return ExecutionResult(
+            success=exit_code == 0,
+            stdout=self._read_output(job_root / "stdout"),
+            stderr=self._read_output(job_root / "stderr"),
+            exit_code=exit_code,
+        )
+
+    def _read_output(self, path: Path) -> str:
+        limit = self._sandbox.max_output_size
+        try:
+            with open(path, encoding="utf-8", errors="replace") as handle:
+                text = handle.read(limit + 1)
+        except FileNotFoundError:
+            return ""
+        if len(text) > limit:
+            return text[:limit] + "\n... (output truncated)"
+        return text
+
+    async def _acquire(self) -> _Worker:
+        while True:
+            if self._closed or self._live == 0:
+                raise SandboxPoolUnavailable("sandbox pool has no workers")
+            worker = await self._idle.get()
+            if worker is not None:
+                return worker
+            if self._closed or self._live == 0:
+                # Pass the wake-up on so every other waiter fails over too
+                self._idle.put_nowait(None)
+                raise SandboxPoolUnavailable("sandbox pool has no workers")
+
+    async def _spawn(self) -> _Worker:
+        process = await asyncio.create_subprocess_exec(
+            "python",
+            "-u",
+            str(WORKER_SCRIPT),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self._sandbox._build_sandbox_env(),
+            cwd=tempfile.gettempdir(),
+            # Own process group, so a timeout kills everything the job started
+            start_new_session=True,
+        )
+        worker = _Worker(process)
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=self.startup_timeout)
+            if not line or not json.loads(line).get("ready"):
+                raise RuntimeError("worker exited during warm-up")
+        except BaseException:
+            await self._kill(worker)
+            raise
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        self.recycled += 1
+        task = asyncio.ensure_future(self._replace(worker))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _replace(self, worker: _Worker) -> None:
+        await self._kill(worker)
+        for attempt in range(3):
+            if self._closed:
+                return
+            try:
+                self._idle.put_nowait(await self._spawn())
+                return
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"Sandbox worker respawn failed (attempt {attempt + 1}): {exc}")
+                await asyncio.sleep(0.5 * (attempt + 1))
+        self._live -= 1
+        # Wake a waiter so it can notice when the pool is empty
+        self._idle.put_nowait(None)
+
+    @staticmethod
+    async def _kill(worker: _Worker) -> None:
+        process = worker.process
+        if process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                process.kill()
+        await process.wait()
@@ -0,0 +1,152 @@
+"""
+Warm sandbox worker process.
+
+Launched by SandboxPool with the restricted sandbox environment; it is not
+imported by the service. The worker imports pytest (and its plugins) once,
+then serves jobs read as JSON lines on stdin. Every job runs in a forked
+child, so it starts from a pristine copy of the warm interpreter and nothing
+a job imports or mutates is visible to the next one. The child applies
+resource limits, redirects stdout/stderr to files in the job directory and
+runs pytest or the script in the job's working directory. The worker replies
+with one JSON line holding the child's exit code.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import runpy
+import sys
+import tempfile
+import traceback
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX
+    resource = None  # type: ignore[assignment]
+
+
+def _redirect(fd: int, path: str, flags: int) -> None:
+    target = os.open(path, flags, 0o600)
+    os.dup2(target, fd)
+    os.close(target)
+
+
+def _warm_up() -> None:
+    """Import pytest with its builtin and entry-point plugins."""
+    import pytest
+
+    saved_path = list(sys.path)
+    saved_modules = set(sys.modules)
+    saved_out, saved_err = os.dup(1), os.dup(2)
+    try:
+        _redirect(1, os.devnull, os.O_WRONLY)
+        _redirect(2, os.devnull, os.O_WRONLY)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pytest.main([tmpdir, "--collect-only", "-q"])
+    finally:
+        os.dup2(saved_out, 1)
+        os.dup2(saved_err, 2)
+        os.close(saved_out)
+        os.close(saved_err)
+        sys.path[:] = saved_path
+        # Keep library modules warm, drop anything collected from the temp dir
+        for name in set(sys.modules) - saved_modules:
+            module_file = getattr(sys.modules[name], "__file__", None) or ""
+            if module_file.startswith(tempfile.gettempdir()):
+                del sys.modules[name]
+
+
+def _apply_limits(limits: dict) -> None:
+    if resource is None:
+        return
+    for name, value in (
+        ("RLIMIT_CPU", limits.get("cpu_seconds")),
+        ("RLIMIT_AS", limits.get("memory_bytes")),
+        ("RLIMIT_FSIZE", limits.get("file_size_bytes")),
+        ("RLIMIT_NOFILE", limits.get("open_files")),
+        ("RLIMIT_CORE", 0),
+    ):
+        rlimit = getattr(resource, name, None)
+        if rlimit is None or value is None:
+            continue
+        try:
+            _soft, hard = resource.getrlimit(rlimit)
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            resource.setrlimit(rlimit, (value, hard))
+        except (ValueError, OSError):
+            # e.g. RLIMIT_AS is not enforceable on macOS
+            pass
+
+
+def _run_child(job: dict) -> int:
+    _redirect(0, os.devnull, os.O_RDONLY)
+    _redirect(1, job["stdout"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    _redirect(2, job["stderr"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    _apply_limits(job.get("limits", {}))
+
+    workdir = job["cwd"]
+    os.chdir(workdir)
+    sys.path[0] = workdir
+
+    if job["kind"] == "pytest":
+        import pytest
+
+        sys.argv = ["pytest"]
+        return int(pytest.main([workdir, "-v", "--tb=short", "--color=no"]))
+
+    script = job["script"]
+    sys.argv = [script]
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        if isinstance(exc.code, int):
+            return exc.code
+        print(exc.code, file=sys.stderr)
+        return 1
+    except BaseException:  # noqa: BLE001 - report like the interpreter would
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def main() -> None:
+    # Replies go to a private copy of stdout; fd 1 itself points at /dev/null
+    # so stray output (and every forked child) can never corrupt the protocol
+    reply = os.fdopen(os.dup(1), "w", buffering=1)
+    _redirect(1, os.devnull, os.O_WRONLY)
+    # The worker script's directory must not be importable by jobs
+    sys.path[0] = ""
+
+    _warm_up()
+    # Move the warm heap out of the collector's view: pytest runs full
+    # collections at teardown, which would otherwise walk (and copy-on-write
+    # touch) every object inherited from this process
+    gc.collect()
+    gc.freeze()
+    reply.write(json.dumps({"ready": True, "pid": os.getpid()}) + "\n")
+
+    for line in sys.stdin.buffer:
+        job = json.loads(line)
+        pid = os.fork()
+        if pid == 0:
+            code = 70
+            try:
+                reply.close()
+                code = _run_child(job)
+            finally:
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(code & 0xFF if code >= 0 else 1)
+        _, status = os.waitpid(pid, 0)
+        reply.write(json.dumps({"exit_code": os.waitstatus_to_exitcode(status)}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Tests for the warm sandbox worker pool.
+
+Each test starts a real pool, so these exercise the worker process,
+fork-per-job isolation and recycling end-to-end.
+"""
+
+import asyncio
+
+import pytest
+
+CODE = """
+def add(a: int, b: int) -> int:
+    return a + b
+"""
+
+TEST_CODE = """
+def test_add():
+    from module import add
+    assert add(2, 3) == 5
+"""
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_jobs_in_isolated_children():
+    """Jobs pass, report output and exit codes, and never see each other's state."""
+    from coder_agent.sandbox_pool import SandboxPool
+
+    pool = SandboxPool(size=1, timeout_seconds=10)
+    await pool.start()
+    try:
+        result = await pool.run_tests(CODE, TEST_CODE)
+        assert result.success
+        assert "1 passed" in result.stdout
+
+        failing = await pool.run_tests(CODE, TEST_CODE.replace("== 5", "== 6"))
+        assert not failing.success
+        assert failing.exit_code == 1
+
+        # A module imported by one job must not be cached for the next
+        first = await pool.run_tests("VALUE = 1", "from module import VALUE\n\ndef test_v():\n    assert VALUE == 1\n")
+        second = await pool.run_tests("VALUE = 2", "from module import VALUE\n\ndef test_v():\n    assert VALUE == 2\n")
+        assert first.success and second.success
+
+        # Mutating the interpreter in one job does not leak either
+        await pool.run_code("import builtins\nbuiltins.LEAKED = True")
+        leaked = await pool.run_code("import builtins\nprint(hasattr(builtins, 'LEAKED'))")
+        assert leaked.stdout.strip() == "False"
+
+        exited = await pool.run_code("import sys\nprint('out')\nprint('err', file=sys.stderr)\nsys.exit(3)")
+        assert exited.exit_code == 3
+        assert exited.stdout == "out\n"
+        assert exited.stderr == "err\n"
+
+        # The service package next to the worker script is not importable
+        hidden = await pool.run_code("import sandbox_pool")
+        assert "ModuleNotFoundError" in hidden.stderr
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_workers_on_timeout_and_job_limit():
+    """Timed-out and worn-out workers are replaced, and candidates run concurrently."""
+    from coder_agent.sandbox import TestRunner
+    from coder_agent.sandbox_pool import SandboxPool
+
+    pool = SandboxPool(size=2, timeout_seconds=2, max_jobs_per_worker=2)
+    await pool.start()
+    try:
+        result = await pool.run_code("while True:\n    pass\n")
+        assert result.timed_out
+        assert "timeout" in result.error_message.lower()
+
+        runner = TestRunner(timeout_seconds=2, pool=pool)
+        results = await runner.run_candidates([(CODE, TEST_CODE)] * 4)
+        assert [r.success for r in results] == [True] * 4
+
+        stats = pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["recycled"] >= 2
+        assert stats["workers"] == 2
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_falls_back_without_pool_workers():
+    """A closed pool degrades to the one-off subprocess sandbox."""
+    from coder_agent.sandbox import TestRunner
+    from coder_agent.sandbox_pool import SandboxPool
+
+    pool = SandboxPool(size=1)
+    await pool.close()
+
+    runner = TestRunner(timeout_seconds=10, pool=pool)
+    result = await asyncio.wait_for(runner.run_single_test_async(CODE, TEST_CODE), timeout=60)
+
+    assert result.success
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_replaces_worker_and_close_kills_busy_workers():
+    """A caller cancelled mid-job does not strand the only worker."""
+    from coder_agent.sandbox_pool import SandboxPool
+
+    pool = SandboxPool(size=1, timeout_seconds=10)
+    await pool.start()
+    try:
+        job = asyncio.create_task(pool.run_code("import time\ntime.sleep(30)\n"))
+        await asyncio.sleep(0.5)
+        job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await job
+
+        result = await asyncio.wait_for(pool.run_tests(CODE, TEST_CODE), timeout=30)
+        assert result.success
+        assert pool.stats()["recycled"] == 1
+
+        busy = asyncio.create_task(pool.run_code("import time\ntime.sleep(30)\n"))
+        await asyncio.sleep(0.5)
+        process = next(iter(pool._busy)).process
+    finally:
+        await pool.close()
+
+    assert process.returncode is not None
+    result = await asyncio.wait_for(busy, timeout=5)
+    assert not result.success
+
+
+@pytest.mark.asyncio
+async def test_all_waiters_fail_over_when_workers_cannot_respawn():
+    """Callers queued beyond the pool size get SandboxPoolUnavailable, not a hang."""
+    from coder_agent.sandbox_pool import SandboxPool, SandboxPoolUnavailable
+
+    pool = SandboxPool(size=2, timeout_seconds=10, max_jobs_per_worker=1)
+    await pool.start()
+
+    async def broken_spawn():
+        raise RuntimeError("no sandbox available")
+
+    pool._spawn = broken_spawn
+    try:
+        jobs = [pool.run_code("print('hi')") for _ in range(5)]
+        results = await asyncio.wait_for(asyncio.gather(*jobs, return_exceptions=True), timeout=30)
+    finally:
+        await pool.close()
+
+    assert sum(1 for r in results if isinstance(r, SandboxPoolUnavailable)) == 3
+    assert [r.success for r in results if not isinstance(r, BaseException)] == [True, True]
@@ -0,0 +1,74 @@
+"""Add autonomy analytics rollups and supporting indexes
+
+Revision ID: b7c8d9e0f1a2
+Revises: a5b6c7d8e9f0
+Create Date: 2026-10-18
+
+- Composite indexes for the goal generator and feedback loop aggregates
+- Daily rollup tables for print failures and goal effectiveness
+- Watermark table tracking how far each rollup has been folded
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b7c8d9e0f1a2"
+down_revision = "a5b6c7d8e9f0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_goals_status_learn_from_measured",
+        "goals",
+        ["status", "learn_from", "outcome_measured_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_print_outcomes_success_completed_at",
+        "print_outcomes",
+        ["success", "completed_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_print_outcomes_success_measured_at",
+        "print_outcomes",
+        ["success", "measured_at"],
+        unique=False,
+    )
+
+    op.create_table(
+        "analytics_watermarks",
+        sa.Column("name", sa.String(64), primary_key=True),
+        sa.Column("high_water", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "print_failure_daily",
+        sa.Column("bucket_date", sa.Date(), primary_key=True),
+        sa.Column("failure_reason", sa.String(64), primary_key=True),
+        sa.Column("failure_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "goal_effectiveness_daily",
+        sa.Column("bucket_date", sa.Date(), primary_key=True),
+        sa.Column("goal_type", sa.String(32), primary_key=True),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("score_min", sa.Numeric(5, 2), nullable=True),
+        sa.Column("score_max", sa.Numeric(5, 2), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("goal_effectiveness_daily")
+    op.drop_table("print_failure_daily")
+    op.drop_table("analytics_watermarks")
+    op.drop_index("ix_print_outcomes_success_measured_at", table_name="print_outcomes")
+    op.drop_index("ix_print_outcomes_success_completed_at", table_name="print_outcomes")
+    op.drop_index("ix_goals_status_learn_from_measured", table_name="goals")
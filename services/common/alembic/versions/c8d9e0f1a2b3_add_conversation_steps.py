@@ -0,0 +1,71 @@
+"""Add append-only conversation_steps log
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-18
+
+Agent reasoning steps move out of the conversation_sessions.agent_history
+JSONB blob into one row per step, so persisting a new step no longer
+rewrites the whole history. Existing histories are backfilled; the
+agent_history column is kept for readers of older rows.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "c8d9e0f1a2b3"
+down_revision = "b7c8d9e0f1a2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "conversation_steps",
+        sa.Column(
+            "conversation_id",
+            postgresql.UUID(as_uuid=False),
+            sa.ForeignKey("conversation_sessions.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("step_index", sa.Integer(), primary_key=True),
+        sa.Column("step", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO conversation_steps (conversation_id, step_index, step)
+        SELECT c.id, h.ordinality - 1, h.value
+        FROM conversation_sessions c
+        CROSS JOIN LATERAL jsonb_array_elements(c.agent_history) WITH ORDINALITY AS h(value, ordinality)
+        WHERE jsonb_typeof(c.agent_history) = 'array'
+        """
+    )
+    op.execute("UPDATE conversation_sessions SET agent_history = '[]'::jsonb")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE conversation_sessions c
+        SET agent_history = s.history
+        FROM (
+            SELECT conversation_id, jsonb_agg(step ORDER BY step_index) AS history
+            FROM conversation_steps
+            GROUP BY conversation_id
+        ) s
+        WHERE s.conversation_id = c.id
+        """
+    )
+    op.drop_table("conversation_steps")
@@ -200,6 +200,10 @@ class Settings(BaseSettings):
     autonomous_cpu_threshold_percent: float = 20.0
     autonomous_memory_threshold_percent: float = 70.0
     autonomous_user_id: str = "system-autonomous"
+    autonomous_task_workers: int = 4  # Tasks executed concurrently per executor
+    # Per task_type caps, e.g. "kb_create:1,review_commit:1" (others use the worker limit)
+    autonomous_task_type_limits: str = "kb_create:1,review_commit:1,research_synthesize:2"
+    autonomous_task_claim_timeout_minutes: int = 120  # Reclaim in_progress tasks after this
 
     # Phase 3: Outcome Tracking & Learning
     outcome_measurement_enabled: bool = True
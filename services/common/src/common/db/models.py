@@ -276,6 +276,21 @@ class ConversationSession(Base):
     last_assistant_message: Mapped[Optional[str]] = mapped_column(Text)
 
 
+class ConversationStep(Base):
+    """One agent reasoning step of a conversation (append-only)."""
+
+    __tablename__ = "conversation_steps"
+
+    conversation_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("conversation_sessions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    step_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    step: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class ConversationRole(enum.Enum):
     user = "user"
     assistant = "assistant"
@@ -493,6 +508,10 @@ class Goal(Base):
     """High-level objectives identified by KITTY for autonomous work."""
 
     __tablename__ = "goals"
+    __table_args__ = (
+        # Feedback loop: completed, learn_from goals by measurement time
+        Index("ix_goals_status_learn_from_measured", "status", "learn_from", "outcome_measured_at"),
+    )
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
     goal_type: Mapped[GoalType] = mapped_column(Enum(GoalType), nullable=False)
@@ -685,6 +704,11 @@ class PrintOutcome(Base):
     """
 
     __tablename__ = "print_outcomes"
+    __table_args__ = (
+        # Goal generator: failures by completion window and by rollup watermark
+        Index("ix_print_outcomes_success_completed_at", "success", "completed_at"),
+        Index("ix_print_outcomes_success_measured_at", "success", "measured_at"),
+    )
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
     job_id: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
@@ -924,6 +948,39 @@ class BudgetForecast(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
 
+class AnalyticsWatermark(Base):
+    """High-water mark of source rows already folded into an analytics rollup."""
+
+    __tablename__ = "analytics_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    high_water: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class PrintFailureDaily(Base):
+    """Failed print outcomes per completion day and failure reason."""
+
+    __tablename__ = "print_failure_daily"
+
+    bucket_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    failure_reason: Mapped[str] = mapped_column(String(64), primary_key=True)
+    failure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class GoalEffectivenessDaily(Base):
+    """Measured goal effectiveness per measurement day and goal type."""
+
+    __tablename__ = "goal_effectiveness_daily"
+
+    bucket_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    goal_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    score_min: Mapped[Optional[float]] = mapped_column(Numeric(5, 2))
+    score_max: Mapped[Optional[float]] = mapped_column(Numeric(5, 2))
+
+
 class CollectivePatternEnum(enum.Enum):
     """Collective deliberation patterns."""
     council = "council"
@@ -1409,6 +1466,7 @@ __all__ = [
     "DeviceCommand",
     "TelemetryEvent",
     "ConversationSession",
+    "ConversationStep",
     "ConversationRole",
     "ConversationMessage",
     "RoutingDecision",
@@ -1433,6 +1491,9 @@ __all__ = [
     "AutonomousSchedule",
     "JobExecutionHistory",
     "BudgetForecast",
+    "AnalyticsWatermark",
+    "PrintFailureDaily",
+    "GoalEffectivenessDaily",
     # Collective meta-agent
     "CollectivePatternEnum",
     "CollectiveStatusEnum",
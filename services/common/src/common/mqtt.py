@@ -58,7 +58,7 @@ class MQTTClient:
         topic: str,
         payload: Dict[str, Any] | str | bytes,
         options: Optional[PublishOptions] = None,
-    ) -> None:
+    ) -> mqtt.MQTTMessageInfo:
         opts = options or PublishOptions()
         data: bytes
         if isinstance(payload, bytes):
@@ -77,7 +77,7 @@ class MQTTClient:
                 "payload_len": len(data),
             },
         )
-        self._client.publish(topic, data, qos=opts.qos, retain=opts.retain)
+        return self._client.publish(topic, data, qos=opts.qos, retain=opts.retain)
 
 
 __all__ = ["MQTTClient", "PublishOptions"]
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from .middleware.remote_mode import RemoteModeMiddleware
 from .routes.routing import router as routing_router
 from .routes.token import router as token_router
 # from .routes.devices import router as devices_router  # Temporarily disabled due to import conflict
 from .routes.remote import router as remote_router
-from .routes.vision import router as vision_router
+from .routes.vision import close_vision_server, router as vision_router
 from .routes.images import router as images_router
 from .routes.fabrication import router as fabrication_router
 from .routes.cad import router as cad_router
@@ -27,8 +30,19 @@ from .routes.cameras import router as cameras_router
 from .routes.voice_proxy import router as voice_router
 from .routes.bambu_proxy import router as bambu_router
 from .routes.settings_proxy import router as settings_router
+from .upstream import registry as upstream_registry, upstream, upstream_lifespan
 
-app = FastAPI(title="KITTY Gateway")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with upstream_lifespan(app):
+        try:
+            yield
+        finally:
+            await close_vision_server()
+
+
+app = FastAPI(title="KITTY Gateway", lifespan=lifespan)
 
 # Add CORS middleware to allow web UI access
 app.add_middleware(
@@ -79,8 +93,6 @@ async def health_detailed() -> dict:
     Used by monitoring systems to verify full system health.
     Load balancer uses /healthz for simple liveness check.
     """
-    import httpx
-
     health_status = {
         "status": "healthy",
         "service": "gateway",
@@ -90,7 +102,7 @@ async def health_detailed() -> dict:
     # Check brain service
     try:
         brain_url = os.getenv("UPSTREAM_BRAIN_URL", "http://brain:8000")
-        async with httpx.AsyncClient(timeout=2.0) as client:
+        async with upstream("brain", timeout=2.0) as client:
             response = await client.get(f"{brain_url}/health")
             health_status["backends"]["brain"] = {
                 "status": "up" if response.status_code == 200 else "degraded",
@@ -106,7 +118,7 @@ async def health_detailed() -> dict:
     # Check fabrication service
     try:
         fab_url = os.getenv("FABRICATION_BASE", "http://fabrication:8300")
-        async with httpx.AsyncClient(timeout=2.0) as client:
+        async with upstream("fabrication", timeout=2.0) as client:
             response = await client.get(f"{fab_url}/health")
             health_status["backends"]["fabrication"] = {
                 "status": "up" if response.status_code == 200 else "degraded",
@@ -121,7 +133,7 @@ async def health_detailed() -> dict:
     # Check discovery service
     try:
         disc_url = os.getenv("DISCOVERY_BASE", "http://discovery:8500")
-        async with httpx.AsyncClient(timeout=2.0) as client:
+        async with upstream("discovery", timeout=2.0) as client:
             response = await client.get(f"{disc_url}/health")
             health_status["backends"]["discovery"] = {
                 "status": "up" if response.status_code == 200 else "degraded",
@@ -134,3 +146,15 @@ async def health_detailed() -> dict:
         }
 
     return health_status
+
+
+@app.get("/health/upstreams")
+async def health_upstreams() -> dict:
+    """Circuit breaker state and recent latency for each pooled upstream."""
+    return {"upstreams": upstream_registry.snapshot()}
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Prometheus metrics, including upstream latency and breaker state."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,15 @@
+"""Camera frame fan-out shared by the camera WebSocket routes."""
+
+from .broadcaster import FrameBroadcaster, Subscription, ViewerChannel
+from .frames import BINARY_HEADER, VARIANT_WIDTHS, Frame, scaling_available, snap_width
+
+__all__ = [
+    "BINARY_HEADER",
+    "Frame",
+    "FrameBroadcaster",
+    "Subscription",
+    "VARIANT_WIDTHS",
+    "ViewerChannel",
+    "scaling_available",
+    "snap_width",
+]
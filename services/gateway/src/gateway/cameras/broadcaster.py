@@ -0,0 +1,230 @@
+"""Fan-out of camera frames to viewers without head-of-line blocking.
+
+Each viewer owns a ``ViewerChannel`` with its own sender task. Publishing a
+frame only drops it into the channel's per-camera slot (latest frame wins),
+so the camera's receive loop never awaits a viewer socket and a slow viewer
+only skips frames of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Union
+
+from fastapi import WebSocket
+from prometheus_client import Counter
+
+from .frames import Frame
+
+logger = logging.getLogger(__name__)
+
+CAMERA_FRAMES_SENT = Counter(
+    "kitty_gateway_camera_frames_sent_total",
+    "Camera frames delivered to viewers",
+    labelnames=("camera_id",),
+)
+
+CAMERA_FRAMES_DROPPED = Counter(
+    "kitty_gateway_camera_frames_dropped_total",
+    "Camera frames superseded before a slow viewer could receive them",
+    labelnames=("camera_id",),
+)
+
+# Control messages (camera joined/left, acks) are rare; beyond this a viewer
+# is considered stuck and is disconnected
+MAX_CONTROL_BACKLOG = 256
+
+
+@dataclass
+class Subscription:
+    camera_id: str
+    max_width: Optional[int] = None
+
+
+class ViewerChannel:
+    """Bounded send queue for one viewer connection.
+
+    Holds at most one pending frame per subscribed camera plus a short queue
+    of control messages. A frame that arrives while an older one is still
+    pending replaces it and counts as dropped.
+    """
+
+    def __init__(self, viewer_id: str, websocket: WebSocket, *, binary: bool = False) -> None:
+        self.viewer_id = viewer_id
+        self.websocket = websocket
+        self.binary = binary
+        self.subscriptions: Dict[str, Subscription] = {}
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.last_lag_ms: Optional[float] = None
+        self.max_lag_ms = 0.0
+        self._pending: "OrderedDict[str, Frame]" = OrderedDict()
+        self._control: Deque[Union[dict, str]] = deque()
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"camera-viewer-{self.viewer_id}")
+
+    async def aclose(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def offer(self, frame: Frame) -> None:
+        """Queue ``frame`` for delivery, superseding any unsent frame from its camera."""
+        if self._closed:
+            return
+        if self._pending.pop(frame.camera_id, None) is not None:
+            self.frames_dropped += 1
+            CAMERA_FRAMES_DROPPED.labels(camera_id=frame.camera_id).inc()
+        self._pending[frame.camera_id] = frame
+        self._wakeup.set()
+
+    def send_control(self, message: dict) -> None:
+        if self._closed:
+            return
+        if len(self._control) >= MAX_CONTROL_BACKLOG:
+            logger.warning("Camera viewer %s control backlog full; disconnecting", self.viewer_id)
+            self._closed = True
+        else:
+            self._control.append(message)
+        self._wakeup.set()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "viewer_id": self.viewer_id,
+            "binary": self.binary,
+            "subscriptions": {
+                camera_id: sub.max_width for camera_id, sub in self.subscriptions.items()
+            },
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "pending": len(self._pending),
+            "last_lag_ms": self.last_lag_ms,
+            "max_lag_ms": round(self.max_lag_ms, 2),
+        }
+
+    async def _run(self) -> None:
+        try:
+            while not self._closed:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while not self._closed and (self._control or self._pending):
+                    if self._control:
+                        await self.websocket.send_json(self._control.popleft())
+                        continue
+                    _, frame = self._pending.popitem(last=False)
+                    await self._send_frame(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.debug("Camera viewer %s send failed: %s", self.viewer_id, exc)
+        finally:
+            self._closed = True
+
+    async def _send_frame(self, frame: Frame) -> None:
+        subscription = self.subscriptions.get(frame.camera_id)
+        if subscription is None:
+            return
+        variant = await frame.scaled(subscription.max_width)
+        if self.binary:
+            await self.websocket.send_bytes(variant.as_binary())
+        else:
+            await self.websocket.send_text(variant.as_json())
+        lag_ms = (time.time() - frame.timestamp) * 1000
+        self.last_lag_ms = round(lag_ms, 2)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self.frames_sent += 1
+        CAMERA_FRAMES_SENT.labels(camera_id=frame.camera_id).inc()
+
+
+class FrameBroadcaster:
+    """Tracks viewer channels and the latest frame of every camera."""
+
+    def __init__(self) -> None:
+        self._viewers: Dict[str, ViewerChannel] = {}
+        self._latest: Dict[str, Frame] = {}
+        self._seq: Dict[str, int] = {}
+
+    @property
+    def viewers(self) -> Dict[str, ViewerChannel]:
+        return self._viewers
+
+    def add_viewer(self, viewer_id: str, websocket: WebSocket, *, binary: bool = False) -> ViewerChannel:
+        channel = self._viewers.get(viewer_id)
+        if channel is None:
+            channel = ViewerChannel(viewer_id, websocket, binary=binary)
+            self._viewers[viewer_id] = channel
+            channel.start()
+        return channel
+
+    async def remove_viewer(self, viewer_id: str) -> None:
+        channel = self._viewers.pop(viewer_id, None)
+        if channel is not None:
+            await channel.aclose()
+
+    def subscribe(self, viewer_id: str, camera_id: str, max_width: Optional[int] = None) -> None:
+        channel = self._viewers[viewer_id]
+        channel.subscriptions[camera_id] = Subscription(camera_id, max_width)
+        latest = self._latest.get(camera_id)
+        if latest is not None:
+            channel.offer(latest)
+
+    def unsubscribe(self, viewer_id: str, camera_id: str) -> None:
+        channel = self._viewers.get(viewer_id)
+        if channel is not None:
+            channel.subscriptions.pop(camera_id, None)
+
+    def publish(self, camera_id: str, jpeg: bytes) -> Frame:
+        """Record a new frame and hand it to every subscribed viewer. Never blocks."""
+        seq = self._seq.get(camera_id, 0) + 1
+        self._seq[camera_id] = seq
+        frame = Frame(camera_id=camera_id, jpeg=jpeg, seq=seq)
+        self._latest[camera_id] = frame
+        for channel in self._reap():
+            if camera_id in channel.subscriptions:
+                channel.offer(frame)
+        return frame
+
+    def send_control(self, message: dict) -> None:
+        for channel in self._reap():
+            channel.send_control(message)
+
+    def latest(self, camera_id: str) -> Optional[Frame]:
+        return self._latest.get(camera_id)
+
+    def forget_camera(self, camera_id: str) -> None:
+        self._latest.pop(camera_id, None)
+        self._seq.pop(camera_id, None)
+
+    def snapshot(self) -> list[Dict[str, Any]]:
+        return [channel.snapshot() for channel in self._viewers.values()]
+
+    def _reap(self) -> list[ViewerChannel]:
+        """Return live channels, dropping ones whose sender has failed."""
+        live = []
+        for viewer_id, channel in list(self._viewers.items()):
+            if channel.closed:
+                self._viewers.pop(viewer_id, None)
+            else:
+                live.append(channel)
+        return live
+
+
+__all__ = ["FrameBroadcaster", "Subscription", "ViewerChannel"]
@@ -0,0 +1,131 @@
+"""Camera frames encoded once and shared by every viewer.
+
+A ``Frame`` caches its JSON and binary wire forms, plus any downscaled
+variants, so fan-out cost is independent of the number of viewers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import json
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+try:  # Pillow is optional; without it viewers always receive full frames
+    from PIL import Image
+except ImportError:  # pragma: no cover - depends on deployment
+    Image = None
+
+# Binary frames are: 4-byte big-endian header length, UTF-8 JSON header, JPEG
+BINARY_HEADER = struct.Struct(">I")
+
+# Downscaled variants are snapped to these widths so a handful of encodes
+# serve any number of differently sized viewer tiles
+VARIANT_WIDTHS = (160, 320, 640, 960, 1280)
+
+
+def snap_width(max_width: Optional[int]) -> Optional[int]:
+    """Round a requested width up to the nearest supported variant."""
+    if not max_width or max_width <= 0:
+        return None
+    for width in VARIANT_WIDTHS:
+        if max_width <= width:
+            return width
+    return None
+
+
+def scaling_available() -> bool:
+    return Image is not None
+
+
+@dataclass(eq=False)
+class Frame:
+    """One JPEG frame from a camera, optionally a downscaled variant."""
+
+    camera_id: str
+    jpeg: bytes
+    seq: int
+    timestamp: float = field(default_factory=time.time)
+    width: Optional[int] = None
+    _json: Optional[str] = field(default=None, repr=False)
+    _binary: Optional[bytes] = field(default=None, repr=False)
+    _variants: Dict[int, "Frame"] = field(default_factory=dict, repr=False)
+    _variant_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    def header(self) -> Dict[str, Any]:
+        header: Dict[str, Any] = {
+            "type": "frame",
+            "camera_id": self.camera_id,
+            "seq": self.seq,
+            "timestamp": self.timestamp,
+        }
+        if self.width:
+            header["width"] = self.width
+        return header
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self.header(), "jpeg_base64": base64.b64encode(self.jpeg).decode("ascii")}
+
+    def as_json(self) -> str:
+        """Legacy JSON/base64 form, serialized at most once per frame."""
+        if self._json is None:
+            self._json = json.dumps(self.as_dict())
+        return self._json
+
+    def as_binary(self) -> bytes:
+        """Binary form (length-prefixed JSON header + raw JPEG), built once."""
+        if self._binary is None:
+            header = json.dumps(self.header()).encode("utf-8")
+            self._binary = BINARY_HEADER.pack(len(header)) + header + self.jpeg
+        return self._binary
+
+    async def scaled(self, max_width: Optional[int]) -> "Frame":
+        """Return a variant no wider than ``max_width`` (snapped), encoding it once.
+
+        Falls back to the full frame when Pillow is unavailable, the width is
+        not a supported variant, or the source is already small enough.
+        """
+        width = snap_width(max_width)
+        if width is None or Image is None:
+            return self
+        variant = self._variants.get(width)
+        if variant is not None:
+            return variant
+        async with self._variant_lock:
+            variant = self._variants.get(width)
+            if variant is None:
+                jpeg = await asyncio.to_thread(_downscale, self.jpeg, width)
+                variant = (
+                    self
+                    if jpeg is None
+                    else Frame(
+                        camera_id=self.camera_id,
+                        jpeg=jpeg,
+                        seq=self.seq,
+                        timestamp=self.timestamp,
+                        width=width,
+                    )
+                )
+                self._variants[width] = variant
+        return variant
+
+
+def _downscale(jpeg: bytes, width: int) -> Optional[bytes]:
+    try:
+        with Image.open(io.BytesIO(jpeg)) as image:
+            if image.width <= width:
+                return None
+            height = max(1, round(image.height * width / image.width))
+            resized = image.convert("RGB").resize((width, height), Image.BILINEAR)
+        out = io.BytesIO()
+        resized.save(out, format="JPEG", quality=80)
+        return out.getvalue()
+    except Exception:  # Corrupt or non-JPEG payloads are relayed unscaled
+        return None
+
+
+__all__ = ["BINARY_HEADER", "Frame", "VARIANT_WIDTHS", "scaling_available", "snap_width"]
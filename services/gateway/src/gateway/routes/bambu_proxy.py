@@ -10,6 +10,8 @@ from typing import Any
 from fastapi import APIRouter, Request, HTTPException, Response
 import httpx
 
+from ..upstream import upstream
+
 
 router = APIRouter(prefix="/api/bambu", tags=["bambu"])
 
@@ -20,7 +22,7 @@ async def _proxy_to_fabrication(method: str, path: str, request: Request | None
     """Proxy request to fabrication service."""
     url = f"{FABRICATION_BASE}/api/bambu{path}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with upstream("fabrication", timeout=30.0) as client:
         try:
             if method == "GET":
                 response = await client.get(url)
@@ -94,7 +96,7 @@ async def bambu_command(device_id: str, request: Request) -> dict[str, Any]:
     """Send command to a Bambu printer."""
     url = f"{FABRICATION_BASE}/api/bambu/printers/{device_id}/command"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with upstream("fabrication", timeout=30.0) as client:
         try:
             data = await request.json()
             response = await client.post(url, json=data)
@@ -20,6 +20,8 @@ import httpx
 from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 
+from ..upstream import upstream
+
 router = APIRouter(tags=["brain-proxy"])
 
 BRAIN_URL = os.getenv("UPSTREAM_BRAIN_URL", "http://brain:8000")
@@ -55,7 +57,7 @@ async def proxy_to_brain(request: Request, path: str) -> Response:
         body = await request.body()
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with upstream("brain", timeout=120.0) as client:
             response = await client.request(
                 method=request.method,
                 url=url,
@@ -367,7 +369,7 @@ async def proxy_suggest_stream(request: Request) -> StreamingResponse:
 
     async def stream_response():
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with upstream("brain", timeout=60.0) as client:
                 async with client.stream(
                     "POST",
                     url,
@@ -8,9 +8,11 @@ import os
 from typing import Any
 
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import StreamingResponse
 import httpx
 
+from ..upstream import upstream
+from ..upstream.streaming import proxy_download
+
 
 router = APIRouter(prefix="/api/cad", tags=["cad"])
 
@@ -51,7 +53,7 @@ async def generate_cad(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=180.0) as client:  # Long timeout for 3D generation
+        async with upstream("cad", timeout=180.0) as client:  # Long timeout for 3D generation
             response = await client.post(
                 f"{CAD_BASE}/api/cad/generate",
                 json=data
@@ -65,41 +67,36 @@ async def generate_cad(request: Request) -> dict[str, Any]:
 
 
 @router.get("/files/{subdir}/{filename}")
-async def get_file(subdir: str, filename: str):
+async def get_file(subdir: str, filename: str, request: Request):
     """
     Serve artifact files (GLB, STL, 3MF) from CAD service static mount.
 
     Proxies to cad_service /api/cad/files/{subdir}/{filename}
     This is the primary endpoint for downloading generated artifacts.
     """
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{CAD_BASE}/api/cad/files/{subdir}/{filename}",
-                follow_redirects=True
-            )
-            response.raise_for_status()
+    # Determine content type
+    content_type = "application/octet-stream"
+    if filename.endswith(".glb"):
+        content_type = "model/gltf-binary"
+    elif filename.endswith(".3mf"):
+        content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
+    elif filename.endswith(".stl"):
+        content_type = "model/stl"
+    elif filename.endswith(".gcode"):
+        content_type = "text/plain"
+    elif filename.endswith(".step") or filename.endswith(".stp"):
+        content_type = "application/step"
 
-            # Determine content type
-            content_type = "application/octet-stream"
-            if filename.endswith(".glb"):
-                content_type = "model/gltf-binary"
-            elif filename.endswith(".3mf"):
-                content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
-            elif filename.endswith(".stl"):
-                content_type = "model/stl"
-            elif filename.endswith(".gcode"):
-                content_type = "text/plain"
-            elif filename.endswith(".step") or filename.endswith(".stp"):
-                content_type = "application/step"
-
-            return StreamingResponse(
-                iter([response.content]),
-                media_type=content_type,
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"'
-                }
-            )
+    try:
+        return await proxy_download(
+            "cad",
+            f"{CAD_BASE}/api/cad/files/{subdir}/{filename}",
+            request,
+            timeout=30.0,
+            media_type=content_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            follow_redirects=True,
+        )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="File not found")
     except httpx.HTTPError as e:
@@ -107,37 +104,32 @@ async def get_file(subdir: str, filename: str):
 
 
 @router.get("/artifacts/{subdir}/{filename}")
-async def get_artifact(subdir: str, filename: str):
+async def get_artifact(subdir: str, filename: str, request: Request):
     """
     Serve artifact files (GLB, STL) from CAD service.
     Legacy endpoint - prefer /files/{subdir}/{filename}.
 
     Proxies to cad_service /api/cad/files/{subdir}/{filename}
     """
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{CAD_BASE}/api/cad/files/{subdir}/{filename}",
-                follow_redirects=True
-            )
-            response.raise_for_status()
+    # Determine content type
+    content_type = "application/octet-stream"
+    if filename.endswith(".glb"):
+        content_type = "model/gltf-binary"
+    elif filename.endswith(".3mf"):
+        content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
+    elif filename.endswith(".stl"):
+        content_type = "model/stl"
 
-            # Determine content type
-            content_type = "application/octet-stream"
-            if filename.endswith(".glb"):
-                content_type = "model/gltf-binary"
-            elif filename.endswith(".3mf"):
-                content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
-            elif filename.endswith(".stl"):
-                content_type = "model/stl"
-
-            return StreamingResponse(
-                iter([response.content]),
-                media_type=content_type,
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"'
-                }
-            )
+    try:
+        return await proxy_download(
+            "cad",
+            f"{CAD_BASE}/api/cad/files/{subdir}/{filename}",
+            request,
+            timeout=30.0,
+            media_type=content_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            follow_redirects=True,
+        )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="Artifact not found")
     except httpx.HTTPError as e:
@@ -149,17 +141,24 @@ async def list_artifacts(
     type: str = "all",
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """
     List all artifacts in storage.
 
-    Proxies to cad_service /api/cad/artifacts/list
+    Proxies to cad_service /api/cad/artifacts/list; pass the returned
+    next_cursor as cursor for the next page
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("cad", timeout=30.0) as client:
             response = await client.get(
                 f"{CAD_BASE}/api/cad/artifacts/list",
-                params={"type": type, "limit": limit, "offset": offset}
+                params={
+                    "type": type,
+                    "limit": limit,
+                    "offset": offset,
+                    **({"cursor": cursor} if cursor else {}),
+                },
             )
             response.raise_for_status()
             return response.json()
@@ -177,7 +176,7 @@ async def get_artifact_stats() -> dict[str, Any]:
     Proxies to cad_service /api/cad/artifacts/stats
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("cad", timeout=30.0) as client:
             response = await client.get(f"{CAD_BASE}/api/cad/artifacts/stats")
             response.raise_for_status()
             return response.json()
@@ -188,33 +187,28 @@ async def get_artifact_stats() -> dict[str, Any]:
 
 
 @router.get("/artifacts/{filename}")
-async def get_artifact_flat(filename: str):
+async def get_artifact_flat(filename: str, request: Request):
     """
     Serve artifact files without subdirectory (fallback).
     """
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{CAD_BASE}/api/cad/files/{filename}",
-                follow_redirects=True
-            )
-            response.raise_for_status()
+    content_type = "application/octet-stream"
+    if filename.endswith(".glb"):
+        content_type = "model/gltf-binary"
+    elif filename.endswith(".3mf"):
+        content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
+    elif filename.endswith(".stl"):
+        content_type = "model/stl"
 
-            content_type = "application/octet-stream"
-            if filename.endswith(".glb"):
-                content_type = "model/gltf-binary"
-            elif filename.endswith(".3mf"):
-                content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
-            elif filename.endswith(".stl"):
-                content_type = "model/stl"
-
-            return StreamingResponse(
-                iter([response.content]),
-                media_type=content_type,
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"'
-                }
-            )
+    try:
+        return await proxy_download(
+            "cad",
+            f"{CAD_BASE}/api/cad/files/{filename}",
+            request,
+            timeout=30.0,
+            media_type=content_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            follow_redirects=True,
+        )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="Artifact not found")
     except httpx.HTTPError as e:
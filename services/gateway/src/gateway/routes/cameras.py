@@ -1,13 +1,15 @@
 """WebSocket endpoint for camera streaming.
 
 Provides real-time camera feed broadcasting using native WebSocket.
-Cameras publish frames, viewers subscribe to receive them.
+Cameras publish frames, viewers subscribe to receive them. Fan-out goes
+through ``FrameBroadcaster`` so a slow viewer never stalls a camera or other
+viewers; it just receives fewer (always the newest) frames.
 """
 
 from __future__ import annotations
 
-import asyncio
 import base64
+import binascii
 import json
 import logging
 import time
@@ -17,6 +19,8 @@ from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from ..cameras import FrameBroadcaster, ViewerChannel
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/cameras", tags=["cameras"])
 
@@ -33,19 +37,25 @@ class CameraInfo:
     fps: int = 15
 
 
-@dataclass
-class ViewerInfo:
-    """Information about a viewer connection."""
+# Global state for connected cameras; viewers and last frames live in the broadcaster
+_cameras: dict[str, CameraInfo] = {}
+_broadcaster = FrameBroadcaster()
 
-    viewer_id: str
-    websocket: WebSocket
-    subscribed_cameras: set[str] = field(default_factory=set)
+# Largest max_width a viewer may request (8K); wider tiles get full frames anyway
+MAX_VIEWER_WIDTH = 7680
 
 
-# Global state for connected cameras and viewers
-_cameras: dict[str, CameraInfo] = {}
-_viewers: dict[str, ViewerInfo] = {}
-_last_frames: dict[str, dict[str, Any]] = {}  # Cache last frame per camera
+def parse_max_width(value: Any) -> int | None:
+    """Validate a viewer's requested ``max_width`` (None means full frames).
+
+    Raises:
+        ValueError: If the value is not an integer in 1..MAX_VIEWER_WIDTH
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or not 0 < value <= MAX_VIEWER_WIDTH:
+        raise ValueError(f"max_width must be an integer between 1 and {MAX_VIEWER_WIDTH}")
+    return value
 
 
 @router.get("")
@@ -64,12 +74,19 @@ async def list_cameras() -> list[dict]:
     ]
 
 
+@router.get("/viewers")
+async def list_viewers() -> list[dict]:
+    """Per-viewer delivery stats: frames sent/dropped and send lag."""
+    return _broadcaster.snapshot()
+
+
 @router.get("/{camera_id}/frame")
 async def get_last_frame(camera_id: str) -> dict:
     """Get the last captured frame from a camera."""
-    if camera_id not in _last_frames:
+    frame = _broadcaster.latest(camera_id)
+    if frame is None:
         return {"error": "No frame available", "camera_id": camera_id}
-    return _last_frames[camera_id]
+    return frame.as_dict()
 
 
 @router.websocket("/stream")
@@ -79,16 +96,28 @@ async def camera_stream(websocket: WebSocket) -> None:
 
     Protocol:
     - Cameras send: {"type": "register", "camera_id": "...", "name": "..."}
-    - Cameras send: {"type": "frame", "jpeg_base64": "..."}
-    - Viewers send: {"type": "subscribe", "camera_id": "..."}
+    - Cameras send: {"type": "frame", "jpeg_base64": "..."} or raw JPEG bytes
+    - Viewers send: {"type": "subscribe", "camera_id": "...",
+                     "binary": true, "max_width": 320}  (binary/max_width optional)
     - Viewers send: {"type": "unsubscribe", "camera_id": "..."}
-    - Server broadcasts frames to subscribed viewers
+    - Server broadcasts frames to subscribed viewers, either as JSON with
+      ``jpeg_base64`` or, for binary viewers, as a binary message: 4-byte
+      big-endian header length, JSON header (type/camera_id/seq/timestamp),
+      then the JPEG bytes
     """
     await websocket.accept()
 
     connection_id = str(uuid.uuid4())
     connection_type: str | None = None
     camera_id: str | None = None
+    viewer: ViewerChannel | None = None
+
+    async def reply(message: dict) -> None:
+        # Once the sender task owns the socket, queue replies behind it
+        if viewer is not None:
+            viewer.send_control(message)
+        else:
+            await websocket.send_json(message)
 
     try:
         # Send initial status
@@ -132,7 +161,7 @@ async def camera_stream(websocket: WebSocket) -> None:
                         connection_type = "camera"
 
                         # Notify all viewers about new camera
-                        await _broadcast_to_viewers({
+                        _broadcast_to_viewers({
                             "type": "camera_joined",
                             "camera_id": camera_id,
                             "friendly_name": friendly_name,
@@ -148,55 +177,58 @@ async def camera_stream(websocket: WebSocket) -> None:
                     elif msg_type == "frame" and camera_id and camera_id in _cameras:
                         # Frame from camera
                         _cameras[camera_id].last_seen = time.time()
+                        try:
+                            jpeg = base64.b64decode(data.get("jpeg_base64", ""), validate=True)
+                        except (binascii.Error, ValueError):
+                            logger.warning("Dropping malformed frame from camera %s", camera_id)
+                            continue
 
-                        frame_data = {
-                            "type": "frame",
-                            "camera_id": camera_id,
-                            "jpeg_base64": data.get("jpeg_base64", ""),
-                            "timestamp": time.time(),
-                        }
-
-                        # Cache last frame
-                        _last_frames[camera_id] = frame_data
-
-                        # Broadcast to subscribed viewers
-                        await _broadcast_frame(camera_id, frame_data)
+                        # Caches the frame and hands it to subscribed viewers
+                        _broadcaster.publish(camera_id, jpeg)
 
                     elif msg_type == "subscribe":
                         # Viewer subscribing to camera
                         target_camera = data.get("camera_id")
-                        if connection_id not in _viewers:
-                            _viewers[connection_id] = ViewerInfo(
-                                viewer_id=connection_id,
-                                websocket=websocket,
+                        try:
+                            max_width = parse_max_width(data.get("max_width"))
+                        except ValueError as e:
+                            await reply({
+                                "type": "error",
+                                "camera_id": target_camera,
+                                "error": str(e),
+                            })
+                            continue
+                        if viewer is None:
+                            viewer = _broadcaster.add_viewer(
+                                connection_id,
+                                websocket,
+                                binary=bool(data.get("binary", False)),
                             )
                             connection_type = "viewer"
+                        elif "binary" in data:
+                            viewer.binary = bool(data["binary"])
 
                         if target_camera:
-                            _viewers[connection_id].subscribed_cameras.add(target_camera)
-
-                            # Send last frame if available
-                            if target_camera in _last_frames:
-                                await websocket.send_json(_last_frames[target_camera])
-
-                            await websocket.send_json({
+                            # Acknowledge first; the last frame (if any) follows
+                            viewer.send_control({
                                 "type": "subscribed",
                                 "camera_id": target_camera,
                             })
+                            _broadcaster.subscribe(connection_id, target_camera, max_width)
 
                     elif msg_type == "unsubscribe":
                         # Viewer unsubscribing from camera
                         target_camera = data.get("camera_id")
-                        if connection_id in _viewers and target_camera:
-                            _viewers[connection_id].subscribed_cameras.discard(target_camera)
-                            await websocket.send_json({
+                        if viewer is not None and target_camera:
+                            _broadcaster.unsubscribe(connection_id, target_camera)
+                            viewer.send_control({
                                 "type": "unsubscribed",
                                 "camera_id": target_camera,
                             })
 
                     elif msg_type == "request_cameras":
                         # Viewer requesting camera list
-                        await websocket.send_json({
+                        await reply({
                             "type": "cameras_list",
                             "cameras": [
                                 {
@@ -212,19 +244,7 @@ async def camera_stream(websocket: WebSocket) -> None:
                     # Binary frame data (more efficient than base64)
                     if camera_id and camera_id in _cameras:
                         _cameras[camera_id].last_seen = time.time()
-
-                        # Convert to base64 for JSON transmission to viewers
-                        jpeg_base64 = base64.b64encode(message["bytes"]).decode("ascii")
-
-                        frame_data = {
-                            "type": "frame",
-                            "camera_id": camera_id,
-                            "jpeg_base64": jpeg_base64,
-                            "timestamp": time.time(),
-                        }
-
-                        _last_frames[camera_id] = frame_data
-                        await _broadcast_frame(camera_id, frame_data)
+                        _broadcaster.publish(camera_id, message["bytes"])
 
             except WebSocketDisconnect:
                 break
@@ -236,42 +256,17 @@ async def camera_stream(websocket: WebSocket) -> None:
         # Cleanup
         if connection_type == "camera" and camera_id:
             _cameras.pop(camera_id, None)
-            _last_frames.pop(camera_id, None)
-            await _broadcast_to_viewers({
+            _broadcaster.forget_camera(camera_id)
+            _broadcast_to_viewers({
                 "type": "camera_left",
                 "camera_id": camera_id,
             })
             logger.info("Camera disconnected: %s", camera_id)
 
         elif connection_type == "viewer":
-            _viewers.pop(connection_id, None)
-
-
-async def _broadcast_frame(camera_id: str, frame_data: dict) -> None:
-    """Broadcast frame to all viewers subscribed to this camera."""
-    disconnected = []
-
-    for viewer_id, viewer in _viewers.items():
-        if camera_id in viewer.subscribed_cameras:
-            try:
-                await viewer.websocket.send_json(frame_data)
-            except Exception:
-                disconnected.append(viewer_id)
-
-    # Remove disconnected viewers
-    for viewer_id in disconnected:
-        _viewers.pop(viewer_id, None)
-
-
-async def _broadcast_to_viewers(message: dict) -> None:
-    """Broadcast a message to all viewers."""
-    disconnected = []
+            await _broadcaster.remove_viewer(connection_id)
 
-    for viewer_id, viewer in _viewers.items():
-        try:
-            await viewer.websocket.send_json(message)
-        except Exception:
-            disconnected.append(viewer_id)
 
-    for viewer_id in disconnected:
-        _viewers.pop(viewer_id, None)
+def _broadcast_to_viewers(message: dict) -> None:
+    """Queue a control message for every viewer without waiting on sockets."""
+    _broadcaster.send_control(message)
@@ -20,6 +20,8 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from ..upstream import upstream
+
 router = APIRouter(prefix="/api/coding", tags=["coding"])
 
 CODER_AGENT_BASE = os.getenv("CODER_AGENT_BASE", "http://coder-agent:8092")
@@ -96,7 +98,7 @@ async def generate_code(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=180.0) as client:  # Long timeout for code gen
+        async with upstream("coder-agent", timeout=180.0) as client:  # Long timeout for code gen
             response = await client.post(
                 f"{CODER_AGENT_BASE}/api/coding/generate",
                 json=data,
@@ -146,7 +148,7 @@ async def stream_generate_code(request: Request) -> StreamingResponse:
     async def stream_proxy() -> AsyncGenerator[bytes, None]:
         """Proxy SSE stream from coder-agent."""
         try:
-            async with httpx.AsyncClient(timeout=None) as client:
+            async with upstream("coder-agent", timeout=None) as client:
                 async with client.stream(
                     "POST",
                     f"{CODER_AGENT_BASE}/api/coding/stream",
@@ -200,7 +202,7 @@ async def health_check() -> dict[str, Any]:
     Proxies to coder-agent /healthz
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("coder-agent", timeout=10.0) as client:
             response = await client.get(f"{CODER_AGENT_BASE}/healthz")
             response.raise_for_status()
             return response.json()
@@ -2,13 +2,14 @@
 from __future__ import annotations
 import asyncio
 import logging
-import httpx
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Query
 from pydantic import BaseModel, Field
 from typing import Literal, Optional, List, Dict, Any
 
 import websockets
 
+from ..upstream import upstream
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/collective", tags=["collective"])
 
@@ -45,7 +46,7 @@ async def proxy_run(req: RunReq):
     """
     # Collective operations can take 5-20 minutes (council k=5, F16 judge, GPU-bound)
     # Use 1200s to respect GPU processing time and avoid premature timeouts
-    async with httpx.AsyncClient(timeout=1200) as client:
+    async with upstream("brain", timeout=1200) as client:
         r = await client.post(f"{BASE}/run", json=req.dict())
     if r.status_code != 200:
         raise HTTPException(status_code=r.status_code, detail=r.text)
@@ -59,7 +60,7 @@ async def proxy_stream_start(req: StreamRunReq):
     Creates a session that can be monitored via WebSocket.
     Returns session_id to connect via WebSocket.
     """
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with upstream("brain", timeout=30) as client:
         r = await client.post(f"{BASE}/stream/start", json=req.dict())
     if r.status_code != 200:
         raise HTTPException(status_code=r.status_code, detail=r.text)
@@ -130,7 +131,7 @@ async def proxy_collective_stream(websocket: WebSocket, session_id: str):
 @router.get("/specialists")
 async def proxy_list_specialists():
     """List available specialists for collective deliberation."""
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with upstream("brain", timeout=30) as client:
         r = await client.get(f"{BASE}/specialists")
     if r.status_code != 200:
         raise HTTPException(status_code=r.status_code, detail=r.text)
@@ -145,7 +146,7 @@ class CostEstimateReq(BaseModel):
 @router.post("/specialists/estimate")
 async def proxy_estimate_cost(req: CostEstimateReq):
     """Estimate cost for selected specialists."""
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with upstream("brain", timeout=30) as client:
         r = await client.post(f"{BASE}/specialists/estimate", json=req.dict())
     if r.status_code != 200:
         raise HTTPException(status_code=r.status_code, detail=r.text)
@@ -165,7 +166,7 @@ async def proxy_list_sessions(
     if status:
         params["status"] = status
 
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with upstream("brain", timeout=30) as client:
         r = await client.get(f"{BASE}/sessions", params=params)
     if r.status_code != 200:
         raise HTTPException(status_code=r.status_code, detail=r.text)
@@ -175,7 +176,7 @@ async def proxy_list_sessions(
 @router.get("/sessions/{session_id}")
 async def proxy_get_session(session_id: str):
     """Get details for a specific collective session."""
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with upstream("brain", timeout=30) as client:
         r = await client.get(f"{BASE}/sessions/{session_id}")
     if r.status_code != 200:
         raise HTTPException(status_code=r.status_code, detail=r.text)
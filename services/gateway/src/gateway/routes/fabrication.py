@@ -8,14 +8,18 @@ import logging
 import os
 from typing import Any
 
-from fastapi import APIRouter, Request, HTTPException, UploadFile, File
+from fastapi import APIRouter, Request, HTTPException
 import httpx
 
+from ..upstream import upstream
+from ..upstream.streaming import proxy_download, proxy_upload
+
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/fabrication", tags=["fabrication"])
 
 FABRICATION_BASE = os.getenv("FABRICATION_BASE", "http://fabrication:8300")
+MAX_MESH_UPLOAD_BYTES = 100 * 1024 * 1024
 
 
 @router.post("/open_in_slicer")
@@ -56,7 +60,7 @@ async def open_in_slicer(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/fabrication/open_in_slicer",
                 json=data
@@ -106,7 +110,7 @@ async def analyze_model(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/fabrication/analyze_model",
                 json=data
@@ -151,7 +155,7 @@ async def get_printer_status() -> dict[str, Any]:
     Proxies to fabrication_service /api/fabrication/printer_status
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(
                 f"{FABRICATION_BASE}/api/fabrication/printer_status"
             )
@@ -170,7 +174,7 @@ async def get_printer_status() -> dict[str, Any]:
 async def list_printers() -> list[dict[str, Any]]:
     """List available printers with build volumes for segmentation."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/segmentation/printers")
             response.raise_for_status()
             return response.json()
@@ -181,28 +185,29 @@ async def list_printers() -> list[dict[str, Any]]:
 
 
 @router.post("/segmentation/upload")
-async def upload_mesh_file(file: UploadFile = File(...)) -> dict[str, Any]:
+async def upload_mesh_file(request: Request) -> dict[str, Any]:
     """
     Upload a 3MF or STL mesh file for segmentation.
 
     Files are saved to the artifacts directory and the container path is returned
     for use with segmentation endpoints.
 
+    The multipart body (field ``file``) is streamed to the fabrication service
+    as it arrives rather than being read into gateway memory.
+
     Max file size: 100MB
     Accepted formats: .3mf, .stl
     """
     try:
-        # Read file content and forward as multipart
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, file.content_type)}
-
-        async with httpx.AsyncClient(timeout=120.0) as client:  # Long timeout for uploads
-            response = await client.post(
-                f"{FABRICATION_BASE}/api/segmentation/upload",
-                files=files
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await proxy_upload(
+            "fabrication",
+            f"{FABRICATION_BASE}/api/segmentation/upload",
+            request,
+            max_bytes=MAX_MESH_UPLOAD_BYTES,
+            timeout=120.0,  # Long timeout for uploads
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
     except httpx.HTTPError as e:
@@ -222,7 +227,7 @@ async def check_segmentation(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/segmentation/check",
                 json=data
@@ -252,7 +257,7 @@ async def segment_mesh(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=300.0) as client:  # Long timeout for segmentation
+        async with upstream("fabrication", timeout=300.0) as client:  # Long timeout for segmentation
             response = await client.post(
                 f"{FABRICATION_BASE}/api/segmentation/segment",
                 json=data
@@ -269,7 +274,7 @@ async def segment_mesh(request: Request) -> dict[str, Any]:
 async def get_segmentation_job(job_id: str) -> dict[str, Any]:
     """Get status of an async segmentation job."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/segmentation/jobs/{job_id}")
             response.raise_for_status()
             return response.json()
@@ -289,7 +294,7 @@ async def segment_mesh_async(request: Request) -> dict[str, Any]:
     try:
         body = await request.json()
         logger.info(f"Starting async segmentation: mesh_path={body.get('mesh_path')}, joint_type={body.get('joint_type')}")
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/segmentation/segment/async",
                 json=body,
@@ -307,27 +312,20 @@ async def segment_mesh_async(request: Request) -> dict[str, Any]:
 
 
 @router.get("/segmentation/download/{job_id}")
-async def download_segmented_zip(job_id: str):
+async def download_segmented_zip(job_id: str, request: Request):
     """
     Download all segmented parts as a ZIP file.
 
     Streams the ZIP file from the fabrication service.
     """
-    from fastapi.responses import StreamingResponse
-
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(
-                f"{FABRICATION_BASE}/api/segmentation/download/{job_id}",
-            )
-            response.raise_for_status()
-
-            # Stream the ZIP response
-            return StreamingResponse(
-                iter([response.content]),
-                media_type="application/zip",
-                headers=dict(response.headers),
-            )
+        return await proxy_download(
+            "fabrication",
+            f"{FABRICATION_BASE}/api/segmentation/download/{job_id}",
+            request,
+            timeout=60.0,
+            media_type="application/zip",
+        )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
     except httpx.HTTPError as e:
@@ -352,7 +350,7 @@ async def get_outcome_statistics(request: Request) -> dict[str, Any]:
         if query_string:
             url = f"{url}?{query_string}"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(url)
             response.raise_for_status()
             return response.json()
@@ -376,7 +374,7 @@ async def list_outcomes(request: Request) -> list[dict[str, Any]]:
         if query_string:
             url = f"{url}?{query_string}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.get(url)
             response.raise_for_status()
             return response.json()
@@ -394,7 +392,7 @@ async def get_outcome(job_id: str) -> dict[str, Any]:
     Proxies to fabrication service.
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/fabrication/outcomes/{job_id}")
             response.raise_for_status()
             return response.json()
@@ -413,7 +411,7 @@ async def record_outcome(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/fabrication/outcomes",
                 json=data
@@ -435,7 +433,7 @@ async def update_outcome_review(job_id: str, request: Request) -> dict[str, Any]
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.patch(
                 f"{FABRICATION_BASE}/api/fabrication/outcomes/{job_id}/review",
                 json=data
@@ -449,39 +447,31 @@ async def update_outcome_review(job_id: str, request: Request) -> dict[str, Any]
 
 
 @router.get("/artifacts/{file_path:path}")
-async def serve_artifact(file_path: str):
+async def serve_artifact(file_path: str, request: Request):
     """
     Serve artifact files (segmented 3MF/STL parts) from the fabrication service.
 
     Proxies file requests to the fabrication service's mounted artifacts directory.
     Used for downloading individual segmented parts and combined assemblies.
+    Range and If-None-Match are passed through so downloads can resume and cache.
     """
-    from fastapi.responses import StreamingResponse
+    # Determine content type based on file extension
+    content_type = "application/octet-stream"
+    if file_path.endswith(".3mf"):
+        content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
+    elif file_path.endswith(".stl"):
+        content_type = "application/sla"
 
+    filename = file_path.split("/")[-1]
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(
-                f"{FABRICATION_BASE}/api/fabrication/artifacts/{file_path}",
-            )
-            response.raise_for_status()
-
-            # Determine content type based on file extension
-            content_type = "application/octet-stream"
-            if file_path.endswith(".3mf"):
-                content_type = "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
-            elif file_path.endswith(".stl"):
-                content_type = "application/sla"
-
-            # Stream the file response with download disposition
-            filename = file_path.split("/")[-1]
-            return StreamingResponse(
-                iter([response.content]),
-                media_type=content_type,
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"',
-                    "Content-Length": str(len(response.content)),
-                },
-            )
+        return await proxy_download(
+            "fabrication",
+            f"{FABRICATION_BASE}/api/fabrication/artifacts/{file_path}",
+            request,
+            timeout=60.0,
+            media_type=content_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
     except httpx.HTTPError as e:
@@ -495,7 +485,7 @@ async def serve_artifact(file_path: str):
 async def list_slicer_printers() -> list[dict[str, Any]]:
     """List available printer profiles for slicing."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/slicer/profiles/printers")
             response.raise_for_status()
             return response.json()
@@ -509,7 +499,7 @@ async def list_slicer_printers() -> list[dict[str, Any]]:
 async def list_slicer_materials() -> list[dict[str, Any]]:
     """List available material profiles for slicing."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/slicer/profiles/materials")
             response.raise_for_status()
             return response.json()
@@ -523,7 +513,7 @@ async def list_slicer_materials() -> list[dict[str, Any]]:
 async def list_slicer_quality() -> list[dict[str, Any]]:
     """List available quality presets for slicing."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/slicer/profiles/quality")
             response.raise_for_status()
             return response.json()
@@ -552,7 +542,7 @@ async def start_slicing_job(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("fabrication", timeout=30.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/slicer/slice",
                 json=data
@@ -569,7 +559,7 @@ async def start_slicing_job(request: Request) -> dict[str, Any]:
 async def get_slicing_job_status(job_id: str) -> dict[str, Any]:
     """Get status of an async slicing job."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/slicer/jobs/{job_id}")
             response.raise_for_status()
             return response.json()
@@ -580,22 +570,16 @@ async def get_slicing_job_status(job_id: str) -> dict[str, Any]:
 
 
 @router.get("/slicer/jobs/{job_id}/download")
-async def download_gcode(job_id: str):
+async def download_gcode(job_id: str, request: Request):
     """Download the generated G-code file."""
-    from fastapi.responses import StreamingResponse
-
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(
-                f"{FABRICATION_BASE}/api/slicer/jobs/{job_id}/download",
-            )
-            response.raise_for_status()
-
-            return StreamingResponse(
-                iter([response.content]),
-                media_type="text/x-gcode",
-                headers=dict(response.headers),
-            )
+        return await proxy_download(
+            "fabrication",
+            f"{FABRICATION_BASE}/api/slicer/jobs/{job_id}/download",
+            request,
+            timeout=60.0,
+            media_type="text/x-gcode",
+        )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
     except httpx.HTTPError as e:
@@ -614,7 +598,7 @@ async def upload_gcode_to_printer(job_id: str, request: Request) -> dict[str, An
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with upstream("fabrication", timeout=120.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/slicer/jobs/{job_id}/upload",
                 json=data
@@ -666,7 +650,7 @@ def _transform_mesh_path(mesh_path: str) -> str:
 async def get_orientation_status() -> dict[str, Any]:
     """Get orientation service status."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/orientation/status")
             response.raise_for_status()
             return response.json()
@@ -698,7 +682,7 @@ async def analyze_orientations(request: Request) -> dict[str, Any]:
             data["mesh_path"] = _transform_mesh_path(data["mesh_path"])
             logger.info(f"Orientation analyze: transformed path to {data['mesh_path']}")
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with upstream("fabrication", timeout=120.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/orientation/analyze",
                 json=data
@@ -731,7 +715,7 @@ async def apply_orientation(request: Request) -> dict[str, Any]:
             data["mesh_path"] = _transform_mesh_path(data["mesh_path"])
             logger.info(f"Orientation apply: transformed path to {data['mesh_path']}")
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with upstream("fabrication", timeout=60.0) as client:
             response = await client.post(
                 f"{FABRICATION_BASE}/api/orientation/apply",
                 json=data
@@ -748,7 +732,7 @@ async def apply_orientation(request: Request) -> dict[str, Any]:
 async def list_orientations() -> dict[str, Any]:
     """List available cardinal orientations with rotation matrices."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("fabrication", timeout=10.0) as client:
             response = await client.get(f"{FABRICATION_BASE}/api/orientation/orientations")
             response.raise_for_status()
             return response.json()
@@ -10,6 +10,8 @@ from typing import Any
 from fastapi import APIRouter, Request, HTTPException
 import httpx
 
+from ..upstream import upstream
+
 
 router = APIRouter(prefix="/api/images", tags=["images"])
 
@@ -25,7 +27,7 @@ async def generate(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=1200.0) as client:
+        async with upstream("images", timeout=1200.0) as client:
             response = await client.post(
                 f"{IMAGES_BASE}/api/images/generate",
                 json=data
@@ -44,7 +46,7 @@ async def job_status(job_id: str) -> dict[str, Any]:
     Proxies to images_service /api/images/jobs/{job_id}
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("images", timeout=30.0) as client:
             response = await client.get(
                 f"{IMAGES_BASE}/api/images/jobs/{job_id}"
             )
@@ -55,17 +57,18 @@ async def job_status(job_id: str) -> dict[str, Any]:
 
 
 @router.get("/latest")
-async def latest(limit: int = 36) -> dict[str, Any]:
+async def latest(limit: int = 36, cursor: str | None = None) -> dict[str, Any]:
     """
     List latest generated images
 
-    Proxies to images_service /api/images/latest
+    Proxies to images_service /api/images/latest; pass the returned
+    next_cursor as cursor for the next page
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("images", timeout=30.0) as client:
             response = await client.get(
                 f"{IMAGES_BASE}/api/images/latest",
-                params={"limit": limit}
+                params={"limit": limit, **({"cursor": cursor} if cursor else {})}
             )
             response.raise_for_status()
             return response.json()
@@ -83,7 +86,7 @@ async def select_image(request: Request) -> dict[str, Any]:
     """
     try:
         data = await request.json()
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("images", timeout=30.0) as client:
             response = await client.post(
                 f"{IMAGES_BASE}/api/images/select",
                 json=data
@@ -102,7 +105,7 @@ async def stats() -> dict[str, Any]:
     Proxies to images_service /api/images/stats
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("images", timeout=30.0) as client:
             response = await client.get(f"{IMAGES_BASE}/api/images/stats")
             response.raise_for_status()
             return response.json()
@@ -8,6 +8,8 @@ import httpx
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 
+from ..upstream import upstream
+
 router = APIRouter(prefix="/api/providers", tags=["providers"])
 
 BRAIN_URL = os.getenv("UPSTREAM_BRAIN_URL", "http://brain:8000")
@@ -22,7 +24,7 @@ async def get_available_models():
     including local (Ollama, llama.cpp) and cloud providers.
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("brain", timeout=10.0) as client:
             response = await client.get(f"{BRAIN_URL}/api/providers/models")
             response.raise_for_status()
             return JSONResponse(content=response.json(), status_code=response.status_code)
@@ -41,7 +43,7 @@ async def get_available_providers():
     New code should use /api/providers/models instead.
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("brain", timeout=10.0) as client:
             response = await client.get(f"{BRAIN_URL}/api/providers/available")
             response.raise_for_status()
             return JSONResponse(content=response.json(), status_code=response.status_code)
@@ -63,7 +65,7 @@ async def get_model_card(model_id: str):
     - Links to documentation
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with upstream("brain", timeout=10.0) as client:
             response = await client.get(f"{BRAIN_URL}/api/providers/models/{model_id}/card")
             response.raise_for_status()
             return JSONResponse(content=response.json(), status_code=response.status_code)
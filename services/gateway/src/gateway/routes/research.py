@@ -6,6 +6,8 @@ import httpx
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
+from ..upstream import upstream
+
 router = APIRouter(prefix="/api/research", tags=["research"])
 
 BRAIN_BASE = "http://brain:8000"
@@ -39,7 +41,7 @@ async def proxy_research(path: str, request: Request):
     # Research operations can be long-running, so use generous timeout
     timeout = httpx.Timeout(300.0, connect=10.0)
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    async with upstream("brain", timeout=timeout) as client:
         if request.method == "GET":
             response = await client.get(url, params=params)
         elif request.method == "POST":
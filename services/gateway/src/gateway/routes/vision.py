@@ -17,6 +17,11 @@ router = APIRouter(prefix="/api/vision", tags=["vision"])
 _server = VisionMCPServer()
 
 
+async def close_vision_server() -> None:
+    """Close the vision server's scoring clients; called from the app lifespan."""
+    await _server.aclose()
+
+
 class ImageSearchRequest(BaseModel):
     query: str
     max_results: int = Field(8, ge=1, le=24)
@@ -17,6 +17,8 @@ import httpx
 from fastapi import APIRouter, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 import websockets
 
+from ..upstream import upstream
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/voice", tags=["voice"])
 
@@ -41,7 +43,7 @@ async def proxy_to_voice(request: Request, path: str) -> Response:
         body = await request.body()
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with upstream("voice", timeout=30.0) as client:
             response = await client.request(
                 method=request.method,
                 url=url,
@@ -0,0 +1,22 @@
+"""Pooled upstream HTTP clients shared by all gateway proxy routes."""
+
+from .breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .client import USE_DEFAULT_TIMEOUT, UpstreamClient, UpstreamSession
+from .config import UpstreamConfig, default_upstreams
+from .registry import UpstreamRegistry, get_upstream, registry, upstream, upstream_lifespan
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "USE_DEFAULT_TIMEOUT",
+    "UpstreamClient",
+    "UpstreamConfig",
+    "UpstreamRegistry",
+    "UpstreamSession",
+    "default_upstreams",
+    "get_upstream",
+    "registry",
+    "upstream",
+    "upstream_lifespan",
+]
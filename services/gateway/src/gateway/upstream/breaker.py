@@ -0,0 +1,93 @@
+"""Consecutive-failure circuit breaker for upstream services."""
+
+from __future__ import annotations
+
+import time
+from enum import Enum
+from typing import Callable
+
+import httpx
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.ConnectError):
+    """Raised instead of contacting an upstream whose breaker is open.
+
+    Subclasses ``httpx.ConnectError`` so existing proxy handlers map it to
+    "service unavailable" without special casing.
+    """
+
+
+class CircuitBreaker:
+    """Open after ``threshold`` consecutive failures; probe again after ``reset_seconds``.
+
+    While half-open a single trial request is let through. Success closes the
+    breaker, failure re-opens it for another ``reset_seconds``. A trial that
+    ends with neither (cancelled, or failed before reaching the upstream) must
+    be handed back with ``release_trial`` so the next request can probe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._name = name
+        self._threshold = threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = CircuitState.CLOSED
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self._reset_seconds:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._failures
+
+    def before_request(self) -> None:
+        """Raise ``CircuitOpenError`` if the upstream should not be contacted."""
+        if self._threshold <= 0:
+            return
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        raise CircuitOpenError(f"Circuit open for upstream '{self._name}'")
+
+    def release_trial(self) -> None:
+        """Give up an in-flight half-open trial without judging the upstream."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._trial_in_flight = False
+        self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._threshold <= 0:
+            return
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self._threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "CircuitState"]
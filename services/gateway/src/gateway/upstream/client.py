@@ -0,0 +1,330 @@
+"""Pooled, resilient HTTP client for a single upstream service."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import httpx
+
+from .breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .config import UpstreamConfig
+from .metrics import (
+    UPSTREAM_CIRCUIT_OPEN,
+    UPSTREAM_LATENCY,
+    UPSTREAM_REJECTED,
+    UPSTREAM_RETRIES,
+    outcome_for_status,
+)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Errors where the request provably never reached the upstream
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Errors that may have happened after the upstream received the request
+# (e.g. a keep-alive connection closed by the peer); only safe to replay
+# for idempotent methods
+_MAYBE_SENT_ERRORS = (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError)
+
+
+class _UseDefault:
+    """Sentinel meaning "use the upstream's configured timeout"."""
+
+
+USE_DEFAULT_TIMEOUT: Any = _UseDefault()
+
+
+class UpstreamClient:
+    """One keep-alive connection pool per upstream with retry and circuit breaking.
+
+    Accepts absolute URLs (as the route modules build them) or paths relative
+    to the upstream's ``base_url``.
+    """
+
+    def __init__(
+        self,
+        config: UpstreamConfig,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.config = config
+        self.name = config.name
+        self._breaker = CircuitBreaker(
+            config.name, config.breaker_threshold, config.breaker_reset_seconds
+        )
+        self._latencies: Deque[float] = deque(maxlen=1024)
+        self._requests = 0
+        self._errors = 0
+        self._client = httpx.AsyncClient(
+            base_url=config.base_url,
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=config.http2 and _h2_available(),
+            transport=transport,
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Any = USE_DEFAULT_TIMEOUT,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying transport failures that are safe to replay."""
+        method = method.upper()
+        if timeout is not USE_DEFAULT_TIMEOUT:
+            kwargs["timeout"] = _as_timeout(timeout, self.config.connect_timeout)
+        replayable = not _has_streaming_body(kwargs)
+        attempts = 1 + (self.config.retries if replayable else 0)
+
+        for attempt in range(attempts):
+            self._before_request()
+            started = time.perf_counter()
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except _NOT_SENT_ERRORS + _MAYBE_SENT_ERRORS as exc:
+                self._record_failure(method, started, type(exc).__name__)
+                can_retry = isinstance(exc, _NOT_SENT_ERRORS) or method in IDEMPOTENT_METHODS
+                if not can_retry or attempt + 1 >= attempts:
+                    raise
+                UPSTREAM_RETRIES.labels(upstream=self.name).inc()
+                await asyncio.sleep(self.config.retry_backoff * (2**attempt))
+                continue
+            except httpx.HTTPError as exc:
+                self._record_failure(method, started, type(exc).__name__)
+                raise
+            except BaseException:
+                # Cancelled (client disconnect) or failed locally, e.g. an
+                # oversized upload: says nothing about the upstream's health
+                self._breaker.release_trial()
+                raise
+            self._record_response(method, started, response.status_code)
+            return response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Any = USE_DEFAULT_TIMEOUT,
+        **kwargs: Any,
+    ) -> AsyncIterator[httpx.Response]:
+        """Stream a response body. Latency is recorded at response headers."""
+        response = await self.send_stream(method, url, timeout=timeout, **kwargs)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def send_stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Any = USE_DEFAULT_TIMEOUT,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request and return once headers arrive, leaving the body unread.
+
+        The caller owns the response and must ``aclose()`` it; this is what lets
+        a ``StreamingResponse`` keep reading after the handler has returned.
+        """
+        method = method.upper()
+        if timeout is not USE_DEFAULT_TIMEOUT:
+            kwargs["timeout"] = _as_timeout(timeout, self.config.connect_timeout)
+        follow_redirects = kwargs.pop("follow_redirects", False)
+        self._before_request()
+        started = time.perf_counter()
+        try:
+            request = self._client.build_request(method, url, **kwargs)
+            response = await self._client.send(
+                request, stream=True, follow_redirects=follow_redirects
+            )
+        except httpx.HTTPError as exc:
+            self._record_failure(method, started, type(exc).__name__)
+            raise
+        except BaseException:
+            self._breaker.release_trial()
+            raise
+        self._record_response(method, started, response.status_code)
+        return response
+
+    def session(self, timeout: Any = USE_DEFAULT_TIMEOUT) -> "UpstreamSession":
+        """Borrow the pooled client with a per-call default timeout."""
+        return UpstreamSession(self, timeout)
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Breaker state and recent latency percentiles for health endpoints."""
+        latencies = sorted(self._latencies)
+        return {
+            "base_url": self.config.base_url,
+            "circuit": self._breaker.state.value,
+            "consecutive_failures": self._breaker.consecutive_failures,
+            "requests": self._requests,
+            "errors": self._errors,
+            "latency_p50_ms": _percentile_ms(latencies, 0.50),
+            "latency_p99_ms": _percentile_ms(latencies, 0.99),
+        }
+
+    def _before_request(self) -> None:
+        try:
+            self._breaker.before_request()
+        except CircuitOpenError:
+            UPSTREAM_REJECTED.labels(upstream=self.name).inc()
+            raise
+
+    def _record_response(self, method: str, started: float, status_code: int) -> None:
+        elapsed = time.perf_counter() - started
+        self._requests += 1
+        self._latencies.append(elapsed)
+        UPSTREAM_LATENCY.labels(
+            upstream=self.name, method=method, outcome=outcome_for_status(status_code)
+        ).observe(elapsed)
+        # Any HTTP response proves the upstream is reachable. 5xx statuses are
+        # counted as errors but do not trip the breaker: services return 503
+        # on purpose (e.g. brain research without DATABASE_URL), and one route
+        # group must not cut off the others sharing this upstream. Only
+        # transport errors and timeouts count as failures.
+        if status_code in (502, 503, 504):
+            self._errors += 1
+        self._breaker.record_success()
+        self._publish_breaker_state()
+
+    def _record_failure(self, method: str, started: float, outcome: str) -> None:
+        elapsed = time.perf_counter() - started
+        self._requests += 1
+        self._errors += 1
+        UPSTREAM_LATENCY.labels(upstream=self.name, method=method, outcome=outcome).observe(
+            elapsed
+        )
+        self._breaker.record_failure()
+        self._publish_breaker_state()
+
+    def _publish_breaker_state(self) -> None:
+        UPSTREAM_CIRCUIT_OPEN.labels(upstream=self.name).set(
+            1 if self._breaker.state is CircuitState.OPEN else 0
+        )
+
+
+class UpstreamSession:
+    """Per-call view over an ``UpstreamClient`` with a default timeout.
+
+    Used as ``async with upstream("cad", timeout=180.0) as client:`` so route
+    handlers keep the familiar ``httpx.AsyncClient`` shape. Leaving the block
+    returns nothing to close; connections stay in the shared pool.
+    """
+
+    def __init__(self, upstream: UpstreamClient, timeout: Any = USE_DEFAULT_TIMEOUT) -> None:
+        self._upstream = upstream
+        self._timeout = timeout
+
+    async def __aenter__(self) -> "UpstreamSession":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        kwargs.setdefault("timeout", self._timeout)
+        return await self._upstream.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    def stream(self, method: str, url: str, **kwargs: Any):
+        kwargs.setdefault("timeout", self._timeout)
+        return self._upstream.stream(method, url, **kwargs)
+
+    async def send_stream(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        kwargs.setdefault("timeout", self._timeout)
+        return await self._upstream.send_stream(method, url, **kwargs)
+
+
+def _as_timeout(timeout: Any, connect_timeout: float) -> Any:
+    if timeout is None or isinstance(timeout, httpx.Timeout):
+        return timeout
+    # Keep connection establishment snappy even for long-running calls
+    return httpx.Timeout(float(timeout), connect=min(float(timeout), connect_timeout))
+
+
+def _has_streaming_body(kwargs: Dict[str, Any]) -> bool:
+    content = kwargs.get("content")
+    if content is not None and not isinstance(content, (bytes, str)):
+        return True
+    files = kwargs.get("files")
+    if files:
+        values = files.values() if isinstance(files, dict) else [f for _, f in files]
+        for value in values:
+            payload = value[1] if isinstance(value, tuple) else value
+            if not isinstance(payload, (bytes, str)):
+                return True
+    return False
+
+
+def _percentile_ms(sorted_values: list[float], quantile: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(quantile * len(sorted_values)))
+    return round(sorted_values[index] * 1000, 2)
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+__all__ = ["USE_DEFAULT_TIMEOUT", "UpstreamClient", "UpstreamSession"]
@@ -0,0 +1,91 @@
+"""Per-upstream connection, timeout and resilience settings."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Settings for one upstream service's pooled client.
+
+    Every field can be overridden with ``GATEWAY_UPSTREAM_<NAME>_<FIELD>``
+    environment variables, e.g. ``GATEWAY_UPSTREAM_CAD_MAX_CONNECTIONS=50``.
+    """
+
+    name: str
+    base_url: str
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    timeout: float = 30.0
+    # Extra attempts after a transport failure (connect errors for any method,
+    # other transport errors only for idempotent methods)
+    retries: int = 2
+    retry_backoff: float = 0.1
+    # Consecutive failures before the breaker opens, and how long it stays open
+    breaker_threshold: int = 5
+    breaker_reset_seconds: float = 15.0
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls, name: str, base_url: str, **defaults: object) -> "UpstreamConfig":
+        prefix = f"GATEWAY_UPSTREAM_{name.upper().replace('-', '_')}_"
+        values: Dict[str, object] = {"name": name, "base_url": base_url, **defaults}
+        for field_name, field in cls.__dataclass_fields__.items():
+            if field_name in ("name", "base_url"):
+                continue
+            raw = os.getenv(prefix + field_name.upper())
+            if raw is None:
+                continue
+            field_type = field.type if isinstance(field.type, str) else field.type.__name__
+            if field_type == "bool":
+                values[field_name] = raw.lower() in ("1", "true", "yes", "on")
+            elif field_type == "int":
+                values[field_name] = int(raw)
+            else:
+                values[field_name] = float(raw)
+        return cls(**values)  # type: ignore[arg-type]
+
+
+def default_upstreams() -> Dict[str, UpstreamConfig]:
+    """Upstreams the gateway proxies to, keyed by name.
+
+    Base URLs use the same environment variables the route modules read.
+    """
+    http2 = os.getenv("GATEWAY_UPSTREAM_HTTP2", "false").lower() == "true"
+    brain_url = os.getenv("UPSTREAM_BRAIN_URL", "http://brain:8000")
+    configs = [
+        # Brain serves chat, research and collective runs; it gets the largest pool
+        UpstreamConfig.from_env("brain", brain_url, max_connections=200, timeout=120.0, http2=http2),
+        UpstreamConfig.from_env("cad", os.getenv("CAD_BASE", "http://cad:8200"), http2=http2),
+        UpstreamConfig.from_env(
+            "fabrication",
+            os.getenv("FABRICATION_BASE", "http://fabrication:8300"),
+            http2=http2,
+        ),
+        UpstreamConfig.from_env(
+            "coder-agent",
+            os.getenv("CODER_AGENT_BASE", "http://coder-agent:8092"),
+            http2=http2,
+        ),
+        UpstreamConfig.from_env(
+            "images", os.getenv("IMAGES_BASE", "http://127.0.0.1:8089"), http2=http2
+        ),
+        UpstreamConfig.from_env(
+            "settings", os.getenv("SETTINGS_BASE_URL", "http://settings:8450"), http2=http2
+        ),
+        UpstreamConfig.from_env(
+            "voice", os.getenv("VOICE_BASE_URL", "http://localhost:8400"), http2=http2
+        ),
+        UpstreamConfig.from_env(
+            "discovery", os.getenv("DISCOVERY_BASE", "http://discovery:8500"), http2=http2
+        ),
+    ]
+    return {config.name: config for config in configs}
+
+
+__all__ = ["UpstreamConfig", "default_upstreams"]
@@ -0,0 +1,43 @@
+"""Prometheus metrics for gateway upstream calls."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+UPSTREAM_LATENCY = Histogram(
+    "kitty_gateway_upstream_request_seconds",
+    "Latency of proxied upstream requests (time to response headers)",
+    labelnames=("upstream", "method", "outcome"),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 120),
+)
+
+UPSTREAM_RETRIES = Counter(
+    "kitty_gateway_upstream_retries_total",
+    "Upstream requests retried after a transport failure",
+    labelnames=("upstream",),
+)
+
+UPSTREAM_REJECTED = Counter(
+    "kitty_gateway_upstream_rejected_total",
+    "Upstream requests short-circuited by an open breaker",
+    labelnames=("upstream",),
+)
+
+UPSTREAM_CIRCUIT_OPEN = Gauge(
+    "kitty_gateway_upstream_circuit_open",
+    "Whether the upstream circuit breaker is open (1) or closed/half-open (0)",
+    labelnames=("upstream",),
+)
+
+
+def outcome_for_status(status_code: int) -> str:
+    return f"{status_code // 100}xx"
+
+
+__all__ = [
+    "UPSTREAM_CIRCUIT_OPEN",
+    "UPSTREAM_LATENCY",
+    "UPSTREAM_REJECTED",
+    "UPSTREAM_RETRIES",
+    "outcome_for_status",
+]
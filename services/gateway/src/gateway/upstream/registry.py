@@ -0,0 +1,95 @@
+"""Process-wide registry of pooled upstream clients."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+from fastapi import FastAPI
+
+from .client import USE_DEFAULT_TIMEOUT, UpstreamClient, UpstreamSession
+from .config import UpstreamConfig, default_upstreams
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamRegistry:
+    """Owns one ``UpstreamClient`` per upstream service.
+
+    Clients are opened in the app lifespan and closed on shutdown. Lookups
+    before startup (scripts, tests without a lifespan) create the client on
+    first use so routes never fall back to per-request clients.
+    """
+
+    def __init__(
+        self,
+        configs: Optional[Dict[str, UpstreamConfig]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._configs = configs
+        self._transport = transport
+        self._clients: Dict[str, UpstreamClient] = {}
+
+    @property
+    def configs(self) -> Dict[str, UpstreamConfig]:
+        if self._configs is None:
+            self._configs = default_upstreams()
+        return self._configs
+
+    def start(self) -> None:
+        for name in self.configs:
+            self.get(name)
+        logger.info("Upstream pools started: %s", ", ".join(sorted(self._clients)))
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+    def get(self, name: str) -> UpstreamClient:
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            try:
+                config = self.configs[name]
+            except KeyError:
+                raise KeyError(f"Unknown upstream '{name}'") from None
+            client = UpstreamClient(config, transport=self._transport)
+            self._clients[name] = client
+        return client
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: client.snapshot() for name, client in self._clients.items()}
+
+
+registry = UpstreamRegistry()
+
+
+def get_upstream(name: str) -> UpstreamClient:
+    """Return the pooled client for ``name`` (e.g. "brain", "cad", "fabrication")."""
+    return registry.get(name)
+
+
+def upstream(name: str, timeout: Any = USE_DEFAULT_TIMEOUT) -> UpstreamSession:
+    """Borrow the pooled client for ``name`` with a per-call default timeout."""
+    return registry.get(name).session(timeout)
+
+
+@asynccontextmanager
+async def upstream_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    registry.start()
+    try:
+        yield
+    finally:
+        await registry.aclose()
+
+
+__all__ = [
+    "UpstreamRegistry",
+    "get_upstream",
+    "registry",
+    "upstream",
+    "upstream_lifespan",
+]
@@ -0,0 +1,171 @@
+"""Bounded-memory streaming of request and response bodies through the gateway.
+
+Downloads are piped chunk by chunk from the upstream socket to the client;
+``StreamingResponse`` awaits each ``send`` before pulling the next chunk, so a
+slow client applies backpressure all the way to the upstream connection.
+Range and conditional headers are forwarded so browsers can resume and cache.
+Uploads forward the raw request body (multipart boundary and all) without
+parsing or spooling it.
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Dict, Mapping, Optional
+
+import httpx
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from .client import USE_DEFAULT_TIMEOUT
+from .registry import get_upstream
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Client request headers that make downloads resumable and cacheable
+FORWARDED_REQUEST_HEADERS = (
+    "range",
+    "if-range",
+    "if-none-match",
+    "if-modified-since",
+    "accept-encoding",
+)
+
+# Upstream response headers relayed to the client
+RELAYED_RESPONSE_HEADERS = (
+    "content-type",
+    "content-length",
+    "content-range",
+    "content-encoding",
+    "content-disposition",
+    "accept-ranges",
+    "etag",
+    "last-modified",
+    "cache-control",
+)
+
+# Statuses streamed back as-is rather than treated as upstream errors
+_PASSTHROUGH_STATUSES = {200, 206, 304, 416}
+
+
+def forwarded_headers(request: Request) -> Dict[str, str]:
+    headers = {
+        name: request.headers[name]
+        for name in FORWARDED_REQUEST_HEADERS
+        if name in request.headers
+    }
+    # Bodies are relayed raw, so never let httpx negotiate an encoding the
+    # client did not ask for
+    headers.setdefault("accept-encoding", "identity")
+    return headers
+
+
+async def proxy_download(
+    upstream_name: str,
+    url: str,
+    request: Request,
+    *,
+    timeout: object = USE_DEFAULT_TIMEOUT,
+    media_type: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    follow_redirects: bool = False,
+) -> Response:
+    """Stream an upstream GET to the client without buffering the body.
+
+    Raises ``httpx.HTTPStatusError`` for upstream error statuses so callers'
+    existing handlers translate it into an ``HTTPException``.
+    """
+    response = await get_upstream(upstream_name).send_stream(
+        "GET",
+        url,
+        headers=forwarded_headers(request),
+        timeout=timeout,
+        follow_redirects=follow_redirects,
+    )
+    if response.status_code not in _PASSTHROUGH_STATUSES:
+        try:
+            # Error bodies are small; read them so the handler can relay detail
+            await response.aread()
+            response.raise_for_status()
+        finally:
+            await response.aclose()
+
+    relayed = {
+        name: response.headers[name]
+        for name in RELAYED_RESPONSE_HEADERS
+        if name in response.headers
+    }
+    if media_type:
+        relayed.pop("content-type", None)
+    if headers:
+        relayed.update({name.lower(): value for name, value in headers.items()})
+
+    if response.status_code == 304:
+        await response.aclose()
+        relayed.pop("content-length", None)
+        return Response(status_code=304, headers=relayed)
+
+    return StreamingResponse(
+        response.aiter_raw(STREAM_CHUNK_SIZE),
+        status_code=response.status_code,
+        headers=relayed,
+        media_type=media_type,
+        background=BackgroundTask(response.aclose),
+    )
+
+
+class UploadTooLarge(HTTPException):
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(status_code=413, detail=f"Upload exceeds {max_bytes} bytes")
+
+
+async def limited_body(request: Request, max_bytes: int) -> AsyncIterator[bytes]:
+    """Yield the raw request body, aborting once it exceeds ``max_bytes``."""
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise UploadTooLarge(max_bytes)
+        yield chunk
+
+
+async def proxy_upload(
+    upstream_name: str,
+    url: str,
+    request: Request,
+    *,
+    max_bytes: int,
+    timeout: object = USE_DEFAULT_TIMEOUT,
+) -> httpx.Response:
+    """Forward the raw request body to ``url`` as it arrives.
+
+    The original ``Content-Type`` (including any multipart boundary) is kept,
+    so the upstream parses exactly what the client sent.
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+        raise UploadTooLarge(max_bytes)
+
+    headers = {"content-type": request.headers.get("content-type", "application/octet-stream")}
+    if declared is not None:
+        headers["content-length"] = declared
+
+    return await get_upstream(upstream_name).request(
+        "POST",
+        url,
+        content=limited_body(request, max_bytes),
+        headers=headers,
+        timeout=timeout,
+    )
+
+
+__all__ = [
+    "FORWARDED_REQUEST_HEADERS",
+    "RELAYED_RESPONSE_HEADERS",
+    "STREAM_CHUNK_SIZE",
+    "UploadTooLarge",
+    "forwarded_headers",
+    "limited_body",
+    "proxy_download",
+    "proxy_upload",
+]
@@ -0,0 +1,137 @@
+"""
+KITTY Images Service - Image Catalog
+Redis index of generated images so the gallery never lists the bucket
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NAMESPACE = "images:catalog"
+
+
+def _member(key: str, created_at: float) -> str:
+    # Zero-padded millisecond prefix: lexicographic order == creation order,
+    # ties broken by key, and any member is a stable pagination cursor
+    return f"{int(created_at * 1000):013d}|{key}"
+
+
+class ImageCatalog:
+    """
+    Newest-first index of generated PNGs
+
+    Entries live in a sorted set (all scores 0, ordered by member) plus a hash
+    of per-image metadata, so a page is one ZREVRANGEBYLEX and one HMGET
+    regardless of how many images the bucket holds.
+    """
+
+    def __init__(self, redis_conn: Redis, namespace: str = DEFAULT_NAMESPACE):
+        self.redis = redis_conn
+        self.index_key = f"{namespace}:index"
+        self.entries_key = f"{namespace}:entries"
+        self.backfill_key = f"{namespace}:backfilled"
+
+    @classmethod
+    def from_env(cls) -> "ImageCatalog":
+        return cls(Redis.from_url(os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")))
+
+    def add(
+        self,
+        key: str,
+        size: int,
+        created_at: Optional[float] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record one image (re-adding a key replaces its entry)"""
+        self.add_many([(key, size, created_at if created_at is not None else time.time(), meta)])
+
+    def add_many(self, images: Iterable[Tuple[str, int, float, Optional[Dict[str, Any]]]]) -> int:
+        """Record (key, size, created_at, meta) tuples in one round trip"""
+        images = list(images)
+        if not images:
+            return 0
+        previous = self.redis.hmget(self.entries_key, [key for key, _, _, _ in images])
+        pipe = self.redis.pipeline(transaction=False)
+        for (key, size, created_at, meta), old in zip(images, previous):
+            member = _member(key, created_at)
+            if old is not None:
+                old_member = json.loads(old)["member"]
+                if old_member != member:
+                    pipe.zrem(self.index_key, old_member)
+            entry = {
+                "member": member,
+                "key": key,
+                "size": size,
+                "last_modified": datetime.fromtimestamp(created_at, tz=timezone.utc).isoformat(),
+            }
+            request = (meta or {}).get("request") or {}
+            if request.get("prompt"):
+                entry["prompt"] = request["prompt"]
+            if request.get("model"):
+                entry["model"] = request["model"]
+            pipe.zadd(self.index_key, {member: 0})
+            pipe.hset(self.entries_key, key, json.dumps(entry))
+        pipe.execute()
+        return len(images)
+
+    def latest(self, limit: int = 36, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Return one page of images, newest first
+
+        ``cursor`` is the ``next_cursor`` of the previous page; the returned
+        cursor is None on the last page.
+        """
+        upper = f"({cursor}" if cursor else "+"
+        members = self.redis.zrevrangebylex(self.index_key, upper, "-", start=0, num=limit + 1)
+        page = [m.decode() if isinstance(m, bytes) else m for m in members[:limit]]
+        next_cursor = page[-1] if len(members) > limit else None
+        if not page:
+            return [], None
+        raw = self.redis.hmget(self.entries_key, [member.split("|", 1)[1] for member in page])
+        items = []
+        for entry in raw:
+            if entry is None:
+                continue
+            item = json.loads(entry)
+            item.pop("member", None)
+            items.append(item)
+        return items, next_cursor
+
+    def count(self) -> int:
+        return self.redis.zcard(self.index_key)
+
+    def backfill(self, s3_client: Any, bucket: str, prefix: str, page_size: int = 1000) -> int:
+        """Index every PNG under ``prefix`` using paginated list_objects_v2"""
+        paginator = s3_client.get_paginator("list_objects_v2")
+        total = 0
+        for page in paginator.paginate(
+            Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": page_size}
+        ):
+            total += self.add_many(
+                (obj["Key"], obj["Size"], obj["LastModified"].timestamp(), None)
+                for obj in page.get("Contents", [])
+                if obj["Key"].lower().endswith(".png")
+            )
+        logger.info(f"Image catalog backfill indexed {total} images from s3://{bucket}/{prefix}")
+        return total
+
+    def backfill_once(self, s3_client: Any, bucket: str, prefix: str) -> Optional[int]:
+        """Run the bucket backfill unless it already ran (or is running) elsewhere"""
+        if not self.redis.set(self.backfill_key, "running", nx=True):
+            return None
+        try:
+            total = self.backfill(s3_client, bucket, prefix)
+        except Exception:
+            # Let the next startup retry
+            self.redis.delete(self.backfill_key)
+            raise
+        self.redis.set(self.backfill_key, json.dumps({"completed_at": time.time(), "images": total}))
+        return total
@@ -8,6 +8,8 @@ import time
 import uuid
 import boto3
 
+from catalog import ImageCatalog
+
 
 class S3Store:
     """MinIO/S3 storage handler for generated images and metadata"""
@@ -22,6 +24,7 @@ class S3Store:
         )
         self.bucket = os.getenv("S3_BUCKET")
         self.prefix = os.getenv("S3_PREFIX", "images/")
+        self.catalog = ImageCatalog.from_env()
 
     def save_png_and_bytes(self, png_bytes: bytes, meta: dict) -> dict:
         """Save PNG bytes and JSON metadata to S3, return keys"""
@@ -46,4 +49,11 @@ class S3Store:
             ContentType="application/json"
         )
 
+        # Index for the gallery; the image is already stored, so a Redis
+        # hiccup must not fail the job
+        try:
+            self.catalog.add(png_key, len(png_bytes), meta=meta)
+        except Exception as e:
+            print(f"[S3Store] Failed to catalog {png_key}: {e}")
+
         return {"png_key": png_key, "meta_key": meta_key}
@@ -4,8 +4,11 @@ Queued image generation with MinIO storage and /vision integration
 """
 import os
 import json
+import logging
+import threading
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from redis import Redis
@@ -13,6 +16,10 @@ from rq import Queue
 from rq.job import Job
 import boto3
 
+from catalog import ImageCatalog
+
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Configuration
@@ -30,6 +37,9 @@ S3_PREFIX = os.getenv("S3_PREFIX", "images/")
 redis_conn = Redis.from_url(REDIS_URL)
 images_queue = Queue("images", connection=redis_conn)
 
+# Gallery index, written by the workers at save time
+image_catalog = ImageCatalog(redis_conn)
+
 # Initialize S3 client
 s3_client = boto3.client(
     "s3",
@@ -74,11 +84,14 @@ class ImageItem(BaseModel):
     key: str
     size: int
     last_modified: str
+    prompt: Optional[str] = None
+    model: Optional[str] = None
 
 
 class ImagesListResponse(BaseModel):
-    """List of images"""
+    """Page of images, newest first"""
     items: list[ImageItem]
+    next_cursor: Optional[str] = None
 
 
 class SelectRequest(BaseModel):
@@ -95,10 +108,25 @@ class SelectResponse(BaseModel):
 # FastAPI Application
 # ============================================================================
 
+def _backfill_catalog():
+    try:
+        image_catalog.backfill_once(s3_client, S3_BUCKET, S3_PREFIX)
+    except Exception as e:
+        logger.error(f"Image catalog backfill failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Index images that predate the catalog (runs once per Redis database)"""
+    threading.Thread(target=_backfill_catalog, name="image-catalog-backfill", daemon=True).start()
+    yield
+
+
 app = FastAPI(
     title="KITTY Images Service",
     description="Stable Diffusion image generation with queued jobs and MinIO storage",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware for UI access
@@ -181,34 +209,25 @@ def job_status(job_id: str):
 
 
 @app.get("/api/images/latest", response_model=ImagesListResponse)
-def latest(limit: int = 36):
+def latest(
+    limit: int = Query(36, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+):
     """
-    List latest generated images from MinIO
+    List latest generated images from the catalog
 
-    Returns most recently modified images first
+    Returns most recently generated images first; pass next_cursor back as
+    cursor to fetch the following page
     """
     try:
-        response = s3_client.list_objects_v2(Bucket=S3_BUCKET, Prefix=S3_PREFIX)
+        items, next_cursor = image_catalog.latest(limit=limit, cursor=cursor)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list images: {e}")
 
-    items = response.get("Contents", [])
-
-    # Sort by modification time (newest first)
-    items.sort(key=lambda x: x["LastModified"], reverse=True)
-
-    # Filter PNG files only and format response
-    image_items = [
-        ImageItem(
-            key=item["Key"],
-            size=item["Size"],
-            last_modified=item["LastModified"].isoformat()
-        )
-        for item in items[:limit]
-        if item["Key"].lower().endswith(".png")
-    ]
-
-    return ImagesListResponse(items=image_items)
+    return ImagesListResponse(
+        items=[ImageItem(**item) for item in items],
+        next_cursor=next_cursor,
+    )
 
 
 @app.post("/api/images/select", response_model=SelectResponse)
@@ -255,6 +274,7 @@ def stats():
         "started": len(images_queue.started_job_registry),
         "finished": len(images_queue.finished_job_registry),
         "failed": len(images_queue.failed_job_registry),
+        "catalog_images": image_catalog.count(),
     }
 
 
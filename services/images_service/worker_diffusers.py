@@ -23,6 +23,8 @@ from diffusers import (
     EulerAncestralDiscreteScheduler,
 )
 
+from catalog import ImageCatalog
+
 
 @dataclass
 class GenParams:
@@ -55,6 +57,7 @@ class S3Store:
         if self.local_root:
             self.local_root = Path(self.local_root).expanduser()
             self.local_root.mkdir(parents=True, exist_ok=True)
+        self.catalog = ImageCatalog.from_env()
 
     def save_png_and_meta(self, im: Image.Image, meta: Dict[str, Any]) -> Dict[str, str]:
         """Save PNG image and JSON metadata to S3, return keys"""
@@ -94,6 +97,13 @@ class S3Store:
             with open(local_meta, "wb") as f:
                 f.write(meta_bytes)
 
+        # Index for the gallery; the image is already stored, so a Redis
+        # hiccup must not fail the job
+        try:
+            self.catalog.add(png_key, len(png_bytes), meta=meta)
+        except Exception as e:
+            print(f"[S3Store] Failed to catalog {png_key}: {e}")
+
         return {"png_key": png_key, "meta_key": meta_key}
 
 
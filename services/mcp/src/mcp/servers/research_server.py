@@ -273,24 +273,16 @@ class ResearchMCPServer(MCPServer):
 
         # Filter duplicates using SimHash
         results = search_result["results"]
-        filtered_results = []
-
-        for result in results:
-            url = result["url"]
-            description = result["description"]
-
-            # Check if content is duplicate
-            if self._deduplicator.is_duplicate(description, url):
-                continue
-
-            # Add to deduplicator
-            self._deduplicator.add(description, url)
-            filtered_results.append(result)
+        added = self._deduplicator.add_many(
+            (result["description"], result["url"]) for result in results
+        )
+        filtered_results = [result for result, is_new in zip(results, added) if is_new]
 
+        top_results = filtered_results[:3]
+        fetch_results = await self._web_tool.fetch_many(entry["url"] for entry in top_results)
         enriched_results = []
-        for entry in filtered_results[:3]:
+        for entry, fetch_result in zip(top_results, fetch_results):
             content_snippet = None
-            fetch_result = await self._web_tool.fetch(entry["url"])
             if fetch_result["success"]:
                 content_snippet = fetch_result.get("content")
             enriched_results.append(
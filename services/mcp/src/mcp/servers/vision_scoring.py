@@ -0,0 +1,239 @@
+"""Batched CLIP relevance scoring for the vision MCP server.
+
+Candidate images are downloaded concurrently over one pooled client,
+decoded/preprocessed in a thread pool, and encoded by CLIP in a single
+batched forward pass. Text prompt embeddings are computed once per query
+and kept in a small LRU.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, List, Optional, Sequence, Tuple
+
+import httpx
+
+try:  # optional CLIP dependencies
+    import torch
+    import open_clip  # type: ignore
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    torch = None  # type: ignore[assignment]
+    open_clip = None  # type: ignore[assignment]
+    Image = None  # type: ignore[assignment]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ClipScorer:
+    """Optional CLIP scorer using open_clip if available."""
+
+    def __init__(
+        self,
+        model: Any,
+        preprocess: Any,
+        tokenizer: Any,
+        device: str,
+        text_cache_size: int = 128,
+    ) -> None:
+        self._model = model
+        self._preprocess = preprocess
+        self._tokenizer = tokenizer
+        self._device = device
+        self._pos_templates = ["{}", "a high quality photo of {}", "a close-up of {}"]
+        self._neg_templates = ["cartoon {}", "toy {}", "statue {}"]
+        self._text_cache: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+        self._text_cache_size = text_cache_size
+        self._text_lock = threading.Lock()
+        # Inference is serialized; concurrent forward passes only thrash the device
+        self._model_lock = threading.Lock()
+
+    @classmethod
+    def create(cls) -> Optional["ClipScorer"]:
+        if torch is None or open_clip is None or Image is None:
+            LOGGER.info("CLIP scorer unavailable (missing torch/open_clip/Pillow)")
+            return None
+        try:
+            device = "cpu"
+            if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():  # type: ignore[attr-defined]
+                device = "mps"
+            model, _, preprocess = open_clip.create_model_and_transforms(
+                "ViT-B-32", pretrained="laion2b_s34b_b79k", device=device
+            )
+            tokenizer = open_clip.get_tokenizer("ViT-B-32")
+            model.eval()
+            return cls(
+                model,
+                preprocess,
+                tokenizer,
+                device,
+                text_cache_size=int(os.getenv("VISION_CLIP_TEXT_CACHE", "128")),
+            )
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Failed to initialize CLIP scorer: %s", exc)
+            return None
+
+    def preprocess(self, image_bytes: bytes) -> Any:
+        """Decode and preprocess one image into a CPU tensor. Thread-safe."""
+        image = Image.open(BytesIO(image_bytes)).convert("RGB")
+        return self._preprocess(image)
+
+    def score(self, query: str, image_bytes: bytes) -> float:
+        return self.score_batch(query, [self.preprocess(image_bytes)])[0]
+
+    def score_batch(self, query: str, images: Sequence[Any]) -> List[float]:
+        """Score preprocessed image tensors against ``query`` in one forward pass.
+
+        Each score is the best positive-prompt similarity minus the best
+        negative-prompt similarity, in [-2, 2] (typically [-1, 1]).
+        """
+        if not images:
+            return []
+        pos_features, neg_features = self._text_features(query)
+        batch = torch.stack(list(images)).to(self._device)
+        with self._model_lock, torch.no_grad():
+            image_features = self._model.encode_image(batch)
+        image_features = image_features / image_features.norm(dim=-1, keepdim=True)
+        pos_scores = (image_features @ pos_features.T).max(dim=-1).values
+        neg_scores = (image_features @ neg_features.T).max(dim=-1).values
+        return (pos_scores - neg_scores).tolist()
+
+    def _text_features(self, query: str) -> Tuple[Any, Any]:
+        with self._text_lock:
+            cached = self._text_cache.get(query)
+            if cached is not None:
+                self._text_cache.move_to_end(query)
+                return cached
+        positives = [template.format(query) for template in self._pos_templates]
+        negatives = [template.format(query) for template in self._neg_templates]
+        # Encode both prompt sets in one pass, then split
+        features = self._encode_text(positives + negatives)
+        features = features / features.norm(dim=-1, keepdim=True)
+        pair = (features[: len(positives)], features[len(positives) :])
+        with self._text_lock:
+            self._text_cache[query] = pair
+            self._text_cache.move_to_end(query)
+            while len(self._text_cache) > self._text_cache_size:
+                self._text_cache.popitem(last=False)
+        return pair
+
+    def _encode_text(self, prompts: List[str]):
+        tokens = self._tokenizer(prompts)
+        with self._model_lock, torch.no_grad():
+            features = self._model.encode_text(tokens.to(self._device))
+        return features
+
+
+class ImageScoringEngine:
+    """Concurrent download + thread-pool preprocessing + batched CLIP inference."""
+
+    def __init__(
+        self,
+        scorer: ClipScorer,
+        *,
+        timeout: float = 10.0,
+        max_concurrency: int = 8,
+        max_image_bytes: int = 10 * 1024 * 1024,
+        batch_size: int = 32,
+        preprocess_workers: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._scorer = scorer
+        self._timeout = timeout
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_image_bytes = max_image_bytes
+        self._batch_size = max(1, batch_size)
+        self._transport = transport
+        self._executor = ThreadPoolExecutor(
+            max_workers=preprocess_workers or min(8, (os.cpu_count() or 2)),
+            thread_name_prefix="vision-preprocess",
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_env(cls, scorer: ClipScorer, timeout: float) -> "ImageScoringEngine":
+        return cls(
+            scorer,
+            timeout=timeout,
+            max_concurrency=int(os.getenv("VISION_IMAGE_CONCURRENCY", "8")),
+            max_image_bytes=int(os.getenv("VISION_IMAGE_MAX_BYTES", str(10 * 1024 * 1024))),
+            batch_size=int(os.getenv("VISION_CLIP_BATCH_SIZE", "32")),
+        )
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency,
+                    max_keepalive_connections=self._max_concurrency,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._executor.shutdown(wait=False)
+
+    async def score(self, query: str, urls: Sequence[Optional[str]]) -> List[Optional[float]]:
+        """Return a CLIP score per URL (``None`` where download/decode failed)."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def prepare(url: Optional[str]) -> Any:
+            if not url:
+                return None
+            async with semaphore:
+                data = await self._download(url)
+            if data is None:
+                return None
+            try:
+                return await loop.run_in_executor(self._executor, self._scorer.preprocess, data)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.debug("Image decode failed for %s: %s", url, exc)
+                return None
+
+        tensors = await asyncio.gather(*(prepare(url) for url in urls))
+        ready = [(index, tensor) for index, tensor in enumerate(tensors) if tensor is not None]
+        scores: List[Optional[float]] = [None] * len(urls)
+        for start in range(0, len(ready), self._batch_size):
+            chunk = ready[start : start + self._batch_size]
+            try:
+                batch_scores = await asyncio.to_thread(
+                    self._scorer.score_batch, query, [tensor for _, tensor in chunk]
+                )
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("CLIP batch scoring failed: %s", exc)
+                continue
+            for (index, _), value in zip(chunk, batch_scores):
+                scores[index] = float(value)
+        return scores
+
+    async def _download(self, url: str) -> Optional[bytes]:
+        try:
+            async with self._http().stream("GET", url) as resp:
+                resp.raise_for_status()
+                declared = resp.headers.get("content-length")
+                if declared and declared.isdigit() and int(declared) > self._max_image_bytes:
+                    return None
+                buffer = bytearray()
+                async for chunk in resp.aiter_bytes():
+                    buffer.extend(chunk)
+                    if len(buffer) > self._max_image_bytes:
+                        return None
+                return bytes(buffer)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.debug("Image download failed for %s: %s", url, exc)
+            return None
+
+
+__all__ = ["ClipScorer", "ImageScoringEngine"]
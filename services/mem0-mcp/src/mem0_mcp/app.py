@@ -11,9 +11,12 @@ from uuid import uuid4
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client.models import Distance, PointStruct, SearchRequest, VectorParams
 from sentence_transformers import SentenceTransformer, CrossEncoder
 
+from .filters import exclusion_filter, memory_filter
+from .inference import InferenceEngine
+
 
 # Configuration
 QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
@@ -24,6 +27,14 @@ EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "384"))
 # Optional reranker for improved top-k precision (15-20% improvement)
 # Falls back to vector-only search if not set or fails to load
 RERANKER_MODEL = os.getenv("RERANKER_MODEL", "")
+# Concurrent requests arriving within the window share one encode()/predict() call
+INFERENCE_BATCH_WINDOW_MS = float(os.getenv("MEM0_INFERENCE_BATCH_WINDOW_MS", "5"))
+INFERENCE_MAX_BATCH = int(os.getenv("MEM0_INFERENCE_MAX_BATCH", "128"))
+INFERENCE_WORKERS = int(os.getenv("MEM0_INFERENCE_WORKERS", "1"))
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("MEM0_QUERY_CACHE_SIZE", "2048"))
+# Bulk claim lookup: claims per request, and searches per Qdrant search_batch call
+CLAIM_BATCH_MAX_QUERIES = int(os.getenv("MEM0_CLAIM_BATCH_MAX_QUERIES", "500"))
+CLAIM_SEARCH_BATCH_SIZE = int(os.getenv("MEM0_CLAIM_SEARCH_BATCH_SIZE", "100"))
 
 # Research collections for paper/claim embeddings
 PAPERS_COLLECTION = "paper_embeddings"
@@ -168,16 +179,32 @@ class ClaimRelatedResponse(BaseModel):
     count: int
 
 
+class ClaimFindRelatedBatchRequest(BaseModel):
+    """Request to find related claims for many claims at once."""
+
+    queries: List[ClaimFindRelatedRequest] = Field(
+        ..., description="One lookup per claim, each with its own filters and limits"
+    )
+
+
+class ClaimRelatedBatchResponse(BaseModel):
+    """Related claims grouped by input claim, in request order."""
+
+    results: List[ClaimRelatedResponse]
+    count: int
+
+
 # Global state
 encoder_model: Optional[SentenceTransformer] = None
 reranker_model: Optional[CrossEncoder] = None
 qdrant_client: Optional[AsyncQdrantClient] = None
+inference: Optional[InferenceEngine] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup resources."""
-    global encoder_model, reranker_model, qdrant_client
+    global encoder_model, reranker_model, qdrant_client, inference
 
     # Initialize sentence transformer
     encoder_model = SentenceTransformer(EMBEDDING_MODEL)
@@ -195,6 +222,16 @@ async def lifespan(app: FastAPI):
         reranker_model = None
         print("Reranker not configured, using vector-only search")
 
+    inference = InferenceEngine(
+        encoder_model,
+        reranker_model,
+        model_name=EMBEDDING_MODEL,
+        window=INFERENCE_BATCH_WINDOW_MS / 1000,
+        max_batch=INFERENCE_MAX_BATCH,
+        workers=INFERENCE_WORKERS,
+        cache_size=QUERY_EMBEDDING_CACHE_SIZE,
+    )
+
     # Initialize Qdrant client
     qdrant_client = AsyncQdrantClient(url=QDRANT_URL)
 
@@ -229,6 +266,8 @@ async def lifespan(app: FastAPI):
     # Cleanup
     if qdrant_client:
         await qdrant_client.close()
+    if inference:
+        inference.shutdown()
 
 
 app = FastAPI(
@@ -248,11 +287,11 @@ async def health_check():
 @app.post("/memory/add", response_model=Memory)
 async def add_memory(request: MemoryAddRequest):
     """Add a new memory to the vector store."""
-    if not encoder_model or not qdrant_client:
+    if not inference or not qdrant_client:
         raise HTTPException(status_code=500, detail="Service not initialized")
 
     # Generate embedding
-    embedding = encoder_model.encode(request.content).tolist()
+    (embedding,) = await inference.embed_documents([request.content])
 
     # Create memory ID and timestamp
     memory_id = str(uuid4())
@@ -294,65 +333,31 @@ async def add_memory(request: MemoryAddRequest):
 @app.post("/memory/search", response_model=MemorySearchResponse)
 async def search_memories(request: MemorySearchRequest):
     """Search for relevant memories using semantic similarity."""
-    if not encoder_model or not qdrant_client:
+    if not inference or not qdrant_client:
         raise HTTPException(status_code=500, detail="Service not initialized")
 
     # Generate query embedding
-    query_embedding = encoder_model.encode(request.query).tolist()
+    query_embedding = await inference.embed_query(request.query)
 
-    # Build filter
-    filter_conditions = []
-    if request.conversation_id:
-        filter_conditions.append(
-            {"key": "conversation_id", "match": {"value": request.conversation_id}}
-        )
-    if request.user_id:
-        filter_conditions.append(
-            {"key": "user_id", "match": {"value": request.user_id}}
-        )
-
-    query_filter = None
-    if filter_conditions:
-        query_filter = {"must": filter_conditions}
-
-    # Search Qdrant with increased limit for post-filtering
-    # We fetch more results than requested to account for tag filtering
-    search_limit = request.limit * 3 if (request.include_tags or request.exclude_tags) else request.limit
+    # Conversation, user and tag filters are all applied by Qdrant
+    query_filter = memory_filter(
+        conversation_id=request.conversation_id,
+        user_id=request.user_id,
+        include_tags=request.include_tags,
+        exclude_tags=request.exclude_tags,
+    )
 
     search_result = await qdrant_client.search(
         collection_name=COLLECTION_NAME,
         query_vector=query_embedding,
         query_filter=query_filter,
-        limit=search_limit,
+        limit=request.limit,
         score_threshold=request.score_threshold,
     )
 
-    # Helper function to check if memory passes tag filters
-    def passes_tag_filter(memory_tags: List[str]) -> bool:
-        memory_tag_set = set(memory_tags or [])
-
-        # If exclude_tags specified, reject if any match
-        if request.exclude_tags:
-            if memory_tag_set & set(request.exclude_tags):
-                return False
-
-        # If include_tags specified, require at least one match
-        if request.include_tags:
-            if not (memory_tag_set & set(request.include_tags)):
-                return False
-
-        return True
-
-    # Convert results to Memory objects, filtering by tags
     memories = []
     for hit in search_result:
         payload = hit.payload
-        memory_tags = payload.get("tags", [])
-
-        # Apply tag filter
-        if not passes_tag_filter(memory_tags):
-            continue
-
         memories.append(
             Memory(
                 id=str(hit.id),
@@ -365,31 +370,16 @@ async def search_memories(request: MemorySearchRequest):
             )
         )
 
-        # Collect enough candidates for reranking (or stop if reached limit without reranker)
-        if not reranker_model and len(memories) >= request.limit:
-            break
-
     # Apply reranking if reranker is available
-    if reranker_model and memories:
-        # Prepare query-document pairs for reranking
-        pairs = [(request.query, mem.content) for mem in memories]
-
-        # Get reranker scores
-        rerank_scores = reranker_model.predict(pairs)
-
+    rerank_scores = await inference.rerank(request.query, [mem.content for mem in memories])
+    if rerank_scores is not None:
         # Update memory scores with reranker scores
         for mem, score in zip(memories, rerank_scores):
-            mem.score = float(score)
+            mem.score = score
 
         # Sort by reranker score (descending)
         memories.sort(key=lambda m: m.score, reverse=True)
 
-        # Take top k after reranking
-        memories = memories[:request.limit]
-    else:
-        # Without reranker, just take top k from vector search
-        memories = memories[:request.limit]
-
     return MemorySearchResponse(
         memories=memories,
         count=len(memories),
@@ -425,6 +415,7 @@ async def get_memory_stats():
         "embedding_model": EMBEDDING_MODEL,
         "reranker_model": RERANKER_MODEL if reranker_model else None,
         "reranker_enabled": reranker_model is not None,
+        "inference": inference.stats() if inference else None,
     }
 
 
@@ -436,12 +427,12 @@ async def get_memory_stats():
 @app.post("/papers/add")
 async def add_paper_embedding(request: PaperAddRequest):
     """Add a paper embedding for semantic deduplication and similarity search."""
-    if not encoder_model or not qdrant_client:
+    if not inference or not qdrant_client:
         raise HTTPException(status_code=500, detail="Service not initialized")
 
     # Generate embedding from title + abstract
     text_to_embed = f"{request.title}\n\n{request.abstract}" if request.abstract else request.title
-    embedding = encoder_model.encode(text_to_embed).tolist()
+    (embedding,) = await inference.embed_documents([text_to_embed])
 
     # Prepare payload
     payload = {
@@ -480,22 +471,22 @@ async def add_paper_embedding(request: PaperAddRequest):
 @app.post("/papers/find_similar", response_model=PaperSimilarResponse)
 async def find_similar_papers(request: PaperFindSimilarRequest):
     """Find similar papers for deduplication before adding to database."""
-    if not encoder_model or not qdrant_client:
+    if not inference or not qdrant_client:
         raise HTTPException(status_code=500, detail="Service not initialized")
 
     # Generate embedding from title + abstract
     text_to_embed = f"{request.title}\n\n{request.abstract}" if request.abstract else request.title
-    query_embedding = encoder_model.encode(text_to_embed).tolist()
+    query_embedding = await inference.embed_query(text_to_embed)
 
-    # Search for similar papers
+    # Search for similar papers (excluded IDs are filtered by Qdrant)
     search_result = await qdrant_client.search(
         collection_name=PAPERS_COLLECTION,
         query_vector=query_embedding,
-        limit=request.limit + len(request.exclude_paper_ids),  # Fetch extra for filtering
+        query_filter=exclusion_filter("paper_id", request.exclude_paper_ids),
+        limit=request.limit,
         score_threshold=request.score_threshold,
     )
 
-    # Filter out excluded papers and build response
     similar_papers = []
     is_duplicate = False
 
@@ -503,10 +494,6 @@ async def find_similar_papers(request: PaperFindSimilarRequest):
         payload = hit.payload
         paper_id = payload.get("paper_id", str(hit.id))
 
-        # Skip excluded papers
-        if paper_id in request.exclude_paper_ids:
-            continue
-
         similar_paper = SimilarPaper(
             paper_id=paper_id,
             title=payload.get("title", ""),
@@ -521,9 +508,6 @@ async def find_similar_papers(request: PaperFindSimilarRequest):
         if hit.score >= 0.95:
             is_duplicate = True
 
-        if len(similar_papers) >= request.limit:
-            break
-
     return PaperSimilarResponse(
         similar_papers=similar_papers,
         is_duplicate=is_duplicate,
@@ -567,11 +551,11 @@ async def get_paper_stats():
 @app.post("/claims/add")
 async def add_claim_embedding(request: ClaimAddRequest):
     """Add a claim embedding for similarity search and conflict detection."""
-    if not encoder_model or not qdrant_client:
+    if not inference or not qdrant_client:
         raise HTTPException(status_code=500, detail="Service not initialized")
 
     # Generate embedding from claim text
-    embedding = encoder_model.encode(request.claim_text).tolist()
+    (embedding,) = await inference.embed_documents([request.claim_text])
 
     # Prepare payload
     payload = {
@@ -605,41 +589,70 @@ async def add_claim_embedding(request: ClaimAddRequest):
 @app.post("/claims/find_related", response_model=ClaimRelatedResponse)
 async def find_related_claims(request: ClaimFindRelatedRequest):
     """Find related claims for cross-referencing and conflict detection."""
-    if not encoder_model or not qdrant_client:
+    if not inference or not qdrant_client:
         raise HTTPException(status_code=500, detail="Service not initialized")
 
     # Generate embedding from claim text
-    query_embedding = encoder_model.encode(request.claim_text).tolist()
-
-    # Build filter for topic IDs if specified
-    query_filter = None
-    if request.topic_ids:
-        query_filter = {
-            "should": [
-                {"key": "topic_ids", "match": {"any": request.topic_ids}}
-            ]
-        }
+    query_embedding = await inference.embed_query(request.claim_text)
 
-    # Search for related claims
+    # Topic and exclusion filters are applied by Qdrant
     search_result = await qdrant_client.search(
         collection_name=CLAIMS_COLLECTION,
         query_vector=query_embedding,
-        query_filter=query_filter,
-        limit=request.limit + len(request.exclude_claim_ids),
+        query_filter=exclusion_filter("claim_id", request.exclude_claim_ids, request.topic_ids),
+        limit=request.limit,
         score_threshold=request.score_threshold,
     )
 
-    # Build response, filtering excluded claims
+    return _related_claims_response(search_result)
+
+
+@app.post("/claims/find_related_batch", response_model=ClaimRelatedBatchResponse)
+async def find_related_claims_batch(request: ClaimFindRelatedBatchRequest):
+    """Find related claims for many claims with one encoder pass and batched searches."""
+    if not inference or not qdrant_client:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+
+    if len(request.queries) > CLAIM_BATCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {CLAIM_BATCH_MAX_QUERIES} claims per batch",
+        )
+    if not request.queries:
+        return ClaimRelatedBatchResponse(results=[], count=0)
+
+    # Encode every claim text in one forward pass
+    embeddings = await inference.embed_queries([query.claim_text for query in request.queries])
+
+    searches = [
+        SearchRequest(
+            vector=embedding,
+            filter=exclusion_filter("claim_id", query.exclude_claim_ids, query.topic_ids),
+            limit=query.limit,
+            score_threshold=query.score_threshold,
+            with_payload=True,
+        )
+        for query, embedding in zip(request.queries, embeddings)
+    ]
+
+    results = []
+    for start in range(0, len(searches), CLAIM_SEARCH_BATCH_SIZE):
+        batch_result = await qdrant_client.search_batch(
+            collection_name=CLAIMS_COLLECTION,
+            requests=searches[start : start + CLAIM_SEARCH_BATCH_SIZE],
+        )
+        results.extend(_related_claims_response(hits) for hits in batch_result)
+
+    return ClaimRelatedBatchResponse(results=results, count=len(results))
+
+
+def _related_claims_response(search_result) -> ClaimRelatedResponse:
     related_claims = []
 
     for hit in search_result:
         payload = hit.payload
         claim_id = payload.get("claim_id", str(hit.id))
 
-        # Skip excluded claims
-        if claim_id in request.exclude_claim_ids:
-            continue
-
         # Determine relation type based on score
         # High similarity (>0.9) = likely supporting
         # Medium similarity (0.7-0.9) = related
@@ -659,9 +672,6 @@ async def find_related_claims(request: ClaimFindRelatedRequest):
         )
         related_claims.append(related_claim)
 
-        if len(related_claims) >= request.limit:
-            break
-
     return ClaimRelatedResponse(
         related_claims=related_claims,
         count=len(related_claims),
@@ -671,7 +681,7 @@ async def find_related_claims(request: ClaimFindRelatedRequest):
 @app.post("/claims/batch_add")
 async def batch_add_claims(claims: List[ClaimAddRequest]):
     """Add multiple claim embeddings in batch."""
-    if not encoder_model or not qdrant_client:
+    if not inference or not qdrant_client:
         raise HTTPException(status_code=500, detail="Service not initialized")
 
     if not claims:
@@ -679,7 +689,7 @@ async def batch_add_claims(claims: List[ClaimAddRequest]):
 
     # Generate embeddings for all claims
     texts = [c.claim_text for c in claims]
-    embeddings = encoder_model.encode(texts).tolist()
+    embeddings = await inference.embed_documents(texts)
 
     # Build points
     points = []
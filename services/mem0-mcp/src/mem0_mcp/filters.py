@@ -0,0 +1,63 @@
+"""Qdrant payload filters for memory, paper and claim searches.
+
+Tag and exclusion filters are evaluated by Qdrant during the vector search,
+so a search returns ``limit`` matching points without over-fetching and
+post-filtering in Python.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def _match_any(key: str, values: Sequence[str]) -> Dict[str, Any]:
+    return {"key": key, "match": {"any": list(values)}}
+
+
+def build_filter(
+    must: Optional[List[Dict[str, Any]]] = None,
+    must_not: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Combine conditions into a Qdrant filter, or ``None`` when unfiltered."""
+    query_filter: Dict[str, Any] = {}
+    if must:
+        query_filter["must"] = must
+    if must_not:
+        query_filter["must_not"] = must_not
+    return query_filter or None
+
+
+def memory_filter(
+    conversation_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    include_tags: Optional[Sequence[str]] = None,
+    exclude_tags: Optional[Sequence[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Filter for memory search.
+
+    ``include_tags`` keeps memories carrying at least one of the tags;
+    ``exclude_tags`` drops memories carrying any of them.
+    """
+    must: List[Dict[str, Any]] = []
+    if conversation_id:
+        must.append({"key": "conversation_id", "match": {"value": conversation_id}})
+    if user_id:
+        must.append({"key": "user_id", "match": {"value": user_id}})
+    if include_tags:
+        must.append(_match_any("tags", include_tags))
+    must_not = [_match_any("tags", exclude_tags)] if exclude_tags else None
+    return build_filter(must, must_not)
+
+
+def exclusion_filter(
+    id_key: str,
+    exclude_ids: Optional[Sequence[str]] = None,
+    topic_ids: Optional[Sequence[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Filter for paper/claim search: optional topic match minus excluded ids."""
+    must = [_match_any("topic_ids", topic_ids)] if topic_ids else None
+    must_not = [_match_any(id_key, exclude_ids)] if exclude_ids else None
+    return build_filter(must, must_not)
+
+
+__all__ = ["build_filter", "exclusion_filter", "memory_filter"]
@@ -0,0 +1,240 @@
+"""Off-loop, micro-batched encoder and reranker inference.
+
+Request handlers never call the models directly. Texts (and reranker pairs)
+submitted within a short window are coalesced into one ``encode(list)`` /
+``predict(list)`` call that runs on a dedicated executor, so concurrent
+searches share a forward pass instead of queueing behind each other on the
+event loop. Query embeddings are cached by normalized text and model name.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def normalize_query(text: str) -> str:
+    """Cache key form of a query: case-folded with collapsed whitespace."""
+    return " ".join(text.split()).casefold()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of query embeddings keyed by (model, normalized text)."""
+
+    def __init__(self, max_size: int = 2048) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        key = (model, normalize_query(text))
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, model: str, text: str, vector: List[float]) -> None:
+        if self.max_size <= 0:
+            return
+        key = (model, normalize_query(text))
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MicroBatcher(Generic[T, R]):
+    """Coalesce items submitted within ``window`` seconds into one batch call.
+
+    ``batch_fn`` receives the list of items and must return one result per
+    item, in order. It runs on ``executor``; a failure is propagated to every
+    caller in that batch. One batch runs at a time: items submitted while a
+    batch is in flight are sent together as soon as it finishes. A single
+    submission of ``max_batch`` or more items is already a batch and runs as
+    one call without waiting.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[T]], Sequence[R]],
+        executor: Executor,
+        *,
+        window: float = 0.005,
+        max_batch: int = 128,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._executor = executor
+        self._window = window
+        self._max_batch = max(1, max_batch)
+        self._pending: List[Tuple[T, "asyncio.Future[R]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._drainer: Optional["asyncio.Task[None]"] = None
+        self.batches = 0
+
+    async def submit(self, item: T) -> R:
+        return (await self.submit_many([item]))[0]
+
+    async def submit_many(self, items: Sequence[T]) -> List[R]:
+        if not items:
+            return []
+        loop = asyncio.get_running_loop()
+        if len(items) >= self._max_batch:
+            batch = list(items)
+            self.batches += 1
+            return self._check(batch, await loop.run_in_executor(self._executor, self._batch_fn, batch))
+        futures = []
+        for item in items:
+            future: "asyncio.Future[R]" = loop.create_future()
+            self._pending.append((item, future))
+            futures.append(future)
+        if self._drainer is None:
+            if len(self._pending) >= self._max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._flush)
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._drainer is None and self._pending:
+            self._drainer = asyncio.ensure_future(self._drain())
+
+    async def _drain(self) -> None:
+        try:
+            while self._pending:
+                batch = self._pending[: self._max_batch]
+                self._pending = self._pending[self._max_batch :]
+                await self._run(batch)
+        finally:
+            self._drainer = None
+
+    async def _run(self, batch: List[Tuple[T, "asyncio.Future[R]"]]) -> None:
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+        self.batches += 1
+        try:
+            results = self._check(items, await loop.run_in_executor(self._executor, self._batch_fn, items))
+        except Exception as exc:  # noqa: BLE001
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _check(items: List[T], results: Sequence[R]) -> List[R]:
+        if len(results) != len(items):
+            raise RuntimeError(f"batch returned {len(results)} results for {len(items)} items")
+        return list(results)
+
+
+class InferenceEngine:
+    """Encoder/reranker front end shared by all request handlers.
+
+    Example:
+        engine = InferenceEngine(SentenceTransformer(name), model_name=name)
+        vector = await engine.embed_query("bed adhesion tips")
+    """
+
+    def __init__(
+        self,
+        encoder: Any,
+        reranker: Any = None,
+        *,
+        model_name: str,
+        window: float = 0.005,
+        max_batch: int = 128,
+        workers: int = 1,
+        cache_size: int = 2048,
+    ) -> None:
+        self.encoder = encoder
+        self.reranker = reranker
+        self.model_name = model_name
+        self.cache = EmbeddingCache(cache_size)
+        # One worker by default: the models already use every core per call,
+        # so throughput comes from batching, not from parallel forward passes
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="mem0-inference")
+        self._encode_batcher: MicroBatcher[str, List[float]] = MicroBatcher(
+            self._encode_batch, self._executor, window=window, max_batch=max_batch
+        )
+        self._rerank_batcher: Optional[MicroBatcher[Tuple[str, str], float]] = None
+        if reranker is not None:
+            self._rerank_batcher = MicroBatcher(
+                self._rerank_batch, self._executor, window=window, max_batch=max_batch
+            )
+
+    async def embed_query(self, text: str) -> List[float]:
+        """Embed a search query, served from the LRU when seen before."""
+        cached = self.cache.get(self.model_name, text)
+        if cached is not None:
+            return cached
+        vector = await self._encode_batcher.submit(text)
+        self.cache.put(self.model_name, text, vector)
+        return vector
+
+    async def embed_queries(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed many queries in one pass; cached ones are not re-encoded."""
+        vectors: List[Optional[List[float]]] = [self.cache.get(self.model_name, text) for text in texts]
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+        if missing:
+            encoded = await self._encode_batcher.submit_many([texts[index] for index in missing])
+            for index, vector in zip(missing, encoded):
+                vectors[index] = vector
+                self.cache.put(self.model_name, texts[index], vector)
+        return vectors  # type: ignore[return-value]
+
+    async def embed_documents(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed texts for storage. Batched with concurrent queries, not cached."""
+        return await self._encode_batcher.submit_many(list(texts))
+
+    async def rerank(self, query: str, documents: Sequence[str]) -> Optional[List[float]]:
+        """Cross-encoder scores for ``documents``, or ``None`` without a reranker."""
+        if self._rerank_batcher is None:
+            return None
+        return await self._rerank_batcher.submit_many([(query, doc) for doc in documents])
+
+    def stats(self) -> dict:
+        return {
+            "encode_batches": self._encode_batcher.batches,
+            "rerank_batches": self._rerank_batcher.batches if self._rerank_batcher else 0,
+            "query_cache_size": len(self.cache),
+            "query_cache_hits": self.cache.hits,
+            "query_cache_misses": self.cache.misses,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _encode_batch(self, texts: List[str]) -> List[List[float]]:
+        # Identical texts in one window (retries, fan-out) are encoded once
+        unique = list(dict.fromkeys(texts))
+        vectors = self.encoder.encode(unique)
+        rows = vectors.tolist() if hasattr(vectors, "tolist") else [list(v) for v in vectors]
+        by_text = dict(zip(unique, rows))
+        return [by_text[text] for text in texts]
+
+    def _rerank_batch(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        return [float(score) for score in self.reranker.predict(pairs)]
+
+
+__all__ = ["EmbeddingCache", "InferenceEngine", "MicroBatcher", "normalize_query"]
@@ -3,7 +3,7 @@
 
 from .app import ModelManagerApp
 from .config import ConfigManager, load_config, save_config
-from .health import HealthChecker, HealthMonitor, sync_check_health, sync_wait_for_ready
+from .health import HealthChecker, HealthCheckError, HealthCheckResult
 from .models import (
     ModelInfo,
     ModelRegistry,
@@ -13,8 +13,10 @@ from .models import (
     ToolCallFormat,
 )
 from .process import ProcessManager, get_process_manager
+from .gguf import GGUFMetadata, read_gguf_metadata
 from .scanner import ModelScanner
-from .supervisor import ServerSupervisor, get_supervisor
+from .supervisor import ServerSupervisor, SupervisorError, SupervisorState, get_supervisor
+from .watcher import ModelDirectoryWatcher
 
 __version__ = "0.1.0"
 
@@ -28,9 +30,8 @@ __all__ = [
     "save_config",
     # Health
     "HealthChecker",
-    "HealthMonitor",
-    "sync_check_health",
-    "sync_wait_for_ready",
+    "HealthCheckError",
+    "HealthCheckResult",
     # Models
     "ModelInfo",
     "ModelRegistry",
@@ -42,8 +43,13 @@ __all__ = [
     "ProcessManager",
     "get_process_manager",
     # Scanner
+    "GGUFMetadata",
+    "ModelDirectoryWatcher",
     "ModelScanner",
+    "read_gguf_metadata",
     # Supervisor
     "ServerSupervisor",
+    "SupervisorError",
+    "SupervisorState",
     "get_supervisor",
 ]
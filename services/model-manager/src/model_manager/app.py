@@ -20,6 +20,7 @@ from .health import HealthChecker, HealthCheckResult
 from .models import ServerStatus
 from .process import ProcessManager
 from .scanner import ModelRegistry, ModelScanner
+from .watcher import ModelDirectoryWatcher
 from .supervisor import ServerSupervisor, SupervisorState
 
 logger = logging.getLogger(__name__)
@@ -205,6 +206,9 @@ class ModelListPanel(Static):
                     if model.estimated_params_billions:
                         details.append(f"~{model.estimated_params_billions:.0f}B params")
 
+                    if model.estimated_memory_gb:
+                        details.append(f"~{model.estimated_memory_gb:.0f}GB RAM")
+
                     model_line = f"   [{status_class}]{status_icon}[/{status_class}] {model.name} [dim]({', '.join(details)})[/dim]"
 
                     # Highlight selected model
@@ -354,6 +358,10 @@ class ModelManagerApp(App):
         self._monitor_task: Optional[asyncio.Task] = None
         self._running = False
 
+        # Model discovery (scanner kept so its header cache survives rescans)
+        self._scanner: Optional[ModelScanner] = None
+        self._watcher: Optional[ModelDirectoryWatcher] = None
+
     def compose(self) -> ComposeResult:
         """Compose application layout."""
         yield Header()
@@ -385,22 +393,26 @@ class ModelManagerApp(App):
         # Initial state update
         await self._update_status()
 
-        # Scan for models
+        # Scan for models, then keep the registry live
         await self._scan_models()
 
-        # Start background monitoring
+        # Supervise the server (auto-restart) and keep the status panel fresh
+        await self.supervisor.start_supervision()
         self._running = True
         self._monitor_task = asyncio.create_task(self._monitor_loop())
 
     async def on_unmount(self) -> None:
         """Handle application unmount."""
         self._running = False
+        if self._watcher:
+            await asyncio.to_thread(self._watcher.stop)
         if self._monitor_task:
             self._monitor_task.cancel()
             try:
                 await self._monitor_task
             except asyncio.CancelledError:
                 pass
+        await self.supervisor.aclose()
 
     def action_quit(self) -> None:
         """Quit application."""
@@ -414,45 +426,12 @@ class ModelManagerApp(App):
 
     async def action_start_server(self) -> None:
         """Start llama.cpp server."""
-        import time
-
         if self.log_panel:
             self.log_panel.add_log("Starting server...", "info")
 
-        start_time = time.time()
-
-        # Progress callback for model loading
-        def on_progress(result, attempt, max_attempts):
-            """Handle progress updates from health checker."""
-            try:
-                elapsed = int(time.time() - start_time)
-                status_msg = result.status.value if result.status else "unknown"
-
-                # Create progress message based on status
-                if status_msg == "READY":
-                    msg = f"Model loaded ({attempt} checks, {elapsed}s elapsed)"
-                    log_type = "success"
-                elif status_msg == "LOADING":
-                    msg = f"Loading model... ({attempt}/{max_attempts}, {elapsed}s elapsed)"
-                    log_type = "info"
-                elif status_msg == "STARTING":
-                    msg = f"Server starting... ({attempt}/{max_attempts}, {elapsed}s elapsed)"
-                    log_type = "info"
-                else:
-                    msg = f"Status: {status_msg} ({attempt}/{max_attempts}, {elapsed}s elapsed)"
-                    log_type = "warning"
-
-                # Thread-safe UI update - post to event loop
-                if self.log_panel:
-                    self.call_from_thread(self.log_panel.add_log, msg, log_type)
-            except Exception as e:
-                # Log errors in progress callback without failing
-                import logging
-                logging.error(f"Progress callback error: {e}")
-
         try:
-            state = await asyncio.to_thread(
-                self.supervisor.start, wait_for_ready=True, on_progress=on_progress
+            state = await self.supervisor.start(
+                wait_for_ready=True, on_progress=self._log_progress
             )
             if self.log_panel:
                 self.log_panel.add_log(
@@ -468,7 +447,7 @@ class ModelManagerApp(App):
             self.log_panel.add_log("Stopping server...", "info")
 
         try:
-            state = await asyncio.to_thread(self.supervisor.stop)
+            state = await self.supervisor.stop()
             if self.log_panel:
                 self.log_panel.add_log("Server stopped", "success")
         except Exception as e:
@@ -477,45 +456,12 @@ class ModelManagerApp(App):
 
     async def action_restart_server(self) -> None:
         """Restart llama.cpp server."""
-        import time
-
         if self.log_panel:
             self.log_panel.add_log("Restarting server...", "info")
 
-        start_time = time.time()
-
-        # Progress callback for model loading
-        def on_progress(result, attempt, max_attempts):
-            """Handle progress updates from health checker."""
-            try:
-                elapsed = int(time.time() - start_time)
-                status_msg = result.status.value if result.status else "unknown"
-
-                # Create progress message based on status
-                if status_msg == "READY":
-                    msg = f"Model loaded ({attempt} checks, {elapsed}s elapsed)"
-                    log_type = "success"
-                elif status_msg == "LOADING":
-                    msg = f"Loading model... ({attempt}/{max_attempts}, {elapsed}s elapsed)"
-                    log_type = "info"
-                elif status_msg == "STARTING":
-                    msg = f"Server starting... ({attempt}/{max_attempts}, {elapsed}s elapsed)"
-                    log_type = "info"
-                else:
-                    msg = f"Status: {status_msg} ({attempt}/{max_attempts}, {elapsed}s elapsed)"
-                    log_type = "warning"
-
-                # Thread-safe UI update - post to event loop
-                if self.log_panel:
-                    self.call_from_thread(self.log_panel.add_log, msg, log_type)
-            except Exception as e:
-                # Log errors in progress callback without failing
-                import logging
-                logging.error(f"Progress callback error: {e}")
-
         try:
-            state = await asyncio.to_thread(
-                self.supervisor.restart, wait_for_ready=True, on_progress=on_progress
+            state = await self.supervisor.restart(
+                wait_for_ready=True, on_progress=self._log_progress
             )
             if self.log_panel:
                 self.log_panel.add_log(
@@ -531,7 +477,7 @@ class ModelManagerApp(App):
             self.log_panel.add_log("Running health check...", "info")
 
         try:
-            state = await asyncio.to_thread(self.supervisor.check_health)
+            state = await self.supervisor.check_health()
             if state.last_health_check:
                 hc = state.last_health_check
                 if self.log_panel:
@@ -644,11 +590,11 @@ class ModelManagerApp(App):
                     # Determine model path relative to models_dir
                     model_path = f"{family_name}/{model.name}"
 
-                    state = await asyncio.to_thread(
-                        self.supervisor.switch_model,
+                    state = await self.supervisor.switch_model(
                         model_path,
                         alias=None,  # Let supervisor determine alias
-                        wait_for_ready=True
+                        wait_for_ready=True,
+                        on_progress=self._log_progress,
                     )
 
                     if self.log_panel:
@@ -687,16 +633,57 @@ class ModelManagerApp(App):
         """Scan for models and update panel."""
         try:
             config = await asyncio.to_thread(self.config_manager.load)
-            scanner = ModelScanner(config.models_dir)
-            registry = await asyncio.to_thread(scanner.scan)
+            scanner_changed = self._scanner is None or self._scanner.models_dir != config.models_dir
+            if scanner_changed:
+                self._scanner = ModelScanner(config.models_dir, context_size=config.context_size)
+            # Serialized with the watcher's rescans by ModelScanner.scan
+            registry = await asyncio.to_thread(self._scanner.scan)
 
             if self.model_panel:
                 self.model_panel.registry = registry
+            if scanner_changed:
+                await self._restart_watcher(registry)
         except Exception as e:
             logger.error(f"Failed to scan models: {e}")
             if self.log_panel:
                 self.log_panel.add_log(f"Model scan failed: {e}", "error")
 
+    async def _restart_watcher(self, registry: ModelRegistry) -> None:
+        """Watch the current scanner's directory, replacing any previous watcher."""
+        if self._watcher:
+            await asyncio.to_thread(self._watcher.stop)
+        self._watcher = ModelDirectoryWatcher(
+            self._scanner,
+            on_change=lambda registry: self.call_from_thread(self._on_registry_change, registry),
+        )
+        await asyncio.to_thread(self._watcher.start, registry)
+
+    def _on_registry_change(self, registry: ModelRegistry) -> None:
+        """Handle a rescan triggered by the directory watcher."""
+        if self.model_panel:
+            self.model_panel.registry = registry
+        if self.log_panel:
+            self.log_panel.add_log(f"Models changed: {registry.total_models} models found", "info")
+
+    def _log_progress(self, result: HealthCheckResult, attempt: int, elapsed: float) -> None:
+        """Log model loading progress reported by the supervisor."""
+        if not self.log_panel:
+            return
+
+        if result.status == ServerStatus.READY:
+            msg = f"Model loaded ({attempt} checks, {elapsed:.1f}s elapsed)"
+            log_type = "success"
+        elif result.status == ServerStatus.LOADING:
+            msg = f"Loading model... ({elapsed:.0f}s elapsed)"
+            log_type = "info"
+        elif result.status == ServerStatus.STARTING:
+            msg = f"Server starting... ({elapsed:.0f}s elapsed)"
+            log_type = "info"
+        else:
+            msg = f"Status: {result.status.value} ({elapsed:.0f}s elapsed)"
+            log_type = "warning"
+        self.log_panel.add_log(msg, log_type)
+
     def _on_status_change(self, state: SupervisorState) -> None:
         """Handle status change callback from supervisor."""
         if self.status_panel:
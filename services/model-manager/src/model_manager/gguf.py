@@ -0,0 +1,323 @@
+# noqa: D401
+"""GGUF header parser.
+
+Reads the key/value metadata and tensor descriptors at the start of a GGUF
+file through a read-only mmap, so only the header pages are ever touched;
+tensor data (the bulk of a multi-GB file) is never read.
+
+Format reference: https://github.com/ggml-org/ggml/blob/master/docs/gguf.md
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import QuantizationType
+
+GGUF_MAGIC = b"GGUF"
+
+# Arrays longer than this (tokenizer vocabularies, merges) are skipped and
+# only their length is recorded
+MAX_ARRAY_VALUES = 64
+
+# Upper bound on tensor/KV counts; anything larger is a corrupt header
+MAX_HEADER_ENTRIES = 1 << 20
+
+# GGUF metadata value types
+_UINT8, _INT8, _UINT16, _INT16, _UINT32, _INT32, _FLOAT32, _BOOL = range(8)
+_STRING, _ARRAY, _UINT64, _INT64, _FLOAT64 = range(8, 13)
+
+_U64 = struct.Struct("<Q")
+
+_SCALAR_FORMATS = {
+    _UINT8: "<B",
+    _INT8: "<b",
+    _UINT16: "<H",
+    _INT16: "<h",
+    _UINT32: "<I",
+    _INT32: "<i",
+    _FLOAT32: "<f",
+    _BOOL: "<?",
+    _UINT64: "<Q",
+    _INT64: "<q",
+    _FLOAT64: "<d",
+}
+
+# ggml tensor type id -> (name, elements per block, bytes per block)
+GGML_TYPES: Dict[int, Tuple[str, int, int]] = {
+    0: ("F32", 1, 4),
+    1: ("F16", 1, 2),
+    2: ("Q4_0", 32, 18),
+    3: ("Q4_1", 32, 20),
+    6: ("Q5_0", 32, 22),
+    7: ("Q5_1", 32, 24),
+    8: ("Q8_0", 32, 34),
+    9: ("Q8_1", 32, 36),
+    10: ("Q2_K", 256, 84),
+    11: ("Q3_K", 256, 110),
+    12: ("Q4_K", 256, 144),
+    13: ("Q5_K", 256, 176),
+    14: ("Q6_K", 256, 210),
+    15: ("Q8_K", 256, 292),
+    16: ("IQ2_XXS", 256, 66),
+    17: ("IQ2_XS", 256, 74),
+    18: ("IQ3_XXS", 256, 98),
+    19: ("IQ1_S", 256, 50),
+    20: ("IQ4_NL", 32, 18),
+    21: ("IQ3_S", 256, 110),
+    22: ("IQ2_S", 256, 82),
+    23: ("IQ4_XS", 256, 136),
+    24: ("I8", 1, 1),
+    25: ("I16", 1, 2),
+    26: ("I32", 1, 4),
+    27: ("I64", 1, 8),
+    28: ("F64", 1, 8),
+    29: ("IQ1_M", 256, 56),
+    30: ("BF16", 1, 2),
+    34: ("TQ1_0", 256, 54),
+    35: ("TQ2_0", 256, 66),
+    39: ("MXFP4", 32, 17),
+}
+
+# llama_ftype values stored in general.file_type
+FILE_TYPE_QUANTIZATION: Dict[int, QuantizationType] = {
+    0: QuantizationType.FP32,
+    1: QuantizationType.FP16,
+    7: QuantizationType.Q8_0,
+    10: QuantizationType.Q2_K,
+    11: QuantizationType.Q3_K_S,
+    12: QuantizationType.Q3_K_M,
+    14: QuantizationType.Q4_K_S,
+    15: QuantizationType.Q4_K_M,
+    16: QuantizationType.Q5_K_S,
+    17: QuantizationType.Q5_K_M,
+    18: QuantizationType.Q6_K,
+}
+
+
+class GGUFError(ValueError):
+    """Raised when a file is not a readable GGUF file."""
+
+
+@dataclass
+class GGUFMetadata:
+    """Model facts read from one GGUF file (or merged across split shards)."""
+
+    version: int
+    architecture: Optional[str] = None
+    name: Optional[str] = None
+    file_type: Optional[int] = None
+    context_length: Optional[int] = None
+    block_count: Optional[int] = None
+    embedding_length: Optional[int] = None
+    head_count: Optional[int] = None
+    head_count_kv: Optional[int] = None
+    split_count: Optional[int] = None
+    tensor_count: int = 0
+    parameter_count: int = 0
+    tensor_bytes: int = 0
+    tensor_types: Dict[str, int] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def quantization(self) -> QuantizationType:
+        if self.file_type is None:
+            return QuantizationType.UNKNOWN
+        return FILE_TYPE_QUANTIZATION.get(self.file_type, QuantizationType.UNKNOWN)
+
+    def kv_cache_bytes(self, context_size: int, bytes_per_value: int = 2) -> Optional[int]:
+        """K and V cache size at ``context_size`` tokens (f16 cache by default)."""
+        if not (self.block_count and self.embedding_length and self.head_count):
+            return None
+        head_dim = self.embedding_length // self.head_count
+        kv_heads = self.head_count_kv or self.head_count
+        return 2 * self.block_count * context_size * kv_heads * head_dim * bytes_per_value
+
+    def memory_bytes(self, context_size: int) -> int:
+        """Weights plus KV cache needed to serve ``context_size`` tokens."""
+        return self.tensor_bytes + (self.kv_cache_bytes(context_size) or 0)
+
+    def merge_shard(self, shard: "GGUFMetadata") -> None:
+        """Add the tensors of another shard of the same split model."""
+        self.tensor_count += shard.tensor_count
+        self.parameter_count += shard.parameter_count
+        self.tensor_bytes += shard.tensor_bytes
+        for type_name, count in shard.tensor_types.items():
+            self.tensor_types[type_name] = self.tensor_types.get(type_name, 0) + count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GGUFMetadata":
+        return cls(**data)
+
+
+class _Reader:
+    def __init__(self, buffer: Any) -> None:
+        self.buffer = buffer
+        self.offset = 0
+
+    def scalar(self, fmt: str) -> Any:
+        try:
+            (value,) = struct.unpack_from(fmt, self.buffer, self.offset)
+        except struct.error as exc:
+            raise GGUFError("truncated GGUF header") from exc
+        self.offset += struct.calcsize(fmt)
+        return value
+
+    def string(self) -> str:
+        length = self.scalar("<Q")
+        end = self.offset + length
+        if end > len(self.buffer):
+            raise GGUFError("truncated GGUF header")
+        raw = self.buffer[self.offset:end]
+        self.offset = end
+        return raw.decode("utf-8", errors="replace")
+
+    def skip_string(self) -> None:
+        length = self.scalar("<Q")
+        self.offset += length
+        if self.offset > len(self.buffer):
+            raise GGUFError("truncated GGUF header")
+
+    def value(self, value_type: int) -> Any:
+        if value_type == _STRING:
+            return self.string()
+        if value_type == _ARRAY:
+            item_type = self.scalar("<I")
+            length = self.scalar("<Q")
+            if length > MAX_ARRAY_VALUES:
+                self.skip_array(item_type, length)
+                return {"type": item_type, "length": length}
+            return [self.value(item_type) for _ in range(length)]
+        fmt = _SCALAR_FORMATS.get(value_type)
+        if fmt is None:
+            raise GGUFError(f"unknown GGUF value type {value_type}")
+        return self.scalar(fmt)
+
+    def skip_array(self, item_type: int, length: int) -> None:
+        if item_type == _STRING:
+            # Hot path for tokenizer vocabularies (100k+ strings)
+            buffer, offset, unpack = self.buffer, self.offset, _U64.unpack_from
+            try:
+                for _ in range(length):
+                    offset += 8 + unpack(buffer, offset)[0]
+            except struct.error as exc:
+                raise GGUFError("truncated GGUF header") from exc
+            self.offset = offset
+        elif item_type == _ARRAY:
+            for _ in range(length):
+                self.value(_ARRAY)
+        else:
+            fmt = _SCALAR_FORMATS.get(item_type)
+            if fmt is None:
+                raise GGUFError(f"unknown GGUF value type {item_type}")
+            self.offset += struct.calcsize(fmt) * length
+        if self.offset > len(self.buffer):
+            raise GGUFError("truncated GGUF header")
+
+
+def _parse(buffer: Any) -> GGUFMetadata:
+    reader = _Reader(buffer)
+    if buffer[:4] != GGUF_MAGIC:
+        raise GGUFError("missing GGUF magic")
+    reader.offset = 4
+    version = reader.scalar("<I")
+    if version not in (2, 3):
+        raise GGUFError(f"unsupported GGUF version {version}")
+    tensor_count = reader.scalar("<Q")
+    kv_count = reader.scalar("<Q")
+    if tensor_count > MAX_HEADER_ENTRIES or kv_count > MAX_HEADER_ENTRIES:
+        raise GGUFError("implausible GGUF header counts")
+
+    values: Dict[str, Any] = {}
+    for _ in range(kv_count):
+        key = reader.string()
+        values[key] = reader.value(reader.scalar("<I"))
+
+    info = GGUFMetadata(version=version, tensor_count=tensor_count)
+    for _ in range(tensor_count):
+        reader.skip_string()  # tensor name
+        n_dims = reader.scalar("<I")
+        elements = 1
+        for _ in range(n_dims):
+            elements *= reader.scalar("<Q")
+        type_id = reader.scalar("<I")
+        reader.offset += 8  # data offset
+        type_name, block_size, type_size = GGML_TYPES.get(type_id, (f"TYPE_{type_id}", 1, 0))
+        info.parameter_count += elements
+        info.tensor_bytes += elements // block_size * type_size
+        info.tensor_types[type_name] = info.tensor_types.get(type_name, 0) + 1
+
+    arch = values.get("general.architecture")
+    info.architecture = arch
+    info.name = values.get("general.name")
+    info.file_type = values.get("general.file_type")
+    info.split_count = values.get("split.count")
+    if arch:
+        info.context_length = values.get(f"{arch}.context_length")
+        info.block_count = values.get(f"{arch}.block_count")
+        info.embedding_length = values.get(f"{arch}.embedding_length")
+        info.head_count = _first(values.get(f"{arch}.attention.head_count"))
+        info.head_count_kv = _first(values.get(f"{arch}.attention.head_count_kv"))
+    info.metadata = {
+        key: value
+        for key, value in values.items()
+        if not key.startswith("tokenizer.") and not isinstance(value, dict)
+    }
+    return info
+
+
+def _first(value: Any) -> Optional[int]:
+    # Per-layer head counts are stored as arrays in some architectures
+    if isinstance(value, list):
+        return max(value) if value else None
+    if isinstance(value, dict):
+        return None
+    return value
+
+
+def read_gguf_metadata(path: Path) -> GGUFMetadata:
+    """Parse the GGUF header of ``path``.
+
+    Args:
+        path: Path to a .gguf file
+
+    Returns:
+        GGUFMetadata for the file
+
+    Raises:
+        GGUFError: If the file is not a valid GGUF file
+    """
+    try:
+        with open(path, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _parse(mapped)
+    except (OSError, ValueError) as exc:
+        if isinstance(exc, GGUFError):
+            raise
+        raise GGUFError(f"cannot read {path}: {exc}") from exc
+
+
+def merge_split_metadata(shards: List[GGUFMetadata]) -> Optional[GGUFMetadata]:
+    """Combine per-shard metadata of a split model (first shard holds the KV data)."""
+    if not shards:
+        return None
+    merged = GGUFMetadata.from_dict(shards[0].to_dict())
+    for shard in shards[1:]:
+        merged.merge_shard(shard)
+    return merged
+
+
+__all__ = [
+    "GGML_TYPES",
+    "GGUFError",
+    "GGUFMetadata",
+    "merge_split_metadata",
+    "read_gguf_metadata",
+]
@@ -11,7 +11,7 @@ from typing import Callable, Optional
 
 import httpx
 
-from .models import ServerConfig, ServerStatus
+from .models import ServerStatus
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,8 @@ class HealthCheckResult:
     slots_processing: Optional[int] = None
     model_loaded: bool = False
     error: Optional[str] = None
+    # The probe got no answer in time (not a 503 "loading model" reply)
+    timed_out: bool = False
 
 
 class HealthCheckError(Exception):
@@ -35,50 +37,75 @@ class HealthCheckError(Exception):
 
 
 class HealthChecker:
-    """Health checker for llama.cpp server with retry logic."""
+    """Health checker for llama.cpp server.
+
+    One pooled keep-alive HTTP client is reused for every probe, and
+    concurrent callers of ``check()`` share a single in-flight request, so
+    the supervisor loop, the TUI and ``wait_for_ready`` never stack up
+    duplicate ``/health`` calls against a busy server.
+    """
 
     def __init__(
         self,
         endpoint: str,
-        timeout: int = 5,
-        max_retries: int = 120,
-        retry_delay: float = 1.0,
-        backoff_factor: float = 1.1,
-        max_delay: float = 10.0,
+        timeout: float = 5.0,
+        poll_interval: float = 0.25,
+        ready_timeout: float = 900.0,
+        progress_interval: float = 2.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ) -> None:
         """Initialize health checker.
 
         Args:
             endpoint: Server endpoint (e.g., http://localhost:8080)
             timeout: HTTP request timeout in seconds
-            max_retries: Maximum number of retry attempts
-            retry_delay: Initial delay between retries in seconds
-            backoff_factor: Exponential backoff multiplier
-            max_delay: Maximum delay between retries
+            poll_interval: Seconds between probes while waiting for readiness
+            ready_timeout: Maximum seconds to wait for the model to load
+            progress_interval: Minimum seconds between unchanged progress reports
+            transport: Optional httpx transport (used by tests)
         """
         self.endpoint = endpoint.rstrip("/")
         self.timeout = timeout
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-        self.backoff_factor = backoff_factor
-        self.max_delay = max_delay
-
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self.poll_interval = poll_interval
+        self.ready_timeout = ready_timeout
+        self.progress_interval = progress_interval
+
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self.probe_count = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=2, max_keepalive_connections=1),
+                transport=self._transport,
+            )
+        return self._client
 
     async def check(self) -> HealthCheckResult:
-        """Perform single health check.
+        """Perform a health check, joining a probe already in flight.
 
         Returns:
             HealthCheckResult with server status and metrics
-
-        Raises:
-            HealthCheckError: If health check fails
         """
-        start_time = time.time()
+        probe = self._inflight
+        if probe is None or probe.done():
+            probe = asyncio.ensure_future(self._probe())
+            self._inflight = probe
+        # Shielded so one cancelled caller does not fail the others
+        return await asyncio.shield(probe)
+
+    async def _probe(self) -> HealthCheckResult:
+        """Issue one ``/health`` request."""
+        self.probe_count += 1
+        start_time = time.perf_counter()
 
         try:
-            response = await self._client.get(f"{self.endpoint}/health")
-            latency_ms = (time.time() - start_time) * 1000
+            response = await self._get_client().get(f"{self.endpoint}/health")
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
             if response.status_code == 200:
                 data = response.json()
@@ -92,10 +119,13 @@ class HealthChecker:
             elif response.status_code == 503:
                 # Server is up but model not loaded yet
                 data = response.json()
+                error = data.get("error", "Model loading")
+                if isinstance(error, dict):
+                    error = error.get("message", "Model loading")
                 return HealthCheckResult(
                     status=ServerStatus.LOADING,
                     latency_ms=latency_ms,
-                    error=data.get("error", "Model loading"),
+                    error=error,
                     model_loaded=False,
                 )
             else:
@@ -106,21 +136,22 @@ class HealthChecker:
                 )
 
         except httpx.ConnectError:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             return HealthCheckResult(
                 status=ServerStatus.STARTING,
                 latency_ms=latency_ms,
                 error="Connection refused",
             )
         except httpx.TimeoutException:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             return HealthCheckResult(
                 status=ServerStatus.LOADING,
                 latency_ms=latency_ms,
                 error="Request timeout",
+                timed_out=True,
             )
         except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             return HealthCheckResult(
                 status=ServerStatus.FAILED,
                 latency_ms=latency_ms,
@@ -129,56 +160,81 @@ class HealthChecker:
 
     async def wait_for_ready(
         self,
-        on_progress: Optional[Callable[[HealthCheckResult, int, int], None]] = None,
+        on_progress: Optional[Callable[[HealthCheckResult, int, float], None]] = None,
+        exited: Optional[asyncio.Event] = None,
     ) -> HealthCheckResult:
-        """Wait for server to become ready with exponential backoff.
+        """Wait for the server to report ready.
+
+        Probes every ``poll_interval`` seconds so readiness is reported as
+        soon as llama.cpp finishes loading, and returns early with an error
+        the moment ``exited`` is set (the server process died while loading).
 
         Args:
-            on_progress: Optional callback for progress updates
-                         (result, attempt, max_attempts)
+            on_progress: Optional callback (result, attempt, elapsed_seconds),
+                         called when the status changes and at most every
+                         ``progress_interval`` seconds otherwise
+            exited: Optional event set when the server process exits
 
         Returns:
             HealthCheckResult when server is ready
 
         Raises:
-            HealthCheckError: If server doesn't become ready within max_retries
+            HealthCheckError: If the process exits or ``ready_timeout`` passes
         """
-        delay = self.retry_delay
-        last_result = None
-
-        for attempt in range(1, self.max_retries + 1):
-            result = await self.check()
-            last_result = result
-
-            # Call progress callback
-            if on_progress:
-                on_progress(result, attempt, self.max_retries)
-
-            # Check if ready
-            if result.status == ServerStatus.READY:
-                logger.info(
-                    f"Server ready after {attempt} attempts "
-                    f"({result.latency_ms:.1f}ms latency)"
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.ready_timeout
+        exit_wait = asyncio.ensure_future(exited.wait()) if exited is not None else None
+        last_result: Optional[HealthCheckResult] = None
+        last_report = float("-inf")
+        attempt = 0
+
+        try:
+            while True:
+                attempt += 1
+                result = await self.check()
+                now = loop.time()
+
+                if on_progress and (
+                    last_result is None
+                    or result.status != last_result.status
+                    or result.status == ServerStatus.READY
+                    or now - last_report >= self.progress_interval
+                ):
+                    on_progress(result, attempt, now - started)
+                    last_report = now
+                last_result = result
+
+                if result.status == ServerStatus.READY:
+                    logger.info(
+                        f"Server ready after {now - started:.1f}s "
+                        f"({attempt} checks, {result.latency_ms:.1f}ms latency)"
+                    )
+                    return result
+
+                logger.debug(
+                    f"Check {attempt}: status={result.status.value}, "
+                    f"latency={result.latency_ms:.1f}ms, error={result.error}"
                 )
-                return result
-
-            # Log status
-            logger.debug(
-                f"Attempt {attempt}/{self.max_retries}: "
-                f"status={result.status.value}, "
-                f"latency={result.latency_ms:.1f}ms, "
-                f"error={result.error}"
-            )
 
-            # Wait before retrying
-            if attempt < self.max_retries:
-                await asyncio.sleep(delay)
-                # Exponential backoff
-                delay = min(delay * self.backoff_factor, self.max_delay)
+                if now >= deadline:
+                    break
+                delay = min(self.poll_interval, deadline - now)
+                if exit_wait is not None:
+                    await asyncio.wait({exit_wait}, timeout=delay)
+                    if exit_wait.done():
+                        raise HealthCheckError(
+                            f"Server process exited while {result.status.value}"
+                            + (f" ({result.error})" if result.error else "")
+                        )
+                else:
+                    await asyncio.sleep(delay)
+        finally:
+            if exit_wait is not None:
+                exit_wait.cancel()
 
-        # Failed to become ready
         error_msg = (
-            f"Server failed to become ready after {self.max_retries} attempts. "
+            f"Server failed to become ready within {self.ready_timeout:.0f}s. "
             f"Last status: {last_result.status.value if last_result else 'unknown'}"
         )
         if last_result and last_result.error:
@@ -187,8 +243,13 @@ class HealthChecker:
         raise HealthCheckError(error_msg)
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self._client.aclose()
+        """Close the pooled HTTP client."""
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.cancel()
+        self._inflight = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def __aenter__(self) -> HealthChecker:
         """Async context manager entry."""
@@ -199,144 +260,8 @@ class HealthChecker:
         await self.close()
 
 
-def sync_check_health(endpoint: str, timeout: int = 5) -> HealthCheckResult:
-    """Synchronous health check helper.
-
-    Args:
-        endpoint: Server endpoint
-        timeout: Request timeout
-
-    Returns:
-        HealthCheckResult
-    """
-
-    async def _check() -> HealthCheckResult:
-        async with HealthChecker(endpoint, timeout=timeout) as checker:
-            return await checker.check()
-
-    return asyncio.run(_check())
-
-
-def sync_wait_for_ready(
-    endpoint: str,
-    max_retries: int = 120,
-    on_progress: Optional[Callable[[HealthCheckResult, int, int], None]] = None,
-) -> HealthCheckResult:
-    """Synchronous wait for ready helper.
-
-    Args:
-        endpoint: Server endpoint
-        max_retries: Maximum retry attempts
-        on_progress: Optional progress callback
-
-    Returns:
-        HealthCheckResult when ready
-
-    Raises:
-        HealthCheckError: If server doesn't become ready
-    """
-
-    async def _wait() -> HealthCheckResult:
-        async with HealthChecker(endpoint, max_retries=max_retries) as checker:
-            return await checker.wait_for_ready(on_progress=on_progress)
-
-    return asyncio.run(_wait())
-
-
-class HealthMonitor:
-    """Continuous health monitoring with auto-restart support."""
-
-    def __init__(
-        self,
-        endpoint: str,
-        check_interval: float = 30.0,
-        failure_threshold: int = 3,
-    ) -> None:
-        """Initialize health monitor.
-
-        Args:
-            endpoint: Server endpoint
-            check_interval: Seconds between health checks
-            failure_threshold: Consecutive failures before marking unhealthy
-        """
-        self.endpoint = endpoint
-        self.check_interval = check_interval
-        self.failure_threshold = failure_threshold
-
-        self._checker = HealthChecker(endpoint)
-        self._running = False
-        self._task: Optional[asyncio.Task] = None
-        self._consecutive_failures = 0
-        self._on_unhealthy: Optional[Callable[[], None]] = None
-
-    def set_unhealthy_callback(self, callback: Callable[[], None]) -> None:
-        """Set callback to invoke when server becomes unhealthy.
-
-        Args:
-            callback: Function to call when unhealthy
-        """
-        self._on_unhealthy = callback
-
-    async def start(self) -> None:
-        """Start monitoring loop."""
-        if self._running:
-            logger.warning("Monitor already running")
-            return
-
-        self._running = True
-        self._task = asyncio.create_task(self._monitor_loop())
-        logger.info("Health monitor started")
-
-    async def stop(self) -> None:
-        """Stop monitoring loop."""
-        if not self._running:
-            return
-
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-
-        await self._checker.close()
-        logger.info("Health monitor stopped")
-
-    async def _monitor_loop(self) -> None:
-        """Main monitoring loop."""
-        while self._running:
-            try:
-                result = await self._checker.check()
-
-                if result.status == ServerStatus.READY:
-                    self._consecutive_failures = 0
-                else:
-                    self._consecutive_failures += 1
-                    logger.warning(
-                        f"Health check failed ({self._consecutive_failures}/"
-                        f"{self.failure_threshold}): {result.error}"
-                    )
-
-                    if self._consecutive_failures >= self.failure_threshold:
-                        logger.error("Server unhealthy, invoking callback")
-                        if self._on_unhealthy:
-                            self._on_unhealthy()
-                        # Reset counter after callback
-                        self._consecutive_failures = 0
-
-            except Exception as e:
-                logger.error(f"Monitor error: {e}")
-
-            # Wait for next check
-            await asyncio.sleep(self.check_interval)
-
-
 __all__ = [
     "HealthChecker",
     "HealthCheckResult",
     "HealthCheckError",
-    "HealthMonitor",
-    "sync_check_health",
-    "sync_wait_for_ready",
 ]
@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional, TypeVar
 
 import typer
 from rich.console import Console
@@ -14,7 +15,7 @@ from rich.table import Table
 from . import __version__
 from .config import load_config
 from .scanner import ModelScanner
-from .supervisor import get_supervisor
+from .supervisor import ServerSupervisor, get_supervisor
 
 app = typer.Typer(
     name="kitty-model-manager",
@@ -25,6 +26,20 @@ app = typer.Typer(
 console = Console()
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _run(supervisor: ServerSupervisor, call: Callable[[], Awaitable[T]]) -> T:
+    """Run one supervisor coroutine, releasing its health client afterwards."""
+
+    async def _main() -> T:
+        try:
+            return await call()
+        finally:
+            await supervisor.aclose()
+
+    return asyncio.run(_main())
+
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -100,7 +115,7 @@ def start(
         supervisor = get_supervisor(env_path=env_path)
 
         with console.status("[bold green]Starting server..."):
-            state = supervisor.start(wait_for_ready=wait)
+            state = _run(supervisor, lambda: supervisor.start(wait_for_ready=wait))
 
         console.print(f"[green]✓[/green] Server started (PID: {state.pid})")
         if wait and state.last_health_check:
@@ -131,7 +146,7 @@ def stop(
         supervisor = get_supervisor(env_path=env_path)
 
         with console.status("[bold yellow]Stopping server..."):
-            state = supervisor.stop(force=force)
+            state = _run(supervisor, lambda: supervisor.stop(force=force))
 
         console.print("[green]✓[/green] Server stopped")
 
@@ -165,7 +180,7 @@ def restart(
         supervisor = get_supervisor(env_path=env_path)
 
         with console.status("[bold blue]Restarting server..."):
-            state = supervisor.restart(force=force, wait_for_ready=wait)
+            state = _run(supervisor, lambda: supervisor.restart(force=force, wait_for_ready=wait))
 
         console.print(f"[green]✓[/green] Server restarted (PID: {state.pid})")
         if wait and state.last_health_check:
@@ -214,7 +229,7 @@ def status(
 
         # Run health check if running
         if state.status not in ["stopped", "crashed"]:
-            state = supervisor.check_health()
+            state = _run(supervisor, supervisor.check_health)
             if state.last_health_check:
                 hc = state.last_health_check
                 console.print(f"\n[dim]Health: {hc.latency_ms:.0f}ms latency[/dim]")
@@ -269,6 +284,9 @@ def scan(
                 if model.estimated_params_billions:
                     details.append(f"~{model.estimated_params_billions:.0f}B params")
 
+                if model.estimated_memory_gb:
+                    details.append(f"~{model.estimated_memory_gb:.0f}GB RAM")
+
                 console.print(f"  {status} {model.name} [dim]({', '.join(details)})[/dim]")
 
             console.print()
@@ -304,7 +322,10 @@ def switch(
         supervisor = get_supervisor(env_path=env_path)
 
         with console.status(f"[bold]Switching to {model_path}..."):
-            state = supervisor.switch_model(model_path, alias=alias, wait_for_ready=wait)
+            state = _run(
+                supervisor,
+                lambda: supervisor.switch_model(model_path, alias=alias, wait_for_ready=wait),
+            )
 
         console.print(f"[green]✓[/green] Switched to {model_path}")
         console.print(f"[dim]  Alias: {state.config.model_alias}[/dim]")
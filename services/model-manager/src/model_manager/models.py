@@ -67,10 +67,18 @@ class ModelInfo(BaseModel):
     shard_total: Optional[int] = None  # e.g., 42 from "00001-of-00042"
     is_complete: bool = True  # All shards present
 
-    # Estimated properties
+    # Estimated properties (from GGUF tensor descriptors when readable,
+    # otherwise guessed from file size and quantization)
     estimated_params_billions: Optional[float] = None
     estimated_memory_gb: Optional[float] = None
 
+    # GGUF header metadata
+    architecture: Optional[str] = None
+    context_length: Optional[int] = None  # Trained context length
+    parameter_count: Optional[int] = None
+    tensor_bytes: Optional[int] = None
+    tensor_types: Dict[str, int] = Field(default_factory=dict)  # e.g. {"Q4_K": 193}
+
     # User metadata
     favorite: bool = False
     last_used: Optional[datetime] = None
@@ -224,6 +224,28 @@ class ProcessManager:
         except psutil.NoSuchProcess:
             return ServerStatus.CRASHED
 
+    def wait_for_exit(self, pid: Optional[int] = None) -> Optional[int]:
+        """Block until the server process exits.
+
+        Args:
+            pid: PID to wait on (defaults to the PID file)
+
+        Returns:
+            Exit code, or None if unknown (process not our child or already gone)
+        """
+        process = self._process
+        if process is not None and (pid is None or process.pid == pid):
+            return process.wait()
+
+        pid = pid or self._read_pid()
+        if pid is None:
+            return None
+
+        try:
+            return psutil.Process(pid).wait()
+        except psutil.NoSuchProcess:
+            return None
+
     def get_pid(self) -> Optional[int]:
         """Get PID of running server.
 
@@ -0,0 +1,116 @@
+# noqa: D401
+"""Persistent cache of parsed GGUF headers for the model scanner."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .gguf import GGUFMetadata
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+def default_cache_path(models_dir: Path) -> Path:
+    """Per-models-directory cache file under ~/.cache/kitty (or $KITTY_MODEL_REGISTRY_CACHE)."""
+    root = os.getenv("KITTY_MODEL_REGISTRY_CACHE")
+    base = Path(root) if root else Path.home() / ".cache" / "kitty" / "model-registry"
+    digest = hashlib.sha1(str(Path(models_dir).resolve()).encode()).hexdigest()[:16]
+    return base / f"{digest}.json"
+
+
+class RegistryCache:
+    """GGUF metadata keyed by (path, size, mtime).
+
+    A file whose size and mtime match its cached entry is not opened again.
+    Files that failed to parse are cached as ``None`` so they are not retried
+    until they change. Methods are thread-safe: the app's manual scans and the
+    directory watcher's rescans run on different threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Initialize cache.
+
+        Args:
+            path: JSON file to persist to, or None for an in-memory cache
+        """
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, Tuple[int, int, Optional[Dict]]] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._load()
+
+    def lookup(self, path: Path, size: int, mtime_ns: int) -> Tuple[bool, Optional[GGUFMetadata]]:
+        """Return (hit, metadata) for ``path`` at the given size/mtime."""
+        with self._lock:
+            entry = self._entries.get(str(path))
+        if entry is None or entry[0] != size or entry[1] != mtime_ns:
+            return False, None
+        data = entry[2]
+        return True, GGUFMetadata.from_dict(data) if data is not None else None
+
+    def store(self, path: Path, size: int, mtime_ns: int, metadata: Optional[GGUFMetadata]) -> None:
+        """Record the parse result for ``path`` at the given size/mtime."""
+        with self._lock:
+            self._entries[str(path)] = (size, mtime_ns, metadata.to_dict() if metadata else None)
+            self._dirty = True
+
+    def retain(self, paths: Iterable[Path]) -> int:
+        """Drop entries for files no longer present. Returns the number dropped."""
+        keep = {str(path) for path in paths}
+        with self._lock:
+            stale = [key for key in self._entries if key not in keep]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        """Write the cache atomically if it changed."""
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return
+            payload = {
+                "version": CACHE_VERSION,
+                "files": {
+                    key: {"size": size, "mtime_ns": mtime_ns, "metadata": data}
+                    for key, (size, mtime_ns, data) in self._entries.items()
+                },
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Unique temp name: another process may share this cache file
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(payload))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not write model registry cache {self.path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text())
+            if payload.get("version") != CACHE_VERSION:
+                return
+            for key, entry in payload.get("files", {}).items():
+                self._entries[key] = (entry["size"], entry["mtime_ns"], entry.get("metadata"))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable model registry cache {self.path}: {e}")
+            self._entries.clear()
+
+
+__all__ = ["RegistryCache", "default_cache_path"]
@@ -4,13 +4,21 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+import threading
 import time
 from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from .gguf import GGUFError, GGUFMetadata, merge_split_metadata, read_gguf_metadata
 from .models import ModelInfo, ModelRegistry, QuantizationType, ToolCallFormat
+from .registry_cache import RegistryCache, default_cache_path
+
+# Context length assumed for KV cache memory estimates (LLAMACPP_CTX default)
+DEFAULT_CONTEXT_SIZE = 8192
 
 logger = logging.getLogger(__name__)
 
@@ -220,6 +228,35 @@ def estimate_params_billions(size_bytes: int, quantization: QuantizationType) ->
     return round(params_billions, 1)
 
 
+def iter_gguf_files(root: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    """Yield (path, stat) for every .gguf file under ``root``.
+
+    Uses os.scandir so each file costs one stat call; symlinked directories
+    are followed once.
+    """
+    stack = [Path(root)]
+    visited: Set[Tuple[int, int]] = set()
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                dir_stat = os.stat(directory)
+                key = (dir_stat.st_dev, dir_stat.st_ino)
+                if key in visited:
+                    continue
+                visited.add(key)
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            stack.append(Path(entry.path))
+                        elif entry.name.endswith(".gguf") and entry.is_file():
+                            yield Path(entry.path), entry.stat()
+                    except OSError as e:
+                        logger.debug(f"Skipping {entry.path}: {e}")
+        except OSError as e:
+            logger.debug(f"Cannot list {directory}: {e}")
+
+
 def validate_split_model(files: List[Path]) -> tuple[bool, Set[int]]:
     """Validate that all shards of a split model are present.
 
@@ -254,34 +291,59 @@ def validate_split_model(files: List[Path]) -> tuple[bool, Set[int]]:
 
 
 class ModelScanner:
-    """Scans directory for GGUF models and builds registry."""
+    """Scans directory for GGUF models and builds registry.
+
+    GGUF headers are parsed once per file version: parse results are kept in
+    a RegistryCache keyed by (path, size, mtime), so a rescan only opens new
+    or changed files.
+    """
 
-    def __init__(self, models_dir: Path) -> None:
+    def __init__(
+        self,
+        models_dir: Path,
+        cache: Optional[RegistryCache] = None,
+        context_size: int = DEFAULT_CONTEXT_SIZE,
+    ) -> None:
         """Initialize scanner.
 
         Args:
             models_dir: Root directory to scan for models
+            cache: Metadata cache (defaults to a per-directory file under ~/.cache/kitty)
+            context_size: Context length used for KV cache memory estimates
         """
         self.models_dir = Path(models_dir)
+        self.cache = cache if cache is not None else RegistryCache(default_cache_path(self.models_dir))
+        self.context_size = context_size
+        self.files_parsed = 0
+        self._scan_lock = threading.Lock()
 
     def scan(self) -> ModelRegistry:
         """Scan models directory and build registry.
 
+        Concurrent calls (a manual rescan while the directory watcher is
+        rescanning) run one after the other; the second is cheap since the
+        cache already holds every header.
+
         Returns:
             ModelRegistry with all discovered models
         """
-        start_time = time.time()
+        with self._scan_lock:
+            return self._scan()
+
+    def _scan(self) -> ModelRegistry:
+        start_time = time.perf_counter()
         logger.info(f"Scanning {self.models_dir} for GGUF models...")
 
         registry = ModelRegistry()
 
         # Find all GGUF files
-        gguf_files = list(self.models_dir.rglob("*.gguf"))
+        gguf_files = dict(iter_gguf_files(self.models_dir))
         logger.info(f"Found {len(gguf_files)} GGUF files")
+        metadata = self._load_metadata(gguf_files)
 
         # Group files by potential model (to detect split models)
         grouped: Dict[str, List[Path]] = defaultdict(list)
-        for file_path in gguf_files:
+        for file_path in sorted(gguf_files):
             # Group key: family + base name without shard info
             family = extract_model_family(file_path)
             base_name = re.sub(r"-\d+-of-\d+", "", file_path.stem)
@@ -302,24 +364,19 @@ class ModelScanner:
                     logger.warning(f"Incomplete split model {group_key}: missing shards {missing}")
 
                 # Create single ModelInfo for the split model (representing all shards)
-                total_size = sum(f.stat().st_size for f in files)
-                quantization = detect_quantization(files[0].name)
+                total_size = sum(gguf_files[f].st_size for f in files)
+                header = merge_split_metadata([metadata[f] for f in files if metadata.get(f)])
                 family = extract_model_family(files[0])
-                name = extract_model_name(files[0], family, quantization)
-
-                model = ModelInfo(
-                    path=files[0],  # Use first shard as representative path
-                    name=name,
-                    family=family,
-                    quantization=quantization,
-                    tool_format=detect_tool_format(family),
-                    size_bytes=total_size,
+
+                model = self._model_info(
+                    files[0],  # Use first shard as representative path
+                    family,
+                    total_size,
+                    header,
                     file_count=len(files),
                     shard_index=1,  # Represents the first shard
                     shard_total=shard_total,
                     is_complete=is_complete,
-                    estimated_params_billions=estimate_params_billions(total_size, quantization),
-                    estimated_memory_gb=estimate_memory_gb(total_size, quantization),
                 )
 
                 registry.add_model(model)
@@ -328,38 +385,86 @@ class ModelScanner:
             else:
                 # Single-file models - create ModelInfo for each
                 for file_path in files:
-                    quantization = detect_quantization(file_path.name)
-                    family = extract_model_family(file_path)
-                    name = extract_model_name(file_path, family, quantization)
-                    size = file_path.stat().st_size
-
-                    model = ModelInfo(
-                        path=file_path,
-                        name=name,
-                        family=family,
-                        quantization=quantization,
-                        tool_format=detect_tool_format(family),
-                        size_bytes=size,
-                        file_count=1,
-                        is_complete=True,
-                        estimated_params_billions=estimate_params_billions(size, quantization),
-                        estimated_memory_gb=estimate_memory_gb(size, quantization),
+                    model = self._model_info(
+                        file_path,
+                        extract_model_family(file_path),
+                        gguf_files[file_path].st_size,
+                        metadata.get(file_path),
                     )
 
                     registry.add_model(model)
                     logger.debug(f"Added model: {model.display_name} ({model.size_gb:.1f} GB)")
 
         # Finalize registry
-        scan_duration = time.time() - start_time
+        scan_duration = time.perf_counter() - start_time
         registry.scan_duration_seconds = scan_duration
+        registry.last_scan = datetime.now()
 
         logger.info(
             f"Scan complete: {registry.total_models} models in {registry.total_families} families "
-            f"({registry.total_size_gb:.1f} GB total) in {scan_duration:.2f}s"
+            f"({registry.total_size_gb:.1f} GB total) in {scan_duration:.3f}s, "
+            f"{self.files_parsed} headers parsed"
         )
 
         return registry
 
+    def _load_metadata(self, files: Dict[Path, os.stat_result]) -> Dict[Path, Optional[GGUFMetadata]]:
+        """GGUF metadata per file, parsing only files missing from the cache."""
+        self.files_parsed = 0
+        metadata: Dict[Path, Optional[GGUFMetadata]] = {}
+        for path, stat in files.items():
+            hit, header = self.cache.lookup(path, stat.st_size, stat.st_mtime_ns)
+            if not hit:
+                try:
+                    header = read_gguf_metadata(path)
+                except GGUFError as e:
+                    logger.debug(f"Falling back to filename heuristics for {path}: {e}")
+                    header = None
+                self.cache.store(path, stat.st_size, stat.st_mtime_ns, header)
+                self.files_parsed += 1
+            metadata[path] = header
+        self.cache.retain(files)
+        self.cache.save()
+        return metadata
+
+    def _model_info(
+        self,
+        path: Path,
+        family: str,
+        size_bytes: int,
+        header: Optional[GGUFMetadata],
+        **fields: Any,
+    ) -> ModelInfo:
+        quantization = detect_quantization(path.name)
+        if header is not None and header.quantization != QuantizationType.UNKNOWN:
+            quantization = header.quantization
+
+        if header is not None and header.parameter_count:
+            params_billions: Optional[float] = round(header.parameter_count / 1e9, 1)
+            memory_gb: Optional[float] = header.memory_bytes(self.context_size) / (1024**3)
+        else:
+            params_billions = estimate_params_billions(size_bytes, quantization)
+            memory_gb = estimate_memory_gb(size_bytes, quantization)
+
+        return ModelInfo(
+            path=path,
+            name=extract_model_name(path, family, quantization),
+            family=family,
+            quantization=quantization,
+            tool_format=detect_tool_format(family),
+            size_bytes=size_bytes,
+            file_count=fields.pop("file_count", 1),
+            is_complete=fields.pop("is_complete", True),
+            estimated_params_billions=params_billions,
+            estimated_memory_gb=memory_gb,
+            architecture=header.architecture if header else None,
+            context_length=header.context_length if header else None,
+            parameter_count=header.parameter_count if header else None,
+            tensor_bytes=header.tensor_bytes if header else None,
+            tensor_types=dict(header.tensor_types) if header else {},
+            **fields,
+        )
+
 
 __all__ = [
     "ModelScanner",
@@ -370,5 +475,6 @@ __all__ = [
     "extract_model_name",
     "estimate_memory_gb",
     "estimate_params_billions",
+    "iter_gguf_files",
     "validate_split_model",
 ]
@@ -1,22 +1,31 @@
 # noqa: D401
-"""Supervisor for llama.cpp server with auto-restart capabilities."""
+"""Supervisor for llama.cpp server with auto-restart capabilities.
+
+All lifecycle methods are coroutines driven from one event loop. A single
+supervision task (``start_supervision``) waits on the server process exiting
+(detected by a watcher thread the moment it happens) or on a periodic shared
+health probe, and restarts the server with awaited exponential backoff.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
 
 from .config import ConfigManager
-from .health import HealthCheckResult, HealthChecker, sync_wait_for_ready
+from .health import HealthCheckError, HealthCheckResult, HealthChecker
 from .models import ServerConfig, ServerStatus
 from .process import ProcessError, ProcessManager
 
 logger = logging.getLogger(__name__)
 
+ProgressCallback = Callable[[HealthCheckResult, int, float], None]
+
 
 @dataclass
 class SupervisorState:
@@ -49,6 +58,11 @@ class ServerSupervisor:
         restart_delay: float = 5.0,
         backoff_factor: float = 2.0,
         max_restart_delay: float = 60.0,
+        check_interval: float = 30.0,
+        failure_threshold: int = 3,
+        ready_timeout: float = 900.0,
+        health_timeout: float = 5.0,
+        health_checker: Optional[HealthChecker] = None,
     ) -> None:
         """Initialize supervisor.
 
@@ -59,6 +73,11 @@ class ServerSupervisor:
             restart_delay: Initial delay before restart in seconds
             backoff_factor: Exponential backoff multiplier
             max_restart_delay: Maximum delay between restarts
+            check_interval: Seconds between supervision health probes
+            failure_threshold: Consecutive failed probes before restarting
+            ready_timeout: Maximum seconds to wait for a model to load
+            health_timeout: HTTP timeout of a single health probe
+            health_checker: Optional shared checker (defaults to one per endpoint)
         """
         self.config_manager = config_manager
         self.process_manager = process_manager
@@ -66,12 +85,24 @@ class ServerSupervisor:
         self.restart_delay = restart_delay
         self.backoff_factor = backoff_factor
         self.max_restart_delay = max_restart_delay
+        self.check_interval = check_interval
+        self.failure_threshold = failure_threshold
+        self.ready_timeout = ready_timeout
+        self.health_timeout = health_timeout
 
         self._config: Optional[ServerConfig] = None
         self._restart_count = 0
         self._start_time: Optional[datetime] = None
         self._on_status_change: Optional[Callable[[SupervisorState], None]] = None
 
+        self._checker = health_checker
+        self._last_health: Optional[HealthCheckResult] = None
+        # Serializes start/stop/restart/switch; the supervision task backs off while held
+        self._lock = asyncio.Lock()
+        # Set when the currently supervised process exits; None when nothing is supervised
+        self._exited: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
     def set_status_callback(self, callback: Callable[[SupervisorState], None]) -> None:
         """Set callback for status changes.
 
@@ -80,18 +111,18 @@ class ServerSupervisor:
         """
         self._on_status_change = callback
 
-    def start(
+    async def start(
         self,
         config: Optional[ServerConfig] = None,
         wait_for_ready: bool = True,
-        on_progress: Optional[Callable[[HealthCheckResult, int, int], None]] = None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> SupervisorState:
         """Start server with supervision.
 
         Args:
             config: Server configuration (loads from .env if not provided)
             wait_for_ready: If True, wait for server to be ready before returning
-            on_progress: Optional progress callback (result, attempt, max_attempts)
+            on_progress: Optional progress callback (result, attempt, elapsed_seconds)
 
         Returns:
             SupervisorState after startup
@@ -99,45 +130,11 @@ class ServerSupervisor:
         Raises:
             SupervisorError: If startup fails
         """
-        # Load config if not provided
-        if config is None:
-            config = self.config_manager.load()
-        self._config = config
-
-        logger.info(f"Starting server with model: {config.primary_model}")
-
-        # Start process
-        try:
-            self.process_manager.start(config)
-            self._start_time = datetime.now()
+        async with self._lock:
             self._restart_count = 0
-        except ProcessError as e:
-            raise SupervisorError(f"Failed to start server: {e}")
-
-        state = self._get_state()
-        self._notify_status_change(state)
-
-        # Wait for ready if requested
-        if wait_for_ready:
-            logger.info("Waiting for server to be ready...")
-            try:
-                result = sync_wait_for_ready(
-                    config.endpoint, max_retries=120, on_progress=on_progress
-                )
-                state = self._get_state()
-                state.last_health_check = result
-                state.status = ServerStatus.READY
-                logger.info("Server is ready")
-            except Exception as e:
-                logger.error(f"Server failed to become ready: {e}")
-                state.status = ServerStatus.FAILED
-                state.error = str(e)
-
-            self._notify_status_change(state)
-
-        return state
+            return await self._start(config, wait_for_ready, on_progress)
 
-    def stop(self, force: bool = False) -> SupervisorState:
+    async def stop(self, force: bool = False) -> SupervisorState:
         """Stop supervised server.
 
         Args:
@@ -146,24 +143,15 @@ class ServerSupervisor:
         Returns:
             SupervisorState after stopping
         """
-        logger.info("Stopping server")
+        async with self._lock:
+            return await self._stop(force)
 
-        try:
-            self.process_manager.stop(force=force)
-            self._start_time = None
-        except ProcessError as e:
-            logger.error(f"Error stopping server: {e}")
-
-        state = self._get_state()
-        self._notify_status_change(state)
-        return state
-
-    def restart(
+    async def restart(
         self,
         config: Optional[ServerConfig] = None,
         force: bool = False,
         wait_for_ready: bool = True,
-        on_progress: Optional[Callable[[HealthCheckResult, int, int], None]] = None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> SupervisorState:
         """Restart server with optional new configuration.
 
@@ -171,30 +159,24 @@ class ServerSupervisor:
             config: New configuration (uses current if not provided)
             force: If True, force kill existing process
             wait_for_ready: If True, wait for ready after restart
-            on_progress: Optional progress callback (result, attempt, max_attempts)
+            on_progress: Optional progress callback (result, attempt, elapsed_seconds)
 
         Returns:
             SupervisorState after restart
         """
-        logger.info("Restarting server")
-
-        # Use current config if not provided
-        if config is None:
-            config = self._config or self.config_manager.load()
-
-        # Stop if running
-        if self.process_manager.is_running():
-            self.stop(force=force)
-
-        # Start with new config
-        return self.start(config=config, wait_for_ready=wait_for_ready, on_progress=on_progress)
+        async with self._lock:
+            self._restart_count = 0
+            return await self._restart(config, force, wait_for_ready, on_progress)
 
-    def auto_restart(
+    async def auto_restart(
         self,
         wait_for_ready: bool = True,
     ) -> SupervisorState:
         """Attempt automatic restart with exponential backoff.
 
+        The backoff delay is awaited, so the event loop (TUI, health probes)
+        keeps running while the supervisor waits.
+
         Args:
             wait_for_ready: If True, wait for ready after restart
 
@@ -222,32 +204,30 @@ class ServerSupervisor:
             f"{self.max_restart_attempts} (waiting {delay:.1f}s)"
         )
 
-        # Wait before restarting
-        import time
+        await asyncio.sleep(delay)
 
-        time.sleep(delay)
+        async with self._lock:
+            try:
+                state = await self._restart(wait_for_ready=wait_for_ready)
+            except Exception as e:
+                logger.error(f"Auto-restart failed: {e}")
+                state = self._get_state()
+                state.status = ServerStatus.FAILED
+                state.error = str(e)
+                self._notify_status_change(state)
+                raise SupervisorError(f"Auto-restart failed: {e}")
 
-        # Attempt restart
-        try:
-            state = self.restart(wait_for_ready=wait_for_ready)
-            if state.status == ServerStatus.READY:
-                # Reset restart counter on success
-                self._restart_count = 0
-            return state
-        except Exception as e:
-            logger.error(f"Auto-restart failed: {e}")
-            state = self._get_state()
-            state.status = ServerStatus.FAILED
-            state.error = str(e)
-            self._notify_status_change(state)
-            raise SupervisorError(f"Auto-restart failed: {e}")
+        if state.status == ServerStatus.READY:
+            # Reset restart counter on success
+            self._restart_count = 0
+        return state
 
-    def switch_model(
+    async def switch_model(
         self,
         model_path: str,
         alias: Optional[str] = None,
         wait_for_ready: bool = True,
-        on_progress: Optional[Callable[[HealthCheckResult, int, int], None]] = None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> SupervisorState:
         """Switch to a different model (hot-swap).
 
@@ -255,19 +235,21 @@ class ServerSupervisor:
             model_path: Relative path to model from models_dir
             alias: Optional model alias
             wait_for_ready: If True, wait for ready after switch
-            on_progress: Optional progress callback (result, attempt, max_attempts)
+            on_progress: Optional progress callback (result, attempt, elapsed_seconds)
 
         Returns:
             SupervisorState after switch
         """
         logger.info(f"Switching to model: {model_path}")
 
-        # Update config
-        self.config_manager.update_model(model_path, alias)
-        config = self.config_manager.load()
+        async with self._lock:
+            # Update config
+            self.config_manager.update_model(model_path, alias)
+            config = self.config_manager.load()
 
-        # Restart with new config
-        return self.restart(config=config, wait_for_ready=wait_for_ready, on_progress=on_progress)
+            # Restart with new config
+            self._restart_count = 0
+            return await self._restart(config, False, wait_for_ready, on_progress)
 
     def get_state(self) -> SupervisorState:
         """Get current supervisor state.
@@ -277,21 +259,19 @@ class ServerSupervisor:
         """
         return self._get_state()
 
-    def check_health(self) -> SupervisorState:
+    async def check_health(self) -> SupervisorState:
         """Perform health check and update state.
 
+        Concurrent callers (the supervision task, the TUI, readiness waits)
+        share one in-flight probe.
+
         Returns:
             SupervisorState with health check results
         """
-        if not self._config:
-            state = self._get_state()
-            state.status = ServerStatus.STOPPED
-            return state
-
         try:
-            from .health import sync_check_health
-
-            result = sync_check_health(self._config.endpoint, timeout=5)
+            checker = await self._get_checker(self._config or self.config_manager.load())
+            result = await checker.check()
+            self._last_health = result
             state = self._get_state()
             state.last_health_check = result
             state.status = result.status
@@ -305,6 +285,238 @@ class ServerSupervisor:
             self._notify_status_change(state)
             return state
 
+    async def start_supervision(self) -> None:
+        """Start the supervision task, adopting an already running server."""
+        if self._task is not None and not self._task.done():
+            return
+
+        if self._exited is None and self.process_manager.is_running():
+            if self._config is None:
+                self._config = self.config_manager.load()
+            self._watch_process()
+
+        self._task = asyncio.create_task(self._supervise(), name="llamacpp-supervisor")
+        logger.info("Supervision started")
+
+    async def stop_supervision(self) -> None:
+        """Stop the supervision task (the server keeps running)."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Supervision stopped")
+
+    async def aclose(self) -> None:
+        """Stop supervision and release the pooled health client."""
+        await self.stop_supervision()
+        if self._checker is not None:
+            await self._checker.close()
+            self._checker = None
+
+    async def _start(
+        self,
+        config: Optional[ServerConfig] = None,
+        wait_for_ready: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> SupervisorState:
+        """Start the server; caller holds the lifecycle lock."""
+        # Load config if not provided
+        if config is None:
+            config = self.config_manager.load()
+        self._config = config
+
+        logger.info(f"Starting server with model: {config.primary_model}")
+
+        # Start process
+        try:
+            self.process_manager.start(config)
+            self._start_time = datetime.now()
+        except ProcessError as e:
+            raise SupervisorError(f"Failed to start server: {e}")
+
+        self._last_health = None
+        exited = self._watch_process()
+        state = self._get_state()
+        self._notify_status_change(state)
+
+        # Wait for ready if requested
+        if wait_for_ready:
+            logger.info("Waiting for server to be ready...")
+            checker = await self._get_checker(config)
+            try:
+                result = await checker.wait_for_ready(on_progress=on_progress, exited=exited)
+                self._last_health = result
+                state = self._get_state()
+                state.last_health_check = result
+                state.status = ServerStatus.READY
+                logger.info("Server is ready")
+            except HealthCheckError as e:
+                logger.error(f"Server failed to become ready: {e}")
+                if exited is not None and exited.is_set():
+                    # Already reported here; nothing left to supervise
+                    self._exited = None
+                state = self._get_state()
+                state.status = ServerStatus.FAILED
+                state.error = str(e)
+
+            self._notify_status_change(state)
+
+        return state
+
+    async def _stop(self, force: bool = False) -> SupervisorState:
+        """Stop the server; caller holds the lifecycle lock."""
+        logger.info("Stopping server")
+
+        # A requested stop is not a crash
+        self._exited = None
+        self._last_health = None
+        try:
+            await asyncio.to_thread(self.process_manager.stop, force=force)
+            self._start_time = None
+        except ProcessError as e:
+            logger.error(f"Error stopping server: {e}")
+
+        state = self._get_state()
+        self._notify_status_change(state)
+        return state
+
+    async def _restart(
+        self,
+        config: Optional[ServerConfig] = None,
+        force: bool = False,
+        wait_for_ready: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> SupervisorState:
+        """Restart the server; caller holds the lifecycle lock."""
+        logger.info("Restarting server")
+
+        # Use current config if not provided
+        if config is None:
+            config = self._config or self.config_manager.load()
+
+        # Stop if running
+        if self.process_manager.is_running():
+            await self._stop(force=force)
+
+        # Start with new config
+        return await self._start(config, wait_for_ready, on_progress)
+
+    async def _supervise(self) -> None:
+        """Restart the server when it exits or stops answering health probes.
+
+        A 503 "loading model" reply counts as progress. A probe timeout only
+        does while the model loads: once the server has been ready, timeouts
+        count toward ``failure_threshold`` like any other failed probe.
+        """
+        failures = 0
+        ready_seen = False
+        while True:
+            exited = self._exited
+            if exited is None:
+                await asyncio.sleep(self.check_interval)
+                continue
+
+            try:
+                await asyncio.wait_for(exited.wait(), timeout=self.check_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            if self._lock.locked():
+                # A start/stop/switch owns the process; re-evaluate once it is done
+                async with self._lock:
+                    pass
+                failures = 0
+                ready_seen = self._last_health is not None and self._last_health.status == ServerStatus.READY
+                continue
+            if exited is not self._exited:
+                continue
+
+            if exited.is_set():
+                reason = "Server process exited"
+            else:
+                state = await self.check_health()
+                result = state.last_health_check
+                hung = ready_seen and result is not None and result.timed_out
+                # LOADING means alive and making progress (large models load slowly)
+                if state.status == ServerStatus.READY or (state.status == ServerStatus.LOADING and not hung):
+                    failures = 0
+                    ready_seen = ready_seen or state.status == ServerStatus.READY
+                    continue
+                failures += 1
+                error = state.last_health_check.error if state.last_health_check else state.error
+                logger.warning(
+                    f"Health check failed ({failures}/{self.failure_threshold}): {error}"
+                )
+                if failures < self.failure_threshold:
+                    continue
+                reason = f"Server unhealthy: {error}"
+
+            failures = 0
+            ready_seen = False
+            self._exited = None
+            logger.error(f"{reason}, restarting")
+            state = self._get_state()
+            state.status = ServerStatus.CRASHED
+            state.error = reason
+            self._notify_status_change(state)
+
+            while True:
+                try:
+                    state = await self.auto_restart()
+                except SupervisorError as e:
+                    logger.error(f"Giving up on server: {e}")
+                    break
+                if state.status == ServerStatus.READY:
+                    ready_seen = True
+                    break
+
+    def _watch_process(self) -> Optional[asyncio.Event]:
+        """Watch the current server process and return an event set on exit."""
+        pid = self.process_manager.get_pid()
+        if pid is None:
+            self._exited = None
+            return None
+
+        loop = asyncio.get_running_loop()
+        exited = asyncio.Event()
+
+        def wait() -> None:
+            code = self.process_manager.wait_for_exit(pid)
+            try:
+                loop.call_soon_threadsafe(self._on_process_exit, exited, pid, code)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+        # Daemon thread: a server outliving the TUI must not block its exit
+        threading.Thread(target=wait, name=f"llamacpp-exit-{pid}", daemon=True).start()
+        self._exited = exited
+        return exited
+
+    def _on_process_exit(self, exited: asyncio.Event, pid: int, code: Optional[int]) -> None:
+        """Record a process exit (runs on the event loop)."""
+        exited.set()
+        if exited is self._exited:
+            self._last_health = None
+            logger.warning(f"Server process {pid} exited (code {code})")
+
+    async def _get_checker(self, config: ServerConfig) -> HealthChecker:
+        """Return the shared health checker for the configured endpoint."""
+        if self._checker is not None and self._checker.endpoint != config.endpoint.rstrip("/"):
+            await self._checker.close()
+            self._checker = None
+        if self._checker is None:
+            self._checker = HealthChecker(
+                config.endpoint,
+                timeout=self.health_timeout,
+                ready_timeout=self.ready_timeout,
+            )
+        return self._checker
+
     def _get_state(self) -> SupervisorState:
         """Get current state.
 
@@ -314,6 +526,10 @@ class ServerSupervisor:
         status = self.process_manager.get_status()
         pid = self.process_manager.get_pid()
 
+        # Refine "process alive" with the latest probe of this process
+        if status == ServerStatus.READY and self._last_health is not None:
+            status = self._last_health.status
+
         uptime = 0.0
         if self._start_time:
             uptime = (datetime.now() - self._start_time).total_seconds()
@@ -325,6 +541,7 @@ class ServerSupervisor:
             uptime_seconds=uptime,
             restart_count=self._restart_count,
             last_restart=self._start_time,
+            last_health_check=self._last_health,
         )
 
     def _notify_status_change(self, state: SupervisorState) -> None:
@@ -0,0 +1,198 @@
+# noqa: D401
+"""Keep a model registry live by watching the models directory.
+
+On Linux the watcher uses inotify (through libc, no extra dependency) and
+rescans shortly after .gguf files or directories are added, removed or
+finish writing. Elsewhere it falls back to periodic rescans, which are
+cheap because the scanner only parses new or changed files.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from .models import ModelRegistry
+from .scanner import ModelScanner
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _registry_signature(registry: ModelRegistry) -> Tuple:
+    return tuple(sorted((str(m.path), m.size_bytes, m.file_count) for m in registry.models))
+
+
+class _Inotify:
+    """Minimal recursive inotify wrapper over libc."""
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[int, Path] = {}
+
+    def add_tree(self, root: Path) -> None:
+        for directory, _dirs, _files in os.walk(root, followlinks=True):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                logger.warning(f"Cannot watch {directory}: {os.strerror(ctypes.get_errno())}")
+                continue
+            self._watches[wd] = Path(directory)
+
+    def read_events(self):
+        """Yield (directory, name, mask) for pending events."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            yield self._watches.get(wd), name, mask
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ModelDirectoryWatcher:
+    """Background thread that rescans on changes and reports new registries."""
+
+    def __init__(
+        self,
+        scanner: ModelScanner,
+        on_change: Callable[[ModelRegistry], None],
+        debounce_seconds: float = 2.0,
+        poll_interval: float = 30.0,
+    ) -> None:
+        """Initialize watcher.
+
+        Args:
+            scanner: Scanner to rescan with (its cache makes rescans cheap)
+            on_change: Called from the watcher thread with each changed registry
+            debounce_seconds: Quiet period after the last event before rescanning
+            poll_interval: Rescan interval when inotify is unavailable
+        """
+        self.scanner = scanner
+        self.on_change = on_change
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        self.backend: Optional[str] = None
+        self._signature: Optional[Tuple] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, registry: Optional[ModelRegistry] = None) -> None:
+        """Start watching. ``registry`` is the current state, if already scanned."""
+        if self._thread is not None:
+            return
+        if registry is not None:
+            self._signature = _registry_signature(registry)
+        # Watches are in place before start() returns, so no change is missed
+        inotify: Optional[_Inotify] = None
+        try:
+            inotify = _Inotify()
+            inotify.add_tree(self.scanner.models_dir)
+            self.backend = "inotify"
+        except (OSError, AttributeError) as e:
+            if inotify is not None:
+                inotify.close()
+                inotify = None
+            logger.info(
+                f"inotify unavailable ({e}); polling {self.scanner.models_dir} "
+                f"every {self.poll_interval:.0f}s"
+            )
+            self.backend = "poll"
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(inotify,), name="model-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def rescan(self) -> None:
+        """Rescan now and report the registry if it changed."""
+        try:
+            registry = self.scanner.scan()
+        except Exception as e:
+            logger.error(f"Model rescan failed: {e}")
+            return
+        signature = _registry_signature(registry)
+        if signature != self._signature:
+            self._signature = signature
+            self.on_change(registry)
+
+    def _run(self, inotify: Optional[_Inotify]) -> None:
+        if inotify is None:
+            self._poll()
+            return
+        try:
+            self._watch(inotify)
+        finally:
+            inotify.close()
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.rescan()
+
+    def _watch(self, inotify: _Inotify) -> None:
+        pending_since: Optional[float] = None
+        while not self._stop.is_set():
+            timeout = 0.5
+            if pending_since is not None:
+                timeout = max(0.0, min(timeout, pending_since + self.debounce_seconds - time.monotonic()))
+            readable, _, _ = select.select([inotify.fd], [], [], timeout)
+            if readable:
+                for directory, name, mask in inotify.read_events():
+                    if mask & IN_Q_OVERFLOW or mask & IN_ISDIR or name.endswith(".gguf"):
+                        pending_since = time.monotonic()
+                    if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and directory is not None:
+                        inotify.add_tree(directory / name)
+            elif pending_since is not None and time.monotonic() >= pending_since + self.debounce_seconds:
+                pending_since = None
+                self.rescan()
+
+
+__all__ = ["ModelDirectoryWatcher"]
@@ -0,0 +1,245 @@
+# noqa: D401
+"""Unit tests for GGUF header parsing, the registry cache and the watcher."""
+
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from model_manager import scanner as scanner_module
+from model_manager.gguf import GGUFError, read_gguf_metadata
+from model_manager.models import QuantizationType
+from model_manager.registry_cache import RegistryCache
+from model_manager.scanner import ModelScanner
+from model_manager.watcher import ModelDirectoryWatcher
+
+
+def _string(value: str) -> bytes:
+    raw = value.encode()
+    return struct.pack("<Q", len(raw)) + raw
+
+
+def _kv(key: str, value: Any) -> bytes:
+    if isinstance(value, str):
+        return _string(key) + struct.pack("<I", 8) + _string(value)
+    if isinstance(value, list):
+        # Array of strings
+        body = b"".join(_string(item) for item in value)
+        return _string(key) + struct.pack("<IIQ", 9, 8, len(value)) + body
+    return _string(key) + struct.pack("<II", 4, value)  # uint32
+
+
+def write_gguf(
+    path: Path,
+    metadata: Dict[str, Any],
+    tensors: List[Tuple[str, Tuple[int, ...], int]],
+    payload_bytes: int = 0,
+) -> Path:
+    """Write a minimal GGUF v3 file with the given KV pairs and tensor descriptors."""
+    header = b"GGUF" + struct.pack("<IQQ", 3, len(tensors), len(metadata))
+    header += b"".join(_kv(key, value) for key, value in metadata.items())
+    for name, dims, type_id in tensors:
+        header += _string(name) + struct.pack("<I", len(dims))
+        header += b"".join(struct.pack("<Q", dim) for dim in dims)
+        header += struct.pack("<IQ", type_id, 0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(header + b"\0" * payload_bytes)
+    return path
+
+
+LLAMA_METADATA = {
+    "general.architecture": "llama",
+    "general.name": "Tiny Llama",
+    "general.file_type": 15,  # Q4_K_M
+    "llama.context_length": 32768,
+    "llama.block_count": 2,
+    "llama.embedding_length": 256,
+    "llama.attention.head_count": 8,
+    "llama.attention.head_count_kv": 2,
+    "tokenizer.ggml.tokens": [f"tok{i}" for i in range(500)],
+}
+LLAMA_TENSORS = [
+    ("token_embd.weight", (256, 1000), 12),  # Q4_K
+    ("blk.0.attn_q.weight", (256, 256), 12),
+    ("blk.0.ffn_down.weight", (1024, 256), 14),  # Q6_K
+    ("output_norm.weight", (256,), 0),  # F32
+]
+
+
+class TestReadGGUFMetadata:
+    """Test GGUF header parsing."""
+
+    def test_reads_architecture_context_and_tensors(self, tmp_path: Path) -> None:
+        """Test metadata, parameter count and tensor sizes come from the header."""
+        path = write_gguf(tmp_path / "tiny.gguf", LLAMA_METADATA, LLAMA_TENSORS, payload_bytes=4096)
+        meta = read_gguf_metadata(path)
+
+        assert meta.architecture == "llama"
+        assert meta.name == "Tiny Llama"
+        assert meta.context_length == 32768
+        assert meta.quantization == QuantizationType.Q4_K_M
+        assert meta.parameter_count == 256 * 1000 + 256 * 256 + 1024 * 256 + 256
+        expected_bytes = (256_000 + 65_536) // 256 * 144 + 262_144 // 256 * 210 + 256 * 4
+        assert meta.tensor_bytes == expected_bytes
+        assert meta.tensor_types == {"Q4_K": 2, "Q6_K": 1, "F32": 1}
+        # Large tokenizer arrays are skipped, not stored
+        assert "tokenizer.ggml.tokens" not in meta.metadata
+
+    def test_kv_cache_uses_grouped_query_heads(self, tmp_path: Path) -> None:
+        """Test KV cache estimate uses head_count_kv."""
+        meta = read_gguf_metadata(write_gguf(tmp_path / "tiny.gguf", LLAMA_METADATA, LLAMA_TENSORS))
+        # 2 (K+V) * 2 layers * 1024 ctx * 2 kv heads * 32 head dim * 2 bytes
+        assert meta.kv_cache_bytes(1024) == 2 * 2 * 1024 * 2 * 32 * 2
+        assert meta.memory_bytes(1024) == meta.tensor_bytes + meta.kv_cache_bytes(1024)
+
+    def test_rejects_non_gguf_and_truncated_files(self, tmp_path: Path) -> None:
+        """Test invalid files raise GGUFError."""
+        (tmp_path / "junk.gguf").write_bytes(b"x" * 100)
+        (tmp_path / "empty.gguf").touch()
+        full = write_gguf(tmp_path / "full.gguf", LLAMA_METADATA, LLAMA_TENSORS).read_bytes()
+        (tmp_path / "cut.gguf").write_bytes(full[:200])
+
+        for name in ("junk.gguf", "empty.gguf", "cut.gguf"):
+            with pytest.raises(GGUFError):
+                read_gguf_metadata(tmp_path / name)
+
+
+class TestScannerWithHeaders:
+    """Test the scanner's use of GGUF headers and the registry cache."""
+
+    def _count_parses(self, monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+        parsed: List[Path] = []
+        real = scanner_module.read_gguf_metadata
+
+        def counting(path: Path):
+            parsed.append(path)
+            return real(path)
+
+        monkeypatch.setattr(scanner_module, "read_gguf_metadata", counting)
+        return parsed
+
+    def test_estimates_come_from_real_tensor_sizes(self, tmp_path: Path) -> None:
+        """Test params and memory use the header, not the file size."""
+        write_gguf(tmp_path / "Tiny" / "tiny.gguf", LLAMA_METADATA, LLAMA_TENSORS, payload_bytes=1 << 20)
+        scanner = ModelScanner(tmp_path, cache=RegistryCache(), context_size=1024)
+        model = scanner.scan().models[0]
+        meta = read_gguf_metadata(model.path)
+
+        assert model.architecture == "llama"
+        assert model.context_length == 32768
+        assert model.quantization == QuantizationType.Q4_K_M  # from general.file_type
+        assert model.parameter_count == meta.parameter_count
+        assert model.estimated_memory_gb == pytest.approx(meta.memory_bytes(1024) / 1024**3)
+        assert model.tensor_types["Q4_K"] == 2
+
+    def test_split_model_sums_tensors_across_shards(self, tmp_path: Path) -> None:
+        """Test split models merge per-shard tensor descriptors."""
+        family = tmp_path / "Big"
+        write_gguf(family / "big-q4_k_m-00001-of-00002.gguf", LLAMA_METADATA, LLAMA_TENSORS[:2])
+        write_gguf(family / "big-q4_k_m-00002-of-00002.gguf", {"split.no": 1}, LLAMA_TENSORS[2:])
+        model = ModelScanner(tmp_path, cache=RegistryCache()).scan().models[0]
+
+        assert model.file_count == 2
+        assert model.architecture == "llama"
+        assert model.tensor_types == {"Q4_K": 2, "Q6_K": 1, "F32": 1}
+
+    def test_rescan_only_parses_new_or_changed_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the (path, size, mtime) cache skips unchanged files."""
+        parsed = self._count_parses(monkeypatch)
+        a = write_gguf(tmp_path / "A" / "a.gguf", LLAMA_METADATA, LLAMA_TENSORS)
+        b = write_gguf(tmp_path / "B" / "b.gguf", LLAMA_METADATA, LLAMA_TENSORS)
+        (tmp_path / "C").mkdir()
+        (tmp_path / "C" / "junk.gguf").write_bytes(b"not gguf")
+        cache_path = tmp_path / "cache.json"
+
+        scanner = ModelScanner(tmp_path, cache=RegistryCache(cache_path))
+        assert scanner.scan().total_models == 3
+        assert len(parsed) == 3
+
+        parsed.clear()
+        scanner.scan()
+        assert parsed == []  # junk file is cached as unreadable too
+
+        write_gguf(b, LLAMA_METADATA, LLAMA_TENSORS, payload_bytes=10)
+        c = write_gguf(tmp_path / "D" / "d.gguf", LLAMA_METADATA, LLAMA_TENSORS)
+        a.unlink()
+        registry = scanner.scan()
+        assert sorted(parsed) == sorted([b, c])
+        assert registry.total_models == 3
+
+        # A fresh scanner reuses the persisted cache
+        parsed.clear()
+        fresh = ModelScanner(tmp_path, cache=RegistryCache(cache_path))
+        fresh.scan()
+        assert parsed == []
+        assert len(fresh.cache) == 3
+
+    def test_concurrent_scans_are_serialized(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a manual scan racing the watcher's rescan parses each file once."""
+        parsed = self._count_parses(monkeypatch)
+        counting = scanner_module.read_gguf_metadata
+
+        def slow(path: Path):
+            time.sleep(0.01)  # widen the race window
+            return counting(path)
+
+        monkeypatch.setattr(scanner_module, "read_gguf_metadata", slow)
+        for name in "abcdef":
+            write_gguf(tmp_path / name.upper() / f"{name}.gguf", LLAMA_METADATA, LLAMA_TENSORS)
+        cache_path = tmp_path / "cache.json"
+        scanner = ModelScanner(tmp_path, cache=RegistryCache(cache_path))
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(scanner.scan())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [registry.total_models for registry in results] == [6] * 4
+        assert len(parsed) == 6
+        assert len(RegistryCache(cache_path)) == 6
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestModelDirectoryWatcher:
+    """Test the directory watcher."""
+
+    def test_rescan_reports_only_changes(self, tmp_path: Path) -> None:
+        """Test on_change fires when the registry changes."""
+        scanner = ModelScanner(tmp_path, cache=RegistryCache())
+        seen = []
+        watcher = ModelDirectoryWatcher(scanner, seen.append)
+        watcher.start(scanner.scan())
+        watcher.stop()
+
+        watcher.rescan()
+        assert seen == []
+        write_gguf(tmp_path / "A" / "a.gguf", LLAMA_METADATA, LLAMA_TENSORS)
+        watcher.rescan()
+        assert len(seen) == 1 and seen[0].total_models == 1
+
+    def test_picks_up_new_model_directories(self, tmp_path: Path) -> None:
+        """Test new files in new subdirectories trigger a rescan."""
+        scanner = ModelScanner(tmp_path, cache=RegistryCache())
+        changed = threading.Event()
+        watcher = ModelDirectoryWatcher(
+            scanner, lambda registry: changed.set(), debounce_seconds=0.1, poll_interval=0.2
+        )
+        watcher.start(scanner.scan())
+        try:
+            (tmp_path / "New").mkdir()
+            write_gguf(tmp_path / "New" / "new.gguf", LLAMA_METADATA, LLAMA_TENSORS)
+            assert changed.wait(5)
+        finally:
+            watcher.stop()
+        assert watcher.backend in ("inotify", "poll")
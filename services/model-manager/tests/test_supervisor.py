@@ -0,0 +1,266 @@
+# noqa: D401
+"""Unit tests for the async health checker and server supervisor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from model_manager.health import HealthCheckError, HealthChecker
+from model_manager.models import ServerConfig, ServerStatus
+from model_manager.supervisor import ServerSupervisor, SupervisorState
+
+ENDPOINT = "http://localhost:8080"
+
+
+class FakeServer:
+    """llama.cpp ``/health`` stand-in that finishes loading after ``load_seconds``."""
+
+    def __init__(self, load_seconds: float = 0.0, latency: float = 0.0) -> None:
+        self.load_seconds = load_seconds
+        self.latency = latency
+        self.started_at: Optional[float] = None
+        self.requests = 0
+        self.hung = False
+
+    def boot(self) -> None:
+        self.started_at = time.monotonic()
+        self.hung = False
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.started_at is None:
+            raise httpx.ConnectError("Connection refused", request=request)
+        if self.hung:
+            raise httpx.ReadTimeout("timed out", request=request)
+        if time.monotonic() - self.started_at < self.load_seconds:
+            return httpx.Response(503, json={"error": {"message": "Loading model"}})
+        return httpx.Response(200, json={"status": "ok", "slots_idle": 6, "slots_processing": 0})
+
+    def checker(self, **kwargs: float) -> HealthChecker:
+        return HealthChecker(ENDPOINT, transport=httpx.MockTransport(self.handle), **kwargs)
+
+
+class FakeProcessManager:
+    """Process manager whose "processes" are events; ``crash`` ends one."""
+
+    def __init__(self, server: FakeServer) -> None:
+        self.server = server
+        self.pid: Optional[int] = None
+        self.starts = 0
+        self._exits: Dict[int, threading.Event] = {}
+
+    def start(self, config: ServerConfig) -> bool:
+        self.starts += 1
+        self.pid = 1000 + self.starts
+        self._exits[self.pid] = threading.Event()
+        self.server.boot()
+        return True
+
+    def stop(self, force: bool = False) -> bool:
+        self.crash()
+        return True
+
+    def crash(self) -> None:
+        if self.pid is not None:
+            self._exits[self.pid].set()
+        self.pid = None
+        self.server.started_at = None
+
+    def is_running(self) -> bool:
+        return self.pid is not None
+
+    def get_status(self) -> ServerStatus:
+        return ServerStatus.READY if self.pid is not None else ServerStatus.STOPPED
+
+    def get_pid(self) -> Optional[int]:
+        return self.pid
+
+    def wait_for_exit(self, pid: Optional[int] = None) -> Optional[int]:
+        self._exits[pid].wait()
+        return -9
+
+
+def _supervisor(server: FakeServer, **kwargs: float) -> ServerSupervisor:
+    config_manager = MagicMock()
+    config_manager.load.return_value = ServerConfig(
+        primary_model="family/model.gguf", models_dir=Path("/models")
+    )
+    return ServerSupervisor(
+        config_manager=config_manager,
+        process_manager=FakeProcessManager(server),
+        health_checker=server.checker(poll_interval=0.02, ready_timeout=5.0),
+        **kwargs,
+    )
+
+
+class TestHealthChecker:
+    """Test shared probes and readiness waits."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_probe(self) -> None:
+        """Callers arriving while a probe is in flight reuse its result."""
+        server = FakeServer(latency=0.05)
+        server.boot()
+        async with server.checker() as checker:
+            results = await asyncio.gather(*(checker.check() for _ in range(20)))
+            assert server.requests == 1
+            assert {r.status for r in results} == {ServerStatus.READY}
+            assert results[0].slots_idle == 6
+
+            # Once it completes, the next check probes again
+            await checker.check()
+            assert server.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_ready_reports_promptly(self) -> None:
+        """Readiness is seen within a poll interval; progress only on changes."""
+        server = FakeServer(load_seconds=0.3)
+        server.boot()
+        seen: List[ServerStatus] = []
+
+        async with server.checker(poll_interval=0.02, progress_interval=60) as checker:
+            started = time.monotonic()
+            result = await checker.wait_for_ready(
+                on_progress=lambda result, attempt, elapsed: seen.append(result.status)
+            )
+            waited = time.monotonic() - started
+
+        assert result.status == ServerStatus.READY
+        assert waited < 0.3 + 0.15
+        assert seen == [ServerStatus.LOADING, ServerStatus.READY]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_ready_fails_fast_when_process_exits(self) -> None:
+        """A server dying mid-load ends the wait instead of polling to timeout."""
+        server = FakeServer(load_seconds=60)
+        server.boot()
+        exited = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.1, exited.set)
+
+        async with server.checker(poll_interval=1.0, ready_timeout=60) as checker:
+            started = time.monotonic()
+            with pytest.raises(HealthCheckError, match="exited"):
+                await checker.wait_for_ready(exited=exited)
+            assert time.monotonic() - started < 0.5
+
+
+class TestServerSupervisor:
+    """Test async lifecycle, backoff and crash supervision."""
+
+    @pytest.mark.asyncio
+    async def test_start_returns_when_model_loaded(self) -> None:
+        """Start resolves as soon as the model finishes loading."""
+        supervisor = _supervisor(FakeServer(load_seconds=0.2))
+        try:
+            started = time.monotonic()
+            state = await supervisor.start()
+            assert state.status == ServerStatus.READY
+            assert time.monotonic() - started < 0.2 + 0.15
+            assert supervisor.get_state().last_health_check is state.last_health_check
+        finally:
+            await supervisor.aclose()
+
+    @pytest.mark.asyncio
+    async def test_auto_restart_backoff_keeps_loop_responsive(self) -> None:
+        """The restart delay is awaited rather than blocking the event loop."""
+        supervisor = _supervisor(FakeServer(), restart_delay=0.3)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            state = await supervisor.auto_restart()
+        finally:
+            task.cancel()
+            await supervisor.aclose()
+
+        assert state.status == ServerStatus.READY
+        assert supervisor.get_state().restart_count == 0
+        assert supervisor.process_manager.starts == 1
+        assert ticks >= 15
+
+    @pytest.mark.asyncio
+    async def test_crash_is_restarted_without_waiting_for_a_probe(self) -> None:
+        """Process exit is detected immediately, long before the next health check."""
+        supervisor = _supervisor(FakeServer(), restart_delay=0.01, check_interval=30)
+        states: List[SupervisorState] = []
+        supervisor.set_status_callback(states.append)
+        try:
+            await supervisor.start()
+            await supervisor.start_supervision()
+
+            supervisor.process_manager.crash()
+            deadline = time.monotonic() + 2
+            while supervisor.get_state().status != ServerStatus.READY or supervisor.process_manager.starts < 2:
+                assert time.monotonic() < deadline
+                await asyncio.sleep(0.01)
+        finally:
+            await supervisor.aclose()
+
+        assert ServerStatus.CRASHED in [s.status for s in states]
+        assert states[-1].status == ServerStatus.READY
+
+    @pytest.mark.asyncio
+    async def test_hung_server_is_restarted(self) -> None:
+        """Probe timeouts after the server was ready count as failures."""
+        server = FakeServer()
+        supervisor = _supervisor(server, restart_delay=0.01, check_interval=0.02, failure_threshold=3)
+        try:
+            await supervisor.start()
+            await supervisor.start_supervision()
+            await asyncio.sleep(0.1)
+
+            server.hung = True
+            deadline = time.monotonic() + 2
+            while supervisor.process_manager.starts < 2 or supervisor.get_state().status != ServerStatus.READY:
+                assert time.monotonic() < deadline
+                await asyncio.sleep(0.01)
+        finally:
+            await supervisor.aclose()
+
+    @pytest.mark.asyncio
+    async def test_timeouts_while_loading_are_not_failures(self) -> None:
+        """A server that never got ready yet is given the benefit of slow probes."""
+        server = FakeServer()
+        supervisor = _supervisor(server, restart_delay=0.01, check_interval=0.02, failure_threshold=3)
+        try:
+            await supervisor.start(wait_for_ready=False)
+            server.hung = True
+            await supervisor.start_supervision()
+            await asyncio.sleep(0.3)
+        finally:
+            await supervisor.aclose()
+
+        assert supervisor.process_manager.starts == 1
+
+    @pytest.mark.asyncio
+    async def test_requested_stop_is_not_restarted(self) -> None:
+        """Stopping or switching the server does not look like a crash."""
+        supervisor = _supervisor(FakeServer(), restart_delay=0.01, check_interval=0.05)
+        try:
+            await supervisor.start()
+            await supervisor.start_supervision()
+            state = await supervisor.switch_model("other/model.gguf")
+            assert state.status == ServerStatus.READY
+            await supervisor.stop()
+            await asyncio.sleep(0.2)
+        finally:
+            await supervisor.aclose()
+
+        assert supervisor.process_manager.starts == 2
+        assert supervisor.get_state().status == ServerStatus.STOPPED
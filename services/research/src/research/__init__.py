@@ -1,13 +1,20 @@
 """Research service for web search and content analysis."""
 
 from .citations import CitationTracker
+from .extraction import HtmlExtractor
+from .page_fetcher import PageFetcher, ResponseCache
 from .search_tool import SearchTool
 from .simhash import SimHashDeduplicator
+from .simhash_index import SimHashIndex
 from .web_tool import WebTool
 
 __all__ = [
     "CitationTracker",
+    "HtmlExtractor",
+    "PageFetcher",
+    "ResponseCache",
     "SearchTool",
     "SimHashDeduplicator",
+    "SimHashIndex",
     "WebTool",
 ]
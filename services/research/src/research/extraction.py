@@ -0,0 +1,242 @@
+# noqa: D401
+"""HTML to markdown extraction, runnable in a worker process.
+
+Parsing with BeautifulSoup/lxml and converting with markdownify is CPU-bound,
+so ``HtmlExtractor`` runs ``extract_page`` in a process pool to keep the
+event loop free while pages download.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+
+def extract_page(body: bytes, charset: Optional[str] = None) -> Dict[str, Any]:
+    """Parse raw HTML into title/description/author and clean markdown.
+
+    Module-level so it can be pickled into a process pool.
+
+    Args:
+        body: Raw response body
+        charset: Declared charset from the Content-Type header, if any
+
+    Returns:
+        Dictionary with title, description, author, and content (markdown)
+    """
+    soup = BeautifulSoup(body, "lxml", from_encoding=charset)
+
+    # Extract metadata
+    title = extract_title(soup)
+    description = extract_description(soup)
+    author = extract_author(soup)
+
+    # Clean content
+    cleaned_soup = clean_html(soup)
+
+    # Convert to markdown
+    markdown_content = md(
+        str(cleaned_soup),
+        heading_style="ATX",
+        bullets="-",
+        strip=["script", "style"],
+    )
+
+    return {
+        "title": title,
+        "description": description,
+        "author": author,
+        "content": markdown_content.strip(),
+    }
+
+
+class HtmlExtractor:
+    """Run ``extract_page`` off the event loop.
+
+    Uses a process pool by default (``RESEARCH_PARSE_WORKERS``, default CPU
+    count capped at 4). With ``workers=0`` extraction runs in the default
+    thread pool instead, which is cheaper for tests and tiny deployments.
+    """
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        """Initialize HtmlExtractor.
+
+        Args:
+            workers: Worker processes; 0 disables the process pool
+        """
+        if workers is None:
+            workers = int(os.getenv("RESEARCH_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.workers = workers
+        self._executor: Optional[Executor] = None
+
+    async def extract(self, body: bytes, charset: Optional[str] = None) -> Dict[str, Any]:
+        """Extract a page in a worker.
+
+        Args:
+            body: Raw response body
+            charset: Declared charset, if any
+
+        Returns:
+            Result of ``extract_page``
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), extract_page, body, charset)
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> Optional[Executor]:
+        if self.workers <= 0:
+            return None  # default thread pool
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+
+def extract_title(soup: BeautifulSoup) -> str:
+    """Extract page title from HTML.
+
+    Tries in order:
+    1. <title> tag
+    2. og:title meta tag
+    3. h1 tag
+    4. URL path
+
+    Args:
+        soup: BeautifulSoup object
+
+    Returns:
+        Page title
+    """
+    # Try <title> tag
+    if soup.title and soup.title.string:
+        return soup.title.string.strip()
+
+    # Try og:title
+    og_title = soup.find("meta", property="og:title")
+    if og_title and og_title.get("content"):
+        return og_title["content"].strip()
+
+    # Try first h1
+    h1 = soup.find("h1")
+    if h1 and h1.string:
+        return h1.string.strip()
+
+    return "Untitled"
+
+
+def extract_description(soup: BeautifulSoup) -> str:
+    """Extract page description from meta tags.
+
+    Args:
+        soup: BeautifulSoup object
+
+    Returns:
+        Page description
+    """
+    # Try meta description
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc and meta_desc.get("content"):
+        return meta_desc["content"].strip()
+
+    # Try og:description
+    og_desc = soup.find("meta", property="og:description")
+    if og_desc and og_desc.get("content"):
+        return og_desc["content"].strip()
+
+    return ""
+
+
+def extract_author(soup: BeautifulSoup) -> str:
+    """Extract author from meta tags.
+
+    Args:
+        soup: BeautifulSoup object
+
+    Returns:
+        Author name if found
+    """
+    # Try meta author
+    meta_author = soup.find("meta", attrs={"name": "author"})
+    if meta_author and meta_author.get("content"):
+        return meta_author["content"].strip()
+
+    # Try article:author
+    article_author = soup.find("meta", property="article:author")
+    if article_author and article_author.get("content"):
+        return article_author["content"].strip()
+
+    return ""
+
+
+def clean_html(soup: BeautifulSoup) -> BeautifulSoup:
+    """Clean HTML by removing non-content elements.
+
+    Removes:
+    - Scripts and styles
+    - Navigation elements
+    - Ads and promotional content
+    - Comments
+    - Hidden elements
+
+    Args:
+        soup: BeautifulSoup object
+
+    Returns:
+        Cleaned BeautifulSoup object
+    """
+    # Remove script and style elements
+    for element in soup(["script", "style", "noscript"]):
+        element.decompose()
+
+    # Remove navigation elements
+    for element in soup.find_all(["nav", "header", "footer", "aside"]):
+        element.decompose()
+
+    # Remove common ad/promo classes
+    ad_classes = [
+        "advertisement",
+        "ad-container",
+        "promo",
+        "sidebar",
+        "comments",
+        "related-posts",
+        "social-share",
+        "newsletter",
+    ]
+    for class_name in ad_classes:
+        for element in soup.find_all(class_=class_name):
+            element.decompose()
+
+    # Remove hidden elements
+    for element in soup.find_all(style=lambda value: value and "display:none" in value):
+        element.decompose()
+
+    # Try to find main content area
+    main_content = (
+        soup.find("main")
+        or soup.find("article")
+        or soup.find(class_="content")
+        or soup.find(id="content")
+        or soup.find("body")
+    )
+
+    return main_content if main_content else soup
+
+
+__all__ = [
+    "HtmlExtractor",
+    "clean_html",
+    "extract_author",
+    "extract_description",
+    "extract_page",
+    "extract_title",
+]
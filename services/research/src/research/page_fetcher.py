@@ -0,0 +1,360 @@
+# noqa: D401
+"""Pooled, size-capped, cache-aware HTTP fetching for research pages."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class ContentTooLarge(Exception):
+    """Raised when a response exceeds the fetcher's size cap."""
+
+    def __init__(self, url: str, size: int) -> None:
+        super().__init__(f"Content too large: {size} bytes")
+        self.url = url
+        self.size = size
+
+
+@dataclass
+class FetchedPage:
+    """Raw body and response metadata for one fetched URL."""
+
+    url: str
+    final_url: str
+    status_code: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "")
+
+    @property
+    def charset(self) -> Optional[str]:
+        for part in self.content_type.split(";")[1:]:
+            key, _, value = part.strip().partition("=")
+            if key.lower() == "charset" and value:
+                return value.strip("\"'")
+        return None
+
+
+# Response headers persisted with cached bodies
+_CACHED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class ResponseCache:
+    """On-disk page cache with TTL and ETag/Last-Modified revalidation.
+
+    Entries younger than ``ttl_seconds`` are served without touching the
+    network. Older entries that carry validators are revalidated with a
+    conditional GET; a 304 refreshes the entry instead of re-downloading.
+
+    With ``max_bytes`` set, the least recently used entries are evicted
+    once the cache outgrows it, down to 90% of the limit.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        ttl_seconds: float = 3600.0,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize ResponseCache.
+
+        Args:
+            root: Cache directory (created on first write)
+            ttl_seconds: Age below which entries are served without revalidation
+            max_bytes: Size limit for the cache directory (None for unbounded)
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        # Bytes on disk, scanned on the first store and then kept running
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``url`` (meta dict with ``body``), or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta["body"] = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if self.max_bytes is not None:
+            # Body mtime is the LRU clock for eviction
+            try:
+                os.utime(body_path)
+            except OSError:
+                pass
+        return meta
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get("stored_at", 0) < self.ttl_seconds
+
+    def validators(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Conditional request headers for revalidating ``entry``."""
+        headers = {}
+        cached = entry.get("headers", {})
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last-modified"):
+            headers["If-Modified-Since"] = cached["last-modified"]
+        return headers
+
+    def store(self, page: FetchedPage) -> None:
+        meta_path, body_path = self._paths(page.url)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "url": page.url,
+            "final_url": page.final_url,
+            "status_code": page.status_code,
+            "headers": {k: v for k, v in page.headers.items() if k in _CACHED_HEADERS},
+            "stored_at": time.time(),
+        }
+        # Body first, then metadata, each via rename, so readers never see
+        # metadata pointing at a partial body
+        encoded = json.dumps(meta).encode("utf-8")
+        self._atomic_write(body_path, page.body)
+        self._atomic_write(meta_path, encoded)
+        if self.max_bytes is not None:
+            self._account(len(page.body) + len(encoded))
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as freshly revalidated (after a 304)."""
+        meta_path, _ = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        meta["stored_at"] = time.time()
+        self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _account(self, added: int) -> None:
+        with self._size_lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                # Overwrites are over-counted; the next eviction rescans
+                self._size += added
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under 90% of ``max_bytes``."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for body_path, size, _ in entries:
+            if total <= target:
+                break
+            for path in (body_path, body_path.with_suffix(".json")):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total -= size
+            evicted += 1
+        self._size = total
+        if evicted:
+            logger.info("Evicted %d cached pages from %s", evicted, self.root)
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        """(body path, entry size, last use) for every cached page."""
+        entries = []
+        for body_path in self.root.glob("*/*.body"):
+            try:
+                body = body_path.stat()
+                meta_size = body_path.with_suffix(".json").stat().st_size
+            except OSError:
+                continue
+            entries.append((body_path, body.st_size + meta_size, body.st_mtime))
+        return entries
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = self.root / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+
+class PageFetcher:
+    """Shared connection pool with per-host concurrency limits.
+
+    Downloads are streamed and aborted as soon as they exceed
+    ``max_content_length``; successful responses are cached on disk
+    when a ``cache`` is configured.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 30,
+        max_content_length: int = 10_000_000,
+        user_agent: Optional[str] = None,
+        max_connections: int = 32,
+        per_host_limit: int = 4,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize PageFetcher.
+
+        Args:
+            timeout: HTTP request timeout in seconds
+            max_content_length: Maximum body size; larger downloads are aborted
+            user_agent: User-Agent header for page requests
+            max_connections: Total pooled connections across hosts
+            per_host_limit: Concurrent requests allowed per host
+            cache: Optional on-disk response cache
+            transport: Optional httpx transport (tests)
+        """
+        self.timeout = timeout
+        self.max_content_length = max_content_length
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.per_host_limit = max(1, per_host_limit)
+        self.cache = cache
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host_limit)
+        )
+
+    @classmethod
+    def from_env(
+        cls,
+        *,
+        timeout: float = 30,
+        max_content_length: int = 10_000_000,
+        user_agent: Optional[str] = None,
+    ) -> "PageFetcher":
+        """Build a fetcher configured from ``RESEARCH_FETCH_*`` environment variables."""
+        cache_dir = os.getenv(
+            "RESEARCH_FETCH_CACHE_DIR", str(Path.home() / ".cache" / "kitty" / "research_pages")
+        )
+        cache = None
+        if cache_dir.lower() not in {"", "0", "false", "off"}:
+            max_mb = float(os.getenv("RESEARCH_FETCH_CACHE_MAX_MB", "512"))
+            cache = ResponseCache(
+                cache_dir,
+                ttl_seconds=float(os.getenv("RESEARCH_FETCH_CACHE_TTL", "3600")),
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb > 0 else None,
+            )
+        return cls(
+            timeout=timeout,
+            max_content_length=max_content_length,
+            user_agent=user_agent,
+            max_connections=int(os.getenv("RESEARCH_FETCH_MAX_CONNECTIONS", "32")),
+            per_host_limit=int(os.getenv("RESEARCH_FETCH_PER_HOST", "4")),
+            cache=cache,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            headers = {"User-Agent": self.user_agent} if self.user_agent else None
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers=headers,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchedPage:
+        """Fetch ``url``, consulting the cache first.
+
+        Args:
+            url: URL to fetch (also the cache key)
+            headers: Extra request headers (e.g. API credentials)
+
+        Raises:
+            httpx.HTTPStatusError: Non-2xx response
+            httpx.RequestError: Transport failure
+            ContentTooLarge: Body exceeded ``max_content_length``
+        """
+        entry = await asyncio.to_thread(self.cache.load, url) if self.cache else None
+        if entry is not None and self.cache.is_fresh(entry):
+            return self._from_entry(url, entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(self.cache.validators(entry))
+        async with self._host_limits[urlparse(url).netloc]:
+            async with self.client.stream("GET", url, headers=request_headers) as response:
+                if response.status_code == 304 and entry is not None:
+                    await asyncio.to_thread(self.cache.touch, url)
+                    return self._from_entry(url, entry)
+                response.raise_for_status()
+                body = await self._read_capped(url, response)
+                page = FetchedPage(
+                    url=url,
+                    final_url=str(response.url),
+                    status_code=response.status_code,
+                    body=body,
+                    headers={k.lower(): v for k, v in response.headers.items()},
+                )
+
+        if self.cache is not None:
+            try:
+                await asyncio.to_thread(self.cache.store, page)
+            except OSError as exc:
+                logger.warning("Failed to cache %s: %s", url, exc)
+        return page
+
+    async def _read_capped(self, url: str, response: httpx.Response) -> bytes:
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > self.max_content_length:
+            raise ContentTooLarge(url, int(declared))
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes():
+            buffer.extend(chunk)
+            if len(buffer) > self.max_content_length:
+                raise ContentTooLarge(url, len(buffer))
+        return bytes(buffer)
+
+    @staticmethod
+    def _from_entry(url: str, entry: Dict[str, Any]) -> FetchedPage:
+        return FetchedPage(
+            url=url,
+            final_url=entry.get("final_url", url),
+            status_code=entry.get("status_code", 200),
+            body=entry["body"],
+            headers=entry.get("headers", {}),
+            from_cache=True,
+        )
+
+
+__all__ = ["ContentTooLarge", "FetchedPage", "PageFetcher", "ResponseCache"]
@@ -5,10 +5,13 @@ from __future__ import annotations
 
 import hashlib
 import re
-from typing import List, Optional, Set
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple, Union
 
 from simhash import Simhash
 
+from .simhash_index import SimHashIndex
+
 
 class SimHashDeduplicator:
     """Deduplicate content using SimHash algorithm.
@@ -20,8 +23,9 @@ class SimHashDeduplicator:
     Features:
     - Configurable similarity threshold (hamming distance)
     - Token-based fingerprinting
-    - Efficient duplicate detection
-    - Memory-efficient hash storage
+    - Banded hash index: lookups touch a few buckets instead of every hash
+    - Bulk checking for a batch of fetched pages
+    - Per-session persistence via ``save``/``load``
     """
 
     def __init__(
@@ -39,7 +43,7 @@ class SimHashDeduplicator:
         """
         self.similarity_threshold = similarity_threshold
         self.min_content_length = min_content_length
-        self._seen_hashes: List[int] = []  # Store computed hashes
+        self._index = SimHashIndex(max_distance=similarity_threshold)  # Seen hashes
         self._seen_urls: Set[str] = set()  # Track URLs for exact deduplication
 
     def compute_hash(self, content: str) -> Optional[int]:
@@ -78,22 +82,8 @@ class SimHashDeduplicator:
         Returns:
             True if content is similar to previously seen content
         """
-        # Check exact URL match first
-        if url and url in self._seen_urls:
-            return True
-
-        # Compute hash
-        content_hash = self.compute_hash(content)
-        if content_hash is None:
-            return False  # Content too short, consider not duplicate
-
-        # Check against all seen hashes
-        for seen_hash in self._seen_hashes:
-            hamming_distance = self._hamming_distance(content_hash, seen_hash)
-            if hamming_distance <= self.similarity_threshold:
-                return True
-
-        return False
+        duplicate, _ = self._check(content, url)
+        return duplicate
 
     def add(
         self,
@@ -109,26 +99,104 @@ class SimHashDeduplicator:
         Returns:
             True if added (not a duplicate), False if duplicate
         """
-        # Check if duplicate first
-        if self.is_duplicate(content, url):
+        # Check if duplicate first, reusing the hash for storage
+        duplicate, content_hash = self._check(content, url)
+        if duplicate:
             return False
 
-        # Compute and store hash
-        content_hash = self.compute_hash(content)
-        if content_hash is not None:
-            self._seen_hashes.append(content_hash)
+        self._remember(content_hash, url)
+        return True
 
-        # Store URL if provided
-        if url:
-            self._seen_urls.add(url)
+    def add_many(
+        self,
+        items: Iterable[Tuple[str, Optional[str]]],
+    ) -> List[bool]:
+        """Add a batch of (content, url) pairs, e.g. all pages from one fetch round.
 
-        return True
+        Pages are also checked against earlier pages in the same batch.
+
+        Args:
+            items: Iterable of (content, url) pairs
+
+        Returns:
+            One flag per item: True if added (not a duplicate), False if duplicate
+        """
+        return [self.add(content, url) for content, url in items]
+
+    def is_duplicate_many(
+        self,
+        items: Iterable[Tuple[str, Optional[str]]],
+    ) -> List[bool]:
+        """Check a batch of (content, url) pairs without adding them.
+
+        Args:
+            items: Iterable of (content, url) pairs
+
+        Returns:
+            One flag per item: True if similar to previously seen content
+        """
+        return [self._check(content, url)[0] for content, url in items]
 
     def reset(self) -> None:
         """Clear all stored hashes and URLs."""
-        self._seen_hashes.clear()
+        self._index.clear()
         self._seen_urls.clear()
 
+    def save(self, path: Union[str, Path]) -> None:
+        """Persist seen hashes and URLs, e.g. at the end of a research session.
+
+        Args:
+            path: Index file path; URLs are written alongside with a ``.urls`` suffix
+        """
+        path = Path(path)
+        self._index.save(path)
+        urls_path = path.with_suffix(path.suffix + ".urls")
+        urls_path.write_text("\n".join(sorted(self._seen_urls)), encoding="utf-8")
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        min_content_length: int = 100,
+    ) -> "SimHashDeduplicator":
+        """Restore a deduplicator written by :meth:`save`.
+
+        Args:
+            path: Index file path passed to ``save``
+            min_content_length: Minimum content length to compute hash (chars)
+
+        Returns:
+            Deduplicator with the saved threshold, hashes, and URLs
+        """
+        path = Path(path)
+        index = SimHashIndex.load(path)
+        dedup = cls(similarity_threshold=index.max_distance, min_content_length=min_content_length)
+        dedup._index = index
+        urls_path = path.with_suffix(path.suffix + ".urls")
+        if urls_path.exists():
+            dedup._seen_urls = {
+                line for line in urls_path.read_text(encoding="utf-8").splitlines() if line
+            }
+        return dedup
+
+    def _check(self, content: str, url: Optional[str]) -> Tuple[bool, Optional[int]]:
+        """Return (is_duplicate, content_hash) computing the hash at most once."""
+        # Check exact URL match first
+        if url and url in self._seen_urls:
+            return True, None
+
+        content_hash = self.compute_hash(content)
+        if content_hash is None:
+            return False, None  # Content too short, consider not duplicate
+
+        return self._index.query(content_hash) is not None, content_hash
+
+    def _remember(self, content_hash: Optional[int], url: Optional[str]) -> None:
+        if content_hash is not None:
+            self._index.add(content_hash)
+        if url:
+            self._seen_urls.add(url)
+
     def _normalize_content(self, content: str) -> str:
         """Normalize content for hashing.
 
@@ -202,7 +270,7 @@ class SimHashDeduplicator:
                 - similarity_threshold: Current threshold setting
         """
         return {
-            "total_hashes": len(self._seen_hashes),
+            "total_hashes": len(self._index),
             "total_urls": len(self._seen_urls),
             "similarity_threshold": self.similarity_threshold,
             "min_content_length": self.min_content_length,
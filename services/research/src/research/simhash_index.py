@@ -0,0 +1,153 @@
+# noqa: D401
+"""Banded (pigeonhole) index for near-duplicate SimHash lookup."""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+_MAGIC = b"KSHI"
+_HEADER = struct.Struct("<4sBBQ")  # magic, bits, max_distance, count
+
+
+class SimHashIndex:
+    """Find stored fingerprints within a hamming distance of a query.
+
+    Each ``bits``-wide fingerprint is split into ``max_distance + 1`` bands.
+    Two fingerprints that differ in at most ``max_distance`` bits must agree
+    exactly on at least one band (pigeonhole principle), so a lookup only
+    verifies the fingerprints sharing a bucket with the query in some band
+    instead of scanning every stored fingerprint.
+
+    Example:
+        index = SimHashIndex(max_distance=3)
+        index.add_many(fingerprints)
+        match = index.query(candidate)  # nearest stored fingerprint or None
+    """
+
+    def __init__(self, max_distance: int = 3, bits: int = 64) -> None:
+        """Initialize SimHashIndex.
+
+        Args:
+            max_distance: Largest hamming distance treated as a match (0 to bits-1)
+            bits: Fingerprint width in bits (default 64, as produced by ``simhash``)
+        """
+        if not 0 <= max_distance < bits:
+            raise ValueError(f"max_distance must be in [0, {bits}), got {max_distance}")
+        self.max_distance = max_distance
+        self.bits = bits
+        self._bands = self._band_layout(bits, max_distance + 1)
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._fingerprints = array("Q")
+        self._members: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return fingerprint in self._members
+
+    @property
+    def fingerprints(self) -> Sequence[int]:
+        return self._fingerprints
+
+    def add(self, fingerprint: int) -> bool:
+        """Store ``fingerprint``. Returns False if it was already stored exactly."""
+        if fingerprint in self._members:
+            return False
+        self._members.add(fingerprint)
+        self._fingerprints.append(fingerprint)
+        for table, (shift, mask) in zip(self._tables, self._bands):
+            table.setdefault((fingerprint >> shift) & mask, []).append(fingerprint)
+        return True
+
+    def add_many(self, fingerprints: Iterable[int]) -> int:
+        """Store several fingerprints. Returns how many were new."""
+        return sum(1 for fingerprint in fingerprints if self.add(fingerprint))
+
+    def query(self, fingerprint: int, max_distance: Optional[int] = None) -> Optional[int]:
+        """Return the closest stored fingerprint within ``max_distance``, or None."""
+        best: Optional[Tuple[int, int]] = None
+        for distance, candidate in self._matches(fingerprint, max_distance):
+            if best is None or distance < best[0]:
+                best = (distance, candidate)
+                if distance == 0:
+                    break
+        return None if best is None else best[1]
+
+    def query_many(
+        self, fingerprints: Iterable[int], max_distance: Optional[int] = None
+    ) -> List[Optional[int]]:
+        """Batch form of :meth:`query`."""
+        return [self.query(fingerprint, max_distance) for fingerprint in fingerprints]
+
+    def find_all(self, fingerprint: int, max_distance: Optional[int] = None) -> List[int]:
+        """Return every stored fingerprint within ``max_distance``, nearest first."""
+        return [candidate for _, candidate in sorted(self._matches(fingerprint, max_distance))]
+
+    def add_if_new(self, fingerprint: int) -> bool:
+        """Store ``fingerprint`` unless a near-duplicate exists. Returns True if stored."""
+        if self.query(fingerprint) is not None:
+            return False
+        return self.add(fingerprint)
+
+    def clear(self) -> None:
+        for table in self._tables:
+            table.clear()
+        self._fingerprints = array("Q")
+        self._members.clear()
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Persist fingerprints to ``path``; band tables are rebuilt on load."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with tmp.open("wb") as fh:
+            fh.write(_HEADER.pack(_MAGIC, self.bits, self.max_distance, len(self._fingerprints)))
+            self._fingerprints.tofile(fh)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SimHashIndex":
+        with Path(path).open("rb") as fh:
+            magic, bits, max_distance, count = _HEADER.unpack(fh.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a SimHash index file")
+            fingerprints = array("Q")
+            fingerprints.fromfile(fh, count)
+        index = cls(max_distance=max_distance, bits=bits)
+        index.add_many(fingerprints)
+        return index
+
+    def _matches(self, fingerprint: int, max_distance: Optional[int]) -> Iterable[Tuple[int, int]]:
+        limit = self.max_distance if max_distance is None else max_distance
+        if limit > self.max_distance:
+            raise ValueError(
+                f"Index built for distance <= {self.max_distance}, asked for {limit}"
+            )
+        seen: set[int] = set()
+        for table, (shift, mask) in zip(self._tables, self._bands):
+            for candidate in table.get((fingerprint >> shift) & mask, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = (candidate ^ fingerprint).bit_count()
+                if distance <= limit:
+                    yield distance, candidate
+
+    @staticmethod
+    def _band_layout(bits: int, bands: int) -> List[Tuple[int, int]]:
+        """Split ``bits`` into ``bands`` contiguous (shift, mask) ranges of near-equal width."""
+        base, extra = divmod(bits, bands)
+        layout = []
+        shift = 0
+        for band in range(bands):
+            width = base + (1 if band < extra else 0)
+            layout.append((shift, (1 << width) - 1))
+            shift += width
+        return layout
+
+
+__all__ = ["SimHashIndex"]
@@ -3,14 +3,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+
+from .extraction import HtmlExtractor
+from .page_fetcher import ContentTooLarge, PageFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,8 @@ class WebTool:
     - Content cleaning (remove scripts, styles, nav, ads)
     - Metadata extraction (title, description, author)
     - Error handling for network issues
+    - Shared connection pool with per-host limits and an on-disk response cache
+    - HTML parsing in a process pool, so batches stay network-bound
     """
 
     def __init__(
@@ -34,6 +39,9 @@ class WebTool:
         enable_jina: bool = True,
         jina_base_url: Optional[str] = None,
         jina_api_key: Optional[str] = None,
+        fetcher: Optional[PageFetcher] = None,
+        extractor: Optional[HtmlExtractor] = None,
+        max_concurrency: int = 16,
     ) -> None:
         """Initialize WebTool.
 
@@ -41,6 +49,9 @@ class WebTool:
             timeout: HTTP request timeout in seconds
             max_content_length: Maximum content size to download
             user_agent: Custom user agent string (uses default if not provided)
+            fetcher: Shared page fetcher (built from RESEARCH_FETCH_* env if not provided)
+            extractor: HTML extractor (process pool sized by RESEARCH_PARSE_WORKERS)
+            max_concurrency: Maximum pages in flight for ``fetch_many``
         """
         self.timeout = timeout
         self.max_content_length = max_content_length
@@ -56,6 +67,35 @@ class WebTool:
         }
         self._jina_base_url = jina_base_url or os.getenv("JINA_READER_BASE_URL", "https://r.jina.ai")
         self._jina_api_key = jina_api_key or os.getenv("JINA_API_KEY")
+        self._fetcher = fetcher or PageFetcher.from_env(
+            timeout=timeout,
+            max_content_length=max_content_length,
+            user_agent=self.user_agent,
+        )
+        self._extractor = extractor or HtmlExtractor()
+        self._max_concurrency = max(1, max_concurrency)
+
+    async def aclose(self) -> None:
+        """Close pooled connections and stop parser workers."""
+        await self._fetcher.aclose()
+        self._extractor.shutdown()
+
+    async def fetch_many(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        """Fetch and parse several pages concurrently.
+
+        Args:
+            urls: URLs to fetch
+
+        Returns:
+            One ``fetch`` result per URL, in input order
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def bounded(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.fetch(url)
+
+        return list(await asyncio.gather(*(bounded(url) for url in urls)))
 
     async def fetch(self, url: str) -> Dict[str, Any]:
         """Fetch and parse web content.
@@ -83,58 +123,36 @@ class WebTool:
                     return jina_result
                 logger.warning("Jina reader failed for %s: %s", url, jina_result.get("error"))
 
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": self.user_agent},
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # Check content length
-                content_length = len(response.content)
-                if content_length > self.max_content_length:
-                    return {
-                        "success": False,
-                        "url": url,
-                        "error": f"Content too large: {content_length} bytes",
-                        "metadata": {"content_length": content_length},
-                    }
-
-                # Parse HTML
-                soup = BeautifulSoup(response.text, "lxml")
-
-                # Extract metadata
-                title = self._extract_title(soup)
-                description = self._extract_description(soup)
-                author = self._extract_author(soup)
-
-                # Clean content
-                cleaned_soup = self._clean_html(soup)
-
-                # Convert to markdown
-                markdown_content = md(
-                    str(cleaned_soup),
-                    heading_style="ATX",
-                    bullets="-",
-                    strip=["script", "style"],
-                )
-
-                return {
-                    "success": True,
-                    "url": url,
-                    "final_url": str(response.url),
-                    "title": title,
-                    "description": description,
-                    "author": author,
-                    "content": markdown_content.strip(),
-                    "metadata": {
-                        "content_length": content_length,
-                        "status_code": response.status_code,
-                        "content_type": response.headers.get("content-type", ""),
-                        "provider": "beautifulsoup",
-                    },
-                }
+            # Streamed download, aborted early past max_content_length
+            page = await self._fetcher.get(url)
+
+            # Parse HTML off the event loop
+            extracted = await self._extractor.extract(page.body, page.charset)
+
+            return {
+                "success": True,
+                "url": url,
+                "final_url": page.final_url,
+                "title": extracted["title"],
+                "description": extracted["description"],
+                "author": extracted["author"],
+                "content": extracted["content"],
+                "metadata": {
+                    "content_length": len(page.body),
+                    "status_code": page.status_code,
+                    "content_type": page.content_type,
+                    "provider": "beautifulsoup",
+                    "cached": page.from_cache,
+                },
+            }
+
+        except ContentTooLarge as exc:
+            return {
+                "success": False,
+                "url": url,
+                "error": str(exc),
+                "metadata": {"content_length": exc.size},
+            }
 
         except httpx.HTTPStatusError as exc:
             logger.error("HTTP error fetching %s: %s", url, exc)
@@ -164,7 +182,11 @@ class WebTool:
             }
 
     async def _fetch_via_jina(self, url: str) -> Dict[str, Any]:
-        """Attempt to extract content using Jina Reader API."""
+        """Attempt to extract content using Jina Reader API.
+
+        Goes through the shared fetcher, so reader calls share its per-host
+        limit, size cap and response cache like direct page fetches.
+        """
         api_url = f"{self._jina_base_url.rstrip('/')}/{url}"
         headers = {
             "Accept": "application/json",
@@ -172,14 +194,12 @@ class WebTool:
         if self._jina_api_key:
             headers["Authorization"] = f"Bearer {self._jina_api_key}"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(api_url, headers=headers)
-            response.raise_for_status()
+        page = await self._fetcher.get(api_url, headers=headers)
 
         try:
-            payload = response.json()
+            payload = json.loads(page.body)
         except ValueError:
-            text = response.text
+            text = page.body.decode(page.charset or "utf-8", errors="replace")
             return {
                 "success": True,
                 "url": url,
@@ -217,133 +237,6 @@ class WebTool:
             },
         }
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract page title from HTML.
-
-        Tries in order:
-        1. <title> tag
-        2. og:title meta tag
-        3. h1 tag
-        4. URL path
-
-        Args:
-            soup: BeautifulSoup object
-
-        Returns:
-            Page title
-        """
-        # Try <title> tag
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
-
-        # Try og:title
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            return og_title["content"].strip()
-
-        # Try first h1
-        h1 = soup.find("h1")
-        if h1 and h1.string:
-            return h1.string.strip()
-
-        return "Untitled"
-
-    def _extract_description(self, soup: BeautifulSoup) -> str:
-        """Extract page description from meta tags.
-
-        Args:
-            soup: BeautifulSoup object
-
-        Returns:
-            Page description
-        """
-        # Try meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            return meta_desc["content"].strip()
-
-        # Try og:description
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):
-            return og_desc["content"].strip()
-
-        return ""
-
-    def _extract_author(self, soup: BeautifulSoup) -> str:
-        """Extract author from meta tags.
-
-        Args:
-            soup: BeautifulSoup object
-
-        Returns:
-            Author name if found
-        """
-        # Try meta author
-        meta_author = soup.find("meta", attrs={"name": "author"})
-        if meta_author and meta_author.get("content"):
-            return meta_author["content"].strip()
-
-        # Try article:author
-        article_author = soup.find("meta", property="article:author")
-        if article_author and article_author.get("content"):
-            return article_author["content"].strip()
-
-        return ""
-
-    def _clean_html(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Clean HTML by removing non-content elements.
-
-        Removes:
-        - Scripts and styles
-        - Navigation elements
-        - Ads and promotional content
-        - Comments
-        - Hidden elements
-
-        Args:
-            soup: BeautifulSoup object
-
-        Returns:
-            Cleaned BeautifulSoup object
-        """
-        # Remove script and style elements
-        for element in soup(["script", "style", "noscript"]):
-            element.decompose()
-
-        # Remove navigation elements
-        for element in soup.find_all(["nav", "header", "footer", "aside"]):
-            element.decompose()
-
-        # Remove common ad/promo classes
-        ad_classes = [
-            "advertisement",
-            "ad-container",
-            "promo",
-            "sidebar",
-            "comments",
-            "related-posts",
-            "social-share",
-            "newsletter",
-        ]
-        for class_name in ad_classes:
-            for element in soup.find_all(class_=class_name):
-                element.decompose()
-
-        # Remove hidden elements
-        for element in soup.find_all(style=lambda value: value and "display:none" in value):
-            element.decompose()
-
-        # Try to find main content area
-        main_content = (
-            soup.find("main")
-            or soup.find("article")
-            or soup.find(class_="content")
-            or soup.find(id="content")
-            or soup.find("body")
-        )
-
-        return main_content if main_content else soup
-
     def is_valid_url(self, url: str) -> bool:
         """Check if URL is valid and fetchable.
 
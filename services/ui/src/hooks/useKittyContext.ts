@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import mqtt, { MqttClient } from 'mqtt';
 
 export interface DeviceState {
@@ -19,9 +19,39 @@ interface KittyContext {
   conversations: Record<string, ConversationContextState>;
 }
 
+type JsonObject = Record<string, unknown>;
+
+const isObject = (value: unknown): value is JsonObject =>
+  typeof value === 'object' && value !== null && !Array.isArray(value);
+
+// RFC 7386 merge patch, mirroring brain.state.context_publisher.apply_merge_patch
+const applyMergePatch = (target: unknown, patch: unknown): unknown => {
+  if (!isObject(patch)) {
+    return patch;
+  }
+  const result: JsonObject = isObject(target) ? { ...target } : {};
+  Object.entries(patch).forEach(([key, value]) => {
+    if (value === null) {
+      delete result[key];
+    } else {
+      result[key] = applyMergePatch(result[key], value);
+    }
+  });
+  return result;
+};
+
+const toConversation = (conversationId: string, data: JsonObject): ConversationContextState => ({
+  conversationId,
+  lastIntent: (data.last_intent || data.lastIntent) as string | undefined,
+  device: data.device as Record<string, unknown> | undefined,
+  state: (data.session_state || data.state) as Record<string, unknown> | undefined,
+});
+
 const useKittyContext = (mqttUrl: string = import.meta.env.VITE_MQTT_URL || 'ws://localhost:9002') => {
   const [client, setClient] = useState<MqttClient | null>(null);
   const [context, setContext] = useState<KittyContext>({ devices: {}, conversations: {} });
+  // Raw context per conversation: the retained snapshot with every delta applied since
+  const rawContexts = useRef<Record<string, JsonObject>>({});
 
   useEffect(() => {
     const mqttClient = mqtt.connect(mqttUrl, {
@@ -33,6 +63,7 @@ const useKittyContext = (mqttUrl: string = import.meta.env.VITE_MQTT_URL || 'ws:
     mqttClient.on('connect', () => {
       mqttClient.subscribe('kitty/devices/+/state');
       mqttClient.subscribe('kitty/ctx/+');
+      mqttClient.subscribe('kitty/ctx/+/delta');
     });
 
     mqttClient.on('message', (topic, payload) => {
@@ -53,17 +84,24 @@ const useKittyContext = (mqttUrl: string = import.meta.env.VITE_MQTT_URL || 'ws:
           }));
         }
         if (topic.startsWith('kitty/ctx/')) {
-          const [, , conversationId] = topic.split('/');
+          const [, , conversationId, kind] = topic.split('/');
+          let next: JsonObject;
+          if (kind === 'delta') {
+            const base = rawContexts.current[conversationId];
+            // Deltas only make sense on top of the retained snapshot
+            if (!base) {
+              return;
+            }
+            next = applyMergePatch(base, data.patch) as JsonObject;
+          } else {
+            next = data;
+          }
+          rawContexts.current[conversationId] = next;
           setContext((prev) => ({
             ...prev,
             conversations: {
               ...prev.conversations,
-              [conversationId]: {
-                conversationId,
-                lastIntent: data.last_intent || data.lastIntent,
-                device: data.device,
-                state: data.session_state || data.state,
-              },
+              [conversationId]: toConversation(conversationId, next),
             },
           }));
         }
@@ -73,6 +111,7 @@ const useKittyContext = (mqttUrl: string = import.meta.env.VITE_MQTT_URL || 'ws:
     });
 
     return () => {
+      rawContexts.current = {};
       mqttClient.end(true);
       setClient(null);
     };
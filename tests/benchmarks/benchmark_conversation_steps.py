@@ -0,0 +1,147 @@
+"""Benchmark: full agent_history upserts vs. append-only conversation_steps.
+
+Persists a conversation one agent step at a time (the worst case: one
+flush per step) and reports the bytes sent per write at a few points in
+the conversation.
+
+- legacy: every write re-serializes and upserts the whole history blob
+- append: every write upserts the small header and inserts the new step
+
+By default statements go to an in-process recorder, so only payload size
+is measured. Pass --dsn to time the append path against a migrated
+PostgreSQL database as well.
+
+Usage:
+    PYTHONPATH=services/common/src:services/brain/src \\
+        python tests/benchmarks/benchmark_conversation_steps.py --steps 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from contextlib import asynccontextmanager
+
+from brain.agents.types import AgentStep
+from brain.conversation.auto_persist import AutoPersistConversationState
+from brain.conversation.persistent_state import PersistentConversationStateManager
+
+CHECKPOINTS = (1, 10, 100, 250, 500, 1000)
+
+
+def payload_bytes(params) -> int:
+    total = 0
+    for value in params or ():
+        if hasattr(value, "obj"):  # psycopg Json wrapper
+            value = value.obj
+        total += len(json.dumps(value, default=str))
+    return total
+
+
+class MeasuringPool:
+    """Records the parameter bytes of each connection's statements."""
+
+    def __init__(self) -> None:
+        self.writes: list[int] = []
+
+    @asynccontextmanager
+    async def connection(self):
+        connection = _MeasuringConnection()
+        yield connection
+        self.writes.append(connection.bytes)
+
+
+class _MeasuringConnection:
+    def __init__(self) -> None:
+        self.bytes = 0
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield self
+
+    async def execute(self, sql, params=None):
+        self.bytes += payload_bytes(params)
+
+    async def executemany(self, sql, rows):
+        for params in rows:
+            self.bytes += payload_bytes(params)
+
+    async def commit(self):
+        pass
+
+
+def make_step(index: int) -> AgentStep:
+    return AgentStep(
+        thought=f"Step {index}: checking printer queue and material inventory " * 3,
+        action="kitty_fab.queue_status",
+        action_input={"printer": "bamboo_h2d", "include_history": True},
+        observation="Queue has 3 jobs; PLA black at 412 g remaining. " * 4,
+    )
+
+
+def legacy_write_bytes(manager: PersistentConversationStateManager, state) -> int:
+    # What the pre-append _persist sent: header plus the full history blob
+    header = manager._serialize_state(state)
+    history = [manager._serialize_agent_step(step) for step in state.history]
+    return payload_bytes(list(header.values()) + [history])
+
+
+async def run_recorded(steps: int) -> None:
+    pool = MeasuringPool()
+    manager = PersistentConversationStateManager(pool)
+    state = AutoPersistConversationState(
+        conversation_id=str(uuid.uuid4()), user_id="bench", manager=manager
+    )
+
+    legacy = []
+    for index in range(1, steps + 1):
+        state.add_step(make_step(index))
+        await state.flush()
+        legacy.append(legacy_write_bytes(manager, state))
+
+    print(f"{'step':>6}{'legacy B/write':>16}{'append B/write':>16}")
+    for checkpoint in CHECKPOINTS:
+        if checkpoint <= steps:
+            print(f"{checkpoint:>6}{legacy[checkpoint - 1]:>16}{pool.writes[checkpoint - 1]:>16}")
+    print(
+        f"{'total':>6}{sum(legacy) / 1e6:>14.1f}MB{sum(pool.writes) / 1e6:>14.2f}MB"
+        f"   ({steps} writes)"
+    )
+
+
+async def run_postgres(steps: int, dsn: str) -> None:
+    from psycopg_pool import AsyncConnectionPool
+
+    async with AsyncConnectionPool(dsn, min_size=1, max_size=2, open=False) as pool:
+        await pool.open()
+        manager = PersistentConversationStateManager(pool)
+        base = await manager.get_or_create(str(uuid.uuid4()), "bench")
+        state = AutoPersistConversationState(
+            conversation_id=base.conversation_id, user_id="bench", manager=manager
+        )
+        timings = []
+        for index in range(1, steps + 1):
+            state.add_step(make_step(index))
+            started = time.perf_counter()
+            await state.flush()
+            timings.append((time.perf_counter() - started) * 1000)
+        await manager.delete(state.conversation_id)
+
+    print(f"{'step':>6}{'append ms/write':>17}")
+    for checkpoint in CHECKPOINTS:
+        if checkpoint <= steps:
+            window = timings[max(0, checkpoint - 10) : checkpoint]
+            print(f"{checkpoint:>6}{sum(window) / len(window):>17.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--dsn", help="PostgreSQL DSN with the conversation_steps migration applied")
+    args = parser.parse_args()
+    asyncio.run(run_recorded(args.steps))
+    if args.dsn:
+        asyncio.run(run_postgres(args.steps, args.dsn))
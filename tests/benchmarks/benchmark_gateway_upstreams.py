@@ -0,0 +1,131 @@
+"""Load test: per-request httpx clients vs. pooled gateway upstream clients.
+
+Starts a local stub upstream with uvicorn, then drives the same request mix
+through (a) a fresh ``httpx.AsyncClient`` per request, as the gateway routes
+used to, and (b) the shared ``gateway.upstream`` pool.
+
+Usage:
+    PYTHONPATH=services/gateway/src python tests/benchmarks/benchmark_gateway_upstreams.py \
+        --requests 2000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+import uvicorn
+
+from gateway.upstream import UpstreamClient, UpstreamConfig
+
+
+async def stub_app(scope, receive, send):  # noqa: D401
+    """Minimal ASGI upstream returning a small JSON body."""
+    if scope["type"] != "http":
+        return
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b'{"status": "ok"}'})
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub(port: int) -> uvicorn.Server:
+    config = uvicorn.Config(stub_app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run_load(
+    send_one: Callable[[], Awaitable[None]], total: int, concurrency: int
+) -> dict:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await send_one()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    wall = time.perf_counter() - wall_start
+    latencies.sort()
+    return {
+        "throughput_rps": total / wall,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))],
+    }
+
+
+async def main(total: int, concurrency: int) -> None:
+    port = _free_port()
+    server = start_stub(port)
+    url = f"http://127.0.0.1:{port}/api/status"
+
+    async def per_request_client() -> None:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+
+    pooled = UpstreamClient(
+        UpstreamConfig(
+            name="stub",
+            base_url=f"http://127.0.0.1:{port}",
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        )
+    )
+
+    async def pooled_client() -> None:
+        response = await pooled.get(url)
+        response.raise_for_status()
+
+    # Warm up both paths
+    await run_load(per_request_client, 50, concurrency)
+    await run_load(pooled_client, 50, concurrency)
+
+    baseline = await run_load(per_request_client, total, concurrency)
+    shared = await run_load(pooled_client, total, concurrency)
+    await pooled.aclose()
+    server.should_exit = True
+
+    print(f"{total} GET requests, concurrency {concurrency}")
+    print(f"{'mode':<22}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, result in (("per-request client", baseline), ("pooled upstream", shared)):
+        print(
+            f"{name:<22}{result['throughput_rps']:>10.0f}"
+            f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+        )
+    print(
+        f"throughput x{shared['throughput_rps'] / baseline['throughput_rps']:.2f}, "
+        f"p99 x{baseline['p99_ms'] / shared['p99_ms']:.2f} better"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
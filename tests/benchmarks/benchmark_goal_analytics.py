@@ -0,0 +1,167 @@
+"""Benchmark: row-loading analytics vs. watermarked SQL rollups.
+
+Seeds print_outcomes and goals at increasing history sizes, then times one
+"nightly run" both ways:
+
+- legacy: load every failed outcome / measured goal and group in Python
+  (what GoalGenerator and FeedbackLoop did before the rollups)
+- rollup: fold the night's new rows into the daily buckets, then read
+  failure counts and effectiveness stats
+
+Runs against in-memory SQLite by default; pass --database-url to use a
+scratch PostgreSQL database (tables are created and dropped).
+
+Usage:
+    PYTHONPATH=services/common/src:services/brain/src \\
+        python tests/benchmarks/benchmark_goal_analytics.py --sizes 10000 50000 100000 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects.sqlite.base import SQLiteTypeCompiler
+from sqlalchemy.orm import Session
+
+from brain.autonomous.analytics_rollup import AnalyticsRollup
+from common.db.models import (
+    AnalyticsWatermark,
+    FailureReason,
+    Goal,
+    GoalEffectivenessDaily,
+    GoalStatus,
+    GoalType,
+    PrintFailureDaily,
+    PrintOutcome,
+)
+
+TABLES = [
+    Goal.__table__,
+    PrintOutcome.__table__,
+    AnalyticsWatermark.__table__,
+    PrintFailureDaily.__table__,
+    GoalEffectivenessDaily.__table__,
+]
+LOOKBACK = timedelta(days=30)
+
+
+def seed(session: Session, count: int, start: datetime, end: datetime, rng: random.Random) -> None:
+    span = (end - start).total_seconds()
+    reasons = list(FailureReason)
+    goal_types = list(GoalType)
+    outcomes, goals = [], []
+    for _ in range(count):
+        at = start + timedelta(seconds=rng.random() * span)
+        success = rng.random() < 0.7
+        outcomes.append(
+            {
+                "id": str(uuid.uuid4()),
+                "job_id": str(uuid.uuid4()),
+                "printer_id": "bench",
+                "material_id": "pla",
+                "success": success,
+                "failure_reason": None if success else rng.choice(reasons),
+                "quality_score": Decimal("50"),
+                "actual_duration_hours": Decimal("1"),
+                "actual_cost_usd": Decimal("1"),
+                "material_used_grams": Decimal("10"),
+                "print_settings": {},
+                "started_at": at - timedelta(hours=1),
+                "completed_at": at,
+                "measured_at": at,
+            }
+        )
+        goals.append(
+            {
+                "id": str(uuid.uuid4()),
+                "goal_type": rng.choice(goal_types),
+                "description": "bench",
+                "rationale": "bench",
+                "estimated_budget": Decimal("1"),
+                "status": GoalStatus.completed,
+                "effectiveness_score": Decimal(str(round(rng.uniform(0, 100), 2))),
+                "outcome_measured_at": at,
+                "learn_from": True,
+            }
+        )
+    for offset in range(0, count, 5000):
+        session.execute(insert(PrintOutcome), outcomes[offset : offset + 5000])
+        session.execute(insert(Goal), goals[offset : offset + 5000])
+    session.commit()
+
+
+def legacy_run(session: Session, now: datetime) -> None:
+    cutoff = now - LOOKBACK
+    failures = defaultdict(int)
+    stmt = select(PrintOutcome).where(
+        PrintOutcome.success == False,  # noqa: E712
+        PrintOutcome.completed_at >= cutoff,
+    )
+    for outcome in session.execute(stmt).scalars():
+        failures[outcome.failure_reason] += 1
+    scores = defaultdict(list)
+    stmt = select(Goal).where(
+        Goal.status == GoalStatus.completed,
+        Goal.outcome_measured_at.is_not(None),
+        Goal.learn_from == True,  # noqa: E712
+    )
+    for goal in session.execute(stmt).scalars():
+        scores[goal.goal_type].append(float(goal.effectiveness_score))
+    session.expunge_all()
+
+
+def rollup_run(session: Session, now: datetime) -> None:
+    rollup = AnalyticsRollup(session)
+    rollup.refresh(now=now)
+    session.commit()
+    rollup.failure_counts(since=now - LOOKBACK)
+    rollup.effectiveness_by_type()
+
+
+def main(sizes: list[int], nightly: int, database_url: str) -> None:
+    SQLiteTypeCompiler.visit_JSONB = lambda self, type_, **kw: "JSON"
+    engine = create_engine(database_url)
+    rng = random.Random(42)
+    history_start = datetime(2024, 1, 1)
+    now = datetime(2026, 1, 1)
+
+    print(f"{'rows':>8}{'legacy ms':>12}{'rollup ms':>12}   (nightly delta {nightly} rows)")
+    try:
+        for size in sizes:
+            Goal.metadata.drop_all(engine, tables=TABLES)
+            Goal.metadata.create_all(engine, tables=TABLES)
+            with Session(engine) as session:
+                seed(session, size, history_start, now, rng)
+                # Steady state: previous night's refresh already folded history
+                rollup_run(session, now)
+
+                tonight = now + timedelta(days=1)
+                seed(session, nightly, now + timedelta(seconds=1), tonight, rng)
+
+                started = time.perf_counter()
+                legacy_run(session, tonight)
+                legacy_ms = (time.perf_counter() - started) * 1000
+
+                started = time.perf_counter()
+                rollup_run(session, tonight)
+                rollup_ms = (time.perf_counter() - started) * 1000
+
+            print(f"{size:>8}{legacy_ms:>12.1f}{rollup_ms:>12.1f}")
+    finally:
+        Goal.metadata.drop_all(engine, tables=TABLES)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000, 200_000])
+    parser.add_argument("--nightly", type=int, default=500, help="New rows per nightly run")
+    parser.add_argument("--database-url", default="sqlite://")
+    args = parser.parse_args()
+    main(args.sizes, args.nightly, args.database_url)
@@ -0,0 +1,88 @@
+"""Benchmark: gallery page latency vs. number of stored images.
+
+Compares the old /api/images/latest approach (list the bucket, sort in
+Python) with one catalog page, for catalogs of increasing size. The bucket
+listing is simulated in memory (network time excluded, so the legacy numbers
+are a lower bound); the catalog runs against fakeredis or, with --redis-url,
+a real Redis.
+
+Usage:
+    PYTHONPATH=services/images_service \\
+        python tests/benchmarks/benchmark_image_gallery.py --sizes 100 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from catalog import ImageCatalog
+
+
+def legacy_page(objects, limit):
+    # Full listing (all pages) sorted in Python, as a correct list-based version would need
+    items = sorted(objects, key=lambda x: x["LastModified"], reverse=True)
+    return [item for item in items if item["Key"].endswith(".png")][:limit]
+
+
+def time_call(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--limit", type=int, default=36)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--redis-url", help="Benchmark against a real Redis (uses db keys under bench:)")
+    args = parser.parse_args()
+
+    if args.redis_url:
+        from redis import Redis
+
+        redis_conn = Redis.from_url(args.redis_url)
+    else:
+        import fakeredis
+
+        redis_conn = fakeredis.FakeRedis()
+
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    print(f"{'images':>8} {'legacy ms':>10} {'catalog ms':>11} {'page 50 ms':>11}")
+    for size in args.sizes:
+        namespace = f"bench:{size}"
+        redis_conn.delete(f"{namespace}:index", f"{namespace}:entries")
+        catalog = ImageCatalog(redis_conn, namespace=namespace)
+        objects = []
+        batch = []
+        for i in range(size):
+            stamp = base + timedelta(seconds=i)
+            key = f"images/{stamp:%Y%m%d_%H%M%S}_{i:08x}"
+            objects.append({"Key": f"{key}.png", "Size": 1_500_000, "LastModified": stamp})
+            objects.append({"Key": f"{key}.json", "Size": 400, "LastModified": stamp})
+            batch.append((f"{key}.png", 1_500_000, stamp.timestamp(), None))
+            if len(batch) == 5000:
+                catalog.add_many(batch)
+                batch = []
+        catalog.add_many(batch)
+
+        # Cursor deep into the gallery, to show later pages cost the same
+        cursor = None
+        for _ in range(min(49, size // args.limit)):
+            _, cursor = catalog.latest(limit=args.limit, cursor=cursor)
+
+        legacy = time_call(lambda: legacy_page(objects, args.limit), args.repeat)
+        first = time_call(lambda: catalog.latest(limit=args.limit), args.repeat)
+        deep = time_call(lambda: catalog.latest(limit=args.limit, cursor=cursor), args.repeat)
+        print(f"{size:>8} {legacy:>10.2f} {first:>11.2f} {deep:>11.2f}")
+        redis_conn.delete(f"{namespace}:index", f"{namespace}:entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Load test: mem0-mcp search latency with inline vs. micro-batched inference.
+
+Simulates the search handler (encode query -> Qdrant search -> rerank) with
+a stand-in encoder/reranker whose cost is a fixed per-call overhead plus a
+small per-item cost, like a batched transformer forward pass. Runs one
+request alone, then N concurrent requests, and reports p50/p99.
+
+- inline: encode()/predict() called directly in the async handler (the
+  previous behaviour; blocks the event loop)
+- batched: InferenceEngine micro-batching on a dedicated executor
+
+Usage:
+    PYTHONPATH=services/mem0-mcp/src python tests/benchmarks/benchmark_mem0_search.py --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from mem0_mcp.inference import InferenceEngine
+
+
+class SimulatedModel:
+    def __init__(self, call_ms: float, item_ms: float) -> None:
+        self.call_s = call_ms / 1000
+        self.item_s = item_ms / 1000
+
+    def _run(self, count: int) -> None:
+        time.sleep(self.call_s + self.item_s * count)  # releases the GIL like torch
+
+    def encode(self, texts):
+        batch = [texts] if isinstance(texts, str) else texts
+        self._run(len(batch))
+        vectors = [[float(len(text)), 1.0] for text in batch]
+        return vectors[0] if isinstance(texts, str) else vectors
+
+    def predict(self, pairs):
+        self._run(len(pairs))
+        return [0.5] * len(pairs)
+
+
+async def qdrant_search(limit: int):
+    await asyncio.sleep(0.003)
+    return [f"memory {i}" for i in range(limit)]
+
+
+async def inline_search(model: SimulatedModel, query: str) -> None:
+    model.encode(query)
+    hits = await qdrant_search(5)
+    model.predict([(query, hit) for hit in hits])
+
+
+async def batched_search(engine: InferenceEngine, query: str) -> None:
+    await engine.embed_query(query)
+    hits = await qdrant_search(5)
+    await engine.rerank(query, hits)
+
+
+async def timed(coro) -> float:
+    started = time.perf_counter()
+    await coro
+    return (time.perf_counter() - started) * 1000
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def run(concurrency: int, rounds: int, call_ms: float, item_ms: float) -> None:
+    model = SimulatedModel(call_ms, item_ms)
+    engine = InferenceEngine(model, model, model_name="bench", cache_size=0)
+    modes = {
+        "inline": lambda q: inline_search(model, q),
+        "batched": lambda q: batched_search(engine, q),
+    }
+
+    print(f"{'mode':>8}{'single ms':>11}{'p50 ms':>9}{'p99 ms':>9}   ({concurrency} concurrent x {rounds})")
+    for name, search in modes.items():
+        single = statistics.median([await timed(search(f"warm {i}")) for i in range(5)])
+        samples = []
+        for round_index in range(rounds):
+            samples += await asyncio.gather(
+                *(timed(search(f"q {round_index} {i}")) for i in range(concurrency))
+            )
+        print(f"{name:>8}{single:>11.1f}{percentile(samples, 50):>9.1f}{percentile(samples, 99):>9.1f}")
+    engine.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--call-ms", type=float, default=15.0, help="Fixed cost per model call")
+    parser.add_argument("--item-ms", type=float, default=0.3, help="Marginal cost per batch item")
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.rounds, args.call_ms, args.item_ms))
@@ -0,0 +1,111 @@
+"""Benchmark: research query dedup speed and paraphrase recall.
+
+Part 1 deduplicates N generated queries with the previous pairwise Jaccard
+loop and with ``deduplicate_queries`` (MinHash-LSH blocking, plus embedding
+confirmation when sentence-transformers is installed; embeddings are timed
+cold and from the per-query cache).
+
+Part 2 measures paraphrase recall and false merges on the bundled fixture
+(tests/benchmarks/data/query_paraphrases.json) for lexical-only dedup and
+for MiniLM embeddings at several cosine thresholds.
+
+Usage:
+    PYTHONPATH=services/brain/src:services/common/src \\
+        python tests/benchmarks/benchmark_query_dedup.py --queries 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import time
+from pathlib import Path
+
+from brain.research.search_dedup import (
+    deduplicate_queries,
+    get_query_embedder,
+    jaccard_similarity,
+    normalize_query,
+)
+
+FIXTURE = Path(__file__).parent / "data" / "query_paraphrases.json"
+
+TOPICS = ["PETG", "PLA", "ABS", "TPU", "nylon", "resin", "llama.cpp", "Qdrant", "Klipper", "MQTT",
+          "LoRA", "GGUF", "RAG", "MoE", "KV cache", "OctoPrint", "Bambu X1C", "Home Assistant"]
+ASPECTS = ["stringing", "warping", "adhesion", "speed", "cost", "latency", "memory", "tuning",
+           "safety", "storage", "benchmarks", "alternatives", "settings", "failure modes"]
+FRAMES = ["how to fix {t} {a}", "{t} {a} best practices", "why does {t} have {a} problems",
+          "{a} guide for {t} users", "{t} vs competitors {a}", "latest research on {t} {a}"]
+
+
+def generate_queries(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        query = rng.choice(FRAMES).format(t=rng.choice(TOPICS), a=rng.choice(ASPECTS))
+        if rng.random() < 0.5:
+            query += f" {rng.choice(['2024', 'reddit', 'guide', 'tips', 'forum'])} {i % 41}"
+        queries.append(query)
+    return queries
+
+
+def legacy_dedup(queries: list[str], threshold: float = 0.7) -> int:
+    canonical_map: dict[str, str] = {}
+    for query in queries:
+        normalized = normalize_query(query)
+        if normalized in canonical_map:
+            continue
+        if not any(jaccard_similarity(normalized, existing) >= threshold for existing in canonical_map):
+            canonical_map[normalized] = query
+    return len(canonical_map)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def merged(pair, **kwargs) -> bool:
+    return len(deduplicate_queries(list(pair), **kwargs).unique_queries) == 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.6, 0.7, 0.8])
+    args = parser.parse_args()
+    logging.getLogger("brain.research.search_dedup").setLevel(logging.WARNING)
+
+    queries = generate_queries(args.queries)
+    embedder = get_query_embedder()
+
+    unique, ms = timed(lambda: legacy_dedup(queries))
+    print(f"{'pairwise Jaccard (previous)':<34} {ms:9.1f} ms   unique {unique}")
+    result, ms = timed(lambda: deduplicate_queries(queries, max_queries=10**6, embedding_threshold=None))
+    print(f"{'MinHash-LSH, lexical only':<34} {ms:9.1f} ms   unique {len(result.unique_queries)}")
+    if embedder is not None:
+        result, ms = timed(lambda: deduplicate_queries(queries, max_queries=10**6, embedder=embedder))
+        print(f"{'LSH + MiniLM (cold embeddings)':<34} {ms:9.1f} ms   unique {len(result.unique_queries)}")
+        result, ms = timed(lambda: deduplicate_queries(queries, max_queries=10**6, embedder=embedder))
+        print(f"{'LSH + MiniLM (cached embeddings)':<34} {ms:9.1f} ms   unique {len(result.unique_queries)}")
+    else:
+        print("sentence-transformers not installed: embedding timings and recall skipped")
+
+    fixture = json.loads(FIXTURE.read_text())
+    paraphrases, distinct = fixture["paraphrases"], fixture["distinct"]
+    print(f"\nfixture: {len(paraphrases)} paraphrase pairs, {len(distinct)} distinct pairs")
+
+    configs = [("lexical only", {"embedding_threshold": None})]
+    if embedder is not None:
+        configs += [(f"MiniLM cosine >= {t}", {"embedding_threshold": t, "embedder": embedder}) for t in args.thresholds]
+    for label, kwargs in configs:
+        recall = sum(merged(pair, **kwargs) for pair in paraphrases) / len(paraphrases)
+        false_merges = sum(merged(pair, **kwargs) for pair in distinct) / len(distinct)
+        print(f"{label:<34} recall {recall:6.1%}   false merges {false_merges:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: per-iteration test latency, subprocess sandbox vs. warm pool.
+
+Runs the same small module + pytest file through ``CodeSandbox.run_tests``
+(fresh ``python -m pytest`` per call) and ``SandboxPool.run_tests`` (warm
+worker, fork per job), then a burst of concurrent candidates on the pool.
+
+Usage:
+    PYTHONPATH=services/coder-agent/src \\
+        python tests/benchmarks/benchmark_sandbox_pool.py --iterations 10 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from coder_agent.sandbox import CodeSandbox
+from coder_agent.sandbox_pool import SandboxPool
+
+CODE = """
+def fizzbuzz(n: int) -> str:
+    if n % 15 == 0:
+        return "FizzBuzz"
+    if n % 3 == 0:
+        return "Fizz"
+    if n % 5 == 0:
+        return "Buzz"
+    return str(n)
+"""
+
+TEST_CODE = """
+import pytest
+from module import fizzbuzz
+
+
+@pytest.mark.parametrize("n,expected", [(1, "1"), (3, "Fizz"), (5, "Buzz"), (15, "FizzBuzz")])
+def test_fizzbuzz(n, expected):
+    assert fizzbuzz(n) == expected
+"""
+
+
+def summarize(label: str, samples: list[float]) -> None:
+    ms = sorted(s * 1000 for s in samples)
+    print(f"{label:<28} median {statistics.median(ms):8.1f} ms   max {ms[-1]:8.1f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    sandbox = CodeSandbox(timeout_seconds=60)
+    samples = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        assert sandbox.run_tests(CODE, TEST_CODE).success
+        samples.append(time.perf_counter() - start)
+    summarize("subprocess sandbox", samples)
+
+    pool = SandboxPool(size=args.workers, timeout_seconds=60)
+    start = time.perf_counter()
+    await pool.start()
+    print(f"{'pool warm-up (one-time)':<28} {time.perf_counter() - start:13.2f} s")
+    try:
+        samples = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            assert (await pool.run_tests(CODE, TEST_CODE)).success
+            samples.append(time.perf_counter() - start)
+        summarize("warm pool, sequential", samples)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(pool.run_tests(CODE, TEST_CODE) for _ in range(args.workers * 4))
+        )
+        elapsed = time.perf_counter() - start
+        assert all(r.success for r in results)
+        print(f"{f'warm pool, {len(results)} concurrent':<28} total  {elapsed * 1000:8.1f} ms")
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
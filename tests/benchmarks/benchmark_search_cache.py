@@ -0,0 +1,135 @@
+"""Benchmark: event-loop stalls during concurrent search cache lookups.
+
+Runs N concurrent lookups (each checking several providers for one query)
+against the previous cache pattern (synchronous redis client called inside
+``async def``, one GET + HINCRBY per provider) and the two-tier
+``SearchCache`` (redis.asyncio, concurrent lookups coalesced into one
+pipelined round trip, L1 on repeat). A 1 ms ticker task records the longest gap the event loop could
+not run. Redis is fakeredis served over TCP, so every command is a real
+socket round trip; pass --redis-url to use a real server instead.
+
+Usage:
+    PYTHONPATH=services/brain/src:services/common/src \\
+        python tests/benchmarks/benchmark_search_cache.py --lookups 100 --providers 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+import redis
+import redis.asyncio as aioredis
+
+from brain.research.search_cache import SearchCache
+
+RESULTS = [{"title": f"result {i}", "url": f"https://example.com/{i}", "snippet": "x" * 200} for i in range(10)]
+
+
+def serve_fakeredis(ports) -> None:
+    from fakeredis import TcpFakeServer
+
+    server = TcpFakeServer(("127.0.0.1", 0))
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def async_client(url: str) -> aioredis.Redis:
+    pool = aioredis.BlockingConnectionPool.from_url(url, max_connections=16, decode_responses=True)
+    return aioredis.Redis(connection_pool=pool)
+
+
+class LegacySearchCache:
+    """The previous implementation's I/O pattern: blocking calls in async methods."""
+
+    def __init__(self, client: redis.Redis) -> None:
+        self._cache = SearchCache()  # key hashing only
+        self._redis = client
+
+    async def get(self, query: str, provider: str):
+        data = self._redis.get(self._cache._cache_key(query, provider))
+        if data:
+            self._redis.hincrby("kitt:search_cache:stats", "hits", 1)
+            return json.loads(data)
+        self._redis.hincrby("kitt:search_cache:stats", "misses", 1)
+        return None
+
+
+async def run(label: str, lookup, queries, providers) -> None:
+    gaps = []
+    stop = asyncio.Event()
+
+    async def ticker() -> None:
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    hits = await asyncio.gather(*(lookup(query, providers) for query in queries))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+
+    found = sum(1 for per_query in hits for hit in per_query if hit)
+    print(
+        f"{label:<30} total {elapsed * 1000:8.1f} ms   "
+        f"max loop stall {max(gaps) * 1000:7.1f} ms   hits {found}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=100)
+    parser.add_argument("--providers", type=int, default=3)
+    parser.add_argument("--redis-url", help="Benchmark against a real Redis (flushes kitt:search_cache:*)")
+    args = parser.parse_args()
+
+    server = None
+    if args.redis_url:
+        url = args.redis_url
+    else:
+        # Separate process so the server does not compete with the event loop for the GIL
+        ports = multiprocessing.Queue()
+        server = multiprocessing.Process(target=serve_fakeredis, args=(ports,), daemon=True)
+        server.start()
+        url = f"redis://127.0.0.1:{ports.get(timeout=10)}/0"
+
+    providers = [f"provider-{i}" for i in range(args.providers)]
+    queries = [f"how to tune pressure advance {i}" for i in range(args.lookups)]
+
+    cache = SearchCache(redis_client=async_client(url))
+    await cache.clear()
+    # Half of the (query, provider) pairs are cached
+    await cache.set_many([(q, p, RESULTS) for q in queries for p in providers[: (args.providers + 1) // 2]])
+
+    legacy = LegacySearchCache(redis.Redis.from_url(url, decode_responses=True))
+
+    async def legacy_lookup(query, providers):
+        return [await legacy.get(query, provider) for provider in providers]
+
+    async def cold_lookup(query, providers):
+        return await cold.get_many([(query, provider) for provider in providers])
+
+    await run("legacy (sync redis)", legacy_lookup, queries, providers)
+
+    cold = SearchCache(redis_client=async_client(url))
+    await run("two-tier, cold L1", cold_lookup, queries, providers)
+    await run("two-tier, warm L1", cold_lookup, queries, providers)
+
+    await cache.clear()
+    await cache.close()
+    await cold.close()
+    if server is not None:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""Benchmark: linear SimHash scan vs. banded SimHashIndex lookups.
+
+Stores N random 64-bit fingerprints, then looks up a mix of near-duplicates
+(1-3 flipped bits) and unrelated fingerprints with both approaches.
+
+Usage:
+    PYTHONPATH=services/research/src python tests/benchmarks/benchmark_simhash_index.py \
+        --fingerprints 100000 --queries 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from research.simhash_index import SimHashIndex
+
+
+def linear_is_duplicate(stored: list[int], query: int, max_distance: int) -> bool:
+    # Mirrors the pre-index SimHashDeduplicator.is_duplicate loop
+    for seen in stored:
+        if bin(seen ^ query).count("1") <= max_distance:
+            return True
+    return False
+
+
+def main(total: int, queries: int, max_distance: int, linear_sample: int) -> None:
+    rng = random.Random(42)
+    stored = [rng.getrandbits(64) for _ in range(total)]
+
+    probes = []
+    for i in range(queries):
+        if i % 2 == 0:
+            value = rng.choice(stored)
+            for bit in rng.sample(range(64), rng.randint(1, max_distance)):
+                value ^= 1 << bit
+            probes.append(value)
+        else:
+            probes.append(rng.getrandbits(64))
+
+    started = time.perf_counter()
+    index = SimHashIndex(max_distance=max_distance)
+    index.add_many(stored)
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = [match is not None for match in index.query_many(probes)]
+    indexed_s = time.perf_counter() - started
+
+    # The linear scan is slow enough that a sample is extrapolated
+    sample = probes[:linear_sample]
+    started = time.perf_counter()
+    linear = [linear_is_duplicate(stored, probe, max_distance) for probe in sample]
+    linear_s = (time.perf_counter() - started) * len(probes) / len(sample)
+    assert linear == indexed[: len(sample)], "index disagrees with linear scan"
+
+    print(f"{total} fingerprints, {len(probes)} lookups, hamming <= {max_distance}")
+    print(f"index build: {build_s * 1000:.0f} ms")
+    print(f"{'mode':<10}{'total s':>10}{'us/lookup':>12}")
+    print(f"{'linear':<10}{linear_s:>10.2f}{linear_s / len(probes) * 1e6:>12.1f}  (extrapolated)")
+    print(f"{'banded':<10}{indexed_s:>10.3f}{indexed_s / len(probes) * 1e6:>12.1f}")
+    print(f"speedup x{linear_s / indexed_s:.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fingerprints", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--max-distance", type=int, default=3)
+    parser.add_argument("--linear-sample", type=int, default=50)
+    args = parser.parse_args()
+    main(args.fingerprints, args.queries, args.max_distance, args.linear_sample)
@@ -0,0 +1,214 @@
+"""Unit tests for the watermarked analytics rollups (SQLite-backed)."""
+
+# ruff: noqa: E402
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.sqlite.base import SQLiteTypeCompiler
+from sqlalchemy.orm import sessionmaker
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/common/src"))
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.autonomous.analytics_rollup import (
+    EFFECTIVENESS_ROLLUP,
+    FAILURE_ROLLUP,
+    AnalyticsRollup,
+)
+from common.db.models import (
+    AnalyticsWatermark,
+    FailureReason,
+    Goal,
+    GoalEffectivenessDaily,
+    GoalStatus,
+    GoalType,
+    PrintFailureDaily,
+    PrintOutcome,
+)
+
+TABLES = [
+    Goal.__table__,
+    PrintOutcome.__table__,
+    AnalyticsWatermark.__table__,
+    PrintFailureDaily.__table__,
+    GoalEffectivenessDaily.__table__,
+]
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite with just the analytics tables (JSONB rendered as JSON)."""
+    original = getattr(SQLiteTypeCompiler, "visit_JSONB", None)
+    SQLiteTypeCompiler.visit_JSONB = lambda self, type_, **kw: "JSON"
+    try:
+        engine = create_engine("sqlite:///:memory:")
+        Goal.metadata.create_all(engine, tables=TABLES)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+    finally:
+        if original is not None:
+            SQLiteTypeCompiler.visit_JSONB = original
+        else:
+            del SQLiteTypeCompiler.visit_JSONB
+
+
+def make_outcome(completed_at, *, success=False, reason=FailureReason.warping, measured_at=None):
+    return PrintOutcome(
+        id=str(uuid.uuid4()),
+        job_id=str(uuid.uuid4()),
+        printer_id="printer",
+        material_id="pla",
+        success=success,
+        failure_reason=None if success else reason,
+        quality_score=Decimal("0"),
+        actual_duration_hours=Decimal("1"),
+        actual_cost_usd=Decimal("1"),
+        material_used_grams=Decimal("10"),
+        print_settings={},
+        started_at=completed_at - timedelta(hours=1),
+        completed_at=completed_at,
+        measured_at=measured_at or completed_at,
+    )
+
+
+def make_goal(measured_at, score, goal_type=GoalType.research, *, learn_from=True):
+    return Goal(
+        id=str(uuid.uuid4()),
+        goal_type=goal_type,
+        description="goal",
+        rationale="test",
+        estimated_budget=Decimal("1"),
+        status=GoalStatus.completed,
+        effectiveness_score=None if score is None else Decimal(str(score)),
+        outcome_measured_at=measured_at,
+        learn_from=learn_from,
+    )
+
+
+def brute_force_failures(outcomes, since):
+    counts = {}
+    for outcome in outcomes:
+        if not outcome.success and outcome.completed_at >= since:
+            key = outcome.failure_reason.value if outcome.failure_reason else "unknown"
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def test_failure_counts_exact_across_refreshes_and_window_edges(db_session):
+    rng = random.Random(7)
+    now = datetime(2026, 3, 1, 12, 0)
+    reasons = list(FailureReason)
+    outcomes = [
+        make_outcome(
+            now - timedelta(minutes=rng.randint(0, 60 * 24 * 60)),
+            success=rng.random() < 0.3,
+            reason=rng.choice(reasons),
+        )
+        for _ in range(400)
+    ]
+    db_session.add_all(outcomes[:300])
+    db_session.commit()
+
+    rollup = AnalyticsRollup(db_session)
+    since = now - timedelta(days=30, hours=5)  # window starts mid-day
+    assert rollup.failure_counts(since) == brute_force_failures(outcomes[:300], since)
+
+    rollup.refresh(now=now)
+    db_session.commit()
+    assert rollup.watermark(FAILURE_ROLLUP) == now
+    assert rollup.failure_counts(since) == brute_force_failures(outcomes[:300], since)
+
+    # New rows land after the watermark and are read live until the next refresh
+    for outcome in outcomes[300:]:
+        outcome.measured_at = now + timedelta(hours=1)
+    db_session.add_all(outcomes[300:])
+    db_session.commit()
+    assert rollup.failure_counts(since) == brute_force_failures(outcomes, since)
+
+    touched = rollup.refresh(now=now + timedelta(hours=2))
+    db_session.commit()
+    assert 0 < touched[FAILURE_ROLLUP] <= 100
+    assert rollup.failure_counts(since) == brute_force_failures(outcomes, since)
+    assert rollup.failure_counts(None) == brute_force_failures(outcomes, datetime.min)
+
+
+def test_refresh_only_folds_rows_past_the_watermark(db_session):
+    day = datetime(2026, 3, 1, 9, 0)
+    db_session.add_all([make_outcome(day), make_outcome(day)])
+    db_session.commit()
+
+    rollup = AnalyticsRollup(db_session)
+    rollup.refresh(now=day + timedelta(hours=1))
+    db_session.commit()
+    assert rollup.refresh(now=day + timedelta(hours=2))[FAILURE_ROLLUP] == 0
+    db_session.commit()
+
+    bucket = db_session.get(PrintFailureDaily, (day.date(), "warping"))
+    assert bucket.failure_count == 2
+
+    db_session.add(make_outcome(day + timedelta(hours=3)))
+    db_session.commit()
+    rollup.refresh(now=day + timedelta(hours=4))
+    db_session.commit()
+    db_session.refresh(bucket)
+    assert bucket.failure_count == 3
+
+
+def test_effectiveness_stats_match_source_rows(db_session):
+    now = datetime(2026, 3, 1, 12, 0)
+    goals = [
+        make_goal(now - timedelta(days=1), 80),
+        make_goal(now - timedelta(days=1), 90),
+        make_goal(now - timedelta(days=40), 20),
+        make_goal(now - timedelta(days=2), 50, GoalType.improvement),
+        make_goal(now - timedelta(days=2), None),  # unscored
+        make_goal(now - timedelta(days=2), 10, learn_from=False),
+        make_goal(None, 99),  # not measured yet
+    ]
+    db_session.add_all(goals)
+    db_session.commit()
+
+    rollup = AnalyticsRollup(db_session)
+    rollup.refresh(now=now)
+    db_session.commit()
+    db_session.add(make_goal(now + timedelta(minutes=5), 70))
+    db_session.commit()
+
+    stats = rollup.effectiveness_by_type()
+    assert stats["research"].count == 4
+    assert stats["research"].average == pytest.approx((80 + 90 + 20 + 70) / 4)
+    assert (stats["research"].minimum, stats["research"].maximum) == (20, 90)
+    assert stats["improvement"].count == 1
+
+    recent = rollup.effectiveness_by_type(since=now - timedelta(days=30))
+    assert recent["research"].count == 3
+    assert recent["research"].minimum == 70
+
+    assert rollup.watermark(EFFECTIVENESS_ROLLUP) == now
+
+
+def test_rebuild_refolds_history(db_session):
+    now = datetime(2026, 3, 1, 12, 0)
+    goal = make_goal(now - timedelta(days=1), 60)
+    db_session.add(goal)
+    db_session.commit()
+
+    rollup = AnalyticsRollup(db_session)
+    rollup.refresh(now=now)
+    db_session.commit()
+
+    goal.learn_from = False
+    db_session.commit()
+    assert rollup.effectiveness_by_type()["research"].count == 1  # stale bucket
+
+    rollup.rebuild(now=now)
+    db_session.commit()
+    assert rollup.effectiveness_by_type() == {}
@@ -0,0 +1,101 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+for src in (ROOT / "services" / "common" / "src", ROOT / "services" / "cad" / "src"):
+    if str(src) not in sys.path:
+        sys.path.insert(0, str(src))
+
+from cad.storage.artifact_catalog import ArtifactCatalog  # type: ignore  # noqa: E402
+from cad.storage.artifact_renamer import ArtifactRenamer  # type: ignore  # noqa: E402
+from cad.storage.artifact_store import ArtifactStore  # type: ignore  # noqa: E402
+
+
+def _write(root: Path, rel: str, size: int, mtime: float) -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    return tmp_path / "artifacts"
+
+
+@pytest.fixture
+def catalog(root: Path) -> ArtifactCatalog:
+    root.mkdir()
+    return ArtifactCatalog(root)
+
+
+def test_reconcile_indexes_tree_and_removes_stale_rows(root: Path, catalog: ArtifactCatalog):
+    _write(root, "glb/a.glb", 10, 1000)
+    stale = _write(root, "stl/b.stl", 20, 1001)
+    _write(root, "unknown/c.bin", 5, 1002)
+
+    assert catalog.reconcile() == {"added": 2, "updated": 0, "removed": 0}
+    stale.unlink()
+    _write(root, "glb/a.glb", 15, 1003)
+
+    assert catalog.reconcile() == {"added": 0, "updated": 1, "removed": 1}
+    assert catalog.stats() == {
+        "glb": {"count": 1, "size_bytes": 15},
+        "stl": {"count": 0, "size_bytes": 0},
+    }
+
+
+def test_keyset_pagination_walks_newest_first(root: Path, catalog: ArtifactCatalog):
+    for idx in range(5):
+        _write(root, f"glb/{idx}.glb", 1, 1000 + idx)
+    _write(root, "stl/same-time.stl", 1, 1004)
+    catalog.reconcile()
+
+    seen = []
+    cursor = None
+    while True:
+        page = catalog.list(limit=2, cursor=cursor)
+        assert page.total == 6
+        seen.extend(entry.path for entry in page.entries)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [
+        "stl/same-time.stl",
+        "glb/4.glb",
+        "glb/3.glb",
+        "glb/2.glb",
+        "glb/1.glb",
+        "glb/0.glb",
+    ]
+
+    glb_page = catalog.list("glb", limit=10)
+    assert glb_page.total == 5
+    assert glb_page.next_cursor is None
+    assert catalog.list(limit=2, offset=4).entries[0].path == "glb/1.glb"
+
+
+def test_invalid_cursor_is_rejected(catalog: ArtifactCatalog):
+    with pytest.raises(ValueError):
+        catalog.list(cursor="not-a-cursor")
+
+
+def test_store_and_renamer_hooks_keep_catalog_current(root: Path, catalog: ArtifactCatalog):
+    store = ArtifactStore(local_root=root, catalog=catalog)
+    first = store.save_bytes(b"mesh", ".glb", "glb")
+    second = store.save_bytes(b"mesh", ".glb", "glb")
+    assert catalog.count("glb") == 2
+
+    renamed = ArtifactRenamer(catalog=catalog).rename_file(first, str(root / "glb" / "duck_abcd.glb"))
+    assert renamed is not None
+    paths = {entry.path for entry in catalog.list("glb").entries}
+    assert paths == {"glb/duck_abcd.glb", f"glb/{Path(second).name}"}
+
+    store.release(second)
+    assert catalog.count("glb") == 1
+    assert catalog.stats()["glb"] == {"count": 1, "size_bytes": 4}
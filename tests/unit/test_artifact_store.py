@@ -0,0 +1,107 @@
+import hashlib
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+for src in (ROOT / "services" / "common" / "src", ROOT / "services" / "cad" / "src"):
+    if str(src) not in sys.path:
+        sys.path.insert(0, str(src))
+
+from cad.storage.artifact_store import ArtifactStore  # type: ignore  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ArtifactStore:
+    return ArtifactStore(local_root=tmp_path / "artifacts", chunk_size=16)
+
+
+def _blobs(root: Path) -> list[Path]:
+    return [path for path in (root / ".blobs").rglob("*") if path.is_file()]
+
+
+def test_save_bytes_deduplicates_identical_content(store: ArtifactStore, tmp_path: Path):
+    first = store.save_bytes(b"mesh-data" * 10, ".glb", "glb")
+    second = store.save_bytes(b"mesh-data" * 10, ".glb", "glb")
+    other = store.save_bytes(b"different", ".glb", "glb")
+
+    assert first != second
+    assert Path(first).read_bytes() == Path(second).read_bytes()
+    assert Path(first).stat().st_ino == Path(second).stat().st_ino
+    assert store.refcount(first) == 2
+    assert store.refcount(other) == 1
+    assert len(_blobs(tmp_path / "artifacts")) == 2
+
+
+def test_release_deletes_blob_at_zero_references(store: ArtifactStore, tmp_path: Path):
+    root = tmp_path / "artifacts"
+    first = store.save_bytes(b"payload", ".stl", "stl")
+    second = store.save_bytes(b"payload", ".stl", "stl")
+
+    assert store.release(first) is True
+    assert not Path(first).exists()
+    assert Path(second).read_bytes() == b"payload"
+    assert len(_blobs(root)) == 1
+
+    assert store.release(second) is True
+    assert _blobs(root) == []
+    assert store.release(second) is False
+
+
+def test_renaming_one_reference_keeps_others_intact(store: ArtifactStore):
+    first = store.save_bytes(b"shared", ".3mf", "3mf")
+    second = store.save_bytes(b"shared", ".3mf", "3mf")
+
+    renamed = Path(first).with_name("widget_abcd.3mf")
+    Path(first).rename(renamed)
+
+    assert Path(second).read_bytes() == b"shared"
+    assert store.refcount(str(renamed)) == 2
+
+
+def test_save_file_streams_from_disk(store: ArtifactStore, tmp_path: Path):
+    source = tmp_path / "model.step"
+    source.write_bytes(b"x" * 100)
+
+    location = store.save_file(source, ".step", "step")
+
+    assert Path(location).read_bytes() == b"x" * 100
+    assert Path(location).parent.name == "step"
+    assert not list((tmp_path / "artifacts" / ".staging").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_save_from_url_streams_in_chunks(store: ArtifactStore, tmp_path: Path):
+    payload = bytes(range(256)) * 8
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=payload)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        location = await store.save_from_url(
+            "http://example.com/model.glb", ".glb", "glb", client=client
+        )
+        again = await store.save_from_url(
+            "http://example.com/model.glb", ".glb", "glb", client=client
+        )
+
+    digest = hashlib.sha256(payload).hexdigest()
+    blob = tmp_path / "artifacts" / ".blobs" / digest[:2] / digest
+    assert blob.read_bytes() == payload
+    assert Path(location).read_bytes() == payload
+    assert store.refcount(again) == 2
+
+
+@pytest.mark.asyncio
+async def test_save_stream_cleans_up_staging_on_error(store: ArtifactStore, tmp_path: Path):
+    async def broken_stream():
+        yield b"partial"
+        raise RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        await store.save_stream(broken_stream(), ".glb", "glb")
+
+    assert not list((tmp_path / "artifacts" / ".staging").iterdir())
+    assert _blobs(tmp_path / "artifacts") == []
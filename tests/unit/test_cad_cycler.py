@@ -78,7 +78,11 @@ class DummyTripo:
 
 
 class DummyStore:
-    async def save_from_url(self, url: str, suffix: str):  # noqa: D401
+    def __init__(self):
+        self.streamed = []
+
+    async def save_from_url(self, url: str, suffix: str, subdir: str = None):  # noqa: D401
+        self.streamed.append(url)
         return f"stored:{url}{suffix}"
 
     def save_bytes(self, content: bytes, suffix: str, subdir: str = None):  # noqa: D401
@@ -130,10 +134,11 @@ async def test_cad_cycler_uses_image_refs_limit(tmp_path: Path):
 @pytest.mark.asyncio
 async def test_cad_cycler_prefers_tripo_convert(tmp_path: Path):
     tripo = DummyTripo()
+    store = DummyStore()
     cycler = CADCycler(
         zoo_client=DummyZoo(),
         tripo_client=tripo,
-        artifact_store=DummyStore(),
+        artifact_store=store,
         local_runner=None,
         freecad_runner=None,
         max_tripo_images=1,
@@ -152,6 +157,10 @@ async def test_cad_cycler_prefers_tripo_convert(tmp_path: Path):
     assert len(artifacts) == 1
     assert artifacts[0].artifact_type == "3mf"
     assert tripo.converts == [("task-1", "convert-1")]
+    # GLB and 3MF are streamed into storage, never buffered in memory
+    assert store.streamed == ["http://example.com/task-1.glb", "http://example.com/convert-1.3mf"]
+    assert artifacts[0].location == "stored:http://example.com/convert-1.3mf.3mf"
+    cycler._download_bytes.assert_not_awaited()
 
 
 @pytest.mark.asyncio
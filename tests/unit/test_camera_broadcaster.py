@@ -0,0 +1,143 @@
+import asyncio
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/gateway/src"))
+
+from gateway.cameras import (  # type: ignore  # noqa: E402
+    BINARY_HEADER,
+    Frame,
+    FrameBroadcaster,
+    scaling_available,
+)
+
+
+class FakeViewerSocket:
+    """Records what a viewer receives; each send takes ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.frames: list = []
+        self.control: list = []
+
+    async def _wait(self) -> None:
+        await asyncio.sleep(self.delay)
+
+    async def send_text(self, text: str) -> None:
+        await self._wait()
+        self.frames.append(json.loads(text))
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self._wait()
+        (length,) = BINARY_HEADER.unpack_from(data)
+        header = json.loads(data[BINARY_HEADER.size : BINARY_HEADER.size + length])
+        header["jpeg"] = data[BINARY_HEADER.size + length :]
+        self.frames.append(header)
+
+    async def send_json(self, message: dict) -> None:
+        await self._wait()
+        self.control.append(message)
+
+
+@pytest.mark.asyncio
+async def test_slow_viewer_does_not_throttle_camera_or_fast_viewers():
+    broadcaster = FrameBroadcaster()
+    fast = FakeViewerSocket(delay=0.0)
+    slow = FakeViewerSocket(delay=0.05)
+    broadcaster.add_viewer("fast", fast)
+    broadcaster.add_viewer("slow", slow)
+    broadcaster.subscribe("fast", "cam")
+    broadcaster.subscribe("slow", "cam")
+
+    total = 40
+    started = time.perf_counter()
+    for index in range(total):
+        broadcaster.publish("cam", b"jpeg-%d" % index)
+        await asyncio.sleep(0.005)  # ~200 fps camera
+    ingest_seconds = time.perf_counter() - started
+    await asyncio.sleep(0.2)
+
+    # Fast viewer saw every frame in order
+    assert [frame["seq"] for frame in fast.frames] == list(range(1, total + 1))
+    # Slow viewer skipped intermediate frames but still ends on the newest
+    assert len(slow.frames) < total / 2
+    assert slow.frames[-1]["seq"] == total
+    # Publishing never waited on the slow socket (40 x 50 ms would be 2 s)
+    assert ingest_seconds < 1.0
+
+    stats = {entry["viewer_id"]: entry for entry in broadcaster.snapshot()}
+    assert stats["fast"]["frames_dropped"] == 0
+    assert stats["slow"]["frames_dropped"] == total - len(slow.frames)
+    assert stats["slow"]["max_lag_ms"] >= stats["fast"]["max_lag_ms"]
+
+    await broadcaster.remove_viewer("fast")
+    await broadcaster.remove_viewer("slow")
+
+
+@pytest.mark.asyncio
+async def test_frame_is_encoded_once_for_all_viewers():
+    broadcaster = FrameBroadcaster()
+    sockets = [FakeViewerSocket() for _ in range(3)]
+    for index, socket in enumerate(sockets):
+        broadcaster.add_viewer(f"v{index}", socket, binary=index == 0)
+        broadcaster.subscribe(f"v{index}", "cam")
+
+    frame = broadcaster.publish("cam", b"\xff\xd8payload")
+    await asyncio.sleep(0.01)
+
+    assert frame.as_json() is frame.as_json()
+    assert frame.as_binary() is frame.as_binary()
+    assert sockets[0].frames[0]["jpeg"] == b"\xff\xd8payload"
+    assert sockets[1].frames[0]["jpeg_base64"] == "/9hwYXlsb2Fk"
+    for index in range(3):
+        await broadcaster.remove_viewer(f"v{index}")
+
+
+@pytest.mark.asyncio
+async def test_subscribe_replays_latest_frame_and_control_messages_queue():
+    broadcaster = FrameBroadcaster()
+    broadcaster.publish("cam", b"first")
+    broadcaster.publish("cam", b"second")
+
+    socket = FakeViewerSocket()
+    broadcaster.add_viewer("viewer", socket)
+    broadcaster.subscribe("viewer", "cam")
+    broadcaster.send_control({"type": "camera_left", "camera_id": "other"})
+    await asyncio.sleep(0.01)
+
+    assert [frame["seq"] for frame in socket.frames] == [2]
+    assert socket.control == [{"type": "camera_left", "camera_id": "other"}]
+    await broadcaster.remove_viewer("viewer")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not scaling_available(), reason="Pillow not installed")
+async def test_downscaled_variant_is_shared_and_snapped():
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (1280, 720), "red").save(buffer, format="JPEG")
+    frame = Frame(camera_id="cam", jpeg=buffer.getvalue(), seq=1)
+
+    small = await frame.scaled(300)
+    assert small is await frame.scaled(320)
+    assert small.width == 320
+    assert Image.open(io.BytesIO(small.jpeg)).size == (320, 180)
+    assert await frame.scaled(None) is frame
+
+
+def test_viewer_max_width_is_bounded():
+    from gateway.routes.cameras import MAX_VIEWER_WIDTH, parse_max_width  # type: ignore
+
+    assert parse_max_width(None) is None
+    assert parse_max_width(320) == 320
+    assert parse_max_width(MAX_VIEWER_WIDTH) == MAX_VIEWER_WIDTH
+    for bad in (0, -5, MAX_VIEWER_WIDTH + 1, 10**9, "320", 3.5, True):
+        with pytest.raises(ValueError):
+            parse_max_width(bad)
@@ -0,0 +1,199 @@
+"""Tests for the cross-session claim fingerprint index."""
+
+# ruff: noqa: E402
+import json
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research.claim_fingerprints import ClaimFingerprintIndex
+from brain.research.collective_evaluator import CollectiveEvaluator, LLMUsage
+from brain.research.extraction_schemas import ExtractedClaim
+from brain.research.metrics import CLAIM_EVALUATION_CALLS, CLAIM_EVALUATION_CALLS_SKIPPED, CLAIM_INDEX_LOOKUPS
+from brain.research.types import Claim
+
+
+class FakeEvaluator(CollectiveEvaluator):
+    """Scores every agent prompt 0.9 and records the prompts it was sent."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prompts = []
+
+    async def _call_llm(self, prompt):
+        self.prompts.append(prompt)
+        return json.dumps({"score": 0.9, "reasoning": "ok"}), LLMUsage(calls=1, prompt_tokens=300, completion_tokens=100)
+
+
+class FakeTableCursor:
+    """Emulates lookups and upserts against research_claim_index in memory.
+
+    Upserts follow the ON CONFLICT rules of ``_UPSERT_SQL`` and
+    ``_UPSERT_EVALUATION_SQL``; rows are stored as the ten looked-up columns
+    plus ``last_session_id``.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.rows = []
+
+    async def execute(self, sql, params=None):
+        self.pool.queries += 1
+        wanted = params[0]
+        self.rows = [tuple(self.pool.table[fp][:10]) for fp in wanted if fp in self.pool.table]
+
+    async def fetchall(self):
+        return self.rows
+
+    async def executemany(self, sql, rows):
+        self.pool.queries += 1
+        updates_scores = "entailment_score = EXCLUDED.entailment_score" in sql
+        for row in rows:
+            fingerprint, claim_id, text, claim_type, entail, prov, conf, evaluation, evidence, _, session = row
+            stored = self.pool.table.get(fingerprint)
+            if stored is None:
+                self.pool.table[fingerprint] = [
+                    fingerprint, claim_id, text, claim_type, entail, prov, conf, evaluation.obj, evidence, 1, session,
+                ]
+                continue
+            if updates_scores:
+                stored[4:7] = [entail, prov, conf]
+            if evaluation.obj != {}:
+                stored[7] = evaluation.obj
+            stored[8] += evidence
+            if session is not None and stored[10] != session:
+                stored[9] += 1
+            if session is not None:
+                stored[10] = session
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield FakeTableCursor(self.pool)
+
+
+class FakePool:
+    def __init__(self):
+        self.table = {}
+        self.queries = 0
+
+    @asynccontextmanager
+    async def connection(self):
+        yield FakeConnection(self)
+
+
+def make_claim(i, session_id="s1"):
+    return Claim(
+        id=f"{session_id}-claim-{i}", session_id=session_id, sub_question_id=None, text=f"claim {i}",
+        evidence=[], confidence=0.4, entailment_score=0.6, dedupe_fingerprint=f"fp-{i}",
+    )
+
+
+def make_extracted(count):
+    return [ExtractedClaim(claim_text=f"claim {i}") for i in range(count)]
+
+
+def counter(metric, **labels):
+    return metric.labels(**labels)._value.get()
+
+
+@pytest.mark.asyncio
+async def test_known_claims_found_with_one_query_and_reuse_scores():
+    pool = FakePool()
+    index = ClaimFingerprintIndex(pool)
+    first = [make_claim(i) for i in range(50)]
+    for claim in first:
+        claim.confidence = 0.9
+    await index.record_claims("s1", first)
+
+    known_before = counter(CLAIM_INDEX_LOOKUPS, result="known")
+    new_before = counter(CLAIM_INDEX_LOOKUPS, result="new")
+    pool.queries = 0
+    second = [make_claim(i, "s2") for i in range(40, 100)]
+    for claim in second:
+        claim.entailment_score = 0.0
+
+    new_claims = await index.apply_known(second)
+
+    assert pool.queries == 1
+    assert [c.dedupe_fingerprint for c in new_claims] == [f"fp-{i}" for i in range(50, 100)]
+    assert second[0].entailment_score == 0.6 and second[0].confidence == 0.9
+    assert second[-1].entailment_score == 0.0 and second[-1].confidence == 0.4
+    assert counter(CLAIM_INDEX_LOOKUPS, result="known") - known_before == 10
+    assert counter(CLAIM_INDEX_LOOKUPS, result="new") - new_before == 50
+
+    await index.record_claims("s2", second)
+    assert pool.table["fp-40"][9] == 2 and pool.table["fp-99"][9] == 1
+
+
+@pytest.mark.asyncio
+async def test_second_session_skips_evaluation_of_known_claims():
+    index = ClaimFingerprintIndex(FakePool())
+    claims = make_extracted(8)
+
+    first = FakeEvaluator(max_concurrency=4)
+    batch = await first.evaluate_batch(claims, budget=10**6, external_calls=100, claim_index=index)
+    assert batch.llm_calls == 24
+    assert all(entry[7]["decision"] == "accept" for entry in index.pool.table.values())
+
+    skipped_before = counter(CLAIM_EVALUATION_CALLS_SKIPPED, stage="collective_evaluation")
+    calls_before = counter(CLAIM_EVALUATION_CALLS, stage="collective_evaluation")
+    second = FakeEvaluator(max_concurrency=4)
+    repeat = make_extracted(10)  # 8 known claims and 2 new ones
+
+    batch = await second.evaluate_batch(repeat, budget=10**6, external_calls=100, claim_index=index)
+
+    assert [r.item_id for r in batch.results] == [c.id for c in repeat]
+    assert batch.accepted == 10
+    assert batch.llm_calls == 6
+    assert len(second.prompts) == 6
+    assert counter(CLAIM_EVALUATION_CALLS_SKIPPED, stage="collective_evaluation") - skipped_before == 24
+    assert counter(CLAIM_EVALUATION_CALLS, stage="collective_evaluation") - calls_before == 6
+    assert len(index.pool.table) == 10
+    # Reused results are not re-recorded, so known claims keep one session each
+    assert all(entry[9] == 1 for entry in index.pool.table.values())
+
+
+@pytest.mark.asyncio
+async def test_session_count_follows_distinct_sessions():
+    pool = FakePool()
+    index = ClaimFingerprintIndex(pool)
+
+    await index.record_claims("s1", [make_claim(1)])
+    await index.record_claims("s1", [make_claim(1)])  # same session, same claim
+    assert pool.table["fp-1"][9] == 1
+
+    await index.record_claims("s2", [make_claim(1, "s2")])
+    assert pool.table["fp-1"][9] == 2 and pool.table["fp-1"][10] == "s2"
+
+
+@pytest.mark.asyncio
+async def test_evaluation_record_keeps_session_scores():
+    pool = FakePool()
+    index = ClaimFingerprintIndex(pool)
+    extracted = make_extracted(2)
+    claim = make_claim(0)
+    claim.dedupe_fingerprint = extracted[0].dedupe_fingerprint
+    await index.record_claims("s1", [claim])
+
+    # A stored session record without an evaluation is evaluated, not reused
+    evaluator = FakeEvaluator(max_concurrency=4)
+    await evaluator.evaluate_batch(extracted, budget=10**6, external_calls=100, claim_index=index)
+
+    stored = pool.table[claim.dedupe_fingerprint]
+    assert stored[4] == 0.6 and stored[6] == 0.4  # entailment and confidence from the session
+    assert stored[7]["decision"] == "accept"
+    assert stored[9] == 1 and stored[10] == "s1"  # offline evaluation is not a session
@@ -0,0 +1,69 @@
+"""Tests for the bulk related-claim client used by research validation."""
+
+# ruff: noqa: E402
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research.claim_index import ClaimIndexClient, ClaimQuery
+
+
+def make_transport(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        results = [
+            {
+                "related_claims": [
+                    {
+                        "claim_id": f"related-{query['claim_text']}",
+                        "paper_id": "p1",
+                        "claim_text": "neighbour",
+                        "claim_type": "finding",
+                        "score": 0.8,
+                        "relation": "similar",
+                    }
+                ],
+                "count": 1,
+            }
+            for query in body["queries"]
+        ]
+        return httpx.Response(200, json={"results": results, "count": len(results)})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_300_claims_go_out_in_one_request_grouped_by_input():
+    requests = []
+    client = ClaimIndexClient(base_url="http://mem0")
+    queries = [ClaimQuery(claim_text=str(i), claim_id=f"c{i}") for i in range(300)]
+
+    async with httpx.AsyncClient(transport=make_transport(requests)) as http:
+        related = await client.find_related_batch(queries, client=http)
+
+    assert len(requests) == 1
+    assert len(related) == 300
+    assert related[42][0].claim_id == "related-42"
+    # Each claim excludes itself
+    assert requests[0]["queries"][42]["exclude_claim_ids"] == ["c42"]
+
+
+@pytest.mark.asyncio
+async def test_large_inputs_are_chunked_in_order():
+    requests = []
+    client = ClaimIndexClient(base_url="http://mem0", chunk_size=100)
+    queries = [ClaimQuery(claim_text=str(i)) for i in range(250)]
+
+    async with httpx.AsyncClient(transport=make_transport(requests)) as http:
+        related = await client.find_related_batch(queries, client=http)
+
+    assert [len(body["queries"]) for body in requests] == [100, 100, 50]
+    assert [group[0].claim_id for group in related] == [f"related-{i}" for i in range(250)]
+    assert await client.find_related_batch([]) == []
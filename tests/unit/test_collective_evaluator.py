@@ -0,0 +1,126 @@
+"""Tests for concurrent, budget-accounted collective claim evaluation."""
+
+# ruff: noqa: E402
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research.collective_evaluator import CollectiveEvaluator, LLMUsage
+from brain.research.extraction_schemas import EvaluationDecision, ExtractedClaim
+
+
+class FakeEvaluator(CollectiveEvaluator):
+    """Answers every agent prompt after a delay, reporting fixed token usage."""
+
+    def __init__(self, scores, delay=0.05, prompt_tokens=300, completion_tokens=100, delays=None, **kwargs):
+        super().__init__(**kwargs)
+        self.scores = scores  # agent keyword in prompt -> score
+        self.delay = delay
+        self.delays = delays or {}  # agent keyword in prompt -> delay override
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+
+    async def _call_llm(self, prompt):
+        delay = next((d for keyword, d in self.delays.items() if keyword in prompt), self.delay)
+        async with self._slot():
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.active -= 1
+        score = next(score for keyword, score in self.scores.items() if keyword in prompt)
+        usage = LLMUsage(calls=1, prompt_tokens=self.prompt_tokens, completion_tokens=self.completion_tokens)
+        return json.dumps({"score": score, "reasoning": "ok"}), usage
+
+
+GOOD = {"ACCURACY": 0.9, "NOVELTY": 0.8, "COHERENCE": 0.9}
+
+
+def make_claims(count):
+    return [ExtractedClaim(claim_text=f"claim {i}") for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_claims_evaluated_concurrently_up_to_slot_count():
+    evaluator = FakeEvaluator(GOOD, max_concurrency=6)
+    claims = make_claims(12)
+
+    start = time.perf_counter()
+    batch = await evaluator.evaluate_batch(claims, budget=10**6, external_calls=100)
+    elapsed = time.perf_counter() - start
+
+    assert [r.item_id for r in batch.results] == [c.id for c in claims]
+    assert batch.accepted == 12
+    assert evaluator.peak == 6
+    # 36 calls of 50 ms over 6 slots, not 12 sequential claims
+    assert elapsed < 0.6
+    assert batch.llm_calls == 36
+    assert batch.total_tokens_used == 36 * 400
+
+
+@pytest.mark.asyncio
+async def test_budget_uses_reported_tokens_and_bounds_overrun():
+    evaluator = FakeEvaluator(GOOD, max_concurrency=4, prompt_tokens=900, completion_tokens=100)
+
+    batch = await evaluator.evaluate_batch(make_claims(20), budget=10_000, external_calls=100)
+
+    # Each claim really costs 3000 tokens: later admissions use the observed average
+    assert batch.total_tokens_used == batch.items_evaluated * 3000
+    assert batch.total_tokens_used <= 10_000 + 3000
+    assert batch.items_evaluated < 20
+
+    evaluator = FakeEvaluator(GOOD, max_concurrency=4)
+    batch = await evaluator.evaluate_batch(make_claims(20), budget=10**6, external_calls=10)
+    assert batch.items_evaluated == 3
+    assert batch.llm_calls == 9
+
+
+@pytest.mark.asyncio
+async def test_two_rejecting_agents_cancel_the_third():
+    scores = {"ACCURACY": 0.1, "NOVELTY": 0.2, "COHERENCE": 0.9}
+    # One slot: accuracy and novelty run before coherence
+    evaluator = FakeEvaluator(scores, max_concurrency=1, delay=0.01)
+
+    result = await evaluator.evaluate_claim(make_claims(1)[0])
+
+    assert result.decision == EvaluationDecision.REJECT
+    assert sorted(result.dimension_scores) == ["accuracy", "novelty"]
+    # Coherence took the freed slot before the verdict: its request counts
+    assert result.usage.calls == len(evaluator.prompts)
+    await asyncio.sleep(0.02)
+    assert evaluator.active == 0
+
+    evaluator = FakeEvaluator({"ACCURACY": 0.1, "NOVELTY": 0.9, "COHERENCE": 0.9}, max_concurrency=1, delay=0.01)
+    result = await evaluator.evaluate_claim(make_claims(1)[0])
+    assert result.usage.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_agent_that_reached_the_server_is_charged():
+    scores = {"ACCURACY": 0.1, "NOVELTY": 0.2, "COHERENCE": 0.9}
+    evaluator = FakeEvaluator(scores, max_concurrency=3, delay=0.01, delays={"COHERENCE": 1.0})
+
+    result = await evaluator.evaluate_claim(make_claims(1)[0])
+
+    assert sorted(result.dimension_scores) == ["accuracy", "novelty"]
+    assert len(evaluator.prompts) == 3
+    assert result.usage.calls == 3
+    assert result.usage.total_tokens == 3 * 400
+
+    evaluator = FakeEvaluator(scores, max_concurrency=3, delay=0.01, delays={"COHERENCE": 1.0})
+    batch = await evaluator.evaluate_batch(make_claims(4), budget=10**6, external_calls=6)
+    # Two claims fit the call budget once the cancelled agents are charged
+    assert batch.items_evaluated == 2
+    assert batch.llm_calls == len(evaluator.prompts) == 6
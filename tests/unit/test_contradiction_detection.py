@@ -0,0 +1,130 @@
+"""Tests for indexed contradiction detection in research validation."""
+
+# ruff: noqa: E402
+import json
+import random
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research.validation.contradictions import (
+    ContradictionDetector,
+    CrossEncoderNLIScorer,
+    NegationScorer,
+)
+from brain.research.validation.pipeline import HallucinationDetector
+
+FIXTURE = json.loads((Path(__file__).parent / "data" / "contradiction_fixture.json").read_text())
+SENTENCES = FIXTURE["sentences"]
+GOLD = {tuple(pair) for pair in FIXTURE["contradictions"]}
+
+
+def predicted_pairs(detector):
+    found = detector.detect(" ".join(SENTENCES))
+    index = {sentence: i for i, sentence in enumerate(SENTENCES)}
+    return {tuple(sorted((index[c.first], index[c.second]))) for c in found}
+
+
+class FakeCrossEncoder:
+    """Returns [contradiction, entailment, neutral] probabilities from the labels."""
+
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, pairs, batch_size, apply_softmax, show_progress_bar):
+        self.batches.append(len(pairs))
+        index = {sentence: i for i, sentence in enumerate(SENTENCES)}
+        rows = []
+        for first, second in pairs:
+            pair = tuple(sorted((index.get(first, -1), index.get(second, -1))))
+            rows.append([0.9, 0.05, 0.05] if pair in GOLD else [0.1, 0.2, 0.7])
+        return np.array(rows)
+
+
+def test_index_only_proposes_pairs_sharing_subject_terms():
+    detector = ContradictionDetector(scorer=NegationScorer())
+
+    candidates = set(detector.candidate_pairs(SENTENCES))
+
+    # Every labeled contradiction is a candidate, out of a small fraction of all pairs
+    assert GOLD <= candidates
+    assert len(candidates) < len(SENTENCES) * (len(SENTENCES) - 1) // 2 // 10
+
+
+def test_negation_fallback_precision_on_labeled_fixture():
+    predicted = predicted_pairs(ContradictionDetector(scorer=NegationScorer()))
+
+    precision = len(predicted & GOLD) / len(predicted)
+    assert precision >= 0.7
+    assert len(predicted & GOLD) >= 5
+
+
+def test_nli_scores_batched_and_cached_by_pair():
+    scorer = CrossEncoderNLIScorer()
+    scorer._model = FakeCrossEncoder()
+    detector = ContradictionDetector(scorer=scorer)
+
+    assert predicted_pairs(detector) == GOLD
+    assert len(scorer._model.batches) == 1
+
+    # Re-validating the same synthesis hits the pair cache
+    predicted_pairs(detector)
+    assert len(scorer._model.batches) == 1
+
+
+def test_model_load_failure_falls_back_to_negation_once(monkeypatch):
+    attempts = []
+
+    def failing_cross_encoder(*args, **kwargs):
+        attempts.append(args)
+        raise OSError("model not cached and no network")
+
+    monkeypatch.setitem(
+        sys.modules, "sentence_transformers", types.SimpleNamespace(CrossEncoder=failing_cross_encoder)
+    )
+    scorer = CrossEncoderNLIScorer()
+    detector = ContradictionDetector(scorer=scorer)
+
+    assert predicted_pairs(detector) == predicted_pairs(ContradictionDetector(scorer=NegationScorer()))
+    predicted_pairs(detector)
+    assert len(attempts) == 1
+
+
+def test_cross_encoder_precision_on_labeled_fixture():
+    pytest.importorskip("sentence_transformers")
+    scorer = CrossEncoderNLIScorer()
+    if scorer._load_model() is None:  # model not cached and no network
+        pytest.skip("NLI model unavailable")
+
+    predicted = predicted_pairs(ContradictionDetector(scorer=scorer))
+
+    assert len(predicted & GOLD) / max(1, len(predicted)) >= 0.8
+
+
+@pytest.mark.asyncio
+async def test_long_synthesis_scores_few_candidates():
+    rng = random.Random(5)
+    sentences = [
+        f"Finding {i}: {rng.choice(SENTENCES)[:-1]} in test batch {i // 4} of series {i % 17}."
+        for i in range(400)
+    ]
+    calls = []
+
+    class CountingScorer(NegationScorer):
+        def score(self, pairs):
+            calls.append(len(pairs))
+            return super().score(pairs)
+
+    validator = HallucinationDetector(ContradictionDetector(scorer=CountingScorer()))
+
+    result = await validator.validate(" ".join(sentences))
+
+    assert len(calls) == 1
+    assert calls[0] <= 2000  # vs 79,800 pairwise comparisons
+    assert result.metadata["potential_contradictions"] == 3
@@ -0,0 +1,158 @@
+"""Tests for append-only, windowed conversation state persistence."""
+
+# ruff: noqa: E402
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.agents.types import AgentStep
+from brain.conversation.auto_persist import AutoPersistConversationState
+from brain.conversation.persistent_state import PersistentConversationStateManager
+
+CONVERSATION_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class RecordingPool:
+    """Minimal psycopg pool double that records statements per connection."""
+
+    def __init__(self, row=None):
+        self.row = row
+        self.transactions = []
+
+    @asynccontextmanager
+    async def connection(self):
+        statements = []
+        yield _Connection(self, statements)
+        self.transactions.append(statements)
+
+    def inserted_steps(self):
+        return [
+            row
+            for statements in self.transactions
+            for kind, _sql, rows in statements
+            if kind == "executemany"
+            for row in rows
+        ]
+
+
+class _Connection:
+    def __init__(self, pool, statements):
+        self._pool = pool
+        self._statements = statements
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield _Cursor(self._pool, self._statements)
+
+    async def commit(self):
+        self._statements.append(("commit", None, None))
+
+
+class _Cursor:
+    def __init__(self, pool, statements):
+        self._pool = pool
+        self._statements = statements
+
+    async def execute(self, sql, params=None):
+        self._statements.append(("execute", sql, params))
+
+    async def executemany(self, sql, rows):
+        self._statements.append(("executemany", sql, list(rows)))
+
+    async def fetchone(self):
+        return self._pool.row
+
+
+def make_state(pool, flush_window=0.05):
+    return AutoPersistConversationState(
+        conversation_id=CONVERSATION_ID,
+        user_id="user",
+        manager=PersistentConversationStateManager(pool),
+        flush_window=flush_window,
+    )
+
+
+@pytest.mark.asyncio
+async def test_steps_and_metadata_in_window_coalesce_into_one_write():
+    pool = RecordingPool()
+    state = make_state(pool)
+
+    for index in range(50):
+        state.add_step(AgentStep(thought=f"step {index}"))
+        state.update_metadata("iteration", index)
+    await asyncio.sleep(0.1)
+
+    assert len(pool.transactions) == 1
+    steps = pool.inserted_steps()
+    assert [index for _, index, _ in steps] == list(range(50))
+
+    # The next window only carries the new step
+    state.add_step(AgentStep(thought="step 50", action="search"))
+    await asyncio.sleep(0.1)
+    assert len(pool.transactions) == 2
+    assert [index for _, index, _ in pool.transactions[1][1][2]] == [50]
+    assert pool.transactions[1][1][2][0][2].obj["action"] == "search"
+
+
+@pytest.mark.asyncio
+async def test_hazard_confirmation_flushes_without_waiting_for_window():
+    pool = RecordingPool()
+    state = make_state(pool, flush_window=10)
+
+    state.add_step(AgentStep(thought="about to heat the bed"))
+    state.set_pending_confirmation("heat_bed", {"temp": 60}, "confirm", "medium", "heater")
+    assert await state.flush()
+
+    assert len(pool.transactions) == 1
+    header_params = pool.transactions[0][0][2]
+    assert header_params[3].obj["tool_name"] == "heat_bed"
+    assert len(pool.inserted_steps()) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_retried_on_next_flush():
+    pool = RecordingPool()
+    state = make_state(pool)
+    calls = []
+    original = state._manager.append
+
+    async def flaky_append(target, first_new_step):
+        calls.append(first_new_step)
+        if len(calls) == 1:
+            return False
+        return await original(target, first_new_step)
+
+    state._manager.append = flaky_append
+    state.add_step(AgentStep(thought="a"))
+    state.update_metadata("k", "v")
+    assert not await state.flush()
+    assert await state.flush()
+
+    assert calls == [0, 0]
+    assert len(pool.inserted_steps()) == 1
+    assert await state.flush()  # nothing pending
+    assert calls == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_get_rebuilds_state_from_header_and_steps():
+    steps = [
+        {"thought": "look", "action": "search", "action_input": {"q": "pla"}},
+        {"thought": "done", "is_final": True},
+    ]
+    pool = RecordingPool(row=(CONVERSATION_ID, CONVERSATION_ID, None, steps, None, {"k": 1}, None, None))
+    manager = PersistentConversationStateManager(pool)
+
+    state = await manager.get(CONVERSATION_ID)
+
+    assert [step.thought for step in state.history] == ["look", "done"]
+    assert state.history[0].action_input == {"q": "pla"}
+    assert state.history[1].is_final is True
+    assert state.metadata == {"k": 1}
+    assert "conversation_steps" in pool.transactions[0][0][1]
@@ -10,7 +10,12 @@ import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+import uuid
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.sqlite.base import SQLiteTypeCompiler
+from sqlalchemy.orm import sessionmaker
 
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT / "services/common/src"))
@@ -20,14 +25,51 @@ from brain.autonomous.feedback_loop import (
     FeedbackLoop,
     create_feedback_loop,
 )
-from common.db.models import Goal, GoalType, GoalStatus
+from common.db.models import (
+    AnalyticsWatermark,
+    Goal,
+    GoalEffectivenessDaily,
+    GoalStatus,
+    GoalType,
+)
 
 
 @pytest.fixture
 def db_session():
-    """Mock database session."""
-    session = MagicMock()
-    return session
+    """In-memory SQLite session with the goal analytics tables."""
+    # JSONB columns render as JSON on SQLite
+    original = getattr(SQLiteTypeCompiler, "visit_JSONB", None)
+    SQLiteTypeCompiler.visit_JSONB = lambda self, type_, **kw: "JSON"
+    try:
+        engine = create_engine("sqlite:///:memory:")
+        Goal.metadata.create_all(
+            engine,
+            tables=[
+                Goal.__table__,
+                AnalyticsWatermark.__table__,
+                GoalEffectivenessDaily.__table__,
+            ],
+        )
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+    finally:
+        if original is not None:
+            SQLiteTypeCompiler.visit_JSONB = original
+        else:
+            del SQLiteTypeCompiler.visit_JSONB
+
+
+def store_goals(session, goals):
+    """Persist goals; an instance repeated in the list is stored as distinct rows."""
+    seen = set()
+    for goal in goals:
+        if id(goal) in seen:
+            columns = {column.key: getattr(goal, column.key) for column in Goal.__table__.columns}
+            goal = Goal(**{**columns, "id": str(uuid.uuid4())})
+        seen.add(id(goal))
+        session.add(goal)
+    session.commit()
 
 
 @pytest.fixture
@@ -137,10 +179,8 @@ class TestAnalyzeHistoricalEffectiveness:
 
     def test_analyze_effectiveness_with_data(self, feedback_loop, db_session, measured_goals):
         """Test analyzing effectiveness with real goal data."""
-        # Mock database query to return measured goals
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = measured_goals
-        db_session.execute.return_value = mock_result
+        # Store measured goals
+        store_goals(db_session, measured_goals)
 
         analysis = feedback_loop.analyze_historical_effectiveness()
 
@@ -180,9 +220,7 @@ class TestAnalyzeHistoricalEffectiveness:
 
     def test_analyze_effectiveness_no_data(self, feedback_loop, db_session):
         """Test analysis with no measured goals."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, [])
 
         analysis = feedback_loop.analyze_historical_effectiveness()
 
@@ -193,9 +231,7 @@ class TestAnalyzeHistoricalEffectiveness:
         # Set one goal as measured 60 days ago
         measured_goals[0].outcome_measured_at = datetime.utcnow() - timedelta(days=60)
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = measured_goals
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, measured_goals)
 
         # Analyze with 30-day lookback
         analysis = feedback_loop.analyze_historical_effectiveness(lookback_days=30)
@@ -317,9 +353,7 @@ class TestGetAdjustmentFactor:
 
     def test_get_adjustment_without_analysis(self, feedback_loop, db_session, measured_goals):
         """Test getting adjustment factor computes analysis if not provided."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = measured_goals
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, measured_goals)
 
         factor = feedback_loop.get_adjustment_factor(GoalType.research)
 
@@ -328,9 +362,7 @@ class TestGetAdjustmentFactor:
 
     def test_get_adjustment_no_data(self, feedback_loop, db_session):
         """Test getting adjustment for goal type with no data."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, [])
 
         factor = feedback_loop.get_adjustment_factor(GoalType.research)
 
@@ -351,9 +383,7 @@ class TestLearningSummary:
 
     def test_get_learning_summary(self, feedback_loop, db_session, measured_goals):
         """Test generating learning summary."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = measured_goals
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, measured_goals)
 
         summary = feedback_loop.get_learning_summary()
 
@@ -370,9 +400,7 @@ class TestLearningSummary:
         """Test learning summary when disabled."""
         loop = FeedbackLoop(db_session, enabled=False)
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, [])
 
         summary = loop.get_learning_summary()
 
@@ -381,9 +409,7 @@ class TestLearningSummary:
 
     def test_get_recommendations(self, feedback_loop, db_session, measured_goals):
         """Test generating human-readable recommendations."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = measured_goals
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, measured_goals)
 
         recommendations = feedback_loop.get_recommendations()
 
@@ -400,10 +426,8 @@ class TestLearningSummary:
 
     def test_get_recommendations_not_active(self, feedback_loop, db_session):
         """Test recommendations when learning not yet active."""
-        # Return goals with no outcomes measured
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        db_session.execute.return_value = mock_result
+        # No goals with measured outcomes
+        store_goals(db_session, [])
 
         recommendations = feedback_loop.get_recommendations()
 
@@ -429,9 +453,7 @@ class TestLearningSummary:
         # Create 10 high effectiveness research goals (meet min_samples)
         goals = [high_eff_goal] * 10
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = goals
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, goals)
 
         recommendations = feedback_loop.get_recommendations()
 
@@ -457,9 +479,7 @@ class TestEdgeCases:
             learn_from=True,
         )
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [goal] * 10
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, [goal] * 10)
 
         analysis = feedback_loop.analyze_historical_effectiveness()
 
@@ -473,9 +493,7 @@ class TestEdgeCases:
         measured_goals[0].learn_from = False
         measured_goals[1].learn_from = False
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = measured_goals
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, measured_goals)
 
         # Analysis should only include goals with learn_from=True
         # (This tests the WHERE clause in the query)
@@ -498,9 +516,7 @@ class TestEdgeCases:
             learn_from=True,
         )
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [goal]
-        db_session.execute.return_value = mock_result
+        store_goals(db_session, [goal])
 
         # Should be filtered out by WHERE clause
         # (Testing the query logic)
@@ -0,0 +1,120 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/gateway/src"))
+
+from gateway.routes import fabrication  # type: ignore  # noqa: E402
+from gateway.upstream import UpstreamConfig, UpstreamRegistry  # type: ignore  # noqa: E402
+
+
+@pytest.fixture
+def fabrication_app(monkeypatch):
+    seen = []
+
+    def install(handler):
+        def recording(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return handler(request)
+
+        registry = UpstreamRegistry(
+            configs={
+                "fabrication": UpstreamConfig(
+                    name="fabrication", base_url="http://fabrication:8300", retry_backoff=0
+                )
+            },
+            transport=httpx.MockTransport(recording),
+        )
+        monkeypatch.setattr(sys.modules["gateway.upstream.registry"], "registry", registry)
+        app = FastAPI()
+        app.include_router(fabrication.router)
+        return TestClient(app), seen
+
+    return install
+
+
+def test_download_streams_range_requests(fabrication_app):
+    payload = bytes(range(256)) * 1024
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["range"] == "bytes=1024-"
+        return httpx.Response(
+            206,
+            headers={
+                "content-range": f"bytes 1024-{len(payload) - 1}/{len(payload)}",
+                "etag": '"abc"',
+                "accept-ranges": "bytes",
+            },
+            stream=httpx.ByteStream(payload[1024:]),
+        )
+
+    client, seen = fabrication_app(handler)
+    response = client.get(
+        "/api/fabrication/artifacts/parts/bracket.3mf", headers={"Range": "bytes=1024-"}
+    )
+
+    assert response.status_code == 206
+    assert response.content == payload[1024:]
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["content-range"].startswith("bytes 1024-")
+    assert response.headers["content-disposition"] == 'attachment; filename="bracket.3mf"'
+    assert seen[0].url.path == "/api/fabrication/artifacts/parts/bracket.3mf"
+
+
+def test_download_relays_not_modified(fabrication_app):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["if-none-match"] == '"v1"'
+        return httpx.Response(304, headers={"etag": '"v1"'})
+
+    client, _ = fabrication_app(handler)
+    response = client.get(
+        "/api/fabrication/segmentation/download/job-1", headers={"If-None-Match": '"v1"'}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"v1"'
+
+
+def test_download_maps_upstream_errors(fabrication_app):
+    client, _ = fabrication_app(lambda request: httpx.Response(404, text="no such job"))
+    response = client.get("/api/fabrication/slicer/jobs/missing/download")
+
+    assert response.status_code == 404
+
+
+def test_upload_forwards_raw_multipart_body(fabrication_app):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["content-type"].startswith("multipart/form-data; boundary=")
+        body = request.read()
+        assert b'filename="cube.stl"' in body
+        assert b"solid cube" in body
+        return httpx.Response(200, json={"path": "/app/artifacts/cube.stl"})
+
+    client, seen = fabrication_app(handler)
+    response = client.post(
+        "/api/fabrication/segmentation/upload",
+        files={"file": ("cube.stl", b"solid cube\nendsolid cube\n", "model/stl")},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"path": "/app/artifacts/cube.stl"}
+    assert len(seen) == 1
+
+
+def test_upload_rejects_oversized_body(fabrication_app, monkeypatch):
+    monkeypatch.setattr(fabrication, "MAX_MESH_UPLOAD_BYTES", 1024)
+    client, seen = fabrication_app(lambda request: httpx.Response(200, json={}))
+
+    response = client.post(
+        "/api/fabrication/segmentation/upload",
+        files={"file": ("big.stl", b"x" * 4096, "model/stl")},
+    )
+
+    assert response.status_code == 413
+    assert seen == []
@@ -0,0 +1,196 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/gateway/src"))
+
+from gateway.upstream import (  # type: ignore  # noqa: E402
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    UpstreamClient,
+    UpstreamConfig,
+    UpstreamRegistry,
+)
+
+
+def _client(handler, **overrides) -> UpstreamClient:
+    config = UpstreamConfig(
+        name="stub",
+        base_url="http://stub",
+        retry_backoff=0,
+        **overrides,
+    )
+    return UpstreamClient(config, transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_get_retries_connect_errors_then_succeeds():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) < 3:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client(handler, retries=2)
+    response = await client.get("http://stub/api/thing")
+
+    assert response.json() == {"ok": True}
+    assert len(calls) == 3
+    assert client.snapshot()["errors"] == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_replayed_after_read_error():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        raise httpx.ReadError("reset", request=request)
+
+    client = _client(handler, retries=3)
+    with pytest.raises(httpx.ReadError):
+        await client.post("/api/generate", json={"prompt": "duck"})
+
+    assert calls == ["POST"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_and_short_circuits():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        raise httpx.ConnectError("refused", request=request)
+
+    client = _client(handler, retries=0, breaker_threshold=2, breaker_reset_seconds=60)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            await client.get("/a")
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("/a")
+    # CircuitOpenError maps onto existing ConnectError handlers
+    assert issubclass(CircuitOpenError, httpx.ConnectError)
+    assert len(calls) == 2
+    assert client.snapshot()["circuit"] == "open"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_application_5xx_does_not_open_breaker():
+    def handler(request: httpx.Request) -> httpx.Response:
+        # e.g. brain research routes without DATABASE_URL
+        return httpx.Response(503, json={"detail": "database not configured"})
+
+    client = _client(handler, retries=0, breaker_threshold=2, breaker_reset_seconds=60)
+    for _ in range(5):
+        response = await client.get("/api/research/sessions")
+        assert response.status_code == 503
+
+    snapshot = client.snapshot()
+    assert snapshot["circuit"] == "closed"
+    assert snapshot["errors"] == 5
+    await client.aclose()
+
+
+def test_breaker_half_open_allows_single_trial():
+    now = [0.0]
+    breaker = CircuitBreaker("stub", threshold=1, reset_seconds=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    now[0] = 11
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_abandoned_half_open_trial_is_released():
+    outcomes = [httpx.ConnectError("refused"), RuntimeError("upload too large"), "hang", "ok"]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome == "hang":
+            await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    client = _client(handler, retries=0, breaker_threshold=1, breaker_reset_seconds=0)
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/a")
+
+    # The trial fails locally, then is cancelled: neither may wedge the breaker
+    with pytest.raises(RuntimeError):
+        await client.post("/upload", content=b"x")
+    task = asyncio.create_task(client.get("/a"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    response = await client.get("/a")
+    assert response.status_code == 200
+    assert client.snapshot()["circuit"] == "closed"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_session_applies_default_timeout_and_streams():
+    seen_timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, content=b"chunk-1chunk-2")
+
+    client = _client(handler)
+    async with client.session(timeout=180.0) as session:
+        await session.get("/slow")
+        async with session.stream("GET", "/file") as response:
+            body = b"".join([chunk async for chunk in response.aiter_bytes()])
+
+    assert body == b"chunk-1chunk-2"
+    assert seen_timeouts == [180.0, 180.0]
+    assert not client.is_closed
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_client_per_upstream():
+    registry = UpstreamRegistry(
+        configs={"cad": UpstreamConfig(name="cad", base_url="http://cad")},
+        transport=httpx.MockTransport(lambda request: httpx.Response(204)),
+    )
+    first = registry.get("cad")
+    assert registry.get("cad") is first
+    with pytest.raises(KeyError):
+        registry.get("unknown")
+
+    await registry.aclose()
+    assert first.is_closed
+    assert registry.get("cad") is not first
+    await registry.aclose()
+
+
+def test_config_reads_env_overrides(monkeypatch):
+    monkeypatch.setenv("GATEWAY_UPSTREAM_CODER_AGENT_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("GATEWAY_UPSTREAM_CODER_AGENT_TIMEOUT", "2.5")
+    monkeypatch.setenv("GATEWAY_UPSTREAM_CODER_AGENT_HTTP2", "true")
+
+    config = UpstreamConfig.from_env("coder-agent", "http://coder-agent:8092")
+
+    assert config.max_connections == 7
+    assert config.timeout == 2.5
+    assert config.http2 is True
@@ -0,0 +1,95 @@
+"""Tests for the images service gallery catalog."""
+
+# ruff: noqa: E402
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/images_service"))
+
+from catalog import ImageCatalog
+
+
+@pytest.fixture
+def catalog():
+    return ImageCatalog(fakeredis.FakeRedis())
+
+
+class FakePaginator:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def paginate(self, **kwargs):
+        self.calls.append(kwargs)
+        return iter(self.pages)
+
+
+class FakeS3:
+    def __init__(self, pages):
+        self.paginator = FakePaginator(pages)
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return self.paginator
+
+
+def test_latest_pages_newest_first_with_cursor(catalog):
+    for i in range(7):
+        catalog.add(f"images/{i:02d}.png", 100 + i, created_at=1_700_000_000 + i)
+    # Same timestamp: order falls back to the key, nothing is skipped
+    catalog.add("images/tie_a.png", 1, created_at=1_700_000_003)
+
+    seen = []
+    cursor = None
+    while True:
+        items, cursor = catalog.latest(limit=3, cursor=cursor)
+        seen.extend(item["key"] for item in items)
+        if cursor is None:
+            break
+
+    assert seen == [
+        "images/06.png",
+        "images/05.png",
+        "images/04.png",
+        "images/tie_a.png",
+        "images/03.png",
+        "images/02.png",
+        "images/01.png",
+        "images/00.png",
+    ]
+
+
+def test_re_adding_a_key_replaces_its_entry(catalog):
+    catalog.add("images/a.png", 10, created_at=1_700_000_000)
+    catalog.add("images/a.png", 20, created_at=1_700_000_100, meta={"request": {"prompt": "a cat"}})
+
+    items, cursor = catalog.latest(limit=10)
+
+    assert catalog.count() == 1
+    assert cursor is None
+    assert items[0]["size"] == 20
+    assert items[0]["prompt"] == "a cat"
+
+
+def test_backfill_indexes_pngs_from_every_page_once(catalog):
+    stamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    pages = [
+        {"Contents": [
+            {"Key": "images/a.png", "Size": 1, "LastModified": stamp},
+            {"Key": "images/a.json", "Size": 1, "LastModified": stamp},
+        ]},
+        {"Contents": [{"Key": "images/b.PNG", "Size": 2, "LastModified": stamp}]},
+        {},
+    ]
+    s3 = FakeS3(pages)
+
+    assert catalog.backfill_once(s3, "bucket", "images/") == 2
+    assert catalog.backfill_once(s3, "bucket", "images/") is None
+    assert len(s3.paginator.calls) == 1
+    assert catalog.count() == 2
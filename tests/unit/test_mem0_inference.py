@@ -0,0 +1,148 @@
+"""Tests for mem0-mcp micro-batched inference and Qdrant filter building."""
+
+# ruff: noqa: E402
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/mem0-mcp/src"))
+
+from mem0_mcp.filters import exclusion_filter, memory_filter
+from mem0_mcp.inference import EmbeddingCache, InferenceEngine, MicroBatcher
+
+
+class FakeEncoder:
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FakeReranker:
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs):
+        self.calls.append(list(pairs))
+        return [float(len(doc)) for _, doc in pairs]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_encode_call_off_the_loop():
+    encoder = FakeEncoder()
+    engine = InferenceEngine(encoder, model_name="m", window=0.01)
+
+    vectors = await asyncio.gather(*(engine.embed_query(f"query {i}") for i in range(32)))
+
+    assert len(encoder.calls) == 1
+    assert len(encoder.calls[0]) == 32
+    assert vectors[5] == [float(len("query 5")), 1.0]
+    assert encoder.threads == {"mem0-inference_0"}
+    engine.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_query_cache_normalizes_text_and_dedupes_within_batch():
+    encoder = FakeEncoder()
+    engine = InferenceEngine(encoder, model_name="m", window=0.01)
+
+    await asyncio.gather(engine.embed_query("Bed  adhesion"), engine.embed_query("Bed  adhesion"))
+    assert encoder.calls == [["Bed  adhesion"]]
+
+    await engine.embed_query("  bed ADHESION ")
+    assert len(encoder.calls) == 1
+    assert engine.stats()["query_cache_hits"] == 1
+
+    # Documents are encoded even if an equal query was cached
+    await engine.embed_documents(["bed adhesion"])
+    assert len(encoder.calls) == 2
+    engine.shutdown()
+
+
+def test_cache_is_keyed_by_model_and_bounded():
+    cache = EmbeddingCache(max_size=2)
+    cache.put("a", "x", [1.0])
+    assert cache.get("b", "x") is None
+    cache.put("a", "y", [2.0])
+    cache.get("a", "x")
+    cache.put("a", "z", [3.0])
+    assert cache.get("a", "y") is None  # least recently used
+    assert cache.get("a", "x") == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_rerank_batches_pairs_across_requests():
+    reranker = FakeReranker()
+    engine = InferenceEngine(FakeEncoder(), reranker, model_name="m", window=0.01)
+
+    first, second = await asyncio.gather(
+        engine.rerank("q1", ["a", "bbb"]), engine.rerank("q2", ["cc"])
+    )
+
+    assert first == [1.0, 3.0] and second == [2.0]
+    assert len(reranker.calls) == 1
+    assert await InferenceEngine(FakeEncoder(), model_name="m").rerank("q", ["a"]) is None
+    engine.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller_and_max_batch_splits():
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+
+    def batch_fn(items):
+        calls.append(len(items))
+        if "boom" in items:
+            raise ValueError("model failed")
+        return items
+
+    batcher = MicroBatcher(batch_fn, ThreadPoolExecutor(1), window=0.01, max_batch=4)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+    assert results == list(range(10))
+    assert calls == [4, 4, 2]
+
+    outcomes = await asyncio.gather(
+        batcher.submit("ok"), batcher.submit("boom"), return_exceptions=True
+    )
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+
+def test_tag_and_exclusion_filters_are_pushed_to_qdrant():
+    assert memory_filter() is None
+    assert memory_filter(user_id="u", include_tags=["dev"], exclude_tags=["meta"]) == {
+        "must": [
+            {"key": "user_id", "match": {"value": "u"}},
+            {"key": "tags", "match": {"any": ["dev"]}},
+        ],
+        "must_not": [{"key": "tags", "match": {"any": ["meta"]}}],
+    }
+    assert exclusion_filter("paper_id", []) is None
+    assert exclusion_filter("claim_id", ["c1"], ["t1"]) == {
+        "must": [{"key": "topic_ids", "match": {"any": ["t1"]}}],
+        "must_not": [{"key": "claim_id", "match": {"any": ["c1"]}}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_queries_are_one_encode_call_and_reuse_the_cache():
+    encoder = FakeEncoder()
+    engine = InferenceEngine(encoder, model_name="m", window=0.01, max_batch=128)
+    await engine.embed_query("claim 7")
+
+    texts = [f"claim {i}" for i in range(300)]
+    vectors = await engine.embed_queries(texts)
+
+    assert len(encoder.calls) == 2
+    assert len(encoder.calls[1]) == 299  # claim 7 came from the cache
+    assert vectors[7] == [float(len("claim 7")), 1.0]
+    assert len(vectors) == 300
+    engine.shutdown()
@@ -0,0 +1,192 @@
+"""Tests for coalesced, delta-based MQTT context publishing."""
+
+# ruff: noqa: E402
+import json
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+sys.path.append(str(ROOT / "services/common/src"))
+
+from brain.models.context import ConversationContext, DeviceSelection
+from brain.state.context_publisher import ContextPublisher, apply_merge_patch, merge_patch
+from brain.state.mqtt_context_store import MQTTContextStore
+
+
+class MessageInfo:
+    def __init__(self, acked=True):
+        self.acked = acked
+
+    def is_published(self):
+        return self.acked
+
+
+class InMemoryBroker:
+    """Retains messages and fans them out to subscribers, like mosquitto would."""
+
+    def __init__(self):
+        self.retained = {}
+        self.subscribers = []
+        self.messages = []
+        self.lock = threading.Lock()
+
+    def publish(self, topic, payload, retain):
+        data = json.dumps(payload, separators=(",", ":"))
+        with self.lock:
+            self.messages.append((topic, data, retain))
+            if retain:
+                self.retained[topic] = data
+            for subscriber in self.subscribers:
+                subscriber.receive(topic, data)
+
+    def subscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.append(subscriber)
+            for topic, data in self.retained.items():
+                subscriber.receive(topic, data)
+
+
+class FakeClient:
+    def __init__(self, broker, acked=True):
+        self.broker = broker
+        self.acked = acked
+        self.infos = []
+
+    def connect(self):
+        pass
+
+    def publish(self, topic, payload, options=None):
+        self.broker.publish(topic, payload, options.retain)
+        info = MessageInfo(self.acked)
+        self.infos.append(info)
+        return info
+
+
+class ContextSubscriber:
+    """Applies retained snapshots and merge-patch deltas per conversation."""
+
+    def __init__(self):
+        self.state = {}
+
+    def receive(self, topic, data):
+        parts = topic.split("/")
+        payload = json.loads(data)
+        if len(parts) == 3:
+            self.state[parts[2]] = payload
+        elif parts[3] == "delta":
+            self.state[parts[2]] = apply_merge_patch(self.state.get(parts[2], {}), payload["patch"])
+
+    def context(self, conversation_id):
+        return ConversationContext.model_validate(self.state[conversation_id])
+
+
+def test_merge_patch_round_trip():
+    old = {"a": 1, "b": {"x": 1, "y": 2}, "c": "keep", "d": 4}
+    new = {"a": 2, "b": {"x": 1, "z": 3}, "c": "keep", "e": None}
+
+    patch = merge_patch(old, new)
+
+    assert patch == {"a": 2, "b": {"y": None, "z": 3}, "d": None, "e": None}
+    assert apply_merge_patch(old, patch) == {"a": 2, "b": {"x": 1, "z": 3}, "c": "keep"}
+
+
+def test_chatty_updates_coalesce_and_subscribers_converge():
+    broker = InMemoryBroker()
+    live = ContextSubscriber()
+    broker.subscribe(live)
+    publisher = ContextPublisher(FakeClient(broker), window=0.05, snapshot_every=5, snapshot_interval=60)
+    store = MQTTContextStore(FakeClient(broker), publisher=publisher)
+
+    updates = 0
+    for burst in range(5):
+        for conversation in range(4):
+            for step in range(50):
+                context = ConversationContext(
+                    conversation_id=f"conv-{conversation}",
+                    last_intent=f"intent-{burst}-{step}",
+                    session_state={"turn": str(step), f"burst-{burst}": "seen"},
+                    device=DeviceSelection(device_id="printer", friendly_name="Bambu")
+                    if step % 2
+                    else None,
+                )
+                store.set_context(context)
+                updates += 1
+        assert store.flush(timeout=5)
+    store.close()
+
+    legacy_messages = updates  # one retained full publish per update
+    assert len(broker.messages) <= legacy_messages / 20
+    assert publisher.counts["coalesced"] >= updates - len(broker.messages)
+
+    late = ContextSubscriber()
+    broker.subscribe(late)
+    for conversation in range(4):
+        expected = store.get_context(f"conv-{conversation}")
+        assert live.context(f"conv-{conversation}") == expected
+        assert late.context(f"conv-{conversation}") == expected
+
+
+def test_deltas_are_compact_and_snapshots_periodic():
+    broker = InMemoryBroker()
+    live = ContextSubscriber()
+    broker.subscribe(live)
+    publisher = ContextPublisher(FakeClient(broker), window=0.0, snapshot_every=3, snapshot_interval=60)
+    big_state = {f"key-{i}": "x" * 100 for i in range(50)}
+
+    for turn in range(7):
+        publisher.submit("c1", {"conversation_id": "c1", "session_state": {**big_state, "turn": str(turn)}})
+        # Flush each turn so every update is its own publish window
+        assert publisher.flush(timeout=5)
+    publisher.stop()
+
+    deltas = [m for m in broker.messages if m[0] == "kitty/ctx/c1/delta"]
+    snapshots = [m for m in broker.messages if m[0] == "kitty/ctx/c1"]
+    assert len(deltas) == 6
+    assert all(len(data) < 100 for _, data, _ in deltas)
+    assert all(retain for _, _, retain in snapshots)
+    assert not any(retain for _, _, retain in deltas)
+    assert live.state["c1"]["session_state"]["turn"] == "6"
+
+
+def test_outbound_bound_defers_until_acknowledged():
+    broker = InMemoryBroker()
+    client = FakeClient(broker, acked=False)
+    publisher = ContextPublisher(client, window=0.01, max_outbound=2, snapshot_interval=60)
+
+    for turn in range(20):
+        publisher.submit(f"c{turn % 5}", {"conversation_id": f"c{turn % 5}", "last_intent": str(turn)})
+    assert not publisher.flush(timeout=0.3)
+    assert len(broker.messages) == 2
+    assert publisher.stats()["deferred"] > 0
+
+    for info in client.infos:
+        info.acked = True
+    client.acked = True
+    assert publisher.flush(timeout=5)
+    publisher.stop()
+
+    late = ContextSubscriber()
+    broker.subscribe(late)
+    assert {cid: state["last_intent"] for cid, state in late.state.items()} == {
+        "c0": "15", "c1": "16", "c2": "17", "c3": "18", "c4": "19"
+    }
+
+
+def test_idle_conversations_are_pruned_after_snapshot():
+    broker = InMemoryBroker()
+    live = ContextSubscriber()
+    broker.subscribe(live)
+    publisher = ContextPublisher(FakeClient(broker), window=0.0, snapshot_interval=60, idle_ttl=0.0)
+
+    publisher.submit("c1", {"conversation_id": "c1", "last_intent": "first"})
+    assert publisher.flush(timeout=5)
+    assert publisher.stats()["conversations"] == 0
+
+    publisher.submit("c1", {"conversation_id": "c1", "last_intent": "second"})
+    assert publisher.flush(timeout=5)
+    publisher.stop()
+
+    assert live.state["c1"]["last_intent"] == "second"
+    assert [m[0] for m in broker.messages] == ["kitty/ctx/c1", "kitty/ctx/c1"]
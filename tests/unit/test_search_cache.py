@@ -0,0 +1,113 @@
+"""Tests for the two-tier (in-process + Redis) search results cache."""
+
+# ruff: noqa: E402
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research.search_cache import INDEX_KEY, SearchCache
+
+RESULTS = [{"title": "Bambu X1C review", "url": "https://example.com/x1c"}]
+
+
+def make_cache(server, **kwargs):
+    client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    return SearchCache(redis_client=client, **kwargs), client
+
+
+async def wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_batch_get_uses_one_round_trip_and_fills_l1():
+    server = fakeredis.FakeServer()
+    cache, _ = make_cache(server)
+    providers = ["duckduckgo", "brave", "perplexity"]
+    assert await cache.set_many([("PLA  Warping", p, RESULTS) for p in providers[:2]]) == 2
+
+    # Fresh process: nothing in L1 yet
+    other, _ = make_cache(server)
+    calls = []
+    original = other._redis.pipeline
+    other._redis.pipeline = lambda **kw: calls.append(kw) or original(**kw)
+
+    hits = await other.get_many([("pla warping", p) for p in providers])
+    assert [h["results"] if h else None for h in hits] == [RESULTS, RESULTS, None]
+    assert hits[0]["cache_age"] >= 0
+    assert len(calls) == 1
+
+    # Second lookup is served from L1 without touching Redis
+    assert (await other.get("pla warping", "brave"))["results"] == RESULTS
+    assert len(calls) == 1
+
+    stats = await other.get_stats()
+    assert stats["hits"] == 3 and stats["l1_hits"] == 1 and stats["misses"] == 1
+    assert stats["entries"] == 2
+
+    await cache.close()
+    await other.close()
+
+
+@pytest.mark.asyncio
+async def test_entries_counted_from_index_and_clear_removes_everything():
+    cache, client = make_cache(fakeredis.FakeServer())
+    await cache.set_many([(f"query {i}", "brave", RESULTS) for i in range(5)])
+    await cache.set("short lived", "brave", RESULTS, ttl=1)
+    # Expired entries drop out of the index on the next stats call
+    await client.zadd(INDEX_KEY, {"kitt:search_cache:brave:gone": 1.0})
+
+    assert (await cache.get_stats())["entries"] == 6
+
+    assert await cache.clear() == 6
+    assert await client.keys("kitt:search_cache:*") == []
+    assert await cache.get("query 1", "brave") is None
+    assert (await cache.get_stats())["entries"] == 0
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_l1_is_bounded_and_invalidated_across_instances():
+    server = fakeredis.FakeServer()
+    writer, _ = make_cache(server)
+    reader, _ = make_cache(server, l1_max_entries=2)
+
+    await writer.set("q1", "brave", RESULTS)
+    for query in ("q1", "q2", "q3"):
+        await writer.set(query, "brave", RESULTS)
+        await reader.get(query, "brave")
+    assert len(reader._l1) == 2
+
+    # An overwrite or invalidation elsewhere evicts the reader's L1 copy
+    await wait_for(lambda: reader._subscriber is not None)
+    await asyncio.sleep(0.05)
+    await writer.set("q3", "brave", [{"title": "updated"}])
+    await wait_for(lambda: len(reader._l1) == 1)
+    assert (await reader.get("q3", "brave"))["results"] == [{"title": "updated"}]
+
+    assert await writer.invalidate("q3", "brave")
+    await wait_for(lambda: len(reader._l1) == 1 and reader._cache_key("q3", "brave") not in reader._l1)
+    assert await reader.get("q3", "brave") is None
+
+    await writer.close()
+    await reader.close()
+
+
+@pytest.mark.asyncio
+async def test_degrades_to_l1_without_redis():
+    cache = SearchCache()
+    cache._redis_available = False
+
+    assert await cache.set("offline", "brave", RESULTS) is False
+    assert (await cache.get("offline", "brave"))["results"] == RESULTS
+    assert (await cache.get_stats())["l1_entries"] == 1
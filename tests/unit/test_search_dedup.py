@@ -0,0 +1,135 @@
+"""Tests for research search query deduplication."""
+
+# ruff: noqa: E402
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research import search_dedup
+from brain.research.search_dedup import deduplicate_queries, jaccard_similarity, normalize_query
+
+TOPICS = ["PETG", "PLA", "ABS", "TPU", "nylon", "llama.cpp", "Qdrant", "Klipper", "MQTT", "LoRA"]
+ASPECTS = ["stringing", "warping", "adhesion", "speed", "cost", "latency", "memory", "tuning", "safety", "storage"]
+FRAMES = [
+    "how to fix {t} {a}",
+    "{t} {a} best practices",
+    "why does {t} have {a} problems",
+    "{a} guide for {t} users",
+]
+
+
+def generate_queries(count, seed=7):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        query = rng.choice(FRAMES).format(t=rng.choice(TOPICS), a=rng.choice(ASPECTS))
+        if rng.random() < 0.3:
+            query += f" {rng.choice(['2024', 'reddit', 'guide', 'tips'])}"
+        if rng.random() < 0.2:
+            query = query.upper()
+        queries.append(query)
+    return queries
+
+
+def pairwise_reference(queries, threshold):
+    """The previous O(n^2) algorithm: compare against every canonical."""
+    canonicals = []
+    mapping = {}
+    for query in queries:
+        query = query.strip()
+        normalized = normalize_query(query)
+        for existing_norm, canonical in canonicals:
+            if existing_norm == normalized or jaccard_similarity(normalized, existing_norm) >= threshold:
+                mapping[query] = canonical
+                break
+        else:
+            canonicals.append((normalized, query))
+            mapping[query] = query
+    return mapping
+
+
+class KeywordEmbedder:
+    """Deterministic stand-in for MiniLM: texts sharing a concept share a vector."""
+
+    def __init__(self, concepts, dim=384, seed=3):
+        rng = np.random.RandomState(seed)
+        self.concepts = {word: rng.randn(dim) for word in concepts}
+        self.rng = rng
+        self.dim = dim
+        self.calls = 0
+
+    def encode(self, texts):
+        self.calls += 1
+        rows = []
+        for text in texts:
+            vector = sum((v for w, v in self.concepts.items() if w in text), np.zeros(self.dim))
+            vector = vector + 0.05 * self.rng.randn(self.dim)
+            rows.append(vector / np.linalg.norm(vector))
+        return np.array(rows, dtype=np.float32)
+
+
+def test_lexical_dedup_matches_pairwise_reference():
+    queries = generate_queries(600)
+
+    result = deduplicate_queries(queries, similarity_threshold=0.7, max_queries=1000, embedding_threshold=None)
+
+    assert result.original_to_canonical == pairwise_reference(queries, 0.7)
+    assert result.unique_queries == list(dict.fromkeys(result.original_to_canonical.values()))
+    assert result.duplicates_removed == len(queries) - len(result.unique_queries)
+
+
+def test_paraphrases_merge_through_embeddings():
+    embedder = KeywordEmbedder(["quantiz", "compress", "warp", "lifting"])
+    embedder.concepts["compress"] = embedder.concepts["quantiz"]
+    embedder.concepts["lifting"] = embedder.concepts["warp"]
+    queries = [
+        "LLM quantization",
+        "compressing large language model weights",
+        "reduce warping on large prints",
+        "prevent corners lifting on big 3D prints",
+        "llm QUANTIZATION",
+    ]
+
+    result = deduplicate_queries(queries, embedder=embedder)
+
+    assert result.unique_queries == ["LLM quantization", "reduce warping on large prints"]
+    assert result.get_canonical("compressing large language model weights") == "LLM quantization"
+    assert result.get_canonical("prevent corners lifting on big 3D prints") == "reduce warping on large prints"
+    assert result.get_canonical("llm QUANTIZATION") == "LLM quantization"
+    assert result.map_results({"LLM quantization": [{"url": "u"}]})["compressing large language model weights"] == [
+        {"url": "u"}
+    ]
+    # One batched encode per call
+    assert embedder.calls == 1
+
+    lexical = deduplicate_queries(queries, embedding_threshold=None)
+    assert len(lexical.unique_queries) == 4
+
+
+def test_two_thousand_queries_need_few_exact_comparisons(monkeypatch):
+    queries = [f"{q} variant {i % 97}" for i, q in enumerate(generate_queries(2000, seed=11))]
+    embedder = KeywordEmbedder(TOPICS + ASPECTS)
+    comparisons = []
+    exact_jaccard = search_dedup._jaccard
+
+    def counting_jaccard(words1, words2):
+        comparisons.append(1)
+        return exact_jaccard(words1, words2)
+
+    monkeypatch.setattr(search_dedup, "_jaccard", counting_jaccard)
+
+    result = deduplicate_queries(queries, max_queries=5000, embedder=embedder)
+
+    distinct = len({normalize_query(q) for q in queries})
+    assert set(result.original_to_canonical) == {q.strip() for q in queries}
+    assert 0 < len(result.unique_queries) < len(queries)
+    # The pairwise scan checks every query against every canonical; LSH
+    # candidates keep it to at most one exact Jaccard per distinct query
+    assert len(comparisons) <= distinct
+    assert len(comparisons) < distinct * len(result.unique_queries) / 10
+    assert embedder.calls == 1
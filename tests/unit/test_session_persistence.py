@@ -0,0 +1,167 @@
+"""Tests for bulk persistence of research session findings, claims and evidence."""
+
+# ruff: noqa: E402
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research.claim_fingerprints import ClaimFingerprintIndex
+from brain.research.session_manager import ResearchSessionManager
+from brain.research.types import Claim, EvidenceSpan
+
+
+class FakeCopy:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def write_row(self, row):
+        self.rows.append(row)
+
+
+class FakeCursor:
+    def __init__(self, log, missing_tables=()):
+        self.log = log
+        self.missing_tables = missing_tables
+
+    async def execute(self, sql, params=None):
+        self.log.append(("execute", " ".join(sql.split()), params))
+
+    async def executemany(self, sql, rows):
+        for table in self.missing_tables:
+            if table in sql:
+                raise RuntimeError(f'relation "{table}" does not exist')
+        self.log.append(("executemany", " ".join(sql.split()), list(rows)))
+
+    @asynccontextmanager
+    async def copy(self, statement):
+        rows = []
+        yield FakeCopy(rows)
+        self.log.append(("copy", statement, rows))
+
+
+class FakeConnection:
+    def __init__(self, log, missing_tables=()):
+        self.log = log
+        self.missing_tables = missing_tables
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.log.append(("begin",))
+        try:
+            yield
+        except BaseException:
+            self.log.append(("rollback",))
+            raise
+        self.log.append(("commit",))
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield FakeCursor(self.log, self.missing_tables)
+
+
+class FakePool:
+    def __init__(self, missing_tables=()):
+        self.log = []
+        self.missing_tables = missing_tables
+
+    @asynccontextmanager
+    async def connection(self):
+        yield FakeConnection(self.log, self.missing_tables)
+
+
+def make_manager(missing_tables=()):
+    manager = ResearchSessionManager.__new__(ResearchSessionManager)
+    manager.pool = FakePool(missing_tables)
+    manager.claim_index = ClaimFingerprintIndex(manager.pool)
+    return manager
+
+
+def make_claim(i, evidence_count):
+    evidence = [
+        EvidenceSpan(source_id=f"src-{j}", url=f"https://example.com/{j}", title="t", quote=f"quote {i}.{j}")
+        for j in range(evidence_count)
+    ]
+    return Claim(
+        id=f"claim-{i}", session_id="s1", sub_question_id=None, text=f"claim {i}", evidence=evidence,
+        confidence=0.5, dedupe_fingerprint=f"fp-{i}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_claims_and_evidence_written_with_constant_round_trips():
+    manager = make_manager()
+    claims = [make_claim(i, 5) for i in range(1000)]
+    # A repeated claim id keeps the later values, like row-by-row upserts did
+    claims.append(make_claim(3, 0))
+    claims[-1].confidence = 0.9
+
+    await manager._persist_claims("s1", {"claims": claims})
+
+    log = manager.pool.log
+    assert [entry[0] for entry in log] == [
+        "begin", "execute", "copy", "execute", "copy", "begin", "executemany", "commit", "commit"
+    ]
+    assert "CREATE TEMP TABLE research_claims_stage" in log[1][1]
+    assert log[2][1].startswith("COPY research_claims_stage (id, session_id")
+    assert "ON CONFLICT (id) DO UPDATE" in log[3][1]
+    assert log[4][1].startswith("COPY research_evidence (id, claim_id")
+
+    claim_rows, evidence_rows = log[2][2], log[4][2]
+    assert len(claim_rows) == 1000
+    assert claim_rows[3][0] == "claim-3" and claim_rows[3][7] == 0.9
+    assert len(evidence_rows) == 5000
+    assert len({row[0] for row in evidence_rows}) == 5000
+    assert evidence_rows[0][1:] == ("claim-0", "src-0", "https://example.com/0", "t", "quote 0.0", None, None)
+
+    # Under a savepoint: the claims are recorded in the cross-session fingerprint index
+    assert log[6][1].startswith("INSERT INTO research_claim_index")
+    index_rows = log[6][2]
+    assert len(index_rows) == 1001
+    assert index_rows[0][:3] == ("fp-0", "claim-0", "claim 0") and index_rows[0][8:] == (5, "s1", "s1")
+
+
+@pytest.mark.asyncio
+async def test_claims_committed_when_claim_index_is_missing():
+    manager = make_manager(missing_tables=("research_claim_index",))
+
+    await manager._persist_claims("s1", {"claims": [make_claim(i, 2) for i in range(10)]})
+
+    log = manager.pool.log
+    # Only the savepoint rolls back; claims and evidence still commit
+    assert [entry[0] for entry in log] == ["begin", "execute", "copy", "execute", "copy", "begin", "rollback", "commit"]
+    assert len(log[2][2]) == 10 and len(log[4][2]) == 20
+
+
+@pytest.mark.asyncio
+async def test_findings_copied_with_resolved_source_metadata():
+    manager = make_manager()
+    state = {
+        "findings": [
+            {"tool": "web_search", "content": "PETG strings at 250C", "confidence": 0.7, "iteration": 2,
+             "citations": ["https://a.example", "https://unknown.example"]},
+            {"content": "no citations"},
+        ],
+        "sources": [{"url": "https://a.example", "title": "A", "snippet": "s", "relevance": 0.4, "tool": "web"}],
+    }
+
+    await manager._persist_findings_and_sources("s1", state)
+
+    log = manager.pool.log
+    assert [entry[0] for entry in log] == ["begin", "copy", "commit"]
+    rows = log[1][2]
+    assert [row[:5] for row in rows] == [
+        ("s1", "web_search", "PETG strings at 250C", 0.7, 2),
+        ("s1", "unknown", "no citations", 0.0, 0),
+    ]
+    assert rows[0][5].obj == [
+        {"url": "https://a.example", "title": "A", "snippet": "s", "relevance": 0.4, "tool": "web"},
+        {"url": "https://unknown.example"},
+    ]
+
+    await manager._persist_claims("s1", {"claims": []})
+    assert len(log) == 3
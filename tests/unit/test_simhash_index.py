@@ -0,0 +1,100 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/research/src"))
+
+from research.simhash_index import SimHashIndex  # type: ignore  # noqa: E402
+
+
+def _flip(value: int, bits: list[int]) -> int:
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+def _linear_nearest(fingerprints, query, max_distance):
+    best = None
+    for candidate in fingerprints:
+        distance = (candidate ^ query).bit_count()
+        if distance <= max_distance and (best is None or distance < best[0]):
+            best = (distance, candidate)
+    return None if best is None else best[1]
+
+
+def test_query_matches_linear_scan():
+    rng = random.Random(7)
+    stored = [rng.getrandbits(64) for _ in range(2000)]
+    index = SimHashIndex(max_distance=3)
+    index.add_many(stored)
+
+    queries = []
+    for _ in range(300):
+        base = rng.choice(stored)
+        queries.append(_flip(base, rng.sample(range(64), rng.randint(0, 5))))
+    queries += [rng.getrandbits(64) for _ in range(100)]
+
+    for query, found in zip(queries, index.query_many(queries)):
+        expected = _linear_nearest(stored, query, 3)
+        assert (found is None) == (expected is None)
+        if found is not None:
+            assert (found ^ query).bit_count() == (expected ^ query).bit_count()
+
+
+def test_every_band_split_catches_worst_case_spread():
+    index = SimHashIndex(max_distance=3)
+    base = 0x0123456789ABCDEF
+    index.add(base)
+    # One flipped bit in each of three bands still leaves one band intact
+    assert index.query(_flip(base, [0, 20, 40])) == base
+    assert index.query(_flip(base, [0, 20, 40, 60])) is None
+    assert index.find_all(_flip(base, [5]), max_distance=1) == [base]
+    with pytest.raises(ValueError):
+        index.query(base, max_distance=4)
+
+
+def test_add_if_new_and_persistence(tmp_path):
+    index = SimHashIndex(max_distance=2)
+    assert index.add_if_new(0b1111)
+    assert not index.add_if_new(0b1110)  # near duplicate
+    assert index.add_if_new(1 << 63)
+    assert len(index) == 2
+
+    path = tmp_path / "session-42.simhash"
+    index.save(path)
+    restored = SimHashIndex.load(path)
+
+    assert restored.max_distance == 2
+    assert list(restored.fingerprints) == [0b1111, 1 << 63]
+    assert restored.query(0b0111) == 0b1111
+
+
+def test_deduplicator_batches_and_round_trips(tmp_path, monkeypatch):
+    from research.simhash import SimHashDeduplicator  # type: ignore
+
+    dedup = SimHashDeduplicator(similarity_threshold=3, min_content_length=1)
+    hashes = {"a": 0xFFFF0000FFFF0000, "a-ish": 0xFFFF0000FFFF0001, "b": 0x1234}
+    calls = []
+
+    def fake_hash(content):
+        calls.append(content)
+        return hashes.get(content)
+
+    monkeypatch.setattr(dedup, "compute_hash", fake_hash)
+
+    added = dedup.add_many([("a", "u1"), ("a-ish", "u2"), ("b", "u1"), ("b", "u3")])
+    assert added == [True, False, False, True]
+    # Hash computed once per checked page, never again when storing
+    assert calls == ["a", "a-ish", "b"]
+    assert dedup.is_duplicate_many([("a-ish", None), ("zzz", "u3")]) == [True, True]
+
+    path = tmp_path / "dedup.simhash"
+    dedup.save(path)
+    restored = SimHashDeduplicator.load(path, min_content_length=1)
+    monkeypatch.setattr(restored, "compute_hash", fake_hash)
+    assert restored.get_stats()["total_hashes"] == 2
+    assert restored.is_duplicate("a-ish")
+    assert restored.is_duplicate("new page", url="u3")
@@ -0,0 +1,139 @@
+"""Tests for concurrent academic source search in SourceRegistry."""
+
+# ruff: noqa: E402
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT / "services/brain/src"))
+
+from brain.research.sources.base import AcademicSource, PaperMetadata, RateLimitConfig, SourcePriority
+from brain.research.sources.registry import SourceRegistry
+
+
+class FakeSource(AcademicSource):
+    """Yields canned papers, one rate-limited request per paper after a delay."""
+
+    def __init__(self, name, papers, delay=0.0, priority=SourcePriority.ARXIV):
+        super().__init__(rate_limit=RateLimitConfig(requests_per_second=1000.0, burst_limit=1000))
+        self._name = name
+        self._papers = papers
+        self._delay = delay
+        self._priority = priority
+        self.closed = False
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def priority(self):
+        return self._priority
+
+    async def search(self, query, max_results=100, date_from=None, date_to=None, categories=None):
+        try:
+            for paper in self._papers[:max_results]:
+                await self._acquire_rate_limit()
+                await asyncio.sleep(self._delay)
+                yield paper
+        finally:
+            self.closed = True
+
+    async def get_paper(self, paper_id):
+        return None
+
+    async def get_full_text(self, paper):
+        return None
+
+
+def paper(source_id, title, **ids):
+    return PaperMetadata(source_id=source_id, title=title, abstract="", authors=[], **ids)
+
+
+def make_registry(*sources):
+    registry = SourceRegistry()
+    for source in sources:
+        registry.register(source)
+    return registry
+
+
+async def collect(agen):
+    start = time.perf_counter()
+    arrivals = []
+    async for item in agen:
+        arrivals.append((item.source_id, time.perf_counter() - start))
+    return arrivals, time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_sources_stream_concurrently_in_arrival_order():
+    slow = FakeSource("slow", [paper("slow:1", "Slow paper one"), paper("slow:2", "Slow paper two")], delay=0.2)
+    fast = FakeSource(
+        "fast", [paper("fast:1", "Fast paper one"), paper("fast:2", "Fast paper two")], delay=0.02,
+        priority=SourcePriority.CORE,
+    )
+    registry = make_registry(slow, fast)
+
+    arrivals, elapsed = await collect(registry.search_all("q"))
+
+    # Lower-priority but faster source comes first; total time is the slowest source, not the sum
+    assert [source_id for source_id, _ in arrivals] == ["fast:1", "fast:2", "slow:1", "slow:2"]
+    assert arrivals[0][1] < 0.1
+    assert elapsed < 0.55
+
+
+@pytest.mark.asyncio
+async def test_online_dedup_by_ids_and_normalized_title():
+    a = FakeSource("a", [
+        paper("a:1", "Attention Is All You Need", arxiv_id="1706.03762v5"),
+        paper("a:2", "Deep Residual Learning", doi="10.1109/CVPR.2016.90"),
+    ])
+    b = FakeSource("b", [
+        paper("b:1", "Attention is all you need (revised)", arxiv_id="1706.03762"),
+        paper("b:2", "Deep residual learning", doi="10.1109/cvpr.2016.90"),
+        paper("b:3", "attention is all you need!"),
+        paper("b:4", "Something else entirely", pubmed_id="123"),
+    ], delay=0.01)
+    registry = make_registry(a, b)
+
+    arrivals, _ = await collect(registry.search_all("q"))
+    assert [source_id for source_id, _ in arrivals] == ["a:1", "a:2", "b:4"]
+
+    arrivals, _ = await collect(registry.search_all("q", deduplicate=False))
+    assert len(arrivals) == 6
+
+
+@pytest.mark.asyncio
+async def test_stalled_source_cancelled_but_its_papers_kept():
+    stalled = FakeSource("stalled", [paper(f"stalled:{i}", f"Stalled {i}") for i in range(5)], delay=0.08)
+    quick = FakeSource("quick", [paper("quick:1", "Quick")])
+    registry = make_registry(stalled, quick)
+
+    arrivals, elapsed = await collect(registry.search_all("q", source_timeout=0.2))
+
+    ids = [source_id for source_id, _ in arrivals]
+    assert "quick:1" in ids
+    assert ids.count("stalled:0") == 1 and "stalled:4" not in ids
+    assert elapsed < 0.3
+    assert stalled.closed
+
+
+@pytest.mark.asyncio
+async def test_request_budget_limits_each_source_and_early_exit_cancels():
+    a = FakeSource("a", [paper(f"a:{i}", f"A {i}") for i in range(10)])
+    b = FakeSource("b", [paper(f"b:{i}", f"B {i}") for i in range(10)])
+    registry = make_registry(a, b)
+
+    arrivals, _ = await collect(registry.search_all("q", max_requests_per_source=3))
+    assert sorted(source_id for source_id, _ in arrivals) == ["a:0", "a:1", "a:2", "b:0", "b:1", "b:2"]
+
+    slow = FakeSource("slow", [paper(f"s:{i}", f"S {i}") for i in range(10)], delay=0.05)
+    registry = make_registry(slow)
+    results = registry.search_all("q")
+    assert (await results.__anext__()).source_id == "s:0"
+    await results.aclose()
+    assert slow.closed
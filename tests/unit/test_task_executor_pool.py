@@ -0,0 +1,142 @@
+"""
+Unit tests for TaskExecutor claiming and worker-pool execution.
+
+The claim query is checked against the PostgreSQL dialect; execution is
+exercised with claim/execute stubs so no database is required.
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from common.db.models import TaskStatus
+from brain.autonomous.task_executor import TaskExecutor, _parse_type_limits
+
+
+def make_executor(**kwargs) -> TaskExecutor:
+    return TaskExecutor(
+        session_factory=MagicMock(),
+        mcp_client=MagicMock(),
+        kb_updater=MagicMock(),
+        **kwargs,
+    )
+
+
+def test_ready_query_joins_dependency_and_skips_locked_rows():
+    executor = make_executor()
+    sql = str(
+        executor._ready_tasks_query(limit=10).compile(dialect=postgresql.dialect())
+    )
+
+    assert "LEFT OUTER JOIN tasks AS tasks_1 ON tasks.depends_on = tasks_1.id" in sql
+    assert "FOR UPDATE OF tasks SKIP LOCKED" in sql
+    assert "LIMIT" in sql
+
+    read_only = str(
+        executor._ready_tasks_query(limit=10, for_update=False).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "FOR UPDATE" not in read_only
+
+
+def test_claim_marks_tasks_in_progress_in_one_commit():
+    tasks = [
+        SimpleNamespace(id="t1", status=TaskStatus.pending, started_at=None,
+                        task_metadata={"task_type": "research_gather"}),
+        SimpleNamespace(id="t2", status=TaskStatus.pending, started_at=None, task_metadata={}),
+    ]
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.execute.return_value.scalars.return_value.all.return_value = tasks
+    executor = make_executor()
+    executor._session_factory = lambda: session
+
+    claimed = executor._claim_ready_tasks(limit=2)
+
+    assert claimed == [("t1", "research_gather"), ("t2", "unknown")]
+    assert all(task.status == TaskStatus.in_progress for task in tasks)
+    assert all(task.started_at is not None for task in tasks)
+    session.commit.assert_called_once()
+
+
+def test_parse_type_limits():
+    assert _parse_type_limits("kb_create:1, review_commit:2,bad,x:") == {
+        "kb_create": 1,
+        "review_commit": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_backlog_drains_in_parallel_within_caps():
+    executor = make_executor(max_workers=8, type_limits={"kb_create": 1})
+    backlog = [(f"r{i}", "research_gather") for i in range(90)]
+    backlog += [(f"k{i}", "kb_create") for i in range(10)]
+
+    lock = threading.Lock()
+    running = defaultdict(int)
+    peak = defaultdict(int)
+
+    def fake_execute(task_id):
+        kind = "kb_create" if task_id.startswith("k") else "research_gather"
+        with lock:
+            running["all"] += 1
+            running[kind] += 1
+            peak["all"] = max(peak["all"], running["all"])
+            peak[kind] = max(peak[kind], running[kind])
+        time.sleep(0.02)
+        with lock:
+            running["all"] -= 1
+            running[kind] -= 1
+        return SimpleNamespace(id=task_id, title=task_id)
+
+    executor._claim_ready_tasks = lambda limit: backlog[:limit]
+    executor._execute_claimed_task = fake_execute
+    executor._update_project_status_in_session = lambda: None
+
+    started = time.perf_counter()
+    executed = await executor.execute_ready_tasks(limit=100)
+    elapsed = time.perf_counter() - started
+
+    assert len(executed) == 100
+    assert peak["all"] == 8
+    assert peak["kb_create"] == 1
+    # Serial execution would take 100 x 20 ms
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_failed_tasks_are_not_reported_as_executed():
+    executor = make_executor(max_workers=2)
+    executor._claim_ready_tasks = lambda limit: [("ok", "x"), ("bad", "x")]
+    executor._execute_claimed_task = (
+        lambda task_id: SimpleNamespace(id=task_id, title=task_id) if task_id == "ok" else None
+    )
+    executor._update_project_status_in_session = lambda: None
+
+    executed = await executor.execute_ready_tasks(limit=5)
+
+    assert [task.id for task in executed] == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_worker_threads_do_not_outlive_the_cycle():
+    def worker_threads():
+        return [t for t in threading.enumerate() if t.name.startswith("task-executor")]
+
+    for _ in range(3):
+        executor = make_executor(max_workers=4)
+        executor._claim_ready_tasks = lambda limit: [(f"t{i}", "x") for i in range(4)]
+        executor._execute_claimed_task = lambda task_id: SimpleNamespace(id=task_id, title=task_id)
+        executor._update_project_status_in_session = lambda: None
+        assert len(await executor.execute_ready_tasks(limit=5)) == 4
+
+    for thread in worker_threads():
+        thread.join(timeout=5)
+    assert worker_threads() == []
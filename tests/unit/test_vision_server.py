@@ -36,3 +36,103 @@ async def test_image_filter_scores_by_keyword():
     scores = [item["score"] for item in result.data["results"]]
     assert scores[0] >= scores[-1]
     assert result.data["results"][0]["id"] == "1"
+
+
+class _FakeScorer:
+    """Stands in for ClipScorer: 'tensors' are the decoded byte strings."""
+
+    def __init__(self) -> None:
+        self.batches = []
+
+    def preprocess(self, image_bytes: bytes) -> bytes:
+        if image_bytes == b"corrupt":
+            raise ValueError("not an image")
+        return image_bytes
+
+    def score_batch(self, query: str, images):
+        self.batches.append(list(images))
+        return [0.5 if b"duck" in image else -0.5 for image in images]
+
+
+@pytest.mark.asyncio
+async def test_scoring_engine_downloads_concurrently_and_batches_inference():
+    import httpx
+
+    from mcp.servers.vision_scoring import ImageScoringEngine  # noqa: E402
+
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        name = request.url.path.strip("/")
+        if name == "missing":
+            return httpx.Response(404)
+        if name == "huge":
+            return httpx.Response(200, content=b"x" * 2048)
+        return httpx.Response(200, content=name.encode())
+
+    scorer = _FakeScorer()
+    engine = ImageScoringEngine(
+        scorer,
+        max_concurrency=4,
+        max_image_bytes=1024,
+        transport=httpx.MockTransport(handler),
+    )
+    urls = [f"http://img/duck-{i}" for i in range(30)] + [
+        "http://img/missing",
+        "http://img/huge",
+        "http://img/corrupt",
+        None,
+    ]
+    scores = await engine.score("rubber duck", urls)
+    await engine.aclose()
+
+    assert len(scorer.batches) == 1
+    assert len(scorer.batches[0]) == 30
+    assert scores[:30] == [0.5] * 30
+    assert scores[30:] == [None, None, None, None]
+    assert 1 < peak <= 4
+
+
+@pytest.mark.asyncio
+async def test_image_filter_blends_batched_clip_scores():
+    server = VisionMCPServer()
+
+    class _Engine:
+        async def score(self, query, urls):
+            return [0.8 if "duck" in url else None for url in urls]
+
+    server._clip_engine = _Engine()
+    server._clip_weight = 0.5
+    args = {
+        "query": "duck",
+        "images": [
+            {"id": "1", "title": "cat", "image_url": "http://img/duck.jpg"},
+            {"id": "2", "title": "cat", "image_url": "http://img/cat.jpg"},
+        ],
+    }
+    result = await server._tool_image_filter(args)
+
+    by_id = {item["id"]: item for item in result.data["results"]}
+    assert by_id["1"]["clip_score"] == 0.8
+    assert by_id["1"]["score"] == 0.45
+    assert "clip_score" not in by_id["2"]
+
+
+@pytest.mark.asyncio
+async def test_server_aclose_releases_scoring_engine():
+    from mcp.servers.vision_scoring import ImageScoringEngine  # noqa: E402
+
+    server = VisionMCPServer()
+    engine = ImageScoringEngine(_FakeScorer())
+    client = engine._http()
+    server._clip_engine = engine
+
+    await server.aclose()
+
+    assert client.is_closed
@@ -1,4 +1,7 @@
+import asyncio
+import os
 import sys
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -21,7 +24,11 @@ sys.modules.setdefault("duckduckgo_search", SimpleNamespace(DDGS=_DummyDDGS))
 sys.modules.setdefault("simhash", SimpleNamespace(Simhash=object))
 sys.modules.setdefault("markdownify", SimpleNamespace(markdownify=lambda value, **_: value))
 
-from research.web_tool import WebTool  # type: ignore
+import httpx  # noqa: E402
+
+from research.extraction import HtmlExtractor  # type: ignore  # noqa: E402
+from research.page_fetcher import FetchedPage, PageFetcher, ResponseCache  # type: ignore  # noqa: E402
+from research.web_tool import WebTool  # type: ignore  # noqa: E402
 
 
 class DummyResponse:
@@ -36,26 +43,17 @@ class DummyResponse:
         return None
 
 
-class DummyAsyncClient:
-    def __init__(self, *args, **kwargs):  # noqa: D401
-        self._response = kwargs.pop("response", DummyResponse())
-
-    async def __aenter__(self):  # noqa: D401
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):  # noqa: D401
-        return False
-
-    async def get(self, *args, **kwargs):  # noqa: D401
-        return self._response
+def _tool(handler, **fetcher_kwargs) -> WebTool:
+    fetcher = PageFetcher(transport=httpx.MockTransport(handler), **fetcher_kwargs)
+    return WebTool(enable_jina=False, fetcher=fetcher, extractor=HtmlExtractor(workers=0))
 
 
 @pytest.mark.asyncio
-async def test_web_tool_falls_back_to_beautifulsoup(monkeypatch):
-    tool = WebTool(enable_jina=False)
-
-    dummy_client = DummyAsyncClient()
-    monkeypatch.setattr("research.web_tool.httpx.AsyncClient", lambda *a, **kw: dummy_client)
+async def test_web_tool_falls_back_to_beautifulsoup():
+    response = DummyResponse()
+    tool = _tool(
+        lambda request: httpx.Response(200, content=response.content, headers=response.headers)
+    )
 
     result = await tool.fetch("http://example.com")
 
@@ -87,3 +85,149 @@ async def test_web_tool_prefers_jina(monkeypatch):
     assert result["success"] is True
     assert result["content"] == "Jina content"
     assert result["metadata"]["provider"] == "jina_reader"
+
+
+@pytest.mark.asyncio
+async def test_jina_reader_goes_through_fetcher_limits_and_cache(tmp_path):
+    in_flight = []
+    peak = []
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.headers.get("authorization")))
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return httpx.Response(200, json={"data": {"title": "T", "content": f"read {request.url.path}"}})
+
+    fetcher = PageFetcher(
+        transport=httpx.MockTransport(handler), per_host_limit=2, cache=ResponseCache(tmp_path)
+    )
+    tool = WebTool(
+        enable_jina=True, jina_base_url="https://r.jina.ai", jina_api_key="key",
+        fetcher=fetcher, extractor=HtmlExtractor(workers=0),
+    )
+    tool._jina_enabled = True
+    urls = [f"http://a.test/{i}" for i in range(6)]
+
+    results = await tool.fetch_many(urls)
+    again = await tool.fetch(urls[0])
+
+    assert [r["content"] for r in results] == [f"read /http://a.test/{i}" for i in range(6)]
+    assert all(r["metadata"]["provider"] == "jina_reader" for r in results)
+    assert max(peak) == 2  # per-host limit applies to r.jina.ai
+    assert len(seen) == 6 and seen[0][1] == "Bearer key"
+    assert again["content"] == results[0]["content"]  # served from the response cache
+    await tool.aclose()
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=5000)
+
+    def page(i):
+        return FetchedPage(url=f"http://a.test/{i}", final_url=f"http://a.test/{i}", status_code=200, body=b"x" * 1000)
+
+    for i in range(4):
+        cache.store(page(i))
+    # Age the entries in write order; reading 0 makes 1 the least recently used
+    for i in range(4):
+        _, body_path = cache._paths(f"http://a.test/{i}")
+        os.utime(body_path, (time.time() - 100 + i, time.time() - 100 + i))
+    assert cache.load("http://a.test/0") is not None
+    cache.store(page(4))
+
+    assert cache.load("http://a.test/1") is None
+    assert cache.load("http://a.test/0") is not None
+    assert cache.load("http://a.test/4") is not None
+    assert sum(size for _, size, _ in cache._entries()) <= 5000
+
+
+@pytest.mark.asyncio
+async def test_fetch_aborts_stream_past_size_cap():
+    chunks_sent = []
+
+    async def body():
+        for _ in range(100):
+            chunks_sent.append(1)
+            yield b"x" * 1024
+
+    tool = _tool(lambda request: httpx.Response(200, content=body()), max_content_length=4096)
+    result = await tool.fetch("http://example.com/huge")
+
+    assert result["success"] is False
+    assert "Content too large" in result["error"]
+    assert len(chunks_sent) < 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_revalidates_cache_with_etag(tmp_path):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=b"<html><title>Cached</title><body><p>Body</p></body></html>",
+            headers={"etag": '"v1"', "content-type": "text/html"},
+        )
+
+    cache = ResponseCache(tmp_path, ttl_seconds=3600)
+    tool = _tool(handler, cache=cache)
+
+    first = await tool.fetch("http://example.com/page")
+    second = await tool.fetch("http://example.com/page")  # fresh: no request
+    cache.ttl_seconds = 0
+    third = await tool.fetch("http://example.com/page")  # stale: conditional GET
+
+    assert seen == [None, '"v1"']
+    assert first["metadata"]["cached"] is False
+    assert second["metadata"]["cached"] is True
+    assert third["metadata"]["cached"] is True
+    assert third["title"] == "Cached"
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_preserves_order_and_limits_per_host():
+    in_flight = {}
+    peak = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, content=f"<title>{request.url.path}</title>".encode())
+
+    tool = _tool(handler, per_host_limit=2)
+    urls = [f"http://a.test/{i}" for i in range(6)] + ["http://b.test/missing"]
+    results = await tool.fetch_many(urls)
+
+    assert [r["title"] for r in results[:6]] == [f"/{i}" for i in range(6)]
+    assert results[6]["success"] is False
+    assert peak["a.test"] == 2
+    await tool.aclose()
+
+
+def test_extract_page_runs_in_worker_process():
+    from research.extraction import extract_page  # type: ignore
+
+    html = "<html><head><title>T</title><meta name='author' content='Ada'></head><body><nav>x</nav><main><h1>Hi</h1></main></body></html>"
+    result = extract_page(html.encode(), "utf-8")
+
+    assert result["title"] == "T"
+    assert result["author"] == "Ada"
+    assert "Hi" in result["content"]
+    assert "x" not in result["content"].replace("Hi", "")
+
+    extractor = HtmlExtractor(workers=1)
+    try:
+        pooled = asyncio.run(extractor.extract(html.encode()))
+    finally:
+        extractor.shutdown()
+    assert pooled == result